@@ -818,6 +818,27 @@ def profile_setup(ctx, interactive, template, format, output, set_default):
         sys.exit(1)
 
 
+@cli.command('plan-campaign')
+@click.option('--limit', '-l', default=10, help='Number of companies the campaign would process')
+@click.option('--generate-emails', is_flag=True, help='Include email generation in the plan')
+@click.pass_context
+def plan_campaign(ctx, limit, generate_emails):
+    """Show how much of a campaign the remaining API quotas can pay for."""
+    try:
+        cli_config = CLIConfig(ctx.obj['config_file'], ctx.obj['dry_run'])
+        controller = ProspectAutomationController(cli_config.base_config)
+        
+        plan = controller.plan_campaign(limit, include_emails=generate_emails)
+        _display_quota_plan(plan.to_dict())
+        
+        if plan.degradations:
+            console.print(f"[yellow]Degradations: {', '.join(plan.degradations)}[/yellow]")
+        
+    except Exception as e:
+        console.print(f"[red]Error planning campaign: {str(e)}[/red]")
+        return 1
+
+
 @cli.command('run-campaign')
 @click.option('--limit', '-l', default=10, help='Maximum number of companies to process')
 @click.option('--campaign-name', '-c', help='Name for this campaign')
@@ -861,10 +882,18 @@ def run_campaign(ctx, limit, campaign_name, sender_profile, generate_emails, sen
         if not campaign_name:
             campaign_name = f"Campaign {datetime.now().strftime('%Y-%m-%d %H:%M')}"
         
+        # Fit the campaign to the remaining API quotas
+        plan = controller.plan_campaign(limit, include_emails=generate_emails)
+        if plan.is_degraded:
+            _display_quota_plan(plan.to_dict())
+        if plan.companies <= 0:
+            console.print("[red]❌ Remaining API quotas do not cover a single company. Campaign not started.[/red]")
+            return 1
+        
         console.print(Panel.fit(
             f"[bold green]>> Starting Complete Campaign Workflow[/bold green]\n"
             f"Campaign: {campaign_name}\n"
-            f"Target: {limit} companies\n"
+            f"Target: {plan.companies} companies\n"
             f"Generate Emails: {'Yes' if generate_emails else 'No'}\n"
             f"Send Emails: {'Yes' if send_emails else 'No'}",
             border_style="green"
@@ -887,7 +916,7 @@ def run_campaign(ctx, limit, campaign_name, sender_profile, generate_emails, sen
         ) as progress:
             task = progress.add_task("Running discovery pipeline...", total=None)
             
-            results = controller.run_discovery_pipeline(limit=limit, campaign_name=campaign_name)
+            results = controller.run_discovery_pipeline(limit=limit, campaign_name=campaign_name, plan=plan)
             
             progress.update(task, description="Discovery completed!")
         
@@ -1933,6 +1962,29 @@ def _display_results(results: Dict[str, Any]):
     console.print(table)
 
 
+def _display_quota_plan(plan: Dict[str, Any]):
+    """Display a campaign quota plan in a formatted table."""
+    table = Table(title="Campaign Quota Plan")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="green")
+    
+    table.add_row("Companies", f"{plan['companies']}/{plan['requested_companies']}")
+    table.add_row("Estimated Prospects", str(plan['estimated_prospects']))
+    table.add_row("Verify Emails", "Yes" if plan['verify_emails'] else "No (skipped to save credits)")
+    if plan.get('fallback_model'):
+        table.add_row("AI Model", f"{plan['fallback_model']} (cheaper fallback)")
+    if plan.get('limiting_resource'):
+        table.add_row("Limited By", plan['limiting_resource'])
+    
+    for resource, remaining in plan.get('remaining', {}).items():
+        table.add_row(f"Remaining {resource}", "unlimited" if remaining is None else str(remaining))
+    
+    for stage, reserved in plan.get('reservations', {}).items():
+        table.add_row(f"Reserved for {stage}", str(reserved))
+    
+    console.print(table)
+
+
 def _display_prospects(prospects: List):
     """Display prospects in a formatted table."""
     if not prospects:
@@ -5,7 +5,8 @@ from typing import (
     Dict,
     Any,
     Optional,
-    Callable
+    Callable,
+    Tuple
 )
 from datetime import datetime
 import time
@@ -33,7 +34,11 @@ from models.data_models import (
     ProspectStatus,
     LinkedInProfile
 )
-from services.product_hunt_scraper import ProductHuntScraper
+from services.product_hunt_scraper import (
+    ProductData,
+    ProductHuntScraper
+)
+from services.product_hunt_crawler import ProductHuntCrawler
 from services.notion_manager import (
     NotionDataManager,
     CampaignProgress,
@@ -55,10 +60,25 @@ from services.ai_service import AIService
 from services.openai_client_manager import CompletionRequest
 from utils.config import Config
 from utils.configuration_service import get_configuration_service
+from utils.http_client import get_connection_stats
 from utils.logging_config import get_logger
+from utils.rate_limiting import (
+    RequestPriority,
+    get_rate_limiter,
+    request_priority
+)
+from utils.deadline import (
+    Deadline,
+    deadline_scope
+)
 from services.notification_manager import NotificationManager
 from services.sender_profile_manager import SenderProfileManager
 from services.parallel_processor import ParallelProcessor
+from services.quota_planner import (
+    CampaignPlan,
+    PipelineStage,
+    QuotaPlanner
+)
 from services.domain_validator import (
     extract_valid_domain,
     is_valid_domain
@@ -165,6 +185,12 @@ class ProspectAutomationController:
         try:
             # Services that support ConfigurationService - don't pass config to eliminate deprecation warnings
             self.product_hunt_scraper = ProductHuntScraper()
+            
+            # Background crawler keeping unseen launches queued for discovery
+            self.product_crawler = None
+            if getattr(self.config, 'enable_producthunt_crawler', False) is True:
+                self.product_crawler = ProductHuntCrawler(self.config)
+                self.product_crawler.start(self.config.producthunt_crawl_interval)
             self.notion_manager = NotionDataManager(self.config)  # Still needs config for now
             self.email_finder = EmailFinder(self.config)  # Still needs config for API keys
             self.linkedin_scraper = LinkedInScraper(self.config)  # Still needs config for now
@@ -201,6 +227,13 @@ class ProspectAutomationController:
                 self.ai_service = None
                 self.use_ai_processing = False
             
+            # Budgets paid API usage across campaign stages
+            self.quota_planner = QuotaPlanner(self.config)
+            self.last_quota_usage = None
+            
+            # Central scheduler that paces every upstream call
+            self.rate_limiter = get_rate_limiter(self.config)
+            
             # Initialize sender profile if enabled
             self.sender_profile = None
             if self.config.enable_sender_profile:
@@ -233,6 +266,7 @@ class ProspectAutomationController:
             'ai_parsing_failures': 0,
             'product_analyses_completed': 0,
             'ai_structured_data_created': 0,
+            'companies_partial': 0,
             'emails_sent': 0,
             'errors': 0,
             'start_time': None,
@@ -494,13 +528,39 @@ class ProspectAutomationController:
         
         return results
     
-    def run_discovery_pipeline(self, limit: Optional[int] = None, campaign_name: str = None) -> Dict[str, Any]:
+    def plan_campaign(self, limit: Optional[int] = None, include_emails: bool = False) -> CampaignPlan:
+        """
+        Work out how much of a campaign the remaining API quotas can pay for.
+        
+        Hunter.io credits are refreshed from the account endpoint first; if
+        that fails, the last recorded quotas are used.
+        
+        Args:
+            limit: Number of companies requested
+            include_emails: Whether emails will be generated in the same run
+            
+        Returns:
+            CampaignPlan with the affordable company count and degradations
+        """
+        requested = limit or self.config.max_products_per_run
+        
+        try:
+            self.email_finder.get_account_quota()
+        except Exception as e:
+            self.logger.warning(f"Could not refresh Hunter.io credits, using last known quotas: {str(e)}")
+        
+        return self.quota_planner.plan(requested, include_emails=include_emails)
+    
+    @request_priority(RequestPriority.DISCOVERY)
+    def run_discovery_pipeline(self, limit: Optional[int] = None, campaign_name: str = None,
+                               plan: Optional[CampaignPlan] = None) -> Dict[str, Any]:
         """
         Run the complete discovery pipeline to find and process prospects with progress tracking.
         
         Args:
             limit: Optional limit on number of companies to process
             campaign_name: Optional campaign name for tracking
+            plan: Quota plan from plan_campaign() (planned here if omitted)
             
         Returns:
             Dictionary containing pipeline results and statistics
@@ -512,10 +572,26 @@ class ProspectAutomationController:
         campaign_name = campaign_name or f"Discovery Campaign {datetime.now().strftime('%Y-%m-%d %H:%M')}"
         target_limit = limit or self.config.max_products_per_run
         
+        # Fit the run to the remaining API quotas
+        if plan is None:
+            try:
+                plan = self.plan_campaign(target_limit)
+            except Exception as e:
+                self.logger.warning(f"Quota planning failed, running without budgets: {str(e)}")
+        if plan is not None:
+            target_limit = min(target_limit, plan.companies)
+            self.quota_planner.start(plan)
+        pacing_baseline = self._pacing_baseline()
+        
         try:
             # Initialize campaign progress tracking
             self._start_campaign_tracking(campaign_name, target_limit)
             
+            if target_limit <= 0:
+                self.logger.warning("Remaining API quotas do not cover a single company; nothing to process")
+                self._complete_campaign_tracking(CampaignStatus.COMPLETED)
+                return self._get_pipeline_results()
+            
             # Step 1: Discover companies from ProductHunt
             self._update_campaign_step("Company Discovery")
             self._log_processing_step(campaign_name, "System", "Discovery", "Started", 
@@ -553,10 +629,15 @@ class ProspectAutomationController:
                 self._update_campaign_current_company(company_name)
                 self.logger.info(f"Progress: {completed}/{total} companies processed")
             
+            # Worker threads do not inherit this thread's priority lane
+            def process_in_discovery_lane(company_data: CompanyData) -> List[Prospect]:
+                with request_priority(RequestPriority.DISCOVERY):
+                    return self.process_company(company_data)
+            
             # Process companies in parallel
             processing_results = parallel_processor.process_companies_parallel(
                 companies=companies,
-                process_function=self.process_company,
+                process_function=process_in_discovery_lane,
                 progress_callback=progress_callback
             )
             
@@ -630,6 +711,10 @@ class ProspectAutomationController:
             self._complete_campaign_tracking(CampaignStatus.COMPLETED)
             
             results = self._get_pipeline_results()
+            if plan is not None:
+                results['quota_plan'] = plan.to_dict()
+            results['pacing'] = self._pacing_report(pacing_baseline)
+            results['http_connections'] = get_connection_stats().get_metrics()
             
             # Send intelligent completion notification
             if self.notification_manager and self.current_campaign:
@@ -665,24 +750,60 @@ class ProspectAutomationController:
                                     error_message=str(e))
             
             raise
+        
+        finally:
+            if plan is not None:
+                self.last_quota_usage = self.quota_planner.finish()
     
     def process_company(self, company_data: CompanyData) -> List[Prospect]:
         """
         Process a single company through the enhanced workflow with AI structuring.
         
+        With company_deadline_seconds configured, the company's service calls
+        share that time budget; steps that no longer fit are skipped and the
+        prospects found so far are returned.
+        
         Args:
             company_data: Company information from ProductHunt
             
         Returns:
             List of processed prospects
         """
+        budget = self.config.company_deadline_seconds
+        with deadline_scope(budget if isinstance(budget, (int, float)) else None) as deadline:
+            return self._process_company(company_data, deadline)
+    
+    def _out_of_time(self, deadline: Optional[Deadline], step: str, company_name: str) -> bool:
+        """
+        Check whether a company's deadline has passed, logging the skipped step.
+        
+        Args:
+            deadline: Company deadline, or None without one
+            step: Step that would run next
+            company_name: Company being processed
+            
+        Returns:
+            True if the step should be skipped
+        """
+        if deadline is None or not deadline.expired:
+            return False
+        self.logger.warning(
+            f"Deadline of {deadline.budget:.0f}s reached for {company_name}, skipping {step}"
+        )
+        return True
+    
+    def _process_company(self, company_data: CompanyData, deadline: Optional[Deadline]) -> List[Prospect]:
+        """Run the company workflow, skipping optional steps once the deadline passes."""
         self.logger.info(f"Processing company: {company_data.name}")
         prospects = []
+        partial = False
         
         try:
             # Step 1: Analyze product comprehensively using AI-enhanced analysis
             self.logger.info(f"Step 1: Analyzing product for {company_data.name}")
-            product_analysis = self._analyze_product_with_ai_structuring(company_data)
+            product_analysis = None
+            if self.quota_planner.allow(PipelineStage.ANALYSIS):
+                product_analysis = self._analyze_product_with_ai_structuring(company_data)
             if product_analysis:
                 self._update_stats_thread_safe(product_analyses_completed=1)
             
@@ -698,11 +819,19 @@ class ProspectAutomationController:
             
             # Step 3: Find emails for team members
             self.logger.info(f"Step 3: Finding emails for team members")
-            email_results = self._find_team_emails(team_members, company_data.domain)
+            email_results = {}
+            if self._out_of_time(deadline, "email finding", company_data.name):
+                partial = True
+            else:
+                email_results = self._find_team_emails(team_members, company_data.domain)
             
             # Step 4: Extract LinkedIn profiles with AI-enhanced parsing
             self.logger.info(f"Step 4: Extracting LinkedIn profiles with AI parsing")
-            linkedin_profiles = self._extract_linkedin_profiles_with_ai(team_members)
+            linkedin_profiles = {}
+            if self._out_of_time(deadline, "LinkedIn extraction", company_data.name):
+                partial = True
+            else:
+                linkedin_profiles = self._extract_linkedin_profiles_with_ai(team_members)
             
             # Step 5: Structure all data with AI and store in Notion
             self.logger.info(f"Step 5: Structuring data with AI and storing prospects")
@@ -716,9 +845,14 @@ class ProspectAutomationController:
                     )
                     
                     if prospect:
+                        if not self.quota_planner.allow(PipelineStage.STORAGE):
+                            self.logger.warning(f"Notion budget used up, not storing remaining prospects for {company_data.name}")
+                            break
+                        
                         # First, store the prospect in Notion to get an ID
                         try:
                             page_id = self.notion_manager.store_prospect(prospect)
+                            self.quota_planner.record(PipelineStage.STORAGE, self.quota_planner.costs.notion_requests_per_prospect)
                             if page_id:
                                 prospect.id = page_id
                                 self.logger.info(f"Stored prospect {prospect.name} with ID: {page_id}")
@@ -732,10 +866,15 @@ class ProspectAutomationController:
                         # Get LinkedIn profile for this team member
                         linkedin_profile = linkedin_profiles.get(team_member.linkedin_url) if team_member.linkedin_url else None
                         
-                        # Structure all data with AI for email personalization
-                        ai_structured_data = self._structure_prospect_data_with_ai(
-                            prospect, linkedin_profile, product_analysis, company_data
-                        )
+                        # Structure all data with AI for email personalization, within the reserved token budget
+                        ai_structured_data = {}
+                        if self._out_of_time(deadline, f"AI structuring for {prospect.name}", company_data.name):
+                            partial = True
+                        elif self.quota_planner.allow(PipelineStage.STRUCTURING):
+                            with self.quota_planner.stage(PipelineStage.STRUCTURING):
+                                ai_structured_data = self._structure_prospect_data_with_ai(
+                                    prospect, linkedin_profile, product_analysis, company_data
+                                )
                         
                         # Store AI-structured data now that we have a prospect ID
                         if ai_structured_data and prospect.id:
@@ -771,6 +910,8 @@ class ProspectAutomationController:
                     continue
             
             self.logger.info(f"Successfully processed {len(prospects)} prospects for {company_data.name} with AI enhancement")
+            if partial:
+                self._update_stats_thread_safe(companies_partial=1)
             
             # Clear cache since we've added new prospects for this company
             if prospects:
@@ -782,6 +923,7 @@ class ProspectAutomationController:
             self.logger.error(f"Failed to process company {company_data.name}: {str(e)}")
             raise
     
+    @request_priority(RequestPriority.INTERACTIVE)
     def generate_outreach_emails(self, prospect_ids: List[str], 
                                template_type: EmailTemplate = EmailTemplate.COLD_OUTREACH) -> Dict[str, Any]:
         """
@@ -955,6 +1097,7 @@ class ProspectAutomationController:
             self.logger.error(f"Email generation process failed: {str(e)}")
             raise
     
+    @request_priority(RequestPriority.SENDING)
     def generate_and_send_outreach_emails(
         self, 
         prospect_ids: List[str], 
@@ -1091,6 +1234,7 @@ class ProspectAutomationController:
             self.logger.error(f"Email generation and sending process failed: {str(e)}")
             raise
     
+    @request_priority(RequestPriority.SENDING)
     def send_single_outreach_email(
         self, 
         prospect_id: str, 
@@ -1169,6 +1313,7 @@ class ProspectAutomationController:
             self.logger.error(f"Failed to generate and send email for prospect {prospect_id}: {str(e)}")
             raise
     
+    @request_priority(RequestPriority.SENDING)
     def send_prospect_emails(self, prospect_ids: List[str], batch_size: int = 5, delay: int = 30) -> Dict[str, Any]:
         """
         Send already generated emails to prospects.
@@ -1192,6 +1337,7 @@ class ProspectAutomationController:
         
         
         for i, prospect_id in enumerate(prospect_ids):
+            waited_before = self.rate_limiter.thread_wait_time()
             try:
                 self.logger.info(f"Sending email to prospect {prospect_id} ({i+1}/{len(prospect_ids)})")
                 
@@ -1333,8 +1479,8 @@ class ProspectAutomationController:
                     self.logger.info(f"Batch completed. Waiting {delay} seconds before next batch...")
                     time.sleep(delay)
                 elif i < len(prospect_ids) - 1:
-                    # Small delay between individual emails
-                    time.sleep(2)
+                    # EmailSender paces individual sends to the Resend quota
+                    self._record_paced_step("email_send_delay", 2.0, waited_before)
                 
             except Exception as e:
                 self.logger.error(f"Failed to send email to prospect {prospect_id}: {str(e)}")
@@ -1447,6 +1593,53 @@ class ProspectAutomationController:
             self.logger.error(f"Failed to get prospect email performance: {str(e)}")
             return {'error': str(e)}
     
+    def _fetch_latest_products(self, limit: int) -> List[ProductData]:
+        """
+        Get the latest ProductHunt launches for discovery.
+        
+        Launches already queued by the background crawler are returned
+        immediately; the homepage is only scraped when the queue is empty.
+        
+        Args:
+            limit: Maximum number of products
+            
+        Returns:
+            List of ProductData objects
+        """
+        if self.product_crawler is not None:
+            try:
+                queued = self.product_crawler.take(limit)
+                if queued:
+                    self.logger.info(f"Took {len(queued)} products from the crawler queue")
+                    return queued
+            except Exception as e:
+                self.logger.warning(f"Crawler queue unavailable: {str(e)}")
+        
+        products = self.product_hunt_scraper.get_latest_products(limit)
+        
+        if self.product_crawler is not None:
+            try:
+                # Keep the crawler from queueing what this campaign already saw
+                self.product_crawler.mark_seen(products)
+            except Exception as e:
+                self.logger.warning(f"Failed to record scraped products with the crawler: {str(e)}")
+        return products
+    
+    def _release_unused_products(self, products: List[ProductData]) -> None:
+        """
+        Queue unprocessed launches this campaign fetched but had no room for.
+        
+        Args:
+            products: ProductData objects beyond the discovery limit
+        """
+        if self.product_crawler is None or not products:
+            return
+        try:
+            released = self.product_crawler.release(products)
+            self.logger.info(f"Returned {released} unused products to the crawler queue")
+        except Exception as e:
+            self.logger.warning(f"Failed to return unused products to the crawler queue: {str(e)}")
+    
     def _discover_companies(self, limit: int) -> List[CompanyData]:
         """
         Discover companies from ProductHunt, ensuring we get the target number of unprocessed companies.
@@ -1465,6 +1658,7 @@ class ProspectAutomationController:
             fetch_limit = max(limit * 3, 10)  # Fetch at least 10 products to find unprocessed ones
             max_attempts = 3
             attempt = 0
+            total_discovered = 0
             
             while len(unprocessed_companies) < limit and attempt < max_attempts:
                 attempt += 1
@@ -1477,8 +1671,9 @@ class ProspectAutomationController:
                     fetch_limit = min(needed + int(needed * 0.5), 100)
                     self.logger.info(f"Attempt {attempt}: Need {needed} more companies, fetching {fetch_limit} with duplicate buffer")
                 
-                # Get latest products from ProductHunt
-                products = self.product_hunt_scraper.get_latest_products(fetch_limit)
+                # Get latest products, from the crawler queue when it has any
+                products = self._fetch_latest_products(fetch_limit)
+                total_discovered += len(products)
                 
                 if not products:
                     self.logger.warning(f"No products found on ProductHunt (attempt {attempt})")
@@ -1486,6 +1681,7 @@ class ProspectAutomationController:
                 
                 # Convert products to companies
                 companies = []
+                products_by_url = {}
                 for product in products:
                     try:
                         # Extract domain using our validator
@@ -1514,6 +1710,7 @@ class ProspectAutomationController:
                         )
                         
                         companies.append(company)
+                        products_by_url[product.product_url] = product
                         
                     except Exception as e:
                         self.logger.warning(f"Failed to convert product to company data: {str(e)}")
@@ -1528,10 +1725,16 @@ class ProspectAutomationController:
                 
                 # Add new unprocessed companies, avoiding duplicates from previous attempts
                 existing_names = {comp.name.lower() for comp in unprocessed_companies}
+                surplus = []
                 for company in batch_unprocessed:
-                    if company.name.lower() not in existing_names and len(unprocessed_companies) < limit:
+                    if company.name.lower() in existing_names:
+                        continue
+                    if len(unprocessed_companies) < limit:
                         unprocessed_companies.append(company)
                         existing_names.add(company.name.lower())
+                    elif company.product_url in products_by_url:
+                        surplus.append(products_by_url[company.product_url])
+                self._release_unused_products(surplus)
                 
                 self.logger.info(f"Attempt {attempt}: Found {len(batch_unprocessed)} new companies, total unprocessed: {len(unprocessed_companies)}/{limit}")
                 
@@ -1549,7 +1752,6 @@ class ProspectAutomationController:
                 unprocessed_companies = unprocessed_companies[:limit]
                 self.logger.info(f"Trimmed results to exactly {limit} companies")
             
-            total_discovered = sum(len(self.product_hunt_scraper.get_latest_products(fetch_limit)) for _ in range(attempt))
             skipped_count = total_discovered - len(unprocessed_companies) if total_discovered > len(unprocessed_companies) else 0
             
             self.logger.info(f"✅ Discovery completed: {len(unprocessed_companies)} unprocessed companies ready for processing")
@@ -1737,6 +1939,7 @@ class ProspectAutomationController:
             if not team_member.linkedin_url:
                 continue
             
+            waited_before = self.rate_limiter.thread_wait_time()
             try:
                 # PERFORMANCE OPTIMIZATION: Skip LinkedIn extraction if likely to fail
                 if not self._should_extract_linkedin_profile(team_member):
@@ -1781,8 +1984,8 @@ class ProspectAutomationController:
                     profiles[team_member.linkedin_url] = raw_profile_data
                     self.logger.info(f"Extracted LinkedIn profile for {team_member.name}")
                 
-                # Add delay to respect LinkedIn rate limits
-                time.sleep(self.config.scraping_delay)
+                # LinkedInScraper paces its requests through the scheduler
+                self._record_paced_step("linkedin_profile_delay", self.config.scraping_delay, waited_before)
                 
             except Exception as e:
                 self.logger.error(f"Failed to extract LinkedIn profile for {team_member.name}: {str(e)}")
@@ -2162,9 +2365,15 @@ class ProspectAutomationController:
                 self.logger.warning(f"Invalid domain for email finding: {domain}")
                 return {}
                 
+            if not self.quota_planner.allow(PipelineStage.EMAIL_FINDING):
+                self.logger.warning(f"Hunter.io search budget used up, skipping email finding at {domain}")
+                return {}
+            
             self.logger.info(f"Finding emails for {len(team_members)} team members at {domain}")
             
-            email_results = self.email_finder.find_and_verify_team_emails(team_members, domain)
+            email_results = self.email_finder.find_and_verify_team_emails(
+                team_members, domain, verify=self.quota_planner.allow(PipelineStage.VERIFICATION)
+            )
             
             # Get best emails with minimum confidence
             best_emails = self.email_finder.get_best_emails(email_results, min_confidence=70)
@@ -2263,6 +2472,54 @@ class ProspectAutomationController:
             self.logger.error(f"Failed to create prospect from team member {team_member.name}: {str(e)}")
             return None
     
+    def _pacing_baseline(self) -> Tuple[Dict[str, float], float]:
+        """Snapshot the scheduler's pacing counters at the start of a run."""
+        return self.rate_limiter.get_avoided_sleep(), self.rate_limiter.get_total_wait_time()
+    
+    def _record_paced_step(self, source: str, fixed_sleep: float, waited_before: float) -> float:
+        """
+        Record the fixed sleep a step no longer takes, minus the rate limit waits it took instead.
+        
+        Args:
+            source: Call site name
+            fixed_sleep: Seconds the step used to sleep
+            waited_before: thread_wait_time() of the rate limiter when the step started
+            
+        Returns:
+            Seconds the step waited on the rate limiter
+        """
+        waited = self.rate_limiter.thread_wait_time() - waited_before
+        self.rate_limiter.record_avoided_sleep(source, fixed_sleep - waited)
+        return waited
+    
+    def _pacing_report(self, baseline: Tuple[Dict[str, float], float]) -> Dict[str, Any]:
+        """
+        Summarize the fixed sleeps avoided and the rate limit waits of a run.
+        
+        Args:
+            baseline: Snapshot from _pacing_baseline() taken when the run started
+            
+        Returns:
+            Dictionary with avoided sleep seconds (total and by call site) and
+            seconds spent waiting on rate limits
+        """
+        avoided_before, waited_before = baseline
+        avoided = {
+            source: round(seconds - avoided_before.get(source, 0.0), 2)
+            for source, seconds in self.rate_limiter.get_avoided_sleep().items()
+            if seconds > avoided_before.get(source, 0.0)
+        }
+        report = {
+            'avoided_sleep_seconds': round(sum(avoided.values()), 2),
+            'avoided_sleep_by_source': avoided,
+            'rate_limit_wait_seconds': round(self.rate_limiter.get_total_wait_time() - waited_before, 2)
+        }
+        self.logger.info(
+            f"Pacing: skipped {report['avoided_sleep_seconds']:.1f}s of fixed sleeps, "
+            f"waited {report['rate_limit_wait_seconds']:.1f}s on rate limits"
+        )
+        return report
+    
     def _get_pipeline_results(self) -> Dict[str, Any]:
         """
         Get pipeline execution results and statistics.
@@ -2307,6 +2564,7 @@ class ProspectAutomationController:
             }
         }
     
+    @request_priority(RequestPriority.DISCOVERY)
     def run_batch_processing(self, companies: List[CompanyData], 
                            batch_size: int = 5,
                            progress_callback: Optional[Callable[[BatchProgress], None]] = None) -> Dict[str, Any]:
@@ -2340,6 +2598,7 @@ class ProspectAutomationController:
             self.progress_callbacks.append(progress_callback)
         
         self.logger.info(f"Starting batch processing: {batch_id} with {len(companies)} companies")
+        pacing_baseline = self._pacing_baseline()
         
         try:
             # Store initial progress state in Notion
@@ -2350,20 +2609,25 @@ class ProspectAutomationController:
                 batch_companies = companies[i:i + batch_size]
                 self.logger.info(f"Processing batch {i//batch_size + 1}: companies {i+1}-{min(i+batch_size, len(companies))}")
                 
+                # Rate limit waits longer than a company's own fixed delay count against the batch delay
+                batch_overflow = 0.0
+                
                 # Process each company in the current batch
                 for company in batch_companies:
                     if self.current_batch.status == ProcessingStatus.PAUSED:
                         self.logger.info("Batch processing paused")
                         break
                     
+                    waited_before = self.rate_limiter.thread_wait_time()
                     result = self._process_company_with_tracking(company)
                     self.batch_results.append(result)
                     
                     # Update progress
                     self._update_batch_progress(company.name, result)
                     
-                    # Add delay between companies
-                    time.sleep(self.config.scraping_delay)
+                    # Every upstream call is paced by the scheduler, so no delay between companies
+                    waited = self._record_paced_step("batch_company_delay", self.config.scraping_delay, waited_before)
+                    batch_overflow += max(0.0, waited - self.config.scraping_delay)
                 
                 # Check if processing was paused
                 if self.current_batch.status == ProcessingStatus.PAUSED:
@@ -2372,9 +2636,8 @@ class ProspectAutomationController:
                 # Store progress after each batch
                 self._store_batch_progress()
                 
-                # Add delay between batches
                 if i + batch_size < len(companies):
-                    time.sleep(self.config.scraping_delay * 2)
+                    self.rate_limiter.record_avoided_sleep("batch_delay", self.config.scraping_delay * 2 - batch_overflow)
             
             # Complete batch processing
             if self.current_batch.status != ProcessingStatus.PAUSED:
@@ -2383,6 +2646,8 @@ class ProspectAutomationController:
                 self._store_batch_progress()
             
             results = self._get_batch_results()
+            results['pacing'] = self._pacing_report(pacing_baseline)
+            results['http_connections'] = get_connection_stats().get_metrics()
             self.logger.info(f"Batch processing completed: {batch_id}")
             
             return results
@@ -2410,6 +2675,7 @@ class ProspectAutomationController:
             return True
         return False
     
+    @request_priority(RequestPriority.DISCOVERY)
     def resume_batch_processing(self, batch_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Resume a paused batch processing session.
@@ -2910,6 +3176,7 @@ class ProspectAutomationController:
     
     # ==================== DAILY ANALYTICS METHODS ====================
     
+    @request_priority(RequestPriority.ANALYTICS)
     def create_daily_summary(self, analytics_db_id: str) -> bool:
         """Create or update daily analytics summary."""
         if not self.dashboard_config.get('enable_progress_tracking'):
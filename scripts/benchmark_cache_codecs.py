@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark cache codecs: encode/decode throughput and on-disk size.
+
+Uses real cached LinkedIn profiles and persistent cache entries when they
+exist, and falls back to a synthetic corpus of profiles and AI results
+otherwise.
+
+Usage:
+    python scripts/benchmark_cache_codecs.py [--cache-dir .cache] [--iterations 20]
+"""
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cache_codecs import (
+    CacheCodec,
+    MSGPACK_AVAILABLE,
+    ORJSON_AVAILABLE,
+    ZSTD_AVAILABLE
+)
+
+
+def load_corpus(cache_dir: Path):
+    """Load cached profiles and cache entries from disk."""
+    codec = CacheCodec()
+    corpus = []
+    
+    for path in (cache_dir / "linkedin_profiles").glob("*.*"):
+        try:
+            data = path.read_bytes()
+            if CacheCodec.is_encoded(data):
+                corpus.append(codec.decode(data))
+            elif path.suffix == ".json":
+                corpus.append(json.loads(data))
+        except Exception:
+            continue
+    
+    for path in cache_dir.glob("*.cache"):
+        try:
+            data = path.read_bytes()
+            if CacheCodec.is_encoded(data):
+                corpus.append(codec.decode(data))
+            else:
+                corpus.append(pickle.loads(data).value)
+        except Exception:
+            continue
+    
+    return corpus
+
+
+def synthetic_corpus(size: int = 200):
+    """Build a corpus shaped like cached profiles and AI parsing results."""
+    corpus = []
+    for i in range(size):
+        corpus.append({
+            'linkedin_url': f'https://www.linkedin.com/in/person-{i}',
+            'profile': {
+                'name': f'Person {i}',
+                'current_role': 'Head of Engineering at Example Labs',
+                'experience': [f'Role {j} at Company {j}' for j in range(8)],
+                'skills': ['Python', 'Go', 'Kubernetes', 'Machine Learning', 'Leadership'],
+                'summary': 'Engineering leader focused on developer platforms. ' * 12
+            },
+            'cached_at': '2024-01-01T12:00:00',
+            'cache_key': f'{i:032x}'
+        })
+        corpus.append({
+            'success': True,
+            'data': {
+                'team_members': [
+                    {'name': f'Member {j}', 'role': 'Founder', 'linkedin_url': None}
+                    for j in range(5)
+                ],
+                'business_insights': 'Product targets mid-market SaaS teams. ' * 20
+            },
+            'confidence_score': 0.87,
+            'model_used': 'gpt-4o-mini',
+            'processing_time': 1.42
+        })
+    return corpus
+
+
+def benchmark(codec: CacheCodec, corpus, iterations: int):
+    """Return encode MB/s, decode MB/s and total encoded bytes."""
+    raw_bytes = sum(len(json.dumps(item)) for item in corpus)
+    
+    start = time.perf_counter()
+    for _ in range(iterations):
+        encoded = [codec.encode(item) for item in corpus]
+    encode_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for data in encoded:
+            codec.decode(data)
+    decode_time = time.perf_counter() - start
+    
+    total_mb = raw_bytes * iterations / (1024 * 1024)
+    return total_mb / encode_time, total_mb / decode_time, sum(len(d) for d in encoded)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cache codecs")
+    parser.add_argument("--cache-dir", default=".cache", help="Cache directory with real entries")
+    parser.add_argument("--iterations", type=int, default=20, help="Benchmark iterations")
+    args = parser.parse_args()
+    
+    corpus = load_corpus(Path(args.cache_dir))
+    source = f"{len(corpus)} cached entries from {args.cache_dir}"
+    if not corpus:
+        corpus = synthetic_corpus()
+        source = f"{len(corpus)} synthetic profiles and AI results"
+    
+    print("🔍 Cache Codec Benchmark")
+    print("=" * 72)
+    print(f"Corpus: {source}")
+    
+    legacy_json = sum(len(json.dumps(item, indent=2).encode('utf-8')) for item in corpus)
+    legacy_pickle = sum(len(pickle.dumps(item)) for item in corpus)
+    print(f"Baseline indented JSON: {legacy_json / 1024:.1f} KB, pickle: {legacy_pickle / 1024:.1f} KB")
+    print()
+    print(f"{'codec':<18}{'encode MB/s':>14}{'decode MB/s':>14}{'size KB':>12}{'vs JSON':>12}")
+    print("-" * 72)
+    
+    serializers = ['json', 'pickle']
+    if ORJSON_AVAILABLE:
+        serializers.append('orjson')
+    if MSGPACK_AVAILABLE:
+        serializers.append('msgpack')
+    compressors = ['none', 'zlib'] + (['zstd'] if ZSTD_AVAILABLE else [])
+    
+    for serializer in serializers:
+        for compression in compressors:
+            codec = CacheCodec(serializer=serializer, compression=compression, compress_threshold=1024,
+                               allow_pickle=serializer == 'pickle')
+            encode_rate, decode_rate, size = benchmark(codec, corpus, args.iterations)
+            print(f"{codec.name:<18}{encode_rate:>14.1f}{decode_rate:>14.1f}"
+                  f"{size / 1024:>12.1f}{size / legacy_json:>11.0%}")
+    
+    print()
+    print(f"✅ Default codec: {CacheCodec().name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark of ProductHunt extraction queries on saved pages.
+
+Compares the per-strategy find_all walks ProductHuntScraper used to run
+(each strategy re-walking the whole tree with its own regex) with the
+single-traversal DomIndex, and html.parser with lxml when lxml is installed.
+Both query sets are checked to return the same elements before timing.
+
+Usage:
+    python scripts/benchmark_dom_index.py [--runs 20] [--html archive/producthunt_raw.html ...]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bs4 import BeautifulSoup
+
+from services.dom_index import (
+    LXML_AVAILABLE,
+    DomIndex
+)
+
+DEFAULT_FIXTURES = [os.path.join(ROOT, "archive", "producthunt_raw.html")]
+
+
+def walk_per_strategy(soup: BeautifulSoup) -> dict:
+    """Run every strategy's query as its own find_all walk."""
+    team_sections = []
+    for text in soup.find_all(string=re.compile(r'team|maker|creator|founder|co-founder', re.I)):
+        parent = text.parent
+        while parent and parent.name not in ['div', 'section', 'article']:
+            parent = parent.parent
+        if parent and not any(parent is section for section in team_sections):
+            team_sections.append(parent)
+    
+    return {
+        'product_links': [a for a in soup.find_all('a', href=True) if '/products/' in a.get('href', '')],
+        'post_links': soup.find_all('a', href=re.compile(r'/posts/')),
+        'product_cards': soup.find_all(['div', 'article'], class_=re.compile(r'.*product.*|.*item.*', re.I)),
+        'team_classes': soup.find_all(['div', 'section'], class_=re.compile(r'.*team.*|.*maker.*|.*creator.*', re.I)),
+        'team_text_sections': team_sections,
+        'team_data_test': soup.find_all(['div'], attrs={'data-test': re.compile(r'.*team.*|.*maker.*', re.I)}),
+        'linkedin_text_sections': soup.find_all(['div', 'section'], string=re.compile(r'linkedin', re.I)),
+        'linkedin_profiles': soup.find_all('a', href=re.compile(r'linkedin\.com/in/', re.I)),
+        'linkedin_links': soup.find_all('a', href=re.compile(r'linkedin\.com', re.I)),
+        'external_links': soup.find_all('a', href=re.compile(r'^https?://(?!.*producthunt\.com)')),
+        'text': soup.get_text(),
+        'text_lines': soup.get_text(separator='\n', strip=True),
+    }
+
+
+def single_traversal(soup: BeautifulSoup) -> dict:
+    """Answer the same queries from one DomIndex traversal."""
+    index = DomIndex(soup)
+    return {
+        'product_links': index.links_containing('/products/'),
+        'post_links': index.links_containing('/posts/'),
+        'product_cards': index.with_class(('product', 'item'), ('div', 'article')),
+        'team_classes': index.with_class(('team', 'maker', 'creator'), ('div', 'section')),
+        'team_text_sections': index.team_sections(),
+        'team_data_test': index.team_data_test,
+        'linkedin_text_sections': index.linkedin_text_sections,
+        'linkedin_profiles': index.links_containing('linkedin.com/in/', ignore_case=True),
+        'linkedin_links': index.links_containing('linkedin.com', ignore_case=True),
+        'external_links': index.external_links(),
+        'text': index.get_text(),
+        'text_lines': index.get_text(separator='\n', strip=True),
+    }
+
+
+def check_same_results(html: str):
+    """Fail loudly if the two query sets disagree on a page."""
+    soup = BeautifulSoup(html, 'html.parser')
+    expected = walk_per_strategy(soup)
+    actual = single_traversal(soup)
+    for name, value in expected.items():
+        if isinstance(value, str):
+            same = value == actual[name]
+        else:
+            same = len(value) == len(actual[name]) and all(a is b for a, b in zip(value, actual[name]))
+        if not same:
+            raise SystemExit(f"DomIndex disagrees with find_all on '{name}'")
+
+
+def time_per_page(func, runs: int) -> float:
+    """Return milliseconds per call."""
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ProductHunt extraction queries")
+    parser.add_argument("--runs", type=int, default=20, help="Repetitions per measurement")
+    parser.add_argument("--html", nargs="+", default=DEFAULT_FIXTURES, help="Saved ProductHunt pages")
+    args = parser.parse_args()
+    
+    print("🔍 ProductHunt Extraction Benchmark")
+    print("=" * 60)
+    
+    for path in args.html:
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+        check_same_results(html)
+        
+        soup = BeautifulSoup(html, 'html.parser')
+        print(f"{os.path.basename(path)} ({len(html) / 1024:.0f} KB)")
+        
+        parse_builtin = time_per_page(lambda: BeautifulSoup(html, 'html.parser'), args.runs)
+        print(f"  {'parse, html.parser':<34}{parse_builtin:>10.1f} ms")
+        if LXML_AVAILABLE:
+            parse_lxml = time_per_page(lambda: BeautifulSoup(html, 'lxml'), args.runs)
+            print(f"  {'parse, lxml':<34}{parse_lxml:>10.1f} ms  ({parse_builtin / parse_lxml:.1f}x)")
+        else:
+            print(f"  {'parse, lxml':<34}{'not installed':>13}")
+        
+        walks = time_per_page(lambda: walk_per_strategy(soup), args.runs)
+        indexed = time_per_page(lambda: single_traversal(soup), args.runs)
+        print(f"  {'queries, find_all per strategy':<34}{walks:>10.1f} ms")
+        print(f"  {'queries, single DomIndex pass':<34}{indexed:>10.1f} ms  ({walks / indexed:.1f}x)")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of rate limiter overhead per call.
+
+Compares the deque-based SlidingWindowCounter with the previous list-based
+implementation (which rebuilt the request list and formatted an INFO log
+line on every call) at several window fill levels, and measures the cost
+of RateLimitingService.acquire() when no waiting is needed.
+
+Usage:
+    python scripts/benchmark_rate_limiter.py [--calls 20000]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from types import SimpleNamespace
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.rate_limiting import (
+    RateLimitConfig,
+    RateLimitStrategy,
+    RateLimitingService,
+    SlidingWindowCounter
+)
+
+
+class ListSlidingWindow:
+    """The list-based sliding window the deque version replaced."""
+    
+    def __init__(self, window_size: int, max_requests: int):
+        self.window_size = window_size
+        self.max_requests = max_requests
+        self.requests: List[float] = []
+        self.logger = logging.getLogger("benchmark.legacy")
+    
+    def can_proceed(self) -> bool:
+        now = time.time()
+        cutoff_time = now - self.window_size
+        self.requests = [req_time for req_time in self.requests if req_time > cutoff_time]
+        result = len(self.requests) < self.max_requests
+        self.logger.info(f"can_proceed: {result}, requests={len(self.requests)}, max={self.max_requests}, cutoff_time={cutoff_time:.2f}")
+        return result
+    
+    def record_request(self) -> None:
+        now = time.time()
+        cutoff_time = now - self.window_size
+        self.requests = [req_time for req_time in self.requests if req_time > cutoff_time]
+        self.requests.append(now)
+        self.logger.info(f"record_request: requests={len(self.requests)}, times={[f'{req-now:.2f}' for req in self.requests]}")
+
+
+def time_window(window, calls: int) -> float:
+    """Return microseconds per can_proceed() + record_request() pair."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        window.can_proceed()
+        window.record_request()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark rate limiter overhead")
+    parser.add_argument("--calls", type=int, default=20000, help="Calls per measurement")
+    args = parser.parse_args()
+    
+    # Match production: INFO enabled, output discarded
+    logging.basicConfig(level=logging.INFO, handlers=[logging.NullHandler()])
+    
+    print("🔍 Rate Limiter Overhead Benchmark")
+    print("=" * 64)
+    print(f"{'window fill':<16}{'list + INFO (us)':>20}{'deque (us)':>14}{'speedup':>12}")
+    print("-" * 64)
+    
+    for fill in (10, 100, 1000):
+        legacy = ListSlidingWindow(window_size=3600, max_requests=10 ** 9)
+        legacy.requests = [time.time()] * fill
+        current = SlidingWindowCounter(window_size=3600, max_requests=10 ** 9)
+        current.requests.extend([time.time()] * fill)
+        
+        calls = max(100, args.calls // max(1, fill // 10))
+        legacy_us = time_window(legacy, calls)
+        current_us = time_window(current, calls)
+        print(f"{fill:<16}{legacy_us:>20.2f}{current_us:>14.2f}{legacy_us / current_us:>11.1f}x")
+    
+    config = SimpleNamespace(hunter_requests_per_minute=10 ** 9, scraping_delay=0.3,
+                             resend_requests_per_minute=100)
+    service = RateLimitingService(config, config_path=os.devnull)
+    service.add_rate_limit(RateLimitConfig(
+        service_name="benchmark", operation="sliding", requests_per_minute=10 ** 9,
+        strategy=RateLimitStrategy.SLIDING_WINDOW
+    ))
+    service.add_rate_limit(RateLimitConfig(
+        service_name="benchmark", operation="bucket", requests_per_minute=10 ** 9,
+        burst_limit=10 ** 9, strategy=RateLimitStrategy.TOKEN_BUCKET
+    ))
+    
+    print()
+    for operation in ("sliding", "bucket"):
+        start = time.perf_counter()
+        for _ in range(args.calls):
+            service.acquire("benchmark", operation)
+        per_call = (time.perf_counter() - start) / args.calls * 1e6
+        print(f"acquire() {operation:<8} {per_call:>8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
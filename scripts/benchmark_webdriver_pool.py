@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark of per-page WebDriver overhead.
+
+Compares starting a new Chrome for every page (what ProductAnalyzer and
+AITeamExtractor used to do) with borrowing a warm driver from the shared
+WebDriverManager pool. Pages are small local data: URLs, so the numbers are
+dominated by driver startup and teardown rather than the network.
+
+Requires Chrome and chromedriver.
+
+Usage:
+    python scripts/benchmark_webdriver_pool.py [--pages 10]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from utils.webdriver_manager import WebDriverManager
+
+PAGE_URL = "data:text/html,<html><body><h1>Benchmark</h1></body></html>"
+
+
+def fresh_driver_per_page(pages: int) -> float:
+    """Return seconds per page when every page launches and quits Chrome."""
+    options = Options()
+    options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    
+    start = time.perf_counter()
+    for _ in range(pages):
+        driver = webdriver.Chrome(options=options)
+        try:
+            driver.get(PAGE_URL)
+            _ = driver.page_source
+        finally:
+            driver.quit()
+    return (time.perf_counter() - start) / pages
+
+
+def pooled_driver_per_page(manager: WebDriverManager, pages: int) -> float:
+    """Return seconds per page when drivers come from the shared pool."""
+    start = time.perf_counter()
+    for _ in range(pages):
+        with manager.get_driver("benchmark") as driver:
+            driver.get(PAGE_URL)
+            _ = driver.page_source
+    return (time.perf_counter() - start) / pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-page WebDriver overhead")
+    parser.add_argument("--pages", type=int, default=10, help="Pages loaded per measurement")
+    args = parser.parse_args()
+    
+    print("🔍 WebDriver Per-Page Overhead Benchmark")
+    print("=" * 48)
+    
+    fresh = fresh_driver_per_page(args.pages)
+    print(f"{'new Chrome per page':<28}{fresh:>10.2f} s/page")
+    
+    manager = WebDriverManager()
+    try:
+        pooled = pooled_driver_per_page(manager, args.pages)
+        stats = manager.get_pool_stats()
+    finally:
+        manager.cleanup()
+    print(f"{'pooled driver':<28}{pooled:>10.2f} s/page")
+    print(f"{'speedup':<28}{fresh / pooled:>10.1f}x")
+    print()
+    print(f"drivers created: {stats['drivers_created']}, reused: {stats['drivers_reused']}, "
+          f"avg startup: {stats['avg_startup_seconds']:.2f}s, "
+          f"avg acquire: {stats['avg_acquire_seconds'] * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
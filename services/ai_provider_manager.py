@@ -8,13 +8,27 @@ instantiation, and provider switching functionality.
 import os
 import logging
 import threading
-from typing import Dict, List, Optional, Any, Type
+from typing import Dict, List, Optional, Any, Type, Callable
 from dataclasses import dataclass
 from enum import Enum
 
 from services.providers.base_provider import BaseAIProvider, ValidationResult, ValidationStatus
 from services.openai_client_manager import CompletionRequest, CompletionResponse
 from utils.config import Config
+from utils.circuit_breaker import (
+    CircuitOpenError,
+    get_circuit_breaker,
+    is_upstream_error_message,
+    is_upstream_failure
+)
+from utils.deadline import (
+    DeadlineExceeded,
+    call_timeout,
+    remaining_time
+)
+
+# Completion timeout used to bound requests made under a deadline
+DEFAULT_COMPLETION_TIMEOUT = 60.0
 
 
 class ProviderType(Enum):
@@ -66,6 +80,8 @@ class AIProviderManager:
         self._provider_registry: Dict[str, ProviderInfo] = {}
         self._active_provider: Optional[str] = None
         self._config: Optional[Config] = None
+        self._usage_observers: List[Callable[[str, CompletionResponse], None]] = []
+        self._model_override: Optional[str] = None
         self._initialized = True
         
         # Register built-in providers
@@ -519,6 +535,11 @@ class AIProviderManager:
         """
         Make a completion request using the specified or active provider.
         
+        Requests go through the provider's circuit breaker: while the
+        provider is failing, a failed response is returned immediately.
+        Under a deadline (see utils.deadline) the request timeout is cut to
+        the time remaining.
+        
         Args:
             request: Completion request
             provider_name: Provider to use (uses active provider if None)
@@ -530,7 +551,89 @@ class AIProviderManager:
             ValueError: If no provider is available
         """
         provider = self.get_provider(provider_name)
-        return provider.make_completion(request)
+        if self._model_override and not request.model:
+            request.model = self._model_override
+        
+        if remaining_time() is not None:
+            try:
+                request.timeout = call_timeout(request.timeout or DEFAULT_COMPLETION_TIMEOUT)
+            except DeadlineExceeded as e:
+                return CompletionResponse(
+                    content="",
+                    model=request.model or "",
+                    usage={},
+                    finish_reason="deadline_exceeded",
+                    success=False,
+                    error_message=str(e)
+                )
+        
+        breaker = get_circuit_breaker(provider_name or self._active_provider or "ai")
+        try:
+            breaker.check()
+        except CircuitOpenError as e:
+            return CompletionResponse(
+                content="",
+                model=request.model or "",
+                usage={},
+                finish_reason="circuit_open",
+                success=False,
+                error_message=str(e)
+            )
+        
+        try:
+            response = provider.make_completion(request)
+        except Exception as e:
+            if is_upstream_failure(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        
+        # Providers report errors in the response rather than raising
+        if not response.success and (response.finish_reason == "connection_error"
+                                     or is_upstream_error_message(response.error_message)):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        
+        if response.success and response.usage:
+            for observer in list(self._usage_observers):
+                try:
+                    observer(provider_name or self._active_provider, response)
+                except Exception as e:
+                    self.logger.debug(f"Usage observer failed: {e}")
+        
+        return response
+    
+    def add_usage_observer(self, observer: Callable[[str, CompletionResponse], None]) -> None:
+        """
+        Register a callback notified with token usage after each successful completion.
+        
+        Args:
+            observer: Callable taking (provider_name, response)
+        """
+        if observer not in self._usage_observers:
+            self._usage_observers.append(observer)
+    
+    def remove_usage_observer(self, observer: Callable[[str, CompletionResponse], None]) -> None:
+        """Unregister a usage observer."""
+        if observer in self._usage_observers:
+            self._usage_observers.remove(observer)
+    
+    def set_model_override(self, model: Optional[str]) -> None:
+        """
+        Use a different model for requests that do not name one.
+        
+        Args:
+            model: Model name, or None to go back to each provider's default
+        """
+        self._model_override = model
+        if model:
+            self.logger.info(f"Completions without an explicit model now use {model}")
+    
+    def get_model_override(self) -> Optional[str]:
+        """Get the model used for requests that do not name one, if overridden."""
+        return self._model_override
     
     def get_provider_status(self) -> Dict[str, Any]:
         """
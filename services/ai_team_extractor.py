@@ -5,27 +5,35 @@ AI-powered team member extraction from ProductHunt pages.
 import logging
 from typing import (
     List,
-    Optional
+    Optional,
+    Union
 )
 import re
 
-import requests
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
 
 from models.data_models import TeamMember
 from services.ai_parser import AIParser
+from services.page_fetcher import PageFetcher, needs_javascript
 from utils.config import Config
+from utils.webdriver_manager import get_webdriver_manager
 
 
 
 logger = logging.getLogger(__name__)
 
+# Markup the team section is read from; without it the page is rendered in a browser
+TEAM_SELECTORS = (
+    "script:-soup-contains('ApolloSSRDataTransport')",
+    "img[src*='avatar']"
+)
+# Elements the browser waits for before the team section is read
+TEAM_WAIT_FOR = (
+    (By.CSS_SELECTOR, "img[src*='avatar']"),
+    (By.CSS_SELECTOR, "a[href*='/@']")
+)
+
 class AITeamExtractor:
     """
     Extract team members from ProductHunt pages using AI.
@@ -43,6 +51,16 @@ class AITeamExtractor:
             
         self.config = config
         
+        # Shared pool of warm WebDriver instances
+        self.webdriver_manager = get_webdriver_manager(config)
+        
+        # HTTP first, escalating to the WebDriver pool when the team is rendered client side
+        self.page_fetcher = PageFetcher(
+            config,
+            webdriver_manager=self.webdriver_manager,
+            service_name="ai_team_extractor"
+        )
+        
         # Initialize AI parser
         try:
             self.ai_parser = AIParser(config)
@@ -51,13 +69,15 @@ class AITeamExtractor:
             logger.error(f"Failed to initialize AI parser: {e}")
             self.ai_parser = None
     
-    def extract_team_from_product_url(self, product_url: str, company_name: str) -> List[TeamMember]:
+    def extract_team_from_product_url(self, product_url: str, company_name: str,
+                                      html: Optional[Union[str, bytes]] = None) -> List[TeamMember]:
         """
         Extract team members from a ProductHunt product URL using AI.
         
         Args:
             product_url: URL of the ProductHunt product page
             company_name: Name of the company
+            html: Page HTML the caller already fetched, reused if it has the team markup
             
         Returns:
             List of TeamMember objects
@@ -68,7 +88,7 @@ class AITeamExtractor:
         
         try:
             # Get raw HTML from the product page
-            raw_html = self._get_product_page_html(product_url)
+            raw_html = self._get_product_page_html(product_url, html)
             if not raw_html:
                 logger.warning(f"Failed to get HTML from {product_url}")
                 return []
@@ -99,70 +119,36 @@ class AITeamExtractor:
             logger.error(f"Error extracting team members: {e}")
             return []
     
-    def _get_product_page_html(self, url: str) -> Optional[str]:
+    def _get_product_page_html(self, url: str, html: Optional[Union[str, bytes]] = None) -> Optional[str]:
         """
         Get the raw HTML from a ProductHunt product page.
         
         Args:
             url: URL of the ProductHunt product page
+            html: Page HTML already fetched over HTTP; fetched again only if it
+                lacks the team markup
             
         Returns:
             Raw HTML content or None if failed
         """
-        # Try with Selenium first for JavaScript-rendered content
-        try:
-            logger.info(f"Getting HTML from {url} using Selenium")
-            
-            # Set up Chrome options
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.set_page_load_timeout(30)
-            
-            try:
-                driver.get(url)
-                
-                # Wait for page to load
-                wait = WebDriverWait(driver, 15)
-                wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                
-                # Get page source
-                html = driver.page_source
-                logger.info(f"Successfully got HTML from {url} using Selenium")
+        if html:
+            if isinstance(html, bytes):
+                html = html.decode('utf-8', errors='replace')
+            reason = needs_javascript(html, TEAM_SELECTORS)
+            if reason is None:
+                logger.debug(f"Reusing fetched HTML for {url}")
                 return html
-                
-            except TimeoutException:
-                logger.warning(f"Selenium timeout for {url}. Trying requests fallback.")
-            except Exception as e:
-                logger.warning(f"Selenium scraping failed for {url}: {e}. Trying requests fallback.")
-            finally:
-                driver.quit()
-        
-        except Exception as e:
-            logger.warning(f"Failed to initialize Selenium: {e}")
+            logger.debug(f"Fetched HTML for {url} is not usable ({reason}), fetching again")
         
-        # Fallback to requests
         try:
-            logger.info(f"Getting HTML from {url} using requests")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-            }
-            
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            logger.info(f"Successfully got HTML from {url} using requests")
-            return response.text
+            html = self.page_fetcher.fetch(
+                url, expected_selectors=TEAM_SELECTORS, wait_for=TEAM_WAIT_FOR, timeout=30
+            )
+            logger.info(f"Successfully got HTML from {url}")
+            return html
             
         except Exception as e:
-            logger.error(f"Both Selenium and requests failed for {url}: {e}")
+            logger.error(f"Both HTTP and Selenium failed for {url}: {e}")
             return None
     
     def _extract_team_section(self, html: str) -> str:
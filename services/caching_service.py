@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
 """
 Caching service for expensive operations with in-memory and persistent caching.
-Provides TTL support, cache invalidation strategies, and cache warming.
+Provides TTL support, stale-while-revalidate refreshes, cache invalidation
+strategies, and cache warming.
 """
 
+import heapq
+import itertools
 import pickle
 import hashlib
 import logging
 import threading
+import time
 from datetime import (
     datetime,
     timedelta
@@ -34,6 +38,16 @@ import fnmatch
 from concurrent.futures import ThreadPoolExecutor
 
 from utils.base_service import BaseService
+from utils.cache_codecs import (
+    CacheCodec,
+    CacheCodecError,
+    get_default_codec
+)
+from utils.shared_store import (
+    SQLiteConnectionPool,
+    create_redis_client,
+    default_shared_path
+)
 
 
 
@@ -48,6 +62,7 @@ class CacheEntry:
     access_count: int = 0
     last_accessed: Optional[datetime] = None
     size_bytes: int = 0
+    stale_at: Optional[datetime] = None
     
     def is_expired(self) -> bool:
         """Check if cache entry has expired."""
@@ -55,6 +70,12 @@ class CacheEntry:
             return False
         return datetime.now() > self.expires_at
     
+    def is_stale(self) -> bool:
+        """Check if cache entry is past its soft TTL and should be revalidated."""
+        if self.stale_at is None:
+            return False
+        return datetime.now() > self.stale_at
+    
     def is_valid(self) -> bool:
         """Check if cache entry is valid (not expired)."""
         return not self.is_expired()
@@ -65,6 +86,42 @@ class CacheEntry:
         self.last_accessed = datetime.now()
 
 
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    return value.timestamp() if value is not None else None
+
+
+def _from_timestamp(value: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value) if value is not None else None
+
+
+def _entry_to_dict(entry: CacheEntry) -> Dict[str, Any]:
+    """Convert a cache entry to plain data for the codec layer."""
+    return {
+        'key': entry.key,
+        'value': entry.value,
+        'created_at': _timestamp(entry.created_at),
+        'expires_at': _timestamp(entry.expires_at),
+        'stale_at': _timestamp(entry.stale_at),
+        'access_count': entry.access_count,
+        'last_accessed': _timestamp(entry.last_accessed),
+        'size_bytes': entry.size_bytes
+    }
+
+
+def _entry_from_dict(data: Dict[str, Any]) -> CacheEntry:
+    """Rebuild a cache entry from plain data produced by _entry_to_dict."""
+    return CacheEntry(
+        key=data['key'],
+        value=data['value'],
+        created_at=_from_timestamp(data['created_at']),
+        expires_at=_from_timestamp(data.get('expires_at')),
+        access_count=data.get('access_count', 0),
+        last_accessed=_from_timestamp(data.get('last_accessed')),
+        size_bytes=data.get('size_bytes', 0),
+        stale_at=_from_timestamp(data.get('stale_at'))
+    )
+
+
 @dataclass
 class CacheStats:
     """Cache statistics for monitoring and optimization."""
@@ -74,6 +131,8 @@ class CacheStats:
     miss_count: int = 0
     eviction_count: int = 0
     expired_count: int = 0
+    stale_hit_count: int = 0
+    refresh_count: int = 0
     
     @property
     def hit_rate(self) -> float:
@@ -213,11 +272,56 @@ class MemoryCacheBackend(CacheBackend):
 class PersistentCacheBackend(CacheBackend):
     """File-based persistent cache backend."""
     
-    def __init__(self, cache_dir: Union[str, Path] = ".cache"):
+    # Written once pickled files from before the codec layer have been converted
+    LEGACY_MIGRATION_MARKER = ".codec-migrated"
+    
+    def __init__(self, cache_dir: Union[str, Path] = ".cache", codec: Optional[CacheCodec] = None,
+                 allow_pickle: bool = False):
+        """
+        Initialize persistent backend.
+        
+        Args:
+            cache_dir: Directory for cache files
+            codec: Codec for cache files (defaults to the shared codec)
+            allow_pickle: Pickle values the plain-data formats cannot store
+                (ignored when a codec is given)
+        """
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.codec = codec or get_default_codec(allow_pickle)
         self.lock = threading.RLock()
         self.logger = logging.getLogger(__name__)
+        self._migrate_legacy_files()
+    
+    def _migrate_legacy_files(self) -> None:
+        """
+        Convert pickled entries written before the codec layer, once per directory.
+        
+        Entries the codec cannot store without pickle are dropped. Afterwards
+        files without a codec header are treated as corrupt, so pickle is
+        never loaded on the read path.
+        """
+        marker = self.cache_dir / self.LEGACY_MIGRATION_MARKER
+        if marker.exists():
+            return
+        
+        migrated = dropped = 0
+        with self.lock:
+            for cache_file in self.cache_dir.glob("*.cache"):
+                try:
+                    data = cache_file.read_bytes()
+                    if CacheCodec.is_encoded(data):
+                        continue
+                    self._write_entry(cache_file, pickle.loads(data))
+                    migrated += 1
+                except Exception as e:
+                    self.logger.debug(f"Dropping legacy cache file {cache_file.name}: {e}")
+                    cache_file.unlink(missing_ok=True)
+                    dropped += 1
+            marker.touch()
+        
+        if migrated or dropped:
+            self.logger.info(f"Migrated {migrated} legacy cache files in {self.cache_dir} ({dropped} dropped)")
     
     def get(self, key: str) -> Optional[CacheEntry]:
         """Get cache entry from file."""
@@ -228,14 +332,12 @@ class PersistentCacheBackend(CacheBackend):
                 return None
             
             try:
-                with open(cache_file, 'rb') as f:
-                    entry = pickle.load(f)
+                entry = self._read_entry(cache_file)
                 
                 if entry.is_valid():
                     entry.touch()
                     # Update file with new access metadata
-                    with open(cache_file, 'wb') as f:
-                        pickle.dump(entry, f)
+                    self._write_entry(cache_file, entry)
                     return entry
                 else:
                     # Remove expired file
@@ -253,13 +355,23 @@ class PersistentCacheBackend(CacheBackend):
         
         with self.lock:
             try:
-                with open(cache_file, 'wb') as f:
-                    pickle.dump(entry, f)
+                self._write_entry(cache_file, entry)
                 return True
+            except CacheCodecError as e:
+                self.logger.warning(f"Not persisting cache entry {key}: {e}")
+                return False
             except Exception as e:
                 self.logger.error(f"Failed to save cache entry {key}: {e}")
                 return False
     
+    def _read_entry(self, cache_file: Path) -> CacheEntry:
+        """Read and decode a cache entry file."""
+        return _entry_from_dict(self.codec.decode(cache_file.read_bytes()))
+    
+    def _write_entry(self, cache_file: Path, entry: CacheEntry) -> None:
+        """Encode and write a cache entry file."""
+        cache_file.write_bytes(self.codec.encode(_entry_to_dict(entry)))
+    
     def delete(self, key: str) -> bool:
         """Delete cache entry file."""
         cache_file = self._get_cache_file(key)
@@ -302,6 +414,279 @@ class PersistentCacheBackend(CacheBackend):
         return self.cache_dir / f"{filename}.cache"
 
 
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Cache backend shared by all processes on one host.
+    
+    Entries live in a SQLite database on a shared-memory filesystem
+    (/dev/shm when available), so a value cached by one CLI/GUI process is
+    immediately visible to the others. Only plain data is stored; values
+    that would need pickle stay in the local tiers.
+    """
+    
+    def __init__(self, db_path: Optional[Union[str, Path]] = None, codec: Optional[CacheCodec] = None):
+        self.pool = SQLiteConnectionPool(db_path or default_shared_path("prospectai-cache.db"))
+        # Entries are written by other processes, so they are never unpickled
+        self.codec = (codec or get_default_codec()).without_pickle()
+        self.logger = logging.getLogger(__name__)
+        self.pool.connection().execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "key TEXT PRIMARY KEY, data BLOB NOT NULL, expires_at REAL)"
+        )
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get cache entry by key."""
+        try:
+            row = self.pool.connection().execute(
+                "SELECT data, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            data, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                self.delete(key)
+                return None
+            
+            entry = _entry_from_dict(self.codec.decode(data))
+            entry.touch()
+            return entry
+        except Exception as e:
+            self.logger.warning(f"Failed to load shared cache entry {key}: {e}")
+            return None
+    
+    def set(self, key: str, entry: CacheEntry) -> bool:
+        """Set cache entry."""
+        try:
+            self.pool.connection().execute(
+                "INSERT OR REPLACE INTO cache_entries (key, data, expires_at) VALUES (?, ?, ?)",
+                (key, self.codec.encode(_entry_to_dict(entry)), _timestamp(entry.expires_at))
+            )
+            return True
+        except CacheCodecError as e:
+            self.logger.debug(f"Not storing {key} in shared cache: {e}")
+            return False
+        except Exception as e:
+            self.logger.error(f"Failed to save shared cache entry {key}: {e}")
+            return False
+    
+    def delete(self, key: str) -> bool:
+        """Delete cache entry."""
+        cursor = self.pool.connection().execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+        return cursor.rowcount > 0
+    
+    def clear(self) -> bool:
+        """Clear all cache entries."""
+        try:
+            self.pool.connection().execute("DELETE FROM cache_entries")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to clear shared cache: {e}")
+            return False
+    
+    def keys(self) -> List[str]:
+        """Get all unexpired cache keys."""
+        rows = self.pool.connection().execute(
+            "SELECT key FROM cache_entries WHERE expires_at IS NULL OR expires_at > ?",
+            (time.time(),)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache backend on a Redis-protocol server, shared across processes and hosts.
+    
+    Like SQLiteCacheBackend, it only stores plain data and never unpickles.
+    
+    Use a ``memory://name`` URL for the in-process stand-in in tests.
+    """
+    
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "prospectai:cache:",
+                 client=None, codec: Optional[CacheCodec] = None):
+        self.client = client or create_redis_client(url)
+        self.prefix = prefix
+        # Entries are written by other processes, so they are never unpickled
+        self.codec = (codec or get_default_codec()).without_pickle()
+        self.logger = logging.getLogger(__name__)
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get cache entry by key."""
+        try:
+            data = self.client.get(self.prefix + key)
+            if data is None:
+                return None
+            
+            entry = _entry_from_dict(self.codec.decode(data))
+            if entry.is_expired():
+                return None
+            entry.touch()
+            return entry
+        except Exception as e:
+            self.logger.warning(f"Failed to load shared cache entry {key}: {e}")
+            return None
+    
+    def set(self, key: str, entry: CacheEntry) -> bool:
+        """Set cache entry, letting the server expire it at the hard TTL."""
+        try:
+            px = None
+            if entry.expires_at is not None:
+                px = int((entry.expires_at - datetime.now()).total_seconds() * 1000)
+                if px <= 0:
+                    return True
+            self.client.set(self.prefix + key, self.codec.encode(_entry_to_dict(entry)), px=px)
+            return True
+        except CacheCodecError as e:
+            self.logger.debug(f"Not storing {key} in shared cache: {e}")
+            return False
+        except Exception as e:
+            self.logger.error(f"Failed to save shared cache entry {key}: {e}")
+            return False
+    
+    def delete(self, key: str) -> bool:
+        """Delete cache entry."""
+        return self.client.delete(self.prefix + key) > 0
+    
+    def clear(self) -> bool:
+        """Clear all cache entries under this backend's prefix."""
+        try:
+            names = list(self.client.scan_iter(match=self.prefix + "*"))
+            if names:
+                self.client.delete(*names)
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to clear shared cache: {e}")
+            return False
+    
+    def keys(self) -> List[str]:
+        """Get all cache keys under this backend's prefix."""
+        keys = []
+        for name in self.client.scan_iter(match=self.prefix + "*"):
+            if isinstance(name, bytes):
+                name = name.decode('utf-8')
+            keys.append(name[len(self.prefix):])
+        return keys
+
+
+def create_shared_backend(url: str, codec: Optional[CacheCodec] = None) -> CacheBackend:
+    """
+    Create a cross-process cache backend from a URL.
+    
+    Args:
+        url: ``sqlite:///path/to/file.db``, ``sqlite://`` (default shared-memory
+             file), ``redis://...`` or ``memory://name``
+        codec: Optional codec for stored entries
+        
+    Returns:
+        Cache backend instance
+    """
+    if url.startswith("sqlite://"):
+        path = url[len("sqlite://"):]
+        return SQLiteCacheBackend(path or None, codec=codec)
+    return RedisCacheBackend(url, codec=codec)
+
+
+class CacheRefreshScheduler:
+    """Background scheduler that runs recurring cache refresh jobs."""
+    
+    def __init__(self, name: str = "cache-refresh-scheduler"):
+        self.name = name
+        self._jobs: List[tuple] = []
+        self._intervals: Dict[str, float] = {}
+        # Token of each job's current heap entry; entries with another token are stale
+        self._tokens: Dict[str, int] = {}
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self.logger = logging.getLogger(__name__)
+    
+    def schedule(self, job_id: str, callback: Callable[[], None], interval: float,
+                 run_immediately: bool = False) -> None:
+        """
+        Schedule a recurring job, replacing any existing job with the same id.
+        
+        Args:
+            job_id: Unique job identifier
+            callback: Function to call on every run
+            interval: Seconds between runs
+            run_immediately: Run the first time now instead of after one interval
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        
+        with self._condition:
+            self._intervals[job_id] = interval
+            token = next(self._counter)
+            self._tokens[job_id] = token
+            first_run = time.monotonic() + (0 if run_immediately else interval)
+            heapq.heappush(self._jobs, (first_run, token, job_id, callback))
+            self._ensure_running()
+            self._condition.notify()
+    
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a scheduled job. Returns True if the job was scheduled."""
+        with self._condition:
+            self._tokens.pop(job_id, None)
+            return self._intervals.pop(job_id, None) is not None
+    
+    def scheduled_jobs(self) -> List[str]:
+        """Get ids of all scheduled jobs."""
+        with self._condition:
+            return list(self._intervals.keys())
+    
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the scheduler thread and drop all jobs."""
+        with self._condition:
+            self._running = False
+            self._jobs.clear()
+            self._intervals.clear()
+            self._tokens.clear()
+            self._condition.notify_all()
+        
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+    
+    def _ensure_running(self) -> None:
+        """Start the scheduler thread lazily (caller holds the condition)."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+    
+    def _run(self) -> None:
+        """Scheduler loop: sleep until the next job is due, run it, reschedule it."""
+        while True:
+            with self._condition:
+                while self._running and not self._jobs:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                
+                run_at, token, job_id, callback = self._jobs[0]
+                delay = run_at - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(timeout=delay)
+                    continue
+                
+                heapq.heappop(self._jobs)
+                if self._tokens.get(job_id) != token:
+                    # Job was cancelled or rescheduled
+                    continue
+                token = next(self._counter)
+                self._tokens[job_id] = token
+                heapq.heappush(
+                    self._jobs,
+                    (time.monotonic() + self._intervals[job_id], token, job_id, callback)
+                )
+            
+            try:
+                callback()
+            except Exception as e:
+                self.logger.warning(f"Scheduled cache refresh '{job_id}' failed: {e}")
+
+
 class CachingService(BaseService):
     """
     Comprehensive caching service with multiple backends and advanced features.
@@ -309,7 +694,9 @@ class CachingService(BaseService):
     
     def __init__(self, config, memory_backend: bool = True, persistent_backend: bool = True,
                  max_memory_entries: int = 1000, max_memory_mb: int = 100,
-                 cache_dir: Union[str, Path] = ".cache"):
+                 cache_dir: Union[str, Path] = ".cache", codec: Optional[CacheCodec] = None,
+                 shared_backend: Optional[Union[str, CacheBackend]] = None,
+                 allow_pickle: bool = False):
         """
         Initialize caching service.
         
@@ -320,6 +707,12 @@ class CachingService(BaseService):
             max_memory_entries: Maximum entries in memory cache
             max_memory_mb: Maximum memory usage in MB
             cache_dir: Directory for persistent cache files
+            codec: Codec for persistent cache files (defaults to the shared codec)
+            shared_backend: Cross-process backend instance or URL (see
+                create_shared_backend); defaults to config.shared_cache_url
+            allow_pickle: Pickle values the plain-data formats cannot store in
+                the persistent tier. Only for caches whose files nobody else
+                can write; the shared tier never uses pickle.
         """
         # Store initialization parameters
         self.memory_backend = memory_backend
@@ -327,6 +720,12 @@ class CachingService(BaseService):
         self.max_memory_entries = max_memory_entries
         self.max_memory_mb = max_memory_mb
         self.cache_dir = cache_dir
+        self.codec = codec
+        self.allow_pickle = allow_pickle
+        
+        if shared_backend is None:
+            shared_backend = getattr(config, 'shared_cache_url', None)
+        self.shared_backend = shared_backend if isinstance(shared_backend, (str, CacheBackend)) else None
         
         super().__init__(config)
     
@@ -335,6 +734,11 @@ class CachingService(BaseService):
         self.backends: Dict[str, CacheBackend] = {}
         self.stats = CacheStats()
         self.warming_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-warmer")
+        self.refresh_scheduler = CacheRefreshScheduler()
+        
+        # Keys with a background revalidation in flight (one refresher per key)
+        self._refreshing: set = set()
+        self._refresh_lock = threading.Lock()
         
         # Initialize backends
         if self.memory_backend:
@@ -343,25 +747,57 @@ class CachingService(BaseService):
                 max_memory_mb=self.max_memory_mb
             )
         
+        if self.shared_backend is not None:
+            try:
+                if isinstance(self.shared_backend, str):
+                    self.backends['shared'] = create_shared_backend(self.shared_backend, codec=self.codec)
+                else:
+                    self.backends['shared'] = self.shared_backend
+            except Exception as e:
+                self.logger.warning(f"Shared cache backend unavailable, continuing without it: {e}")
+        
         if self.persistent_backend:
-            self.backends['persistent'] = PersistentCacheBackend(self.cache_dir)
+            self.backends['persistent'] = PersistentCacheBackend(
+                self.cache_dir, codec=self.codec, allow_pickle=self.allow_pickle
+            )
         
-        # Default backend priority (memory first, then persistent)
+        # Default backend priority (memory first, then shared, then persistent)
         self.backend_priority = ['memory', 'persistent']
+        if 'shared' in self.backends:
+            self.backend_priority.insert(1, 'shared')
         
         self.logger.info(f"Initialized caching service with backends: {list(self.backends.keys())}")
     
-    def get(self, key: str, default: Any = None) -> Any:
+    def get(self, key: str, default: Any = None,
+            refresh: Optional[Callable[[], Any]] = None) -> Any:
         """
         Get cached value by key.
         
+        Entries past their soft TTL are still returned. If a refresh function
+        is given, a single background worker regenerates the value with the
+        entry's original TTLs while callers keep receiving the stale value.
+        
         Args:
             key: Cache key
             default: Default value if not found
+            refresh: Optional function used to revalidate stale entries
             
         Returns:
             Cached value or default
         """
+        entry = self._get_entry(key)
+        if entry is None:
+            return default
+        
+        if entry.is_stale():
+            self.stats.stale_hit_count += 1
+            if refresh is not None:
+                self._schedule_revalidation(key, refresh, entry)
+        
+        return entry.value
+    
+    def _get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Look up a cache entry across backends, promoting it to memory on hit."""
         cache_key = self._normalize_key(key)
         
         # Try backends in priority order
@@ -380,21 +816,23 @@ class CachingService(BaseService):
                 if backend_name != self.backend_priority[0] and 'memory' in self.backends:
                     self.backends['memory'].set(cache_key, entry)
                 
-                return entry.value
+                return entry
         
         # Cache miss
         self.stats.miss_count += 1
         self.logger.debug(f"Cache miss for key '{key}'")
-        return default
+        return None
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None,
+            soft_ttl: Optional[int] = None) -> bool:
         """
         Set cached value.
         
         Args:
             key: Cache key
             value: Value to cache
-            ttl: Time to live in seconds
+            ttl: Time to live in seconds (hard TTL, entry is dropped afterwards)
+            soft_ttl: Seconds after which the entry is served stale and revalidated
             
         Returns:
             True if successfully cached
@@ -402,15 +840,21 @@ class CachingService(BaseService):
         cache_key = self._normalize_key(key)
         
         # Create cache entry
+        now = datetime.now()
         expires_at = None
         if ttl is not None:
-            expires_at = datetime.now() + timedelta(seconds=ttl)
+            expires_at = now + timedelta(seconds=ttl)
+        
+        stale_at = None
+        if soft_ttl is not None and (ttl is None or soft_ttl < ttl):
+            stale_at = now + timedelta(seconds=soft_ttl)
         
         entry = CacheEntry(
             key=cache_key,
             value=value,
-            created_at=datetime.now(),
-            expires_at=expires_at
+            created_at=now,
+            expires_at=expires_at,
+            stale_at=stale_at
         )
         
         # Store in all available backends
@@ -487,39 +931,121 @@ class CachingService(BaseService):
         
         return success
     
-    def get_or_set(self, key: str, factory: Callable[[], Any], ttl: Optional[int] = None) -> Any:
+    def get_or_set(self, key: str, factory: Callable[[], Any], ttl: Optional[int] = None,
+                   soft_ttl: Optional[int] = None) -> Any:
         """
         Get cached value or set it using factory function.
         
+        With a soft TTL, stale values are returned immediately and refreshed
+        in the background; callers only block on the factory once the hard
+        TTL has passed.
+        
         Args:
             key: Cache key
             factory: Function to generate value if not cached
-            ttl: Time to live in seconds
+            ttl: Time to live in seconds (hard TTL)
+            soft_ttl: Seconds after which the value is revalidated in the background
             
         Returns:
             Cached or newly generated value
         """
         # Try to get from cache first
-        cached_value = self.get(key)
+        cached_value = self.get(key, refresh=factory)
         if cached_value is not None:
             return cached_value
         
         # Generate new value
         try:
             new_value = factory()
-            self.set(key, new_value, ttl)
+            self.set(key, new_value, ttl, soft_ttl=soft_ttl)
             return new_value
         except Exception as e:
             self.logger.error(f"Error generating value for key '{key}': {e}")
             raise
     
+    def _schedule_revalidation(self, key: str, factory: Callable[[], Any],
+                               entry: CacheEntry) -> bool:
+        """
+        Refresh a stale entry in the background, at most once per key at a time.
+        
+        Returns:
+            True if a refresh was submitted, False if one is already running
+        """
+        cache_key = self._normalize_key(key)
+        with self._refresh_lock:
+            if cache_key in self._refreshing:
+                return False
+            self._refreshing.add(cache_key)
+        
+        # Reuse the TTL windows the entry was originally stored with
+        ttl = soft_ttl = None
+        if entry.expires_at is not None:
+            ttl = max(1, int((entry.expires_at - entry.created_at).total_seconds()))
+        if entry.stale_at is not None:
+            soft_ttl = max(1, int((entry.stale_at - entry.created_at).total_seconds()))
+        
+        try:
+            self.warming_executor.submit(self._revalidate_key, key, factory, ttl, soft_ttl)
+        except RuntimeError:
+            # Executor already shut down
+            with self._refresh_lock:
+                self._refreshing.discard(cache_key)
+            return False
+        
+        self.logger.debug(f"Scheduled background refresh for stale key '{key}'")
+        return True
+    
+    def _revalidate_key(self, key: str, factory: Callable[[], Any],
+                        ttl: Optional[int], soft_ttl: Optional[int]):
+        """Regenerate a stale key; keeps serving the stale value if the factory fails."""
+        cache_key = self._normalize_key(key)
+        try:
+            value = factory()
+            if value is not None:
+                self.set(key, value, ttl, soft_ttl=soft_ttl)
+                self.stats.refresh_count += 1
+        except Exception as e:
+            self.logger.warning(f"Background refresh failed for key '{key}': {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(cache_key)
+    
+    def schedule_refresh(self, key: str, factory: Callable[[], Any], interval: float,
+                         ttl: Optional[int] = None, soft_ttl: Optional[int] = None,
+                         run_immediately: bool = False) -> None:
+        """
+        Refresh a key periodically on the background scheduler.
+        
+        Args:
+            key: Cache key
+            factory: Function to generate the value
+            interval: Seconds between refreshes
+            ttl: Time to live in seconds for refreshed values
+            soft_ttl: Soft TTL in seconds for refreshed values
+            run_immediately: Refresh once right away
+        """
+        def refresh_job():
+            self.warming_executor.submit(self._warm_single_key, key, factory, ttl, soft_ttl)
+        
+        self.refresh_scheduler.schedule(
+            self._normalize_key(key), refresh_job, interval, run_immediately=run_immediately
+        )
+        self.logger.debug(f"Scheduled refresh for key '{key}' every {interval}s")
+    
+    def cancel_refresh(self, key: str) -> bool:
+        """Cancel a scheduled refresh for a key."""
+        return self.refresh_scheduler.cancel(self._normalize_key(key))
+    
     def warm_cache(self, warming_config: Dict[str, Dict[str, Any]]):
         """
         Warm cache with frequently accessed data.
         
         Args:
             warming_config: Dict mapping cache keys to warming configuration
-                          Format: {key: {'factory': callable, 'ttl': int, 'priority': int}}
+                          Format: {key: {'factory': callable, 'ttl': int, 'priority': int,
+                                         'soft_ttl': int, 'refresh_interval': float}}
+                          Keys with a refresh_interval are kept warm by the
+                          background scheduler after the initial warm-up.
         """
         self.logger.info(f"Starting cache warming for {len(warming_config)} keys")
         
@@ -538,9 +1064,19 @@ class CachingService(BaseService):
                 self._warm_single_key,
                 key,
                 config['factory'],
-                config.get('ttl')
+                config.get('ttl'),
+                config.get('soft_ttl')
             )
             futures.append((key, future))
+            
+            if config.get('refresh_interval'):
+                self.schedule_refresh(
+                    key,
+                    config['factory'],
+                    config['refresh_interval'],
+                    ttl=config.get('ttl'),
+                    soft_ttl=config.get('soft_ttl')
+                )
         
         # Wait for completion and log results
         warmed_count = 0
@@ -554,11 +1090,12 @@ class CachingService(BaseService):
         
         self.logger.info(f"Cache warming completed: {warmed_count}/{len(warming_config)} keys warmed")
     
-    def _warm_single_key(self, key: str, factory: Callable[[], Any], ttl: Optional[int]):
+    def _warm_single_key(self, key: str, factory: Callable[[], Any], ttl: Optional[int],
+                         soft_ttl: Optional[int] = None):
         """Warm a single cache key."""
         try:
             value = factory()
-            self.set(key, value, ttl)
+            self.set(key, value, ttl, soft_ttl=soft_ttl)
         except Exception as e:
             self.logger.error(f"Error warming cache key '{key}': {e}")
             raise
@@ -645,4 +1182,5 @@ class CachingService(BaseService):
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - cleanup resources."""
+        self.refresh_scheduler.shutdown()
         self.warming_executor.shutdown(wait=True)
@@ -0,0 +1,207 @@
+"""
+Single-pass element index for ProductHunt pages.
+
+ProductHuntScraper tries several extraction strategies on the same page
+(product links, class-name patterns, team keywords, LinkedIn links, the page
+text), and each used to re-walk the whole tree with find_all and a regex.
+DomIndex walks the parsed document once, records everything those
+strategies look for, and answers their queries from the recorded lists.
+
+Pages are parsed with lxml when it is installed, which is several times
+faster than the pure Python html.parser on ProductHunt's large pages.
+"""
+
+import re
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+
+from bs4 import BeautifulSoup
+from bs4.element import (
+    NavigableString,
+    Tag
+)
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# Class-name keywords the extraction strategies select on
+CLASS_KEYWORDS = ('product', 'item', 'team', 'maker', 'creator')
+
+TEAM_TEXT_PATTERN = re.compile(r'team|maker|creator|founder|co-founder', re.I)
+TEAM_DATA_TEST_PATTERN = re.compile(r'team|maker', re.I)
+LINKEDIN_TEXT_PATTERN = re.compile(r'linkedin', re.I)
+EXTERNAL_LINK_PATTERN = re.compile(r'^https?://(?!.*producthunt\.com)')
+
+# Tags a team keyword's surrounding section is taken from
+SECTION_TAGS = ('div', 'section', 'article')
+
+
+def parse_html(markup: Union[str, bytes]) -> BeautifulSoup:
+    """
+    Parse HTML with the fastest available parser.
+    
+    Args:
+        markup: Page HTML
+    
+    Returns:
+        BeautifulSoup document
+    """
+    return BeautifulSoup(markup, HTML_PARSER)
+
+
+class DomIndex:
+    """
+    Elements of one document, collected in a single traversal.
+    
+    All lists are in document order, matching what find_all would return.
+    """
+    
+    def __init__(self, soup: BeautifulSoup):
+        """
+        Index a parsed document.
+        
+        Args:
+            soup: Parsed page
+        """
+        self.soup = soup
+        self.links: List[Tag] = []
+        self.class_matches: List[Tuple[Tag, FrozenSet[str]]] = []
+        self.team_data_test: List[Tag] = []
+        self.team_strings: List[NavigableString] = []
+        self.linkedin_text_sections: List[Tag] = []
+        self._texts: Dict[Tuple[str, bool], str] = {}
+        self._team_sections: Optional[List[Tag]] = None
+        self._build()
+    
+    @classmethod
+    def of(cls, soup: BeautifulSoup) -> 'DomIndex':
+        """
+        Get the index for a document, building it on first use.
+        
+        The index is kept on the soup itself so every strategy run against
+        the same page shares one traversal.
+        
+        Args:
+            soup: Parsed page
+        
+        Returns:
+            DomIndex for the document
+        """
+        # Tag.__getattr__ turns unknown attributes into a tree search, so go through __dict__
+        index = soup.__dict__.get('_dom_index')
+        if index is None:
+            index = cls(soup)
+            soup.__dict__['_dom_index'] = index
+        return index
+    
+    def _build(self):
+        """Walk the document once and record every element the strategies query."""
+        for node in self.soup.descendants:
+            if isinstance(node, Tag):
+                if node.name == 'a' and node.get('href') is not None:
+                    self.links.append(node)
+                
+                classes = node.get('class')
+                if classes:
+                    class_text = (' '.join(classes) if isinstance(classes, list) else classes).lower()
+                    keywords = frozenset(k for k in CLASS_KEYWORDS if k in class_text)
+                    if keywords:
+                        self.class_matches.append((node, keywords))
+                
+                if node.name == 'div':
+                    data_test = node.get('data-test')
+                    if data_test and TEAM_DATA_TEST_PATTERN.search(data_test):
+                        self.team_data_test.append(node)
+                
+                if node.name in ('div', 'section'):
+                    # Same rule as find_all(string=...): only tags with a single string child
+                    text = node.string
+                    if text is not None and LINKEDIN_TEXT_PATTERN.search(text):
+                        self.linkedin_text_sections.append(node)
+            elif isinstance(node, NavigableString) and TEAM_TEXT_PATTERN.search(node):
+                self.team_strings.append(node)
+    
+    def with_class(self, keywords: Iterable[str], names: Iterable[str]) -> List[Tag]:
+        """
+        Get elements whose class contains any of the keywords.
+        
+        Args:
+            keywords: Keywords from CLASS_KEYWORDS
+            names: Tag names to include
+        
+        Returns:
+            Matching elements
+        """
+        keywords = frozenset(keywords)
+        names = frozenset(names)
+        return [node for node, matched in self.class_matches
+                if node.name in names and matched & keywords]
+    
+    def links_containing(self, fragment: str, ignore_case: bool = False) -> List[Tag]:
+        """
+        Get links whose href contains a fragment.
+        
+        Args:
+            fragment: Substring to look for
+            ignore_case: Compare case-insensitively
+        
+        Returns:
+            Matching <a> elements
+        """
+        if ignore_case:
+            fragment = fragment.lower()
+            return [link for link in self.links if fragment in link['href'].lower()]
+        return [link for link in self.links if fragment in link['href']]
+    
+    def external_links(self) -> List[Tag]:
+        """Get absolute links that point away from ProductHunt."""
+        return [link for link in self.links if EXTERNAL_LINK_PATTERN.search(link['href'])]
+    
+    def team_sections(self) -> List[Tag]:
+        """
+        Get the sections around strings that mention the team.
+        
+        Returns:
+            Nearest div, section or article around each team keyword, without duplicates
+        """
+        if self._team_sections is None:
+            sections = []
+            seen = set()
+            for text in self.team_strings:
+                parent = text.parent
+                while parent is not None and parent.name not in SECTION_TAGS:
+                    parent = parent.parent
+                if parent is not None and id(parent) not in seen:
+                    seen.add(id(parent))
+                    sections.append(parent)
+            self._team_sections = sections
+        return self._team_sections
+    
+    def get_text(self, separator: str = '', strip: bool = False) -> str:
+        """
+        Get the document text, computed once per separator.
+        
+        Args:
+            separator: String joining text fragments
+            strip: Strip whitespace from each fragment
+        
+        Returns:
+            Page text
+        """
+        key = (separator, strip)
+        if key not in self._texts:
+            self._texts[key] = self.soup.get_text(separator=separator, strip=strip)
+        return self._texts[key]
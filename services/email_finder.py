@@ -3,6 +3,11 @@ Hunter.io email finder service for discovering and verifying email addresses."""
 
 import time
 import logging
+from dataclasses import asdict
+from datetime import (
+    datetime,
+    timedelta
+)
 from typing import (
     List,
     Optional,
@@ -28,6 +33,9 @@ from utils.error_handling import (
 )
 from utils.api_monitor import get_api_monitor
 from utils.rate_limiting import wait_for_service, get_rate_limiter
+from utils.http_client import create_session
+from services.caching_service import CachingService
+from services.negative_cache import get_negative_cache, NegativeReason
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +52,9 @@ class EmailFinder:
     - Error handling for API failures and rate limits
     """
     
+    # Found emails are shared with other processes for a week
+    PERSON_EMAIL_CACHE_TTL = 7 * 24 * 3600
+    
     def __init__(self, config: Optional[Config] = None):
         """
         Initialize the EmailFinder with Hunter.io API configuration.
@@ -69,12 +80,22 @@ class EmailFinder:
         # Initialize centralized rate limiting service
         self.rate_limiter = get_rate_limiter(self.config)
         
-        # HTTP session for requests
-        self.session = requests.Session()
-        self.session.headers.update({
+        # HTTP session on the shared connection pools, failing fast while Hunter.io is down
+        self.session = create_session(self.config, headers={
             'User-Agent': 'JobProspectAutomation/1.0'
         })
         
+        # Hunter results shared with other processes when a shared cache is configured
+        self.result_cache = None
+        shared_cache_url = getattr(self.config, 'shared_cache_url', None)
+        if isinstance(shared_cache_url, str) and shared_cache_url:
+            self.result_cache = CachingService(
+                self.config, persistent_backend=False, shared_backend=shared_cache_url
+            )
+        
+        # Lookups known to come back empty are skipped on later runs
+        self.negative_cache = get_negative_cache(self.config)
+        
         logger.info(f"EmailFinder initialized with Hunter.io API (rate limit: {self.config.hunter_requests_per_minute} RPM)")
     
     def test_connection(self) -> bool:
@@ -107,6 +128,69 @@ class EmailFinder:
         except requests.exceptions.RequestException as e:
             raise Exception(f"Hunter.io API connection failed: {str(e)}")
     
+    def get_account_quota(self) -> Dict[str, Any]:
+        """
+        Fetch the Hunter.io credits used and available this period.
+        
+        The counts are also recorded through APIMonitor.update_quota_usage so
+        the error handler's service quotas reflect the live account state.
+        
+        Returns:
+            Dictionary mapping quota type ('searches', 'verifications', or
+            'requests' for single-pool plans) to {'used', 'available'} counts,
+            plus 'reset_time' as a datetime
+            
+        Raises:
+            Exception if the account endpoint cannot be read
+        """
+        wait_for_service("hunter", "account-info")
+        
+        start_time = time.time()
+        url = f"{self.base_url}/account"
+        params = {'api_key': self.api_key}
+        
+        response = self.session.get(url, params=params, timeout=10)
+        self.api_monitor.record_api_call(
+            service='hunter',
+            endpoint='account',
+            response_time=time.time() - start_time,
+            status_code=response.status_code,
+            success=response.status_code < 400
+        )
+        response.raise_for_status()
+        
+        data = response.json().get('data', {})
+        requests_data = data.get('requests', {})
+        
+        try:
+            reset_time = datetime.strptime(data['reset_date'], '%Y-%m-%d')
+        except (KeyError, TypeError, ValueError):
+            reset_time = datetime.now() + timedelta(days=30)
+        
+        quotas: Dict[str, Any] = {}
+        for quota_type in ('searches', 'verifications'):
+            counts = requests_data.get(quota_type)
+            if isinstance(counts, dict) and 'available' in counts:
+                quotas[quota_type] = {
+                    'used': int(counts.get('used', 0)),
+                    'available': int(counts['available'])
+                }
+        
+        # Older plans report a single pool of requests
+        if not quotas and 'available' in requests_data:
+            quotas['requests'] = {
+                'used': int(requests_data.get('used', 0)),
+                'available': int(requests_data['available'])
+            }
+        
+        for quota_type, counts in quotas.items():
+            self.api_monitor.update_quota_usage(
+                'hunter', quota_type, counts['used'], counts['available'], reset_time
+            )
+        
+        quotas['reset_time'] = reset_time
+        return quotas
+    
     @retry_with_backoff(category=ErrorCategory.API_RATE_LIMIT)
     def find_company_emails(self, domain: str) -> List[EmailData]:
         """
@@ -256,7 +340,6 @@ class EmailFinder:
             )
             raise
     
-    @retry_with_backoff(category=ErrorCategory.API_RATE_LIMIT)
     def find_person_email(self, name: str, domain: str) -> Optional[EmailData]:
         """
         Find a specific person's email using Hunter.io email finder.
@@ -277,17 +360,51 @@ class EmailFinder:
             logger.warning("Empty name or domain provided")
             return None
         
+        cache_key = self._person_cache_key(name, domain)
+        if self.result_cache:
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached email for {name} at {domain}")
+                return EmailData(**cached)
+        
+        negative = self.negative_cache.check("hunter-person", cache_key)
+        if negative:
+            logger.info(f"Skipping {name} at {domain} - previous lookup: {negative.reason.value}")
+            return None
+        
+        # Parse name into first and last name
+        if len(name.strip().split()) < 2:
+            logger.warning(f"Name '{name}' doesn't contain first and last name")
+            return None
+        
+        try:
+            return self._lookup_person_email(name, domain, cache_key)
+        except requests.exceptions.HTTPError:
+            raise
+        except requests.exceptions.RequestException as e:
+            # Recorded only once every retry has failed, so retries are not answered from this entry
+            self.negative_cache.record_failure("hunter-person", cache_key, e)
+            raise
+    
+    @retry_with_backoff(category=ErrorCategory.API_RATE_LIMIT)
+    def _lookup_person_email(self, name: str, domain: str, cache_key: str) -> Optional[EmailData]:
+        """
+        Query the Hunter.io email finder for a person, retrying failed calls.
+        
+        Args:
+            name: Person's full name, with first and last name
+            domain: Company domain
+            cache_key: Key the result is cached under
+            
+        Returns:
+            EmailData object if email found, None otherwise
+        """
         # Apply centralized rate limiting for email finder
         wait_for_service("hunter", "email-finder")
         
         start_time = time.time()
         try:
-            # Parse name into first and last name
             name_parts = name.strip().split()
-            if len(name_parts) < 2:
-                logger.warning(f"Name '{name}' doesn't contain first and last name")
-                return None
-            
             first_name = name_parts[0]
             last_name = name_parts[-1]  # Use last part as last name
             
@@ -331,8 +448,11 @@ class EmailFinder:
             
             if email_data:
                 logger.info(f"Found email for {name}: {email_data.email}")
+                if self.result_cache:
+                    self.result_cache.set(cache_key, asdict(email_data), ttl=self.PERSON_EMAIL_CACHE_TTL)
             else:
                 logger.info(f"No email found for {name} at {domain}")
+                self.negative_cache.record("hunter-person", cache_key, NegativeReason.NOT_FOUND)
             
             return email_data
             
@@ -586,6 +706,11 @@ class EmailFinder:
         
         return emails
     
+    @staticmethod
+    def _person_cache_key(name: str, domain: str) -> str:
+        """Build the shared cache key for a person email lookup."""
+        return f"hunter:email-finder:{domain.strip().lower()}:{' '.join(name.lower().split())}"
+    
     def _parse_email_finder_result(self, data: Dict[str, Any]) -> Optional[EmailData]:
         """
         Parse Hunter.io email finder API response into EmailData object.
@@ -658,13 +783,15 @@ class EmailFinder:
             # Return default verification result
             return EmailVerification(email=email, result="unknown")
     
-    def find_and_verify_team_emails(self, team_members: List[TeamMember], domain: str) -> Dict[str, Dict[str, Any]]:
+    def find_and_verify_team_emails(self, team_members: List[TeamMember], domain: str,
+                                    verify: bool = True) -> Dict[str, Dict[str, Any]]:
         """
         Complete workflow to find and verify emails for team members using individual email finder.
         
         Args:
             team_members: List of TeamMember objects
             domain: Company domain
+            verify: Whether to spend verification credits on found emails
             
         Returns:
             Dictionary mapping team member names to their email data and verification results
@@ -686,6 +813,15 @@ class EmailFinder:
                     if email_data:
                         logger.info(f"Found email for {team_member.name}: {email_data.email}")
                         
+                        if not verify:
+                            results[team_member.name] = {
+                                'email_data': email_data,
+                                'verification': None,
+                                'is_deliverable': None,
+                                'confidence_score': email_data.confidence or 0
+                            }
+                            continue
+                        
                         # Verify the found email
                         try:
                             verification = self.verify_email(email_data.email)
@@ -801,45 +937,3 @@ class EmailFinder:
             score += 0.1
         
         return min(score, 1.0)  # Cap at 1.0
-
-
-class RateLimiter:
-    """Rate limiter for Hunter.io API calls."""
-    
-    def __init__(self, requests_per_minute: int = 10):
-        self.requests_per_minute = requests_per_minute
-        self.min_delay = 60.0 / requests_per_minute  # Minimum delay between requests
-        self.last_request_time = 0.0
-        self.request_count = 0
-        self.window_start = time.time()
-    
-    def wait_if_needed(self):
-        """Wait if necessary to respect rate limits."""
-        current_time = time.time()
-        
-        # Reset window if more than a minute has passed
-        if current_time - self.window_start >= 60.0:
-            self.request_count = 0
-            self.window_start = current_time
-        
-        # Increment request count
-        self.request_count += 1
-        
-        # If we've exceeded our rate limit, calculate wait time
-        if self.request_count > self.requests_per_minute:
-            # Calculate time until next window
-            time_until_reset = 60.0 - (current_time - self.window_start)
-            if time_until_reset > 0:
-                logger.info(f"Rate limiting: Hunter.io request limit reached, waiting {time_until_reset:.2f}s until next window")
-                time.sleep(time_until_reset)
-                self.request_count = 1
-                self.window_start = time.time()
-        else:
-            # Apply minimum delay between requests
-            time_since_last = current_time - self.last_request_time
-            if time_since_last < self.min_delay:
-                sleep_time = self.min_delay - time_since_last
-                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s between requests")
-                time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
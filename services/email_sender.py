@@ -24,6 +24,7 @@ import re
 import resend
 
 from utils.config import Config
+from utils.rate_limiting import get_rate_limiter
 
 @dataclass
 class SendResult:
@@ -116,6 +117,7 @@ class EmailSender:
         # Rate limiting
         self.requests_per_minute = config.resend_requests_per_minute
         self.request_times: List[datetime] = []
+        self.rate_limiter = get_rate_limiter(config)
         
         # Statistics tracking
         self.stats = SendingStats()
@@ -582,13 +584,33 @@ class EmailSender:
     def send_bulk_emails(
         self,
         email_list: List[Dict[str, str]],
-        delay_between_emails: float = 1.0
+        delay_between_emails: Optional[float] = None
     ) -> List[SendResult]:
-        """Send multiple emails with rate limiting and delay."""
+        """
+        Send multiple emails, paced by the Resend rate limit.
+        
+        Args:
+            email_list: Emails to send
+            delay_between_emails: Optional minimum seconds between the start of
+                consecutive sends; only the part not already spent sending is waited
+            
+        Returns:
+            List of send results
+        """
         results = []
+        last_send_started = None
         
         for i, email_data in enumerate(email_list):
             try:
+                if delay_between_emails and last_send_started is not None:
+                    remaining = last_send_started + delay_between_emails - time.time()
+                    if remaining > 0:
+                        time.sleep(remaining)
+                    self.rate_limiter.record_avoided_sleep(
+                        "bulk_email_delay", delay_between_emails - max(0.0, remaining)
+                    )
+                last_send_started = time.time()
+                
                 result = self.send_email(
                     recipient_email=email_data["recipient_email"],
                     subject=email_data["subject"],
@@ -598,10 +620,6 @@ class EmailSender:
                     prospect_id=email_data.get("prospect_id")
                 )
                 results.append(result)
-                
-                # Add delay between emails (except for the last one)
-                if i < len(email_list) - 1:
-                    time.sleep(delay_between_emails)
                     
             except Exception as e:
                 self.logger.error(f"Error sending bulk email {i+1}: {str(e)}")
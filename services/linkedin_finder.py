@@ -8,11 +8,16 @@ import time
 import re
 from typing import List, Optional, Dict, Any
 from urllib.parse import quote_plus
+
 import requests
 from bs4 import BeautifulSoup
 
 from models.data_models import TeamMember
 from utils.config import Config
+from utils.rate_limiting import get_rate_limiter
+from utils.http_client import create_session
+from utils.deadline import call_timeout
+from services.negative_cache import get_negative_cache, NegativeReason
 
 logger = logging.getLogger(__name__)
 
@@ -27,18 +32,19 @@ class LinkedInFinder:
         """Initialize the optimized LinkedIn finder."""
         self.config = config or Config.from_env()
         
-        # AGGRESSIVE rate limiting - much faster
-        self.request_delay = 0.5  # Reduced from 2.0 to 0.5 seconds
-        self.last_request_time = 0
+        # Minimum spacing per host; requests are paced by the central scheduler
+        self.request_delay = 0.5
+        self.rate_limiter = get_rate_limiter(self.config)
+        # Profile probes are HEAD requests, paced apart from full profile scraping
+        self.rate_limiter.register("linkedin", "profile-check", min_interval=self.request_delay)
         
-        # Fast HTTP session with shorter timeouts
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Fast HTTP session on the shared connection pools, with per-host circuit breakers
+        self.session = create_session(self.config, headers={
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         
-        # Cache for failed searches to avoid repeating
-        self.failed_searches = set()
+        # Persistent cache of failed searches to avoid repeating them across runs
+        self.negative_cache = get_negative_cache(self.config)
         
         logger.info("Optimized LinkedIn finder initialized - SPEED MODE")
     
@@ -63,16 +69,26 @@ class LinkedInFinder:
                 continue
             
             # Skip if we've already failed to find this person
-            search_key = f"{member.name}_{member.company}".lower()
-            if search_key in self.failed_searches:
-                logger.debug(f"⏭️ Skipping {member.name} - previous search failed")
+            search_key = self._search_key(member)
+            negative = self.negative_cache.check("linkedin-search", search_key)
+            if negative:
+                logger.debug(f"⏭️ Skipping {member.name} - previous search failed ({negative.reason.value})")
                 updated_members.append(member)
                 continue
             
             logger.info(f"🔍 Fast search: {member.name}")
+            search_started = time.time()
             
             # SINGLE FAST STRATEGY - no multiple attempts
-            linkedin_url = self._fast_linkedin_search(member)
+            search_completed = True
+            try:
+                linkedin_url = self._fast_linkedin_search(member)
+            except Exception as e:
+                # Outages and blocks are cached by reason, never as "not found"
+                logger.debug(f"Fast search error for {member.name}: {e}")
+                self.negative_cache.record_failure("linkedin-search", search_key, e)
+                linkedin_url = None
+                search_completed = False
             
             if linkedin_url:
                 logger.info(f"✅ Found: {member.name} -> {linkedin_url}")
@@ -85,11 +101,14 @@ class LinkedInFinder:
                 updated_members.append(updated_member)
             else:
                 logger.warning(f"❌ Not found: {member.name}")
-                self.failed_searches.add(search_key)
+                if search_completed:
+                    self.negative_cache.record("linkedin-search", search_key, NegativeReason.NOT_FOUND)
                 updated_members.append(member)
             
-            # Minimal rate limiting
-            self._fast_wait()
+            # Each request waits for its own host's slot instead of a fixed per-member delay
+            self.rate_limiter.record_avoided_sleep(
+                "linkedin_finder_delay", self.request_delay - (time.time() - search_started)
+            )
         
         found_count = len([m for m in updated_members if m.linkedin_url]) - len([m for m in team_members if m.linkedin_url])
         logger.info(f"🎯 Found {found_count} LinkedIn URLs in FAST mode")
@@ -104,25 +123,36 @@ class LinkedInFinder:
             member: TeamMember object
             
         Returns:
-            LinkedIn URL if found quickly, None otherwise
+            LinkedIn URL if found quickly, None if the search found nothing
+            
+        Raises:
+            requests.exceptions.RequestException: If the search could not run
         """
+        # STRATEGY 1: Direct LinkedIn search (fastest)
+        linkedin_url = self._direct_linkedin_search(member)
+        if linkedin_url:
+            return linkedin_url
+        
+        # STRATEGY 2: Quick Google search (if direct fails)
+        search_error = None
         try:
-            # STRATEGY 1: Direct LinkedIn search (fastest)
-            linkedin_url = self._direct_linkedin_search(member)
-            if linkedin_url:
-                return linkedin_url
-            
-            # STRATEGY 2: Quick Google search (if direct fails)
             linkedin_url = self._quick_google_search(member)
             if linkedin_url:
                 return linkedin_url
-            
-            # STRATEGY 3: Generate likely LinkedIn URL (instant fallback)
-            return self._generate_likely_linkedin_url(member)
-            
-        except Exception as e:
-            logger.debug(f"Fast search error for {member.name}: {e}")
-            return None
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Quick Google search error: {e}")
+            search_error = e
+        
+        # STRATEGY 3: Generate likely LinkedIn URL (instant fallback)
+        linkedin_url = self._generate_likely_linkedin_url(member)
+        if linkedin_url is None and search_error is not None:
+            # Nothing found because the search failed, not because there is no profile
+            raise search_error
+        return linkedin_url
+    
+    def _search_key(self, member: TeamMember) -> str:
+        """Build the negative cache key for a team member search."""
+        return f"{member.name}_{member.company}".lower()
     
     def _direct_linkedin_search(self, member: TeamMember) -> Optional[str]:
         """
@@ -175,33 +205,35 @@ class LinkedInFinder:
             member: TeamMember object
             
         Returns:
-            LinkedIn URL if found quickly, None otherwise
-        """
-        try:
-            # Single optimized search query
-            query = f'"{member.name}" {member.company} site:linkedin.com/in'
-            search_url = f"https://duckduckgo.com/html/?q={quote_plus(query)}"
-            
-            # FAST request with short timeout
-            response = self.session.get(search_url, timeout=3)
-            if response.status_code != 200:
-                return None
+            LinkedIn URL if found quickly, None if the results had none
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for first LinkedIn URL
-            linkedin_links = soup.find_all('a', href=re.compile(r'linkedin\.com/in/', re.I))
-            
-            for link in linkedin_links[:3]:  # Check only first 3 results
-                href = link.get('href', '')
-                if self._is_valid_linkedin_url(href):
-                    return self._clean_linkedin_url(href)
-            
-            return None
-            
-        except Exception as e:
-            logger.debug(f"Quick Google search error: {e}")
-            return None
+        Raises:
+            requests.exceptions.RequestException: If the search request failed,
+                including non-200 responses (blocked or rate limited)
+        """
+        # Single optimized search query
+        query = f'"{member.name}" {member.company} site:linkedin.com/in'
+        search_url = f"https://duckduckgo.com/html/?q={quote_plus(query)}"
+        
+        # FAST request with short timeout
+        self.rate_limiter.acquire_url(search_url, min_interval=self.request_delay)
+        response = self.session.get(search_url, timeout=call_timeout(3))
+        if response.status_code != 200:
+            raise requests.exceptions.HTTPError(
+                f"Search returned HTTP {response.status_code}", response=response
+            )
+        
+        soup = BeautifulSoup(response.content, 'html.parser')
+        
+        # Look for first LinkedIn URL
+        linkedin_links = soup.find_all('a', href=re.compile(r'linkedin\.com/in/', re.I))
+        
+        for link in linkedin_links[:3]:  # Check only first 3 results
+            href = link.get('href', '')
+            if self._is_valid_linkedin_url(href):
+                return self._clean_linkedin_url(href)
+        
+        return None
     
     def _generate_likely_linkedin_url(self, member: TeamMember) -> Optional[str]:
         """
@@ -244,7 +276,8 @@ class LinkedInFinder:
             True if URL responds, False otherwise
         """
         try:
-            response = self.session.head(url, timeout=2, allow_redirects=True)
+            self.rate_limiter.acquire("linkedin", "profile-check")
+            response = self.session.head(url, timeout=call_timeout(2), allow_redirects=True)
             return response.status_code in [200, 302, 403]  # 403 often means profile exists but private
         except Exception:
             return False
@@ -271,14 +304,3 @@ class LinkedInFinder:
                 url = 'https://' + url
         
         return url
-    
-    def _fast_wait(self):
-        """Minimal wait for rate limiting."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.request_delay:
-            sleep_time = self.request_delay - time_since_last
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
@@ -8,11 +8,11 @@ import time
 import re
 from typing import List, Optional, Dict, Any
 from urllib.parse import quote_plus
-import requests
 from bs4 import BeautifulSoup
 
 from models.data_models import TeamMember
 from utils.config import Config
+from utils.http_client import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -31,9 +31,8 @@ class LinkedInFinderOptimized:
         self.request_delay = 0.5  # Reduced from 2.0 to 0.5 seconds
         self.last_request_time = 0
         
-        # Fast HTTP session with shorter timeouts
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Fast HTTP session on the shared connection pools
+        self.session = create_session(self.config, headers={
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         
@@ -4,36 +4,72 @@ LinkedIn profile caching service to avoid re-scraping the same profiles.
 This can provide massive performance improvements by caching successful extractions.
 """
 
+import atexit
 import json
 import hashlib
+import os
+import tempfile
+import threading
 import time
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
 from datetime import datetime, timedelta
 
 from models.data_models import LinkedInProfile
 from utils.logging_config import get_logger
+from utils.cache_codecs import (
+    CacheCodec,
+    get_default_codec
+)
 
 
 class LinkedInProfileCache:
     """Cache for LinkedIn profile data to avoid re-scraping."""
     
-    def __init__(self, cache_dir: str = ".cache/linkedin_profiles", cache_ttl_hours: int = 24):
+    CACHE_SUFFIX = ".pcache"
+    LEGACY_SUFFIX = ".json"
+    INDEX_FILE = "profiles.index"
+    # Index changes are written in batches: after this many, or this many seconds
+    INDEX_SAVE_BATCH = 50
+    INDEX_SAVE_INTERVAL = 30.0
+    
+    def __init__(self, cache_dir: str = ".cache/linkedin_profiles", cache_ttl_hours: int = 24,
+                 codec: Optional[CacheCodec] = None, max_memory_cache_size: int = 1000):
         """
         Initialize LinkedIn profile cache.
         
         Args:
             cache_dir: Directory to store cached profiles
             cache_ttl_hours: Time-to-live for cached profiles in hours
+            codec: Codec for cache files (defaults to the shared codec)
+            max_memory_cache_size: Maximum number of decoded profiles kept in memory
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_ttl = timedelta(hours=cache_ttl_hours)
+        self.codec = codec or get_default_codec()
         self.logger = get_logger(__name__)
+        self._lock = threading.RLock()
+        
+        # LRU of decoded profiles: cache_key -> (profile, cached_at timestamp).
+        # Profiles are shared between callers and must be treated as read-only.
+        self.memory_cache: "OrderedDict[str, Tuple[LinkedInProfile, float]]" = OrderedDict()
+        self.max_memory_cache_size = max_memory_cache_size
+        
+        # Hit/miss statistics
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
         
-        # In-memory cache for frequently accessed profiles
-        self.memory_cache: Dict[str, Dict[str, Any]] = {}
-        self.max_memory_cache_size = 100
+        # Index of files on disk: cache_key -> cached_at timestamp. The index
+        # only saves opening files; files it misses are found and added on access.
+        self._index_save_lock = threading.Lock()
+        # Index changes not yet written: cache_key -> cached_at, or None if removed
+        self._index_changes: Dict[str, Optional[float]] = {}
+        self._last_index_save = time.monotonic()
+        self._index: Dict[str, float] = self._load_index()
     
     def _get_cache_key(self, linkedin_url: str) -> str:
         """Generate cache key from LinkedIn URL."""
@@ -43,7 +79,153 @@ class LinkedInProfileCache:
     
     def _get_cache_file(self, cache_key: str) -> Path:
         """Get cache file path for a given cache key."""
-        return self.cache_dir / f"{cache_key}.json"
+        return self.cache_dir / f"{cache_key}{self.CACHE_SUFFIX}"
+    
+    def _get_legacy_cache_file(self, cache_key: str) -> Path:
+        """Get path of an indented JSON cache file written by older versions."""
+        return self.cache_dir / f"{cache_key}{self.LEGACY_SUFFIX}"
+    
+    def _iter_cache_files(self):
+        """Iterate over all cache files, including legacy JSON files."""
+        yield from self.cache_dir.glob(f"*{self.CACHE_SUFFIX}")
+        yield from self.cache_dir.glob(f"*{self.LEGACY_SUFFIX}")
+    
+    def _read_cache_file(self, cache_file: Path) -> Dict[str, Any]:
+        """Read a cache file in either the codec or the legacy JSON format."""
+        if cache_file.suffix == self.LEGACY_SUFFIX:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return self.codec.decode(cache_file.read_bytes())
+    
+    def _write_cache_file(self, cache_key: str, cached_data: Dict[str, Any]) -> None:
+        """Write a cache file with the codec, replacing any legacy JSON file."""
+        self._get_cache_file(cache_key).write_bytes(self.codec.encode(cached_data))
+        self._get_legacy_cache_file(cache_key).unlink(missing_ok=True)
+    
+    def _read_index(self) -> Optional[Dict[str, float]]:
+        """Read the index file (None if it is missing or corrupted)."""
+        index_file = self.cache_dir / self.INDEX_FILE
+        if not index_file.exists():
+            return None
+        try:
+            return dict(self.codec.decode(index_file.read_bytes()))
+        except Exception as e:
+            self.logger.warning(f"Ignoring corrupted LinkedIn cache index: {e}")
+            return None
+    
+    def _load_index(self) -> Dict[str, float]:
+        """Load the on-disk index, rebuilding it from the cache files if needed."""
+        index = self._read_index()
+        if index is not None:
+            return index
+        
+        index = {}
+        for cache_file in self._iter_cache_files():
+            try:
+                cached_data = self._read_cache_file(cache_file)
+                index[cache_file.stem] = datetime.fromisoformat(cached_data['cached_at']).timestamp()
+            except Exception:
+                # Corrupted files are removed on access or by clear_expired_cache
+                continue
+        
+        if index:
+            self._write_index(index)
+        return index
+    
+    def _write_index(self, index: Dict[str, float]) -> None:
+        """
+        Atomically replace the index file.
+        
+        Each writer uses its own temporary file, so concurrent threads or
+        processes never write into one another's half-written file.
+        """
+        index_file = self.cache_dir / self.INDEX_FILE
+        temp_path = None
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f"{self.INDEX_FILE}.", suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self.codec.encode(index))
+            os.replace(temp_path, index_file)
+        except Exception as e:
+            self.logger.warning(f"Failed to save LinkedIn cache index: {e}")
+            if temp_path is not None:
+                Path(temp_path).unlink(missing_ok=True)
+    
+    def _set_index(self, cache_key: str, cached_at: Optional[float]) -> None:
+        """Add (or, with None, remove) an index entry; the change is saved in a later batch."""
+        with self._lock:
+            if cached_at is None:
+                self._index.pop(cache_key, None)
+            else:
+                self._index[cache_key] = cached_at
+            self._index_changes[cache_key] = cached_at
+        self._save_index()
+    
+    def _save_index(self, force: bool = False) -> None:
+        """
+        Write pending index changes once a batch has built up.
+        
+        Changes are merged into the index file as it is on disk, so entries
+        written by other processes sharing the cache directory are kept (and
+        picked up by this one). The file is encoded outside the cache lock.
+        
+        Args:
+            force: Write pending changes now instead of waiting for the batch
+        """
+        with self._lock:
+            if not self._index_changes:
+                return
+            if not force and len(self._index_changes) < self.INDEX_SAVE_BATCH and \
+                    time.monotonic() - self._last_index_save < self.INDEX_SAVE_INTERVAL:
+                return
+            changes, self._index_changes = self._index_changes, {}
+            self._last_index_save = time.monotonic()
+        
+        with self._index_save_lock:
+            index = self._read_index() or {}
+            for cache_key, cached_at in changes.items():
+                if cached_at is None:
+                    index.pop(cache_key, None)
+                else:
+                    index[cache_key] = cached_at
+            self._write_index(index)
+        
+        with self._lock:
+            for cache_key, cached_at in index.items():
+                if cache_key not in self._index_changes:
+                    self._index.setdefault(cache_key, cached_at)
+    
+    def flush_index(self) -> None:
+        """Write any pending index changes."""
+        self._save_index(force=True)
+    
+    def _rewrite_index(self) -> None:
+        """Replace the index file with this instance's index, dropping pending changes."""
+        with self._lock:
+            self._index_changes.clear()
+            self._last_index_save = time.monotonic()
+            index = dict(self._index)
+        with self._index_save_lock:
+            self._write_index(index)
+    
+    def _is_fresh(self, cached_at: float, now: Optional[float] = None) -> bool:
+        """Check whether an entry cached at the given timestamp is within the TTL."""
+        return (now or time.time()) - cached_at < self.cache_ttl.total_seconds()
+    
+    def _remember(self, cache_key: str, profile: LinkedInProfile, cached_at: float) -> None:
+        """Insert a decoded profile into the LRU, evicting the least recently used."""
+        with self._lock:
+            self.memory_cache[cache_key] = (profile, cached_at)
+            self.memory_cache.move_to_end(cache_key)
+            while len(self.memory_cache) > self.max_memory_cache_size:
+                self.memory_cache.popitem(last=False)
+                self.evictions += 1
+    
+    def _forget(self, cache_key: str) -> None:
+        """Drop a key from memory and the index."""
+        with self._lock:
+            self.memory_cache.pop(cache_key, None)
+        self._set_index(cache_key, None)
     
     def get_cached_profile(self, linkedin_url: str) -> Optional[LinkedInProfile]:
         """
@@ -51,50 +233,65 @@ class LinkedInProfileCache:
         
         Args:
             linkedin_url: LinkedIn profile URL
-            
+        
         Returns:
             LinkedInProfile if cached and valid, None otherwise
         """
         cache_key = self._get_cache_key(linkedin_url)
         
         # Check memory cache first
-        if cache_key in self.memory_cache:
-            cached_data = self.memory_cache[cache_key]
-            cached_time = datetime.fromisoformat(cached_data['cached_at'])
-            
-            if datetime.now() - cached_time < self.cache_ttl:
-                self.logger.debug(f"Found profile in memory cache: {linkedin_url}")
-                return LinkedInProfile.from_dict(cached_data['profile'])
-            else:
+        with self._lock:
+            cached = self.memory_cache.get(cache_key)
+            if cached is not None:
+                profile, cached_at = cached
+                if self._is_fresh(cached_at):
+                    self.memory_cache.move_to_end(cache_key)
+                    self.memory_hits += 1
+                    self.logger.debug(f"Found profile in memory cache: {linkedin_url}")
+                    return profile
                 # Remove expired entry from memory cache
                 del self.memory_cache[cache_key]
         
         # Check file cache
         cache_file = self._get_cache_file(cache_key)
+        if not cache_file.exists():
+            cache_file = self._get_legacy_cache_file(cache_key)
         if cache_file.exists():
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
+                cached_data = self._read_cache_file(cache_file)
                 
-                cached_time = datetime.fromisoformat(cached_data['cached_at'])
+                cached_at = datetime.fromisoformat(cached_data['cached_at']).timestamp()
                 
-                if datetime.now() - cached_time < self.cache_ttl:
-                    # Add to memory cache for faster future access
-                    if len(self.memory_cache) < self.max_memory_cache_size:
-                        self.memory_cache[cache_key] = cached_data
+                if self._is_fresh(cached_at):
+                    # Migrate legacy JSON files to the compact format
+                    if cache_file.suffix == self.LEGACY_SUFFIX:
+                        self._write_cache_file(cache_key, cached_data)
+                    
+                    profile = LinkedInProfile.from_dict(cached_data['profile'])
+                    self._remember(cache_key, profile, cached_at)
+                    with self._lock:
+                        self.disk_hits += 1
+                        known = cache_key in self._index
+                    if not known:
+                        # Written by another process
+                        self._set_index(cache_key, cached_at)
                     
                     self.logger.info(f"Found cached LinkedIn profile: {linkedin_url}")
-                    return LinkedInProfile.from_dict(cached_data['profile'])
+                    return profile
                 else:
                     # Remove expired cache file
                     cache_file.unlink()
+                    self._forget(cache_key)
                     self.logger.debug(f"Removed expired cache for: {linkedin_url}")
-                    
-            except (json.JSONDecodeError, KeyError, Exception) as e:
+            
+            except Exception as e:
                 self.logger.warning(f"Error reading cache file {cache_file}: {e}")
                 # Remove corrupted cache file
                 cache_file.unlink(missing_ok=True)
+                self._forget(cache_key)
         
+        with self._lock:
+            self.misses += 1
         return None
     
     def cache_profile(self, linkedin_url: str, profile: LinkedInProfile) -> None:
@@ -106,26 +303,24 @@ class LinkedInProfileCache:
             profile: LinkedInProfile object to cache
         """
         cache_key = self._get_cache_key(linkedin_url)
+        cached_at = datetime.now()
         
         cached_data = {
             'linkedin_url': linkedin_url,
             'profile': profile.to_dict(),
-            'cached_at': datetime.now().isoformat(),
+            'cached_at': cached_at.isoformat(),
             'cache_key': cache_key
         }
         
         # Save to file cache
-        cache_file = self._get_cache_file(cache_key)
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cached_data, f, indent=2, ensure_ascii=False)
+            self._write_cache_file(cache_key, cached_data)
             
-            # Add to memory cache if there's space
-            if len(self.memory_cache) < self.max_memory_cache_size:
-                self.memory_cache[cache_key] = cached_data
+            self._remember(cache_key, profile, cached_at.timestamp())
+            self._set_index(cache_key, cached_at.timestamp())
             
             self.logger.info(f"Cached LinkedIn profile: {profile.name} ({linkedin_url})")
-            
+        
         except Exception as e:
             self.logger.error(f"Error caching profile {linkedin_url}: {e}")
     
@@ -133,39 +328,53 @@ class LinkedInProfileCache:
         """
         Clear expired cache entries.
         
+        Uses the index to find expired files without opening them; only files
+        missing from the index (e.g. written by another process) are read.
+        
         Returns:
             Number of entries cleared
         """
         cleared_count = 0
-        current_time = datetime.now()
-        
-        # Clear memory cache
-        expired_keys = []
-        for cache_key, cached_data in self.memory_cache.items():
-            cached_time = datetime.fromisoformat(cached_data['cached_at'])
-            if current_time - cached_time >= self.cache_ttl:
-                expired_keys.append(cache_key)
-        
-        for key in expired_keys:
-            del self.memory_cache[key]
-            cleared_count += 1
+        now = time.time()
         
-        # Clear file cache
-        for cache_file in self.cache_dir.glob("*.json"):
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
+        with self._lock:
+            # Clear memory cache
+            expired_keys = [
+                cache_key for cache_key, (_, cached_at) in self.memory_cache.items()
+                if not self._is_fresh(cached_at, now)
+            ]
+            for key in expired_keys:
+                del self.memory_cache[key]
+                cleared_count += 1
+            
+            # Clear file cache
+            for cache_file in list(self._iter_cache_files()):
+                cache_key = cache_file.stem
+                cached_at = self._index.get(cache_key)
                 
-                cached_time = datetime.fromisoformat(cached_data['cached_at'])
-                if current_time - cached_time >= self.cache_ttl:
-                    cache_file.unlink()
+                if cached_at is None:
+                    try:
+                        cached_data = self._read_cache_file(cache_file)
+                        cached_at = datetime.fromisoformat(cached_data['cached_at']).timestamp()
+                        self._index[cache_key] = cached_at
+                    except Exception as e:
+                        self.logger.warning(f"Error checking cache file {cache_file}: {e}")
+                        # Remove corrupted files
+                        cache_file.unlink(missing_ok=True)
+                        cleared_count += 1
+                        continue
+                
+                if not self._is_fresh(cached_at, now):
+                    cache_file.unlink(missing_ok=True)
+                    self._index.pop(cache_key, None)
                     cleared_count += 1
-                    
-            except Exception as e:
-                self.logger.warning(f"Error checking cache file {cache_file}: {e}")
-                # Remove corrupted files
-                cache_file.unlink(missing_ok=True)
-                cleared_count += 1
+            
+            # Drop index entries whose files were removed externally
+            on_disk = {f.stem for f in self._iter_cache_files()}
+            for cache_key in [k for k in self._index if k not in on_disk]:
+                del self._index[cache_key]
+        
+        self._rewrite_index()
         
         if cleared_count > 0:
             self.logger.info(f"Cleared {cleared_count} expired cache entries")
@@ -174,29 +383,41 @@ class LinkedInProfileCache:
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        file_cache_count = len(list(self.cache_dir.glob("*.json")))
-        memory_cache_count = len(self.memory_cache)
-        
-        return {
-            'file_cache_entries': file_cache_count,
-            'memory_cache_entries': memory_cache_count,
-            'cache_directory': str(self.cache_dir),
-            'cache_ttl_hours': self.cache_ttl.total_seconds() / 3600,
-            'max_memory_cache_size': self.max_memory_cache_size
-        }
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            hits = self.memory_hits + self.disk_hits
+            
+            return {
+                'file_cache_entries': len(self._index),
+                'memory_cache_entries': len(self.memory_cache),
+                'cache_directory': str(self.cache_dir),
+                'cache_ttl_hours': self.cache_ttl.total_seconds() / 3600,
+                'max_memory_cache_size': self.max_memory_cache_size,
+                'codec': self.codec.name,
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': hits / lookups if lookups > 0 else 0.0
+            }
     
     def clear_all_cache(self) -> int:
         """Clear all cache entries."""
         cleared_count = 0
         
-        # Clear memory cache
-        cleared_count += len(self.memory_cache)
-        self.memory_cache.clear()
+        with self._lock:
+            # Clear memory cache
+            cleared_count += len(self.memory_cache)
+            self.memory_cache.clear()
+            
+            # Clear file cache
+            for cache_file in list(self._iter_cache_files()):
+                cache_file.unlink()
+                cleared_count += 1
+            
+            self._index.clear()
         
-        # Clear file cache
-        for cache_file in self.cache_dir.glob("*.json"):
-            cache_file.unlink()
-            cleared_count += 1
+        self._rewrite_index()
         
         self.logger.info(f"Cleared all cache entries: {cleared_count} total")
         return cleared_count
@@ -211,4 +432,5 @@ def get_linkedin_cache() -> LinkedInProfileCache:
     global _linkedin_cache
     if _linkedin_cache is None:
         _linkedin_cache = LinkedInProfileCache()
-    return _linkedin_cache
\ No newline at end of file
+        atexit.register(_linkedin_cache.flush_index)
+    return _linkedin_cache
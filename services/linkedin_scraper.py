@@ -16,8 +16,6 @@ from urllib.parse import urlparse
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
@@ -33,11 +31,16 @@ from utils.error_handling import (
     retry_with_backoff
 )
 from utils.api_monitor import get_api_monitor
-from utils.webdriver_manager import get_webdriver_manager
+from utils.rate_limiting import get_rate_limiter
+from utils.http_client import create_session
+from utils.deadline import call_timeout, hedged_call
+from utils.webdriver_manager import (
+    get_webdriver_manager,
+    load_page
+)
 from services.ai_parser import AIParser
 from services.linkedin_profile_cache import get_linkedin_cache
 from models.data_models import LinkedInProfile
-import requests
 
 
 
@@ -45,6 +48,13 @@ import requests
 
 # Use LinkedInProfile from data models instead of defining it here
 
+# Profile header elements; any one means the profile content has rendered
+PROFILE_WAIT_FOR = (
+    (By.CSS_SELECTOR, "h1"),
+    (By.CSS_SELECTOR, ".top-card-layout"),
+    (By.CSS_SELECTOR, ".pv-top-card")
+)
+
 
 class LinkedInScraper:
     """
@@ -72,6 +82,7 @@ class LinkedInScraper:
         self.api_monitor = get_api_monitor()
         self.last_request_time = 0
         self.min_delay = getattr(config, 'linkedin_scraping_delay', 3.0)  # 3 second delay between requests
+        self.rate_limiter = get_rate_limiter(self.config)
         
         # Initialize WebDriver manager
         self.webdriver_manager = get_webdriver_manager(config)
@@ -89,23 +100,16 @@ class LinkedInScraper:
         # Initialize profile cache for massive performance improvements
         self.profile_cache = get_linkedin_cache()
         
-        # Initialize fast extraction session
-        self.fast_session = requests.Session()
-        self.fast_session.headers.update({
+        # Initialize fast extraction session on the shared connection pools
+        self.fast_session = create_session(self.config, headers={
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
     
 
     def _enforce_rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.min_delay:
-            sleep_time = self.min_delay - time_since_last
-            self.logger.info(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
-        
+        """Wait for the shared LinkedIn rate limit before a request."""
+        self.rate_limiter.register("linkedin", "scraping", min_interval=self.min_delay)
+        self.rate_limiter.acquire("linkedin", "scraping")
         self.last_request_time = time.time()
     
     def _is_valid_linkedin_url(self, url: str) -> bool:
@@ -167,19 +171,14 @@ class LinkedInScraper:
         try:
             with self.webdriver_manager.get_driver("linkedin_scraper") as driver:
                 try:
-                    driver.get(linkedin_url)
+                    # Wait for the profile header rather than the full page load
+                    page_load = load_page(driver, linkedin_url, wait_for=PROFILE_WAIT_FOR, timeout=2)
                 except Exception as e:
                     self.logger.warning(f"Page load timeout for {linkedin_url}: {str(e)}")
                     return None
                 
-                # Wait for page to load (reduced timeout)
-                try:
-                    WebDriverWait(driver, 2).until(  # Reduced from 5 to 2 seconds
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
-                except TimeoutException:
-                    self.logger.warning(f"Page body load timeout for {linkedin_url}")
-                    return None
+                if not page_load.ready:
+                    self.logger.warning(f"Profile header not found for {linkedin_url}, using page as loaded")
                 
                 # PERFORMANCE OPTIMIZATION: Minimal scrolling and wait times
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight/3);")
@@ -571,7 +570,11 @@ class LinkedInScraper:
     def _extract_from_http_request(self, url: str) -> Optional[LinkedInProfile]:
         """Try quick HTTP request - no WebDriver."""
         try:
-            response = self.fast_session.get(url, timeout=3)
+            response = hedged_call(
+                "linkedin_profile_http", self.fast_session.get, url, timeout=call_timeout(3),
+                enabled=self.config.enable_hedged_requests is True,
+                hedge_permit=lambda: self.rate_limiter.try_acquire("linkedin", "scraping")
+            )
             if response.status_code == 200:
                 content = response.text
                 
@@ -0,0 +1,187 @@
+"""
+Negative-result cache for lookups that came back empty or failed.
+
+Records *why* a lookup produced nothing (not found, blocked, timed out) so
+that known dead ends are skipped on later runs instead of costing another
+network call. Entries are stored through CachingService, so they persist
+across processes and campaigns, and each reason has its own TTL: a person
+who is not in Hunter stays "not found" for days, while a timeout is retried
+within the hour.
+"""
+
+import socket
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import (
+    Any,
+    Dict,
+    Optional
+)
+
+import requests
+
+from services.caching_service import CachingService
+from utils.logging_config import get_logger
+
+
+class NegativeReason(Enum):
+    """Why a lookup produced no result."""
+    NOT_FOUND = "not_found"
+    BLOCKED = "blocked"
+    TIMEOUT = "timeout"
+
+
+# Default time-to-live per reason, in seconds
+DEFAULT_NEGATIVE_TTLS: Dict[NegativeReason, int] = {
+    NegativeReason.NOT_FOUND: 7 * 24 * 3600,
+    NegativeReason.BLOCKED: 6 * 3600,
+    NegativeReason.TIMEOUT: 30 * 60
+}
+
+# HTTP status codes that mean the target refused to serve us. 429 is not
+# one: rate limiting is transient and handled by the rate limiter.
+BLOCKED_STATUS_CODES = {401, 403, 451, 999}
+
+
+@dataclass
+class NegativeResult:
+    """A cached negative lookup result."""
+    reason: NegativeReason
+    recorded_at: datetime
+    detail: Optional[str] = None
+
+
+def classify_failure(error: Exception) -> Optional[NegativeReason]:
+    """
+    Map a lookup exception to a negative-cache reason.
+    
+    Args:
+        error: Exception raised by the lookup
+    
+    Returns:
+        NegativeReason, or None if the failure should not be cached
+    """
+    if isinstance(error, (requests.exceptions.Timeout, socket.timeout, TimeoutError)):
+        return NegativeReason.TIMEOUT
+    if type(error).__name__ == "TimeoutException":  # selenium
+        return NegativeReason.TIMEOUT
+    
+    if isinstance(error, requests.exceptions.HTTPError):
+        response = error.response
+        if response is not None and response.status_code in BLOCKED_STATUS_CODES:
+            return NegativeReason.BLOCKED
+    
+    return None
+
+
+class NegativeCache:
+    """
+    Cache of failed lookups, keyed by namespace and lookup key.
+    
+    Namespaces keep unrelated lookups apart, e.g. ``hunter-person``,
+    ``linkedin-search`` or ``website-url``.
+    """
+    
+    KEY_PREFIX = "negative"
+    
+    def __init__(self, caching_service: Optional[CachingService] = None,
+                 ttls: Optional[Dict[NegativeReason, int]] = None, config=None):
+        """
+        Initialize negative cache.
+        
+        Args:
+            caching_service: Cache used for storage (defaults to a memory +
+                persistent cache under .cache/negative)
+            ttls: Per-reason TTL overrides in seconds
+            config: Configuration object for the default caching service
+        """
+        self.cache = caching_service or CachingService(config, cache_dir=".cache/negative")
+        self.ttls = dict(DEFAULT_NEGATIVE_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.logger = get_logger(__name__)
+    
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.KEY_PREFIX}:{namespace}:{key.strip().lower()}"
+    
+    def check(self, namespace: str, key: str) -> Optional[NegativeResult]:
+        """
+        Look up a cached negative result.
+        
+        Args:
+            namespace: Lookup namespace
+            key: Lookup key within the namespace
+        
+        Returns:
+            NegativeResult if the lookup is a known dead end, None otherwise
+        """
+        data = self.cache.get(self._key(namespace, key))
+        if not data:
+            return None
+        
+        try:
+            return NegativeResult(
+                reason=NegativeReason(data['reason']),
+                recorded_at=datetime.fromisoformat(data['recorded_at']),
+                detail=data.get('detail')
+            )
+        except (KeyError, ValueError, TypeError) as e:
+            self.logger.warning(f"Ignoring malformed negative cache entry for {namespace}:{key}: {e}")
+            return None
+    
+    def record(self, namespace: str, key: str, reason: NegativeReason,
+               detail: Optional[str] = None, ttl: Optional[int] = None) -> bool:
+        """
+        Record a negative lookup result.
+        
+        Args:
+            namespace: Lookup namespace
+            key: Lookup key within the namespace
+            reason: Why the lookup produced nothing
+            detail: Optional human readable detail
+            ttl: TTL override in seconds (defaults to the reason's TTL)
+        
+        Returns:
+            True if the result was cached
+        """
+        value: Dict[str, Any] = {
+            'reason': reason.value,
+            'recorded_at': datetime.now().isoformat(),
+            'detail': detail
+        }
+        self.logger.debug(f"Caching negative result for {namespace}:{key} ({reason.value})")
+        return self.cache.set(self._key(namespace, key), value, ttl=ttl or self.ttls[reason])
+    
+    def record_failure(self, namespace: str, key: str, error: Exception) -> Optional[NegativeReason]:
+        """
+        Record a failed lookup if its exception maps to a reason code.
+        
+        Args:
+            namespace: Lookup namespace
+            key: Lookup key within the namespace
+            error: Exception raised by the lookup
+        
+        Returns:
+            The recorded reason, or None if the failure was not cached
+        """
+        reason = classify_failure(error)
+        if reason is not None:
+            self.record(namespace, key, reason, detail=str(error)[:200])
+        return reason
+    
+    def clear(self, namespace: str, key: str) -> bool:
+        """Forget a negative result, e.g. after a successful lookup."""
+        return self.cache.delete(self._key(namespace, key))
+
+
+# Global negative cache instance
+_negative_cache = None
+
+
+def get_negative_cache(config=None) -> NegativeCache:
+    """Get the global negative cache instance."""
+    global _negative_cache
+    if _negative_cache is None:
+        _negative_cache = NegativeCache(config=config)
+    return _negative_cache
@@ -11,6 +11,7 @@ from typing import (
     Optional,
     Dict,
     Any,
+    Mapping,
     Union
 )
 from datetime import datetime
@@ -36,6 +37,7 @@ from utils.validation_framework import (
     ValidationResult,
     ValidationSeverity
 )
+from utils.api_monitor import get_api_monitor
 from utils.config import Config
 from utils.configuration_service import get_configuration_service
 from utils.base_service import BaseService
@@ -554,9 +556,13 @@ class OptimizedNotionDataManager(BaseService):
         # Generate cache key
         cache_key = f"prospects:{hashlib.md5(str(filters or {}).encode()).hexdigest()}"
         
-        # Check cache first (unless force refresh)
+        # Check cache first (unless force refresh); stale entries are
+        # served immediately and refreshed in the background
         if not force_refresh and self.cache:
-            cached_prospects = self.cache.get(cache_key)
+            cached_prospects = self.cache.get(
+                cache_key,
+                refresh=lambda: self._fetch_prospects_from_api(filters, force_refresh=True)
+            )
             if cached_prospects:
                 logger.info(f"Retrieved {len(cached_prospects)} prospects from cache")
                 return cached_prospects
@@ -566,7 +572,7 @@ class OptimizedNotionDataManager(BaseService):
         
         # Cache the results
         if self.cache and prospects:
-            self.cache.set(cache_key, prospects, ttl=600)  # Cache for 10 minutes
+            self.cache.set(cache_key, prospects, ttl=600, soft_ttl=300)  # Revalidate after 5, drop after 10 minutes
         
         return prospects
     
@@ -582,9 +588,11 @@ class OptimizedNotionDataManager(BaseService):
         """
         cache_key = "processed_companies"
         
-        # Check cache first
+        # Check cache first; stale entries are refreshed in the background
         if not force_refresh and self.cache:
-            cached_companies = self.cache.get(cache_key)
+            cached_companies = self.cache.get(
+                cache_key, refresh=self._fetch_processed_companies_optimized
+            )
             if cached_companies:
                 logger.info(f"Retrieved {len(cached_companies)} processed companies from cache")
                 return cached_companies
@@ -594,7 +602,7 @@ class OptimizedNotionDataManager(BaseService):
         
         # Cache the results
         if self.cache and companies:
-            self.cache.set(cache_key, companies, ttl=1800)  # Cache for 30 minutes
+            self.cache.set(cache_key, companies, ttl=1800, soft_ttl=600)  # Revalidate after 10, drop after 30 minutes
         
         return companies
     
@@ -1209,6 +1217,17 @@ class OptimizedNotionDataManager(BaseService):
             raise
         except APIResponseError as e:
             logger.error(f"Failed to store prospect in Notion: {e}")
+            if getattr(e, 'status', None) == 429:
+                # Report the 429 so the shared limiter backs off
+                get_api_monitor().record_api_call(
+                    service='notion',
+                    endpoint='api_call',
+                    response_time=0.0,
+                    status_code=429,
+                    success=False,
+                    error_message=str(e),
+                    rate_limit_headers=dict(e.headers) if isinstance(getattr(e, 'headers', None), Mapping) else None
+                )
             raise
         except Exception as e:
             logger.error(f"Unexpected error storing prospect: {e}")
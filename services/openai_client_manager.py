@@ -12,6 +12,7 @@ import threading
 from typing import (
     Dict,
     List,
+    Mapping,
     Optional,
     Union,
     Any
@@ -26,6 +27,7 @@ from openai import (
 )
 import httpx
 
+from utils.api_monitor import get_api_monitor
 from utils.config import Config
 
 
@@ -46,6 +48,7 @@ class CompletionRequest:
     top_p: float = 1.0
     frequency_penalty: float = 0.0
     presence_penalty: float = 0.0
+    timeout: Optional[float] = None  # Seconds; None uses the client's default
 
 
 @dataclass
@@ -214,15 +217,19 @@ class OpenAIClientManager:
             
             self.logger.debug(f"Making completion request with client '{client_id}' and model '{model_name}'")
             
-            response = client.chat.completions.create(
-                model=model_name,
-                messages=request.messages,
-                temperature=request.temperature,
-                max_tokens=request.max_tokens,
-                top_p=request.top_p,
-                frequency_penalty=request.frequency_penalty,
-                presence_penalty=request.presence_penalty
-            )
+            request_params = {
+                'model': model_name,
+                'messages': request.messages,
+                'temperature': request.temperature,
+                'max_tokens': request.max_tokens,
+                'top_p': request.top_p,
+                'frequency_penalty': request.frequency_penalty,
+                'presence_penalty': request.presence_penalty
+            }
+            if request.timeout is not None:
+                request_params['timeout'] = request.timeout
+            
+            response = client.chat.completions.create(**request_params)
             
             # Extract response content
             content = response.choices[0].message.content.strip()
@@ -241,6 +248,7 @@ class OpenAIClientManager:
             
         except openai.RateLimitError as e:
             self.logger.error(f"Rate limit exceeded for client '{client_id}': {str(e)}")
+            self._report_rate_limit(e)
             return CompletionResponse(
                 content="",
                 model=request.model or self.get_model_name(client_id),
@@ -294,6 +302,22 @@ class OpenAIClientManager:
                 error_message=f"Unexpected error: {str(e)}"
             )
     
+    def _report_rate_limit(self, error: Exception) -> None:
+        """Report a 429 to the API monitor so the shared rate limiter backs off."""
+        try:
+            headers = getattr(getattr(error, 'response', None), 'headers', None)
+            get_api_monitor().record_api_call(
+                service='openai',
+                endpoint='completion',
+                response_time=0.0,
+                status_code=429,
+                success=False,
+                error_message=str(error),
+                rate_limit_headers=dict(headers) if isinstance(headers, Mapping) else None
+            )
+        except Exception as e:
+            self.logger.debug(f"Could not report rate limit error: {e}")
+    
     def make_simple_completion(
         self,
         messages: List[Dict[str, str]],
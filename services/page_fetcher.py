@@ -0,0 +1,323 @@
+"""
+Tiered page fetching: plain HTTP first, a browser only when the page needs it.
+
+Most company landing pages are server rendered, so a pooled HTTP session
+returns the same content as Chrome in a fraction of the time. Each HTTP
+response is checked for signs that it only renders with JavaScript (almost
+no visible text, an empty single-page-app root, or none of the selectors the
+caller expects), and only those pages are loaded in a pooled WebDriver.
+
+Which tier works is learned per domain and stored through CachingService,
+so domains known to need a browser skip the HTTP attempt in later runs.
+"""
+
+import re
+import threading
+from datetime import datetime
+from enum import Enum
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Sequence,
+    Tuple
+)
+from urllib.parse import urlparse
+
+import requests
+from bs4 import BeautifulSoup
+
+from services.caching_service import CachingService
+from utils.http_client import create_session
+from utils.deadline import (
+    call_timeout,
+    hedged_call
+)
+from utils.logging_config import get_logger
+from utils.rate_limiting import HostRateLimiter
+from utils.webdriver_manager import (
+    BODY,
+    get_webdriver_manager,
+    load_page
+)
+
+
+class FetchTier(Enum):
+    """How a page is fetched."""
+    HTTP = "http"
+    BROWSER = "browser"
+
+
+# How long a learned tier is trusted before the domain is probed again
+DEFAULT_TIER_TTL = 7 * 24 * 3600
+
+# Pages with less visible text than this are assumed to render client side
+MIN_VISIBLE_TEXT = 200
+
+# Empty mount points left by client-rendered frameworks
+SPA_ROOT_PATTERN = re.compile(
+    r'<(div|main)[^>]+id=["\'](root|app|__next|__nuxt|___gatsby)["\'][^>]*>\s*</\1>',
+    re.I
+)
+NOSCRIPT_PATTERN = re.compile(r'<noscript[^>]*>[^<]*(enable|requires?)\s+javascript', re.I)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+
+def needs_javascript(html: str, expected_selectors: Sequence[str] = ()) -> Optional[str]:
+    """
+    Decide whether an HTTP response must be rendered in a browser.
+    
+    Args:
+        html: Page HTML as served
+        expected_selectors: CSS selectors the caller needs; if given and none
+            match, the content is assumed to be rendered client side
+    
+    Returns:
+        Reason the page needs JavaScript, or None if the HTML is usable
+    """
+    if not html or not html.strip():
+        return "empty body"
+    
+    if SPA_ROOT_PATTERN.search(html):
+        return "empty app root"
+    
+    soup = BeautifulSoup(html, 'html.parser')
+    if expected_selectors and not any(soup.select_one(selector) for selector in expected_selectors):
+        return "expected selectors missing"
+    
+    for element in soup(['script', 'style', 'noscript', 'template']):
+        element.decompose()
+    text_length = len(soup.get_text(separator=' ', strip=True))
+    if text_length < MIN_VISIBLE_TEXT:
+        return f"only {text_length} characters of text"
+    
+    if NOSCRIPT_PATTERN.search(html) and text_length < 5 * MIN_VISIBLE_TEXT:
+        return "asks for JavaScript"
+    
+    return None
+
+
+def fetch_domain(url: str) -> str:
+    """Get the domain a URL's fetch tier is learned for."""
+    host = urlparse(url).netloc.lower().split(':')[0]
+    return host[4:] if host.startswith('www.') else host
+
+
+class FetchTierCache:
+    """
+    Learned fetch tier per domain, persisted across runs.
+    
+    Tiers are learned separately for each set of expected selectors: a page
+    can have what one caller needs in its server-rendered HTML and still
+    need the browser for another caller's selectors.
+    """
+    
+    KEY_PREFIX = "fetch-tier"
+    
+    def __init__(self, caching_service: Optional[CachingService] = None,
+                 ttl: int = DEFAULT_TIER_TTL, config=None):
+        """
+        Initialize tier cache.
+        
+        Args:
+            caching_service: Cache used for storage (defaults to a memory +
+                persistent cache under .cache/fetch_tiers)
+            ttl: Seconds a learned tier is kept
+            config: Configuration object for the default caching service
+        """
+        self.cache = caching_service or CachingService(config, cache_dir=".cache/fetch_tiers")
+        self.ttl = ttl
+        self.logger = get_logger(__name__)
+    
+    def _key(self, domain: str, expected_selectors: Sequence[str] = ()) -> str:
+        if not expected_selectors:
+            return f"{self.KEY_PREFIX}:{domain}"
+        return f"{self.KEY_PREFIX}:{domain}:{','.join(sorted(set(expected_selectors)))}"
+    
+    def get(self, domain: str, expected_selectors: Sequence[str] = ()) -> Optional[FetchTier]:
+        """
+        Look up the tier learned for a domain.
+        
+        Args:
+            domain: Domain from fetch_domain()
+            expected_selectors: CSS selectors the caller needs in the HTML
+        
+        Returns:
+            FetchTier, or None if nothing has been learned yet
+        """
+        data = self.cache.get(self._key(domain, expected_selectors))
+        if not data:
+            return None
+        try:
+            return FetchTier(data['tier'])
+        except (KeyError, ValueError, TypeError) as e:
+            self.logger.warning(f"Ignoring malformed fetch tier entry for {domain}: {e}")
+            return None
+    
+    def record(self, domain: str, tier: FetchTier, reason: Optional[str] = None,
+               expected_selectors: Sequence[str] = ()) -> bool:
+        """
+        Record the tier that works for a domain.
+        
+        Args:
+            domain: Domain from fetch_domain()
+            tier: Tier that produced usable HTML
+            reason: Why the browser was needed, if it was
+            expected_selectors: CSS selectors the HTML was checked for
+        
+        Returns:
+            True if the tier was cached
+        """
+        value: Dict[str, Any] = {
+            'tier': tier.value,
+            'recorded_at': datetime.now().isoformat(),
+            'reason': reason
+        }
+        self.logger.debug(f"Learned fetch tier for {domain}: {tier.value}")
+        return self.cache.set(self._key(domain, expected_selectors), value, ttl=self.ttl)
+
+
+# Global tier cache instance
+_tier_cache = None
+
+
+def get_fetch_tier_cache(config=None) -> FetchTierCache:
+    """Get the global fetch tier cache instance."""
+    global _tier_cache
+    if _tier_cache is None:
+        _tier_cache = FetchTierCache(config=config)
+    return _tier_cache
+
+
+class PageFetcher:
+    """
+    Fetches page HTML over HTTP, escalating to the WebDriver pool when needed.
+    """
+    
+    def __init__(self, config=None, session: Optional[requests.Session] = None,
+                 webdriver_manager=None, tier_cache: Optional[FetchTierCache] = None,
+                 service_name: str = "page_fetcher",
+                 rate_limiter: Optional[HostRateLimiter] = None):
+        """
+        Initialize page fetcher.
+        
+        Args:
+            config: Configuration object
+            session: HTTP session for the first tier (defaults to a session
+                on the shared connection pools)
+            webdriver_manager: WebDriver manager for the browser tier
+            tier_cache: Learned tiers (defaults to the global cache)
+            service_name: Name used when borrowing drivers and for hedging stats
+            rate_limiter: Limit the caller paces requests with; hedged
+                duplicates are only sent when it has a slot open (defaults
+                to the host limits of the global scheduler)
+        """
+        self.config = config
+        if session is None:
+            session = create_session(config, headers=DEFAULT_HEADERS)
+        self.session = session
+        self.webdriver_manager = webdriver_manager or get_webdriver_manager(config)
+        self.tier_cache = tier_cache or get_fetch_tier_cache(config)
+        self.service_name = service_name
+        self.hedge_requests = getattr(config, 'enable_hedged_requests', False) is True
+        self.rate_limiter = rate_limiter or HostRateLimiter(delay=0)
+        self.logger = get_logger(__name__)
+        
+        self._stats_lock = threading.Lock()
+        self.http_pages = 0
+        self.browser_pages = 0
+        self.escalations = 0
+        self.learned_skips = 0
+    
+    def fetch(self, url: str, expected_selectors: Sequence[str] = (),
+              wait_for: Sequence[Tuple[str, str]] = (BODY,), timeout: float = 30) -> str:
+        """
+        Fetch a page's HTML with the cheapest tier that renders it.
+        
+        Args:
+            url: Page URL
+            expected_selectors: CSS selectors the caller needs in the HTML
+            wait_for: Locators the browser waits for (any one) before reading the page
+            timeout: Upper bound on each request, further limited by the deadline
+        
+        Returns:
+            Page HTML
+        
+        Raises:
+            Exception: If neither tier could fetch the page
+        """
+        domain = fetch_domain(url)
+        learned = self.tier_cache.get(domain, expected_selectors)
+        http_html = None
+        reason = None
+        
+        if learned is FetchTier.BROWSER:
+            with self._stats_lock:
+                self.learned_skips += 1
+        else:
+            try:
+                http_html = self._fetch_http(url, timeout)
+                reason = needs_javascript(http_html, expected_selectors)
+            except Exception as e:
+                reason = f"HTTP failed: {e}"
+            
+            if reason is None:
+                if learned is not FetchTier.HTTP:
+                    self.tier_cache.record(domain, FetchTier.HTTP, expected_selectors=expected_selectors)
+                with self._stats_lock:
+                    self.http_pages += 1
+                return http_html
+            
+            self.logger.debug(f"Escalating {url} to the browser: {reason}")
+            with self._stats_lock:
+                self.escalations += 1
+        
+        try:
+            html = self._fetch_browser(url, wait_for, timeout)
+        except Exception as e:
+            if http_html is not None:
+                self.logger.warning(f"Browser failed for {url}: {e}. Using the HTTP response.")
+                return http_html
+            if learned is FetchTier.BROWSER:
+                self.logger.warning(f"Browser failed for {url}: {e}. Trying HTTP.")
+                return self._fetch_http(url, timeout)
+            raise
+        
+        if http_html is not None and needs_javascript(html, expected_selectors) is None:
+            # Only learn the browser tier when it actually rendered what HTTP lacked
+            self.tier_cache.record(domain, FetchTier.BROWSER, reason=reason,
+                                   expected_selectors=expected_selectors)
+        with self._stats_lock:
+            self.browser_pages += 1
+        return html
+    
+    def _fetch_http(self, url: str, timeout: float) -> str:
+        """Fetch a page with the HTTP session."""
+        response = hedged_call(
+            f"{self.service_name}_http", self.session.get, url, timeout=call_timeout(timeout),
+            enabled=self.hedge_requests, hedge_permit=lambda: self.rate_limiter.try_acquire(url)
+        )
+        response.raise_for_status()
+        return response.text
+    
+    def _fetch_browser(self, url: str, wait_for: Sequence[Tuple[str, str]], timeout: float) -> str:
+        """Fetch a page with a pooled WebDriver."""
+        with self.webdriver_manager.get_driver(self.service_name) as driver:
+            driver.set_page_load_timeout(call_timeout(timeout))
+            load_page(driver, url, wait_for=wait_for, timeout=10)
+            return driver.page_source
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get page counts per tier."""
+        with self._stats_lock:
+            return {
+                'http_pages': self.http_pages,
+                'browser_pages': self.browser_pages,
+                'escalations': self.escalations,
+                'learned_browser_skips': self.learned_skips
+            }
@@ -40,7 +40,7 @@ from models.data_models import (
     Prospect
 )
 from utils.base_service import BaseService
-from utils.rate_limiting import RateLimitingService
+from utils.rate_limiting import get_rate_limiter
 
 
 
@@ -132,7 +132,7 @@ class EnhancedParallelProcessor(BaseService):
     
     def _initialize_service(self) -> None:
         """Initialize service-specific components."""
-        self.rate_limiter = RateLimitingService(self.config)
+        self.rate_limiter = get_rate_limiter(self.config)
         self.processing_stats = {
             'total_companies': 0,
             'successful_companies': 0,
@@ -2,34 +2,40 @@
 Product Analyzer service for comprehensive product information extraction and analysis.
 """
 
-import time
 import logging
+import threading
+from contextlib import contextmanager
 from typing import (
     List,
     Optional,
     Dict,
     Any,
-    Tuple
+    Tuple,
+    Union
+)
+from dataclasses import (
+    dataclass,
+    field
 )
-from dataclasses import dataclass
 from datetime import datetime
 import re
 import json
 
-import requests
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 from utils.config import Config
+from utils.rate_limiting import (
+    HostRateLimiter,
+    get_rate_limiter
+)
+from utils.http_client import create_session
+from utils.webdriver_manager import get_webdriver_manager
 from services.ai_parser import (
     AIParser,
     ProductInfo
 )
 from services.openai_client_manager import CompletionRequest
+from services.page_fetcher import PageFetcher
 
 
 
@@ -130,24 +136,23 @@ class ComprehensiveProductInfo:
         }
 
 
-class RateLimiter:
-    """Simple rate limiter for web scraping."""
-    
-    def __init__(self, delay: float = 2.0):
-        self.delay = delay
-        self.last_request_time = 0.0
+@dataclass
+class PageDocument:
+    """A fetched page, parsed at most once and shared by every extractor."""
+    url: str
+    html: str
+    _soup: Optional[BeautifulSoup] = field(default=None, repr=False)
     
-    def wait_if_needed(self):
-        """Wait if necessary to respect rate limits."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.delay:
-            sleep_time = self.delay - time_since_last
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+    @property
+    def soup(self) -> BeautifulSoup:
+        """Get the parsed DOM, parsing the HTML on first use."""
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, 'html.parser')
+        return self._soup
+
+
+# Scraping requests are scheduled by the central rate limiter
+RateLimiter = HostRateLimiter
 
 
 class ProductAnalyzer:
@@ -169,20 +174,27 @@ class ProductAnalyzer:
             config: Configuration object containing API keys and settings
         """
         self.config = config
-        self.rate_limiter = RateLimiter(delay=config.scraping_delay)
+        self.rate_limiter = RateLimiter(delay=config.scraping_delay, rate_limiter=get_rate_limiter(config))
         
-        # HTTP session for requests
-        self.session = requests.Session()
-        self.session.headers.update({
+        # HTTP session on the shared connection pools, with per-host circuit breakers
+        self.session = create_session(config, headers={
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         
-        # Selenium WebDriver options
-        self.chrome_options = Options()
-        self.chrome_options.add_argument('--headless')
-        self.chrome_options.add_argument('--no-sandbox')
-        self.chrome_options.add_argument('--disable-dev-shm-usage')
-        self.chrome_options.add_argument('--disable-gpu')
+        # Shared pool of warm WebDriver instances
+        self.webdriver_manager = get_webdriver_manager(config)
+        
+        # HTTP first, escalating to the WebDriver pool for JavaScript-rendered pages
+        self.page_fetcher = PageFetcher(
+            config,
+            session=self.session,
+            webdriver_manager=self.webdriver_manager,
+            service_name="product_analyzer",
+            rate_limiter=self.rate_limiter
+        )
+        
+        # Pages fetched during the current analysis, per thread
+        self._page_cache = threading.local()
         
         # Initialize AI parser for enhanced analysis
         try:
@@ -213,40 +225,45 @@ class ProductAnalyzer:
         logger.info(f"Starting comprehensive product analysis for: {product_url}")
         
         try:
-            # Step 1: Extract basic product information
-            basic_info = self._extract_basic_product_info(product_url)
-            
-            # Step 2: Extract detailed features
-            features = self.extract_features(product_url, company_website)
-            
-            # Step 3: Analyze pricing information
-            pricing = self.get_pricing_info(product_url, company_website)
-            
-            # Step 4: Perform market analysis
-            market_analysis = self.analyze_market_position(basic_info, company_website)
-            
-            # Step 5: Gather additional context (funding, team size, etc.)
-            additional_context = self._gather_additional_context(product_url, company_website)
-            
-            # Combine all information
-            comprehensive_info = ComprehensiveProductInfo(
-                basic_info=basic_info,
-                features=features,
-                pricing=pricing,
-                market_analysis=market_analysis,
-                funding_info=additional_context.get('funding_info'),
-                team_size=additional_context.get('team_size'),
-                launch_date=additional_context.get('launch_date'),
-                social_metrics=additional_context.get('social_metrics')
-            )
-            
-            logger.info(f"Successfully completed comprehensive product analysis")
-            return comprehensive_info
+            with self._page_cache_scope():
+                return self._analyze_product(product_url, company_website)
             
         except Exception as e:
             logger.error(f"Failed to analyze product {product_url}: {str(e)}")
             raise
     
+    def _analyze_product(self, product_url: str, company_website: str) -> ComprehensiveProductInfo:
+        """Run every extraction step, sharing one fetch of each page."""
+        # Step 1: Extract basic product information
+        basic_info = self._extract_basic_product_info(product_url)
+        
+        # Step 2: Extract detailed features
+        features = self.extract_features(product_url, company_website)
+        
+        # Step 3: Analyze pricing information
+        pricing = self.get_pricing_info(product_url, company_website)
+        
+        # Step 4: Perform market analysis
+        market_analysis = self.analyze_market_position(basic_info, company_website)
+        
+        # Step 5: Gather additional context (funding, team size, etc.)
+        additional_context = self._gather_additional_context(product_url, company_website)
+        
+        # Combine all information
+        comprehensive_info = ComprehensiveProductInfo(
+            basic_info=basic_info,
+            features=features,
+            pricing=pricing,
+            market_analysis=market_analysis,
+            funding_info=additional_context.get('funding_info'),
+            team_size=additional_context.get('team_size'),
+            launch_date=additional_context.get('launch_date'),
+            social_metrics=additional_context.get('social_metrics')
+        )
+        
+        logger.info(f"Successfully completed comprehensive product analysis")
+        return comprehensive_info
+    
     def extract_features(self, product_url: str, company_website: str = "") -> List[Feature]:
         """
         Extract product features from product page and company website.
@@ -377,15 +394,13 @@ class ProductAnalyzer:
         """Extract basic product information using AI parsing."""
         logger.info("Extracting basic product information")
         
-        self.rate_limiter.wait_if_needed()
-        
         try:
             # Scrape the product page
-            content = self._scrape_page_content(product_url)
+            page = self._get_page(product_url)
             
             if self.use_ai_parsing and self.ai_parser:
                 # Use AI parser to extract structured product info
-                ai_result = self.ai_parser.parse_product_info(content, product_url)
+                ai_result = self.ai_parser.parse_product_info(page.html, product_url)
                 
                 if ai_result.success and ai_result.data:
                     logger.info(f"AI parsing successful with confidence: {ai_result.confidence_score:.2f}")
@@ -394,7 +409,7 @@ class ProductAnalyzer:
                     logger.warning(f"AI parsing failed: {ai_result.error_message}")
             
             # Fall back to basic extraction
-            return self._extract_basic_info_fallback(content, product_url)
+            return self._extract_basic_info_fallback(page.soup, product_url)
             
         except Exception as e:
             logger.error(f"Failed to extract basic product info: {str(e)}")
@@ -404,14 +419,12 @@ class ProductAnalyzer:
         """Extract features from a specific URL."""
         logger.debug(f"Extracting features from: {url}")
         
-        self.rate_limiter.wait_if_needed()
-        
         try:
-            content = self._scrape_page_content(url)
+            page = self._get_page(url)
             
             if self.use_ai_parsing and self.ai_parser:
                 # Use AI to extract and structure features
-                features_content = self._extract_features_content(content)
+                features_content = self._extract_features_content(page.soup)
                 
                 if features_content:
                     ai_features = self._extract_features_with_ai(features_content)
@@ -419,7 +432,7 @@ class ProductAnalyzer:
                         return ai_features
             
             # Fall back to traditional feature extraction
-            return self._extract_features_traditional(content)
+            return self._extract_features_traditional(page.soup)
             
         except Exception as e:
             logger.warning(f"Failed to extract features from {url}: {str(e)}")
@@ -429,14 +442,12 @@ class ProductAnalyzer:
         """Extract pricing information from a specific URL."""
         logger.debug(f"Extracting pricing from: {url}")
         
-        self.rate_limiter.wait_if_needed()
-        
         try:
-            content = self._scrape_page_content(url)
+            page = self._get_page(url)
             
             if self.use_ai_parsing and self.ai_parser:
                 # Use AI to extract and structure pricing
-                pricing_content = self._extract_pricing_content(content)
+                pricing_content = self._extract_pricing_content(page.soup)
                 
                 if pricing_content:
                     ai_pricing = self._extract_pricing_with_ai(pricing_content)
@@ -444,53 +455,73 @@ class ProductAnalyzer:
                         return ai_pricing
             
             # Fall back to traditional pricing extraction
-            return self._extract_pricing_traditional(content)
+            return self._extract_pricing_traditional(page.soup)
             
         except Exception as e:
             logger.warning(f"Failed to extract pricing from {url}: {str(e)}")
             return PricingInfo(model="unknown", tiers=[])
     
-    def _scrape_page_content(self, url: str) -> str:
-        """Scrape content from a web page using Selenium for JavaScript rendering."""
-        driver = None
-        
+    @contextmanager
+    def _page_cache_scope(self):
+        """Fetch each URL at most once until the outermost scope exits."""
+        if getattr(self._page_cache, 'pages', None) is not None:
+            yield
+            return
+        
+        self._page_cache.pages = {}
         try:
-            driver = webdriver.Chrome(options=self.chrome_options)
-            driver.set_page_load_timeout(30)
-            driver.get(url)
-            
-            # Wait for page to load
-            wait = WebDriverWait(driver, 10)
-            wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            
-            # Get page content
-            content = driver.page_source
-            
-            logger.debug(f"Successfully scraped content from {url}")
-            return content
+            yield
+        finally:
+            logger.debug(f"Analysis fetched {len(self._page_cache.pages)} page(s)")
+            self._page_cache.pages = None
+    
+    def _get_page(self, url: str) -> PageDocument:
+        """
+        Get a page, from the current analysis' cache if it was already fetched.
+        
+        Failed fetches are cached too, so later extractors do not retry them.
+        
+        Args:
+            url: Page URL
             
+        Returns:
+            PageDocument for the URL
+        """
+        pages = getattr(self._page_cache, 'pages', None)
+        if pages is not None and url in pages:
+            cached = pages[url]
+            if isinstance(cached, Exception):
+                raise cached
+            return cached
+        
+        self.rate_limiter.wait_if_needed(url)
+        try:
+            page = PageDocument(url=url, html=self._scrape_page_content(url))
         except Exception as e:
-            logger.warning(f"Selenium scraping failed for {url}: {str(e)}. Trying requests fallback.")
-            
-            # Fall back to requests
-            try:
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                return response.text
-            except Exception as fallback_e:
-                logger.error(f"Both Selenium and requests failed for {url}: {str(fallback_e)}")
-                raise
-                
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                except Exception:
-                    pass
+            if pages is not None:
+                pages[url] = e
+            raise
+        
+        if pages is not None:
+            pages[url] = page
+        return page
+    
+    @staticmethod
+    def _as_soup(content: Union[str, BeautifulSoup]) -> BeautifulSoup:
+        """Parse HTML, or pass through an already parsed DOM."""
+        if isinstance(content, BeautifulSoup):
+            return content
+        return BeautifulSoup(content, 'html.parser')
+    
+    def _scrape_page_content(self, url: str) -> str:
+        """Fetch a page over HTTP, using a browser only if it needs JavaScript to render."""
+        content = self.page_fetcher.fetch(url)
+        logger.debug(f"Successfully scraped content from {url}")
+        return content
     
-    def _extract_basic_info_fallback(self, content: str, url: str) -> ProductInfo:
+    def _extract_basic_info_fallback(self, content: Union[str, BeautifulSoup], url: str) -> ProductInfo:
         """Fallback method for basic product info extraction."""
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = self._as_soup(content)
         
         # Extract title
         title_elem = soup.find('title')
@@ -510,9 +541,9 @@ class ProductAnalyzer:
             market_analysis=""
         )
     
-    def _extract_features_content(self, content: str) -> str:
+    def _extract_features_content(self, content: Union[str, BeautifulSoup]) -> str:
         """Extract content sections that likely contain feature information."""
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = self._as_soup(content)
         
         # Look for sections that might contain features
         feature_sections = []
@@ -617,9 +648,9 @@ Return only the JSON array, no additional text or explanation."""
             logger.error(f"AI feature extraction failed: {str(e)}")
             return []
     
-    def _extract_features_traditional(self, content: str) -> List[Feature]:
+    def _extract_features_traditional(self, content: Union[str, BeautifulSoup]) -> List[Feature]:
         """Traditional method for feature extraction."""
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = self._as_soup(content)
         features = []
         
         # Look for lists that might contain features
@@ -640,9 +671,9 @@ Return only the JSON array, no additional text or explanation."""
         
         return features[:10]  # Limit to 10 features
     
-    def _extract_pricing_content(self, content: str) -> str:
+    def _extract_pricing_content(self, content: Union[str, BeautifulSoup]) -> str:
         """Extract content sections that likely contain pricing information."""
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = self._as_soup(content)
         
         # Look for pricing-related sections
         pricing_sections = []
@@ -748,9 +779,9 @@ Return only the JSON object, no additional text or explanation."""
             logger.error(f"AI pricing extraction failed: {str(e)}")
             return None
     
-    def _extract_pricing_traditional(self, content: str) -> PricingInfo:
+    def _extract_pricing_traditional(self, content: Union[str, BeautifulSoup]) -> PricingInfo:
         """Traditional method for pricing extraction."""
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = self._as_soup(content)
         
         # Look for price indicators
         price_patterns = [r'\$\d+', r'€\d+', r'£\d+', r'\d+\s*USD', r'free', r'premium']
@@ -782,8 +813,7 @@ Return only the JSON object, no additional text or explanation."""
         
         if company_website:
             try:
-                website_content = self._scrape_page_content(company_website)
-                soup = BeautifulSoup(website_content, 'html.parser')
+                soup = self._get_page(company_website).soup
                 
                 # Extract relevant sections for market analysis
                 about_section = soup.find(string=re.compile(r'about|mission|vision', re.I))
@@ -895,8 +925,7 @@ Return only the JSON object, no additional text or explanation."""
     def _extract_funding_info(self, company_website: str) -> Optional[Dict[str, Any]]:
         """Extract funding information from company website."""
         try:
-            content = self._scrape_page_content(company_website)
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = self._get_page(company_website).soup
             
             # Look for funding-related keywords
             funding_keywords = ['funding', 'investment', 'series a', 'series b', 'seed', 'venture']
@@ -918,8 +947,7 @@ Return only the JSON object, no additional text or explanation."""
         try:
             # This is a simplified estimation - could be enhanced with LinkedIn data
             if company_website:
-                content = self._scrape_page_content(company_website)
-                soup = BeautifulSoup(content, 'html.parser')
+                soup = self._get_page(company_website).soup
                 
                 # Look for team section
                 team_elements = soup.find_all(string=re.compile(r'team|staff|employee', re.I))
@@ -937,8 +965,7 @@ Return only the JSON object, no additional text or explanation."""
         """Extract social metrics from ProductHunt or other sources."""
         try:
             if 'producthunt.com' in product_url:
-                content = self._scrape_page_content(product_url)
-                soup = BeautifulSoup(content, 'html.parser')
+                soup = self._get_page(product_url).soup
                 
                 # Look for upvotes, comments, etc.
                 metrics = {}
@@ -0,0 +1,335 @@
+"""
+Incremental ProductHunt crawler feeding a persistent discovery queue.
+
+Discovery used to scrape the ProductHunt homepage from scratch at the start
+of every campaign, and duplicates were only dropped later against Notion.
+ProductHuntCrawler runs in the background instead: each crawl reads the
+latest launches, keeps only slugs it has never seen, and queues them in a
+local SQLite store. Campaigns take companies straight from that queue, so
+discovery does not wait on a homepage render.
+
+The store survives restarts and is shared by every process on the host.
+"""
+
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union
+)
+from urllib.parse import urlparse
+
+from services.product_hunt_scraper import (
+    ProductData,
+    ProductHuntScraper
+)
+from utils.logging_config import get_logger
+from utils.shared_store import SQLiteConnectionPool
+
+
+DEFAULT_STORE_PATH = Path(".cache") / "product_hunt_crawler.db"
+DEFAULT_CRAWL_INTERVAL = 3600
+DEFAULT_CRAWL_LIMIT = 50
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    slug TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    company_name TEXT NOT NULL,
+    website_url TEXT NOT NULL,
+    product_url TEXT NOT NULL,
+    description TEXT NOT NULL,
+    launch_date TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    taken_at REAL
+);
+CREATE INDEX IF NOT EXISTS products_pending ON products (taken_at, first_seen);
+CREATE TABLE IF NOT EXISTS crawl_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def product_slug(product_url: str) -> str:
+    """
+    Get the slug that identifies a product across crawls.
+    
+    Args:
+        product_url: ProductHunt product or post URL
+    
+    Returns:
+        Last path segment, e.g. "acme" for /products/acme
+    """
+    path = urlparse(product_url).path.rstrip('/')
+    return path.rsplit('/', 1)[-1].lower() if path else product_url.lower()
+
+
+class SeenProductStore:
+    """
+    Persistent set of seen product slugs, with a queue of ones not yet taken.
+    """
+    
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_STORE_PATH):
+        """
+        Open (and create if needed) the store.
+        
+        Args:
+            db_path: SQLite database file
+        """
+        self.pool = SQLiteConnectionPool(db_path)
+        self.pool.connection().executescript(SCHEMA)
+    
+    def add(self, products: Iterable[ProductData], taken: bool = False) -> List[ProductData]:
+        """
+        Record products, keeping only slugs that were never seen.
+        
+        Args:
+            products: ProductData objects
+            taken: Record them as already taken, so they never enter the queue
+        
+        Returns:
+            Products that were new
+        """
+        conn = self.pool.connection()
+        now = time.time()
+        new = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for product in products:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO products VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (product_slug(product.product_url), product.name, product.company_name,
+                     product.website_url or "", product.product_url, product.description or "",
+                     product.launch_date.isoformat(), now, now if taken else None)
+                )
+                if cursor.rowcount:
+                    new.append(product)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return new
+    
+    def take(self, limit: int) -> List[ProductData]:
+        """
+        Remove up to limit products from the queue, oldest first.
+        
+        Args:
+            limit: Maximum number of products
+        
+        Returns:
+            ProductData objects
+        """
+        conn = self.pool.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute(
+                "SELECT slug, name, company_name, website_url, product_url, description, launch_date "
+                "FROM products WHERE taken_at IS NULL ORDER BY first_seen, rowid LIMIT ?",
+                (limit,)
+            ).fetchall()
+            conn.executemany(
+                "UPDATE products SET taken_at = ? WHERE slug = ?",
+                [(time.time(), row[0]) for row in rows]
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        
+        return [
+            ProductData(
+                name=name,
+                company_name=company_name,
+                website_url=website_url,
+                product_url=product_url,
+                description=description,
+                launch_date=datetime.fromisoformat(launch_date)
+            )
+            for _, name, company_name, website_url, product_url, description, launch_date in rows
+        ]
+    
+    def release(self, products: Iterable[ProductData]) -> int:
+        """
+        Put taken products back in the queue, e.g. when a campaign did not use them.
+        
+        Args:
+            products: ProductData objects
+        
+        Returns:
+            Number of products queued again
+        """
+        conn = self.pool.connection()
+        cursor = conn.executemany(
+            "UPDATE products SET taken_at = NULL WHERE slug = ? AND taken_at IS NOT NULL",
+            [(product_slug(product.product_url),) for product in products]
+        )
+        return max(cursor.rowcount, 0)
+    
+    def pending_count(self) -> int:
+        """Number of queued products not yet taken."""
+        return self.pool.connection().execute(
+            "SELECT COUNT(*) FROM products WHERE taken_at IS NULL"
+        ).fetchone()[0]
+    
+    def seen_count(self) -> int:
+        """Number of distinct products ever seen."""
+        return self.pool.connection().execute("SELECT COUNT(*) FROM products").fetchone()[0]
+    
+    def get_state(self, key: str) -> Optional[str]:
+        """Get a crawl state value."""
+        row = self.pool.connection().execute(
+            "SELECT value FROM crawl_state WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def set_state(self, key: str, value: str) -> None:
+        """Set a crawl state value."""
+        self.pool.connection().execute(
+            "INSERT OR REPLACE INTO crawl_state (key, value) VALUES (?, ?)", (key, value)
+        )
+
+
+class ProductHuntCrawler:
+    """
+    Background crawler that queues ProductHunt launches it has not seen before.
+    """
+    
+    def __init__(self, config=None, scraper=None, store: Optional[SeenProductStore] = None,
+                 fetch_limit: int = DEFAULT_CRAWL_LIMIT):
+        """
+        Initialize crawler.
+        
+        Args:
+            config: Configuration object
+            scraper: ProductHuntScraper used for crawls (created on first crawl if not given)
+            store: Seen-set and queue (defaults to a store under .cache)
+            fetch_limit: Launches read per crawl
+        """
+        self.config = config
+        self._scraper = scraper
+        self.store = store or SeenProductStore()
+        self.fetch_limit = fetch_limit
+        self.logger = get_logger(__name__)
+        
+        self._crawl_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.crawls = 0
+        self.products_queued = 0
+        self.last_error: Optional[str] = None
+    
+    @property
+    def scraper(self):
+        """ProductHuntScraper used for crawls."""
+        if self._scraper is None:
+            self._scraper = ProductHuntScraper(self.config)
+        return self._scraper
+    
+    @property
+    def last_crawl(self) -> Optional[datetime]:
+        """When the last successful crawl started."""
+        value = self.store.get_state('last_crawl')
+        return datetime.fromisoformat(value) if value else None
+    
+    def crawl(self) -> int:
+        """
+        Read the latest launches and queue the ones never seen before.
+        
+        Returns:
+            Number of products queued
+        """
+        with self._crawl_lock:
+            started = datetime.now().astimezone()
+            products = self.scraper.get_latest_products(self.fetch_limit, posted_after=self.last_crawl)
+            new = self.store.add(products)
+            self.store.set_state('last_crawl', started.isoformat())
+            
+            self.crawls += 1
+            self.products_queued += len(new)
+            self.logger.info(f"ProductHunt crawl queued {len(new)} new of {len(products)} launches "
+                             f"({self.store.pending_count()} waiting)")
+            return len(new)
+    
+    def take(self, limit: int) -> List[ProductData]:
+        """
+        Take queued products for discovery.
+        
+        Args:
+            limit: Maximum number of products
+        
+        Returns:
+            ProductData objects never handed out before
+        """
+        return self.store.take(limit)
+    
+    def release(self, products: Iterable[ProductData]) -> int:
+        """
+        Return products a campaign took but did not use to the queue.
+        
+        Args:
+            products: ProductData objects
+        
+        Returns:
+            Number of products queued again
+        """
+        return self.store.release(products)
+    
+    def mark_seen(self, products: Iterable[ProductData]) -> None:
+        """
+        Record products found outside the crawler so they are never queued.
+        
+        Args:
+            products: ProductData objects
+        """
+        self.store.add(products, taken=True)
+    
+    def start(self, interval: float = DEFAULT_CRAWL_INTERVAL) -> None:
+        """
+        Crawl now and then every interval seconds in a background thread.
+        
+        Args:
+            interval: Seconds between crawls
+        """
+        if interval <= 0 or (self._thread and self._thread.is_alive()):
+            return
+        
+        def run():
+            while True:
+                try:
+                    self.crawl()
+                    self.last_error = None
+                except Exception as e:
+                    self.last_error = str(e)
+                    self.logger.warning(f"ProductHunt crawl failed: {e}")
+                if self._stop.wait(interval):
+                    return
+        
+        self._stop.clear()
+        self._thread = threading.Thread(target=run, name="producthunt-crawler", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get crawl counts and queue depth."""
+        last_crawl = self.last_crawl
+        return {
+            'crawls': self.crawls,
+            'products_queued': self.products_queued,
+            'pending': self.store.pending_count(),
+            'seen': self.store.seen_count(),
+            'last_crawl': last_crawl.isoformat() if last_crawl else None,
+            'last_error': self.last_error
+        }
@@ -0,0 +1,412 @@
+"""
+Structured ProductHunt data: embedded page payloads and the GraphQL API.
+
+ProductHunt pages are Next.js apps that ship the data they render as JSON:
+the homepage's Apollo SSR transport carries every post of the day's feed,
+and product pages carry the post with its makers. Reading that JSON gives
+exact names, taglines, slugs and maker profiles without walking the DOM.
+
+ProductHuntGraphQLClient pages through the public GraphQL API with a
+cursor, which reaches past the ~15 posts the homepage renders without
+clicking "See all" in a browser. It needs a developer token.
+"""
+
+import json
+import re
+from dataclasses import (
+    dataclass,
+    field
+)
+from datetime import (
+    datetime,
+    timedelta,
+    timezone
+)
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+
+import requests
+
+from utils.http_client import create_session
+from utils.logging_config import get_logger
+
+
+PRODUCTHUNT_URL = "https://www.producthunt.com"
+GRAPHQL_API_URL = "https://api.producthunt.com/v2/api/graphql"
+
+NEXT_DATA_PATTERN = re.compile(
+    r'<script[^>]+id=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>', re.S | re.I
+)
+# (window[Symbol.for("ApolloSSRDataTransport")] ??= []).push({...})
+APOLLO_TRANSPORT_PATTERN = re.compile(r'ApolloSSRDataTransport"\)\]\s*\?\?=\s*\[\]\)\.push\(')
+APOLLO_STATE_PATTERN = re.compile(r'window\.__APOLLO_STATE__\s*=\s*')
+# Apollo writes JavaScript, not JSON: undefined values have to become null
+UNDEFINED_PATTERN = re.compile(r'(?<=[:\[,])undefined(?=[,}\]])')
+
+LINKEDIN_PROFILE_PATTERN = re.compile(r'https?://(?:[a-z]{2,3}\.)?linkedin\.com/in/[^"\s?#]+', re.I)
+
+POSTS_QUERY = """
+query LatestPosts($first: Int!, $after: String, $postedAfter: DateTime) {
+  posts(first: $first, after: $after, postedAfter: $postedAfter, order: RANKING) {
+    pageInfo { endCursor hasNextPage }
+    edges {
+      node {
+        id
+        name
+        slug
+        tagline
+        website
+        createdAt
+        makers { name username headline websiteUrl twitterUsername }
+      }
+    }
+  }
+}
+"""
+
+
+@dataclass
+class EmbeddedMaker:
+    """A maker profile from ProductHunt structured data."""
+    name: str
+    username: str = ""
+    headline: str = ""
+    linkedin_url: str = ""
+
+
+@dataclass
+class EmbeddedPost:
+    """A launch from ProductHunt structured data."""
+    id: str
+    name: str
+    slug: str
+    tagline: str = ""
+    product_slug: str = ""
+    website_url: str = ""
+    created_at: Optional[datetime] = None
+    makers: List[EmbeddedMaker] = field(default_factory=list)
+    
+    @property
+    def product_url(self) -> str:
+        """ProductHunt URL of the product, or of the launch post if the product is unknown."""
+        if self.product_slug:
+            return f"{PRODUCTHUNT_URL}/products/{self.product_slug}"
+        return f"{PRODUCTHUNT_URL}/posts/{self.slug}"
+
+
+def _decode_object(text: str, start: int) -> Optional[Any]:
+    """Decode the JSON object starting at text[start], ignoring anything after it."""
+    end = text.find('</script>', start)
+    chunk = text[start:end if end != -1 else len(text)]
+    try:
+        return json.JSONDecoder().raw_decode(UNDEFINED_PATTERN.sub('null', chunk))[0]
+    except ValueError:
+        return None
+
+
+def extract_payloads(html: Union[str, bytes]) -> List[Any]:
+    """
+    Pull every embedded JSON payload out of a ProductHunt page.
+    
+    Args:
+        html: Page HTML
+    
+    Returns:
+        Decoded __NEXT_DATA__, Apollo SSR transport and Apollo state payloads
+    """
+    if isinstance(html, bytes):
+        html = html.decode('utf-8', errors='replace')
+    if not isinstance(html, str):
+        return []
+    
+    payloads = []
+    for match in NEXT_DATA_PATTERN.finditer(html):
+        try:
+            payloads.append(json.loads(match.group(1)))
+        except ValueError:
+            continue
+    for pattern in (APOLLO_TRANSPORT_PATTERN, APOLLO_STATE_PATTERN):
+        for match in pattern.finditer(html):
+            payload = _decode_object(html, match.end())
+            if payload is not None:
+                payloads.append(payload)
+    return payloads
+
+
+def _walk(node: Any, refs: Dict[str, Any], seen: Optional[set] = None) -> Iterator[Dict[str, Any]]:
+    """Yield every object in a payload, following Apollo cache references."""
+    if seen is None:
+        seen = set()
+    if isinstance(node, dict):
+        ref = node.get('__ref')
+        if isinstance(ref, str) and len(node) == 1:
+            node = refs.get(ref)
+            if node is None or id(node) in seen:
+                return
+        if id(node) in seen:
+            return
+        seen.add(id(node))
+        yield node
+        for value in node.values():
+            yield from _walk(value, refs, seen)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _walk(value, refs, seen)
+
+
+def _resolve(node: Any, refs: Dict[str, Any]) -> Any:
+    """Follow an Apollo cache reference, if node is one."""
+    if isinstance(node, dict) and isinstance(node.get('__ref'), str):
+        return refs.get(node['__ref'], node)
+    return node
+
+
+def _cache_refs(payloads: List[Any]) -> Dict[str, Any]:
+    """Collect normalized Apollo cache entries ("Post:123": {...}) for reference lookups."""
+    refs = {}
+    for node in _walk(payloads, {}):
+        for key, value in node.items():
+            if isinstance(value, dict) and ':' in key and '__typename' in value:
+                refs[key] = value
+    return refs
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp from ProductHunt."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def _linkedin_url(user: Dict[str, Any]) -> str:
+    """Find a LinkedIn profile URL anywhere in a user object."""
+    match = LINKEDIN_PROFILE_PATTERN.search(json.dumps(user))
+    return match.group(0) if match else ""
+
+
+def _external_url(value: Any) -> str:
+    """Return a website URL unless it is a ProductHunt redirect."""
+    if not isinstance(value, str) or 'producthunt.com' in value.lower():
+        return ""
+    return value
+
+
+def _maker_from_user(user: Dict[str, Any]) -> Optional[EmbeddedMaker]:
+    """Convert a User object into an EmbeddedMaker."""
+    name = (user.get('name') or '').strip()
+    if not name:
+        return None
+    return EmbeddedMaker(
+        name=name,
+        username=user.get('username') or '',
+        headline=(user.get('headline') or '').strip(),
+        linkedin_url=_linkedin_url(user)
+    )
+
+
+def _makers_of(node: Dict[str, Any], refs: Dict[str, Any]) -> List[EmbeddedMaker]:
+    """Get the makers listed on a Post or Product, as a list or a connection."""
+    makers = _resolve(node.get('makers'), refs)
+    if isinstance(makers, dict):
+        # Relay-style connection: {"edges": [{"node": {...}}]} or {"nodes": [...]}
+        edges = makers.get('edges') or []
+        makers = [edge.get('node') for edge in edges if isinstance(edge, dict)] or makers.get('nodes') or []
+    if not isinstance(makers, list):
+        return []
+    
+    result = []
+    for user in makers:
+        user = _resolve(user, refs)
+        if isinstance(user, dict):
+            maker = _maker_from_user(user)
+            if maker:
+                result.append(maker)
+    return result
+
+
+def _post_from_node(node: Dict[str, Any], refs: Dict[str, Any]) -> Optional[EmbeddedPost]:
+    """Convert a Post object into an EmbeddedPost."""
+    name = (node.get('name') or '').strip()
+    slug = node.get('slug') or ''
+    if not name or not slug:
+        return None
+    
+    product = _resolve(node.get('product'), refs)
+    return EmbeddedPost(
+        id=str(node.get('id') or slug),
+        name=name,
+        slug=slug,
+        tagline=(node.get('tagline') or '').strip(),
+        product_slug=(product.get('slug') or '') if isinstance(product, dict) else '',
+        website_url=_external_url(node.get('website')),
+        created_at=_parse_timestamp(node.get('featuredAt') or node.get('createdAt')),
+        makers=_makers_of(node, refs)
+    )
+
+
+def extract_posts(html: Union[str, bytes], limit: Optional[int] = None) -> List[EmbeddedPost]:
+    """
+    Get the launches embedded in a ProductHunt page.
+    
+    Args:
+        html: Page HTML
+        limit: Maximum number of posts to return
+    
+    Returns:
+        Posts in page order, without duplicates
+    """
+    payloads = extract_payloads(html)
+    refs = _cache_refs(payloads)
+    posts: Dict[str, EmbeddedPost] = {}
+    for payload in payloads:
+        for node in _walk(payload, refs):
+            if node.get('__typename') != 'Post':
+                continue
+            post = _post_from_node(node, refs)
+            if post is None:
+                continue
+            existing = posts.get(post.id)
+            if existing is None:
+                posts[post.id] = post
+            elif not existing.makers:
+                # The same post can appear once thin and once with makers attached
+                existing.makers = post.makers
+    ordered = list(posts.values())
+    return ordered[:limit] if limit is not None else ordered
+
+
+def extract_makers(html: Union[str, bytes]) -> List[EmbeddedMaker]:
+    """
+    Get the makers listed in a ProductHunt product or post page.
+    
+    Only users attached as makers are returned; commenters and voters in the
+    same payload are ignored.
+    
+    Args:
+        html: Page HTML
+    
+    Returns:
+        Makers without duplicates, in page order
+    """
+    payloads = extract_payloads(html)
+    refs = _cache_refs(payloads)
+    makers = []
+    seen = set()
+    for payload in payloads:
+        for node in _walk(payload, refs):
+            if 'makers' not in node:
+                continue
+            for maker in _makers_of(node, refs):
+                key = maker.username or maker.name.lower()
+                if key not in seen:
+                    seen.add(key)
+                    makers.append(maker)
+    return makers
+
+
+class ProductHuntGraphQLClient:
+    """
+    Cursor-paginated reads from ProductHunt's public GraphQL API.
+    """
+    
+    def __init__(self, token: str, session: Optional[requests.Session] = None,
+                 page_size: int = 20, timeout: float = 30):
+        """
+        Initialize GraphQL client.
+        
+        Args:
+            token: ProductHunt API developer token
+            session: HTTP session to send requests with (defaults to one on the shared pools)
+            page_size: Posts requested per page (the API allows up to 20)
+            timeout: Seconds to wait for each page
+        """
+        self.token = token
+        self.session = session or create_session()
+        self.page_size = page_size
+        self.timeout = timeout
+        self.logger = get_logger(__name__)
+    
+    def _query(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a query and return its data, raising on transport or GraphQL errors."""
+        response = self.session.post(
+            GRAPHQL_API_URL,
+            json={'query': query, 'variables': variables},
+            headers={
+                'Authorization': f'Bearer {self.token}',
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            },
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        body = response.json()
+        if body.get('errors'):
+            raise RuntimeError(f"ProductHunt GraphQL error: {body['errors'][0].get('message', body['errors'])}")
+        return body.get('data') or {}
+    
+    def iter_post_pages(self, posted_after: Optional[datetime] = None) -> Iterator[Tuple[List[EmbeddedPost], bool]]:
+        """
+        Page through ranked posts.
+        
+        Args:
+            posted_after: Only posts launched after this time (defaults to the last day)
+        
+        Yields:
+            Tuple of (posts on the page, whether another page follows)
+        """
+        if posted_after is None:
+            posted_after = datetime.now(timezone.utc) - timedelta(days=1)
+        
+        cursor = None
+        while True:
+            data = self._query(POSTS_QUERY, {
+                'first': self.page_size,
+                'after': cursor,
+                'postedAfter': posted_after.isoformat()
+            })
+            connection = data.get('posts') or {}
+            posts = []
+            for edge in connection.get('edges') or []:
+                post = _post_from_node(edge.get('node') or {}, {})
+                if post:
+                    posts.append(post)
+            
+            page_info = connection.get('pageInfo') or {}
+            cursor = page_info.get('endCursor')
+            has_next = bool(page_info.get('hasNextPage')) and bool(cursor) and bool(posts)
+            yield posts, has_next
+            if not has_next:
+                return
+    
+    def get_posts(self, limit: int, posted_after: Optional[datetime] = None) -> List[EmbeddedPost]:
+        """
+        Get up to limit ranked posts, following cursors as needed.
+        
+        Args:
+            limit: Maximum number of posts
+            posted_after: Only posts launched after this time (defaults to the last day)
+        
+        Returns:
+            Posts in ranking order
+        """
+        posts: List[EmbeddedPost] = []
+        seen_ids = set()
+        for page, _ in self.iter_post_pages(posted_after):
+            for post in page:
+                if post.id not in seen_ids:
+                    seen_ids.add(post.id)
+                    posts.append(post)
+            if len(posts) >= limit:
+                break
+        self.logger.debug(f"Fetched {len(posts)} posts from the ProductHunt GraphQL API")
+        return posts[:limit]
@@ -25,10 +25,28 @@ from selenium.common.exceptions import TimeoutException
 
 from models.data_models import TeamMember
 from utils.config import Config
+from utils.rate_limiting import (
+    HostRateLimiter,
+    get_rate_limiter
+)
+from utils.http_client import create_session
 from utils.configuration_service import get_configuration_service
-from utils.webdriver_manager import get_webdriver_manager
+from utils.webdriver_manager import (
+    get_webdriver_manager,
+    load_page
+)
 from services.ai_parser import AIParser
 from services.ai_team_extractor import AITeamExtractor
+from services.dom_index import (
+    DomIndex,
+    parse_html
+)
+from services.product_hunt_data import (
+    EmbeddedPost,
+    ProductHuntGraphQLClient,
+    extract_makers,
+    extract_posts
+)
 from services.website_extractor import WebsiteExtractor
 
 
@@ -71,24 +89,8 @@ class ProductData:
     team_section_url: Optional[str] = None
 
 
-class RateLimiter:
-    """Simple rate limiter for web scraping."""
-    
-    def __init__(self, delay: float = 2.0):
-        self.delay = delay
-        self.last_request_time = 0.0
-    
-    def wait_if_needed(self):
-        """Wait if necessary to respect rate limits."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.delay:
-            sleep_time = self.delay - time_since_last
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+# Scraping requests are scheduled by the central rate limiter
+RateLimiter = HostRateLimiter
 
 
 class ProductHuntScraper:
@@ -119,17 +121,28 @@ class ProductHuntScraper:
             config_service = get_configuration_service()
             self.config = config_service.get_config()
         
-        self.rate_limiter = RateLimiter(delay=self.config.scraping_delay)
+        self.rate_limiter = RateLimiter(
+            delay=self.config.scraping_delay,
+            service_name="producthunt",
+            operation="scraping",
+            rate_limiter=get_rate_limiter(self.config)
+        )
         
-        # HTTP session for requests
-        self.session = requests.Session()
-        self.session.headers.update({
+        # HTTP session on the shared connection pools, failing fast while Product Hunt is down
+        self.session = create_session(self.config, headers={
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         
         # Initialize WebDriver manager
         self.webdriver_manager = get_webdriver_manager(self.config)
         
+        # Paginated listings through the GraphQL API when a developer token is configured
+        api_token = getattr(self.config, 'producthunt_api_token', None)
+        self.graphql_client = (
+            ProductHuntGraphQLClient(api_token, session=self.session)
+            if isinstance(api_token, str) and api_token else None
+        )
+        
         # Initialize AI parser for enhanced team extraction
         try:
             self.ai_parser = AIParser(self.config)
@@ -143,16 +156,20 @@ class ProductHuntScraper:
         logger.info("ProductHuntScraper initialized with requests and BeautifulSoup")
     
     @retry_with_backoff(max_retries=3, base_delay=2.0)
-    def get_latest_products(self, limit: int = 50) -> List[ProductData]:
+    def get_latest_products(self, limit: int = 50, posted_after: Optional[datetime] = None) -> List[ProductData]:
         """
         Scrape ProductHunt for the latest product launches.
         
         Uses enhanced strategy:
-        - For limits > 15: Use Selenium with "See all of today's products" button
-        - For limits <= 15: Try raw HTTP first, fallback to Selenium if needed
+        - With an API token: page through the GraphQL API
+        - Otherwise read the homepage's embedded feed data over raw HTTP
+        - For limits > 15 not covered by the feed: Use Selenium with "See all of today's products" button
+        - For limits <= 15: fall back to the rendered HTML, then Selenium if needed
         
         Args:
             limit: Maximum number of products to retrieve
+            posted_after: Only launches after this time; honoured by the GraphQL
+                API, while page scraping always reads the current feed
             
         Returns:
             List of ProductData objects containing product information
@@ -164,13 +181,11 @@ class ProductHuntScraper:
         
         self.rate_limiter.wait_if_needed()
         
-        # If limit > 15, use Selenium approach directly since raw HTTP typically only shows ~15 products
-        if limit > 15:
-            logger.info(f"Limit ({limit}) > 15, using enhanced Selenium approach to access all products")
-            return self._get_products_with_selenium(limit)
-        
-        # For smaller limits, try raw HTTP first (faster)
-        logger.info(f"Limit ({limit}) <= 15, trying raw HTTP approach first")
+        # The GraphQL API pages past the homepage, so no browser is needed to expand the list
+        if self.graphql_client is not None:
+            products = self._get_products_from_graphql(limit, posted_after)
+            if products:
+                return products
         
         # ProductHunt URL for latest products
         url = "https://www.producthunt.com/"
@@ -183,11 +198,25 @@ class ProductHuntScraper:
             
             logger.info(f"Successfully fetched ProductHunt page, content length: {len(response.content)}")
             
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # The homepage embeds the day's whole feed as JSON, more posts than it renders
+            embedded_products = self._extract_products_from_embedded_data(response.content, limit)
+            if len(embedded_products) >= limit:
+                logger.info(f"Found {len(embedded_products)} products in the embedded page data")
+                return embedded_products
+            
+            # Rendered HTML typically only shows ~15 products, so larger limits need Selenium
+            if limit > 15:
+                logger.info(f"Limit ({limit}) > 15, using enhanced Selenium approach to access all products")
+                products = self._get_products_with_selenium(limit)
+                return products if len(products) >= len(embedded_products) else embedded_products
+            
+            # Parse once; every strategy below shares the same element index
+            soup = parse_html(response.content)
             
             # Extract product information from the page
             products = self._extract_products_from_raw_html(soup, limit)
+            if len(products) < len(embedded_products):
+                products = embedded_products
             
             # If we didn't get enough products and the limit is close to our threshold, try Selenium
             if len(products) < limit and limit > 10:
@@ -243,19 +272,33 @@ class ProductHuntScraper:
         try:
             # Extract company name for team members
             company_name = self._extract_company_from_url(product_url)
+            html = None
+            team_members = []
             
-            # Use our dedicated AI team extractor
-            team_extractor = AITeamExtractor(self.config)
-            team_members = team_extractor.extract_team_from_product_url(product_url, company_name)
+            # Makers listed in the page's embedded data need neither an AI call nor a DOM walk
+            try:
+                response = self.session.get(product_url, timeout=30)
+                response.raise_for_status()
+                html = response.content
+                team_members = self._extract_team_from_embedded_data(html, company_name)
+            except requests.RequestException as e:
+                logger.debug(f"Could not fetch {product_url} for embedded maker data: {e}")
+            
+            if not team_members:
+                # Use our dedicated AI team extractor
+                team_extractor = AITeamExtractor(self.config)
+                team_members = team_extractor.extract_team_from_product_url(product_url, company_name, html=html)
             
             if not team_members:
                 # Fall back to traditional parsing if AI extraction failed
                 logger.info("AI team extraction failed, using traditional team extraction")
                 
-                # Get the raw HTML using requests
-                response = self.session.get(product_url, timeout=30)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
+                if html is None:
+                    # Get the raw HTML using requests
+                    response = self.session.get(product_url, timeout=30)
+                    response.raise_for_status()
+                    html = response.content
+                soup = parse_html(html)
                 
                 # Use traditional extraction method
                 team_members = self._extract_team_from_soup(soup, product_url)
@@ -329,7 +372,7 @@ class ProductHuntScraper:
             response = self.session.get(product_data.product_url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(response.content)
             
             # Look for external links that might be the company website
             domain = self._find_company_domain_in_soup(soup, product_data.company_name)
@@ -512,11 +555,12 @@ class ProductHuntScraper:
         try:
             # Look for product cards on the homepage
             # ProductHunt structure may change, so we'll look for common patterns
-            product_elements = soup.find_all(['div', 'article'], class_=re.compile(r'.*product.*|.*item.*', re.I))
+            index = DomIndex.of(soup)
+            product_elements = index.with_class(('product', 'item'), ('div', 'article'))
             
             if not product_elements:
                 # Try alternative selectors - look for links to posts
-                product_elements = soup.find_all('a', href=re.compile(r'/posts/'))
+                product_elements = index.links_containing('/posts/')
             
             logger.debug(f"Found {len(product_elements)} potential product elements")
             
@@ -620,36 +664,28 @@ class ProductHuntScraper:
         company_name = self._extract_company_from_url(product_url)
         
         try:
-            # Multiple strategies to find team information
+            # Multiple strategies to find team information, all answered from one traversal
+            index = DomIndex.of(soup)
             team_sections = []
             
             # Strategy 1: Look for team/maker sections by class
-            team_sections.extend(soup.find_all(['div', 'section'], class_=re.compile(r'.*team.*|.*maker.*|.*creator.*', re.I)))
+            team_sections.extend(index.with_class(('team', 'maker', 'creator'), ('div', 'section')))
             
             # Strategy 2: Look for sections with team-related text
-            text_elements = soup.find_all(string=re.compile(r'team|maker|creator|founder|co-founder', re.I))
-            for text_elem in text_elements:
-                if text_elem.parent and text_elem.parent not in team_sections:
-                    # Get the parent container that might contain team info
-                    parent = text_elem.parent
-                    while parent and parent.name not in ['div', 'section', 'article']:
-                        parent = parent.parent
-                    if parent:
-                        team_sections.append(parent)
+            team_sections.extend(index.team_sections())
             
             # Strategy 3: Look for common ProductHunt team section patterns
-            team_sections.extend(soup.find_all(['div'], attrs={'data-test': re.compile(r'.*team.*|.*maker.*', re.I)}))
+            team_sections.extend(index.team_data_test)
             
             # Strategy 4: Look for sections containing LinkedIn links (often team sections)
-            linkedin_sections = soup.find_all(['div', 'section'], string=re.compile(r'linkedin', re.I))
-            for section in linkedin_sections:
-                if section not in team_sections:
-                    team_sections.append(section)
+            team_sections.extend(index.linkedin_text_sections)
             
             # Remove duplicates while preserving order
             unique_sections = []
+            seen = set()
             for section in team_sections:
-                if section not in unique_sections:
+                if id(section) not in seen:
+                    seen.add(id(section))
                     unique_sections.append(section)
             
             logger.debug(f"Found {len(unique_sections)} potential team sections")
@@ -782,7 +818,7 @@ class ProductHuntScraper:
         """
         try:
             # Look for external links that might be the company website
-            external_links = soup.find_all('a', href=re.compile(r'^https?://(?!.*producthunt\.com)'))
+            external_links = DomIndex.of(soup).external_links()
             
             for link in external_links:
                 href = link.get('href', '')
@@ -824,11 +860,8 @@ class ProductHuntScraper:
             logger.info("Extracting products from raw HTML using updated ProductHunt structure")
             
             # ProductHunt now uses /products/ instead of /posts/
-            product_links = []
-            
             # Strategy 1: Find all links containing '/products/'
-            all_links = soup.find_all('a', href=True)
-            product_links.extend([link for link in all_links if '/products/' in link.get('href', '')])
+            product_links = DomIndex.of(soup).links_containing('/products/')
             
             logger.info(f"Found {len(product_links)} potential product links")
             
@@ -969,7 +1002,7 @@ class ProductHuntScraper:
             logger.info("Using alternative raw HTML extraction")
             
             # Look for any text that might contain product URLs
-            page_text = soup.get_text()
+            page_text = DomIndex.of(soup).get_text()
             
             # Use regex to find ProductHunt product URLs in the text (updated pattern)
             url_pattern = r'https?://(?:www\.)?producthunt\.com/products/([a-zA-Z0-9-]+)'
@@ -1008,6 +1041,95 @@ class ProductHuntScraper:
         
         return products
     
+    def _product_from_post(self, post: EmbeddedPost) -> ProductData:
+        """
+        Convert a post from ProductHunt structured data into ProductData.
+        
+        Args:
+            post: Post from embedded page data or the GraphQL API
+            
+        Returns:
+            ProductData object
+        """
+        launch_date = post.created_at.astimezone().replace(tzinfo=None) if post.created_at else datetime.now()
+        return ProductData(
+            name=post.name,
+            company_name=post.name,
+            website_url=post.website_url,
+            product_url=post.product_url,
+            description=post.tagline,
+            launch_date=launch_date
+        )
+    
+    def _extract_products_from_embedded_data(self, html, limit: int) -> List[ProductData]:
+        """
+        Extract products from the JSON payload embedded in a ProductHunt page.
+        
+        Args:
+            html: Page HTML
+            limit: Maximum number of products to extract
+            
+        Returns:
+            List of ProductData objects
+        """
+        try:
+            products = [self._product_from_post(post) for post in extract_posts(html, limit)]
+            logger.debug(f"Found {len(products)} products in embedded page data")
+            return products
+        except Exception as e:
+            logger.warning(f"Failed to read embedded ProductHunt data: {str(e)}")
+            return []
+    
+    def _extract_team_from_embedded_data(self, html, company_name: str) -> List[TeamMember]:
+        """
+        Extract the makers listed in the JSON payload embedded in a product page.
+        
+        Args:
+            html: Page HTML
+            company_name: Name of the company
+            
+        Returns:
+            List of TeamMember objects
+        """
+        team_members = []
+        try:
+            for maker in extract_makers(html):
+                headline = maker.headline[:200]
+                try:
+                    team_members.append(TeamMember(
+                        name=maker.name,
+                        role=headline if len(headline) >= 2 else "Team Member",
+                        linkedin_url=maker.linkedin_url,
+                        company=company_name
+                    ))
+                except Exception as e:
+                    logger.debug(f"Skipping embedded maker {maker.name}: {str(e)}")
+        except Exception as e:
+            logger.warning(f"Failed to read embedded maker data: {str(e)}")
+        
+        if team_members:
+            logger.info(f"Found {len(team_members)} makers in embedded page data")
+        return team_members
+    
+    def _get_products_from_graphql(self, limit: int, posted_after: Optional[datetime] = None) -> List[ProductData]:
+        """
+        Get the latest products from the ProductHunt GraphQL API, following page cursors.
+        
+        Args:
+            limit: Maximum number of products to retrieve
+            posted_after: Only launches after this time (defaults to the last day)
+            
+        Returns:
+            List of ProductData objects, empty if the API failed
+        """
+        try:
+            products = [self._product_from_post(post) for post in self.graphql_client.get_posts(limit, posted_after)]
+            logger.info(f"Fetched {len(products)} products from the ProductHunt GraphQL API")
+            return products
+        except Exception as e:
+            logger.warning(f"ProductHunt GraphQL API failed: {str(e)}. Falling back to page scraping.")
+            return []
+    
     def _try_api_approach(self, limit: int) -> List[ProductData]:
         """
         Try to use ProductHunt's API or API-like endpoints.
@@ -1092,14 +1214,14 @@ class ProductHuntScraper:
         
         try:
             with self.webdriver_manager.get_driver("product_hunt_scraper") as driver:
-                driver.get("https://www.producthunt.com/")
-                
-                # Wait for products to load
-                wait = WebDriverWait(driver, 15)
-                try:
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/products/']")))
-                except TimeoutException:
+                # Wait for product links rather than the full page load
+                page_load = load_page(
+                    driver, "https://www.producthunt.com/",
+                    wait_for=[(By.CSS_SELECTOR, "a[href*='/products/']")], timeout=15
+                )
+                if not page_load.ready:
                     logger.warning("Selenium: Could not find expected elements, proceeding with current page state")
+                wait = WebDriverWait(driver, 15)
                 
                 # Count initial products
                 initial_products = driver.find_elements(By.CSS_SELECTOR, "a[href*='/products/']")
@@ -1110,8 +1232,8 @@ class ProductHuntScraper:
                 expanded = self._try_expand_product_list(driver, wait)
                 
                 if expanded:
-                    # Wait a bit for the expanded content to load
-                    time.sleep(2)
+                    # _try_expand_product_list already waited for the new products to render
+                    get_rate_limiter(self.config).record_avoided_sleep("producthunt_expansion", 2.0)
                     
                     # Count products after expansion
                     expanded_products = driver.find_elements(By.CSS_SELECTOR, "a[href*='/products/']")
@@ -1121,7 +1243,7 @@ class ProductHuntScraper:
                     logger.info("Could not expand product list, using initial view")
                 
                 # Get page source and parse with BeautifulSoup
-                soup = BeautifulSoup(driver.page_source, 'html.parser')
+                soup = parse_html(driver.page_source)
                 
                 # Use the raw HTML extraction method
                 products = self._extract_products_from_raw_html(soup, limit)
@@ -1136,6 +1258,32 @@ class ProductHuntScraper:
             logger.error(f"Enhanced Selenium approach failed: {str(e)}")
             return []
     
+    def _wait_for_more_products(self, driver, count_before: int, timeout: float = 10.0) -> bool:
+        """
+        Wait until more product links are on the page than before an expansion.
+        
+        Args:
+            driver: Selenium WebDriver instance
+            count_before: Number of unique product links before the expansion
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if more products appeared, False on timeout
+        """
+        def products_grew(current_driver) -> bool:
+            links = current_driver.find_elements(By.CSS_SELECTOR, "a[href*='/products/']")
+            return len(set(link.get_attribute('href') for link in links if link.get_attribute('href'))) > count_before
+        
+        started = time.time()
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.2).until(products_grew)
+            grew = True
+        except TimeoutException:
+            grew = False
+        # Replaces a fixed 3 second sleep
+        get_rate_limiter(self.config).record_avoided_sleep("producthunt_expansion", 3.0 - (time.time() - started))
+        return grew
+    
     def _try_expand_product_list(self, driver, wait: WebDriverWait) -> bool:
         """
         Try to click the "See all of today's products" button to expand the product list.
@@ -1211,9 +1359,14 @@ class ProductHuntScraper:
                 if not expand_button:
                     return False
             
-            # Scroll the button into view
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", expand_button)
-            time.sleep(2)
+            # Scroll the button into view and wait until it can be clicked
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", expand_button)
+            started = time.time()
+            try:
+                WebDriverWait(driver, 5).until(EC.element_to_be_clickable(expand_button))
+            except TimeoutException:
+                logger.debug("Expansion button not reported clickable, trying anyway")
+            get_rate_limiter(self.config).record_avoided_sleep("producthunt_expansion", 2.0 - (time.time() - started))
             
             # Count products before clicking
             products_before = driver.find_elements(By.CSS_SELECTOR, "a[href*='/products/']")
@@ -1227,7 +1380,7 @@ class ProductHuntScraper:
                 logger.info("Successfully clicked the expansion button")
                 
                 # Wait for the page to update and count products
-                time.sleep(3)  # Give the page time to load
+                self._wait_for_more_products(driver, len(unique_before))
                 
                 products_after = driver.find_elements(By.CSS_SELECTOR, "a[href*='/products/']")
                 unique_after = set(link.get_attribute('href') for link in products_after if link.get_attribute('href'))
@@ -1249,7 +1402,7 @@ class ProductHuntScraper:
                     logger.info("Successfully clicked expansion button using JavaScript")
                     
                     # Wait for the page to update
-                    time.sleep(3)
+                    self._wait_for_more_products(driver, len(unique_before))
                     products_after_js = driver.find_elements(By.CSS_SELECTOR, "a[href*='/products/']")
                     unique_after_js = set(link.get_attribute('href') for link in products_after_js if link.get_attribute('href'))
                     logger.info(f"Products after JS expansion: {len(unique_after_js)}")
@@ -1284,7 +1437,7 @@ class ProductHuntScraper:
         
         try:
             # Find all LinkedIn links on the page
-            linkedin_links = soup.find_all('a', href=re.compile(r'linkedin\.com/in/', re.I))
+            linkedin_links = DomIndex.of(soup).links_containing('linkedin.com/in/', ignore_case=True)
             
             logger.debug(f"Found {len(linkedin_links)} LinkedIn links for team extraction")
             
@@ -1354,10 +1507,11 @@ class ProductHuntScraper:
             String containing team-related content for AI parsing
         """
         try:
+            index = DomIndex.of(soup)
             team_content_parts = []
             
             # Strategy 1: Look for team/maker sections by class
-            team_sections = soup.find_all(['div', 'section'], class_=re.compile(r'.*team.*|.*maker.*|.*creator.*', re.I))
+            team_sections = index.with_class(('team', 'maker', 'creator'), ('div', 'section'))
             
             for section in team_sections:
                 content = section.get_text(separator=' ', strip=True)
@@ -1367,7 +1521,7 @@ class ProductHuntScraper:
             # Strategy 1b: Look for any content that mentions team-related keywords
             if not team_content_parts:
                 # Get all text content and look for team-related sections
-                all_text = soup.get_text(separator='\n', strip=True)
+                all_text = index.get_text(separator='\n', strip=True)
                 lines = all_text.split('\n')
                 
                 team_section_found = False
@@ -1397,20 +1551,13 @@ class ProductHuntScraper:
                     team_content_parts.append(' '.join(current_section))
             
             # Strategy 2: Look for sections with team-related text
-            text_elements = soup.find_all(string=re.compile(r'team|maker|creator|founder|co-founder', re.I))
-            for text_elem in text_elements:
-                if text_elem.parent:
-                    # Get the parent container that might contain team info
-                    parent = text_elem.parent
-                    while parent and parent.name not in ['div', 'section', 'article']:
-                        parent = parent.parent
-                    if parent:
-                        content = parent.get_text(separator=' ', strip=True)
-                        if content and len(content) > 20 and content not in team_content_parts:
-                            team_content_parts.append(content)
+            for parent in index.team_sections():
+                content = parent.get_text(separator=' ', strip=True)
+                if content and len(content) > 20 and content not in team_content_parts:
+                    team_content_parts.append(content)
             
             # Strategy 3: Extract content around LinkedIn links
-            linkedin_links = soup.find_all('a', href=re.compile(r'linkedin\.com', re.I))
+            linkedin_links = index.links_containing('linkedin.com', ignore_case=True)
             for link in linkedin_links:
                 if link.parent:
                     parent_content = link.parent.get_text(separator=' ', strip=True)
@@ -129,6 +129,8 @@ class AnthropicProvider(BaseAIProvider):
             # Add system message if present
             if system_message:
                 request_params["system"] = system_message
+            if request.timeout is not None:
+                request_params["timeout"] = request.timeout
             
             # Make the API call
             response = self.client.messages.create(**request_params)
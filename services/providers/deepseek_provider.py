@@ -112,6 +112,8 @@ class DeepSeekProvider(BaseAIProvider):
                 request_params["frequency_penalty"] = request.frequency_penalty
             if hasattr(request, 'presence_penalty') and request.presence_penalty is not None:
                 request_params["presence_penalty"] = request.presence_penalty
+            if getattr(request, 'timeout', None) is not None:
+                request_params["timeout"] = request.timeout
             
             # Make the API call
             response = self.client.chat.completions.create(**request_params)
@@ -0,0 +1,493 @@
+"""
+Quota budgeting and campaign planning for paid APIs.
+
+Before a campaign starts, QuotaPlanner turns the remaining Hunter.io
+credits, the daily LLM token budget and the optional daily Notion request
+budget into the number of companies the run can afford. Each pipeline stage
+gets its share of the budgets reserved up front, and when the budgets fall
+short the plan degrades (skipping email verification, switching to a cheaper
+model) instead of letting the run fail part-way when credits run out.
+
+While a plan is active the planner meters actual usage: Hunter calls through
+APIMonitor observers, LLM tokens through AIProviderManager usage observers,
+and Notion writes as reported by the controller. Daily usage is kept in a
+small JSON ledger so budgets hold across runs on the same day.
+"""
+
+import json
+import math
+import threading
+from contextlib import contextmanager
+from dataclasses import (
+    dataclass,
+    field
+)
+from datetime import date
+from enum import Enum
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple
+)
+
+from utils.api_monitor import get_api_monitor
+from utils.error_handling import get_error_handler
+from utils.logging_config import get_logger
+
+
+class QuotaResource(Enum):
+    """Paid or limited resources consumed by a campaign."""
+    HUNTER_SEARCHES = "hunter_searches"
+    HUNTER_VERIFICATIONS = "hunter_verifications"
+    LLM_TOKENS = "llm_tokens"
+    NOTION_REQUESTS = "notion_requests"
+
+
+class PipelineStage(Enum):
+    """Campaign stages that budget is reserved for."""
+    ANALYSIS = "analysis"
+    EMAIL_FINDING = "email_finding"
+    VERIFICATION = "verification"
+    STRUCTURING = "structuring"
+    STORAGE = "storage"
+
+
+# Resource each stage draws from
+STAGE_RESOURCES: Dict[PipelineStage, QuotaResource] = {
+    PipelineStage.ANALYSIS: QuotaResource.LLM_TOKENS,
+    PipelineStage.EMAIL_FINDING: QuotaResource.HUNTER_SEARCHES,
+    PipelineStage.VERIFICATION: QuotaResource.HUNTER_VERIFICATIONS,
+    PipelineStage.STRUCTURING: QuotaResource.LLM_TOKENS,
+    PipelineStage.STORAGE: QuotaResource.NOTION_REQUESTS
+}
+
+# Hunter endpoints that spend credits
+HUNTER_ENDPOINT_STAGES: Dict[str, PipelineStage] = {
+    'email-finder': PipelineStage.EMAIL_FINDING,
+    'email-verifier': PipelineStage.VERIFICATION
+}
+
+# Cheaper model per provider, used when the LLM budget runs short
+FALLBACK_MODELS: Dict[str, str] = {
+    "openai": "gpt-4o-mini",
+    "anthropic": "claude-3-haiku-20240307",
+    "google": "gemini-2.5-flash-lite"
+}
+
+
+@dataclass
+class CostEstimate:
+    """Expected spend per company and per prospect."""
+    prospects_per_company: float = 3.0
+    llm_tokens_per_company: int = 9000  # product analysis, team extraction, LinkedIn parsing
+    llm_tokens_per_prospect: int = 4000  # data structuring for personalization
+    llm_tokens_per_email: int = 1500
+    hunter_searches_per_prospect: float = 1.0
+    hunter_verifications_per_prospect: float = 1.0
+    notion_requests_per_prospect: float = 3.0  # duplicate check, page create, AI data update
+    
+    def stage_costs(self, verify: bool = True, include_emails: bool = False,
+                    token_weight: float = 1.0) -> Dict[PipelineStage, float]:
+        """
+        Get the per-company cost of each stage in units of its resource.
+        
+        Args:
+            verify: Whether found emails are verified
+            include_emails: Whether outreach emails are generated in the same run
+            token_weight: Budget weight of each LLM token
+        
+        Returns:
+            Dictionary mapping stage to cost per company
+        """
+        prospects = self.prospects_per_company
+        prospect_tokens = self.llm_tokens_per_prospect
+        if include_emails:
+            prospect_tokens += self.llm_tokens_per_email
+        
+        return {
+            PipelineStage.ANALYSIS: self.llm_tokens_per_company * token_weight,
+            PipelineStage.EMAIL_FINDING: self.hunter_searches_per_prospect * prospects,
+            PipelineStage.VERIFICATION: self.hunter_verifications_per_prospect * prospects if verify else 0.0,
+            PipelineStage.STRUCTURING: prospect_tokens * prospects * token_weight,
+            PipelineStage.STORAGE: self.notion_requests_per_prospect * prospects
+        }
+
+
+@dataclass
+class CampaignPlan:
+    """How much of a campaign the remaining quotas can pay for."""
+    requested_companies: int
+    companies: int
+    estimated_prospects: int
+    verify_emails: bool = True
+    fallback_model: Optional[str] = None
+    limiting_resource: Optional[str] = None
+    degradations: List[str] = field(default_factory=list)
+    reservations: Dict[str, int] = field(default_factory=dict)
+    remaining: Dict[str, Optional[int]] = field(default_factory=dict)
+    
+    @property
+    def is_degraded(self) -> bool:
+        """Check if the plan deviates from a full-quality run."""
+        return bool(self.degradations) or self.companies < self.requested_companies
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for display and logging."""
+        return {
+            'requested_companies': self.requested_companies,
+            'companies': self.companies,
+            'estimated_prospects': self.estimated_prospects,
+            'verify_emails': self.verify_emails,
+            'fallback_model': self.fallback_model,
+            'limiting_resource': self.limiting_resource,
+            'degradations': list(self.degradations),
+            'reservations': dict(self.reservations),
+            'remaining': dict(self.remaining)
+        }
+
+
+def _number(value: Any) -> Optional[float]:
+    """Return value if it is a real number (not a bool or a test double)."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return None
+
+
+class QuotaPlanner:
+    """
+    Plans campaigns against remaining API quotas and meters their usage.
+    
+    Hunter.io credits come from the error handler's service quotas (kept
+    current by EmailFinder.get_account_quota()); LLM tokens and Notion
+    requests are budgeted per day from configuration. Budgets that are not
+    known or not configured are treated as unlimited.
+    """
+    
+    # Tokens on the fallback model count at this fraction against the budget,
+    # which caps spend rather than raw token counts
+    FALLBACK_TOKEN_WEIGHT = 0.25
+    
+    def __init__(self, config=None, costs: Optional[CostEstimate] = None,
+                 ledger_path: str = "logs/quota_usage.json"):
+        """
+        Initialize quota planner.
+        
+        Args:
+            config: Configuration object with budget settings
+            costs: Per-company and per-prospect cost estimates
+            ledger_path: JSON file recording each day's usage
+        """
+        self.config = config
+        self.logger = get_logger(__name__)
+        self.error_handler = get_error_handler()
+        self.ledger_path = Path(ledger_path)
+        
+        if costs is None:
+            costs = CostEstimate()
+            max_prospects = _number(getattr(config, 'max_prospects_per_company', None))
+            if max_prospects:
+                costs.prospects_per_company = min(costs.prospects_per_company, max_prospects)
+        self.costs = costs
+        
+        self.active_plan: Optional[CampaignPlan] = None
+        self._consumed: Dict[PipelineStage, float] = {}
+        self._exhausted_logged: set = set()
+        self._previous_model: Optional[str] = None
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        
+        self._ledger_day, self._daily_usage = self._load_ledger()
+    
+    def _load_ledger(self) -> Tuple[str, Dict[str, float]]:
+        """Load today's usage from the ledger file."""
+        today = date.today().isoformat()
+        try:
+            if self.ledger_path.exists():
+                with open(self.ledger_path, 'r') as f:
+                    data = json.load(f)
+                if data.get('date') == today:
+                    return today, {k: float(v) for k, v in data.get('usage', {}).items()}
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            self.logger.warning(f"Ignoring unreadable quota ledger {self.ledger_path}: {e}")
+        return today, {}
+    
+    def save_ledger(self) -> None:
+        """Persist today's usage."""
+        with self._lock:
+            data = {'date': self._ledger_day, 'usage': dict(self._daily_usage)}
+        try:
+            self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.ledger_path, 'w') as f:
+                json.dump(data, f, indent=2)
+        except OSError as e:
+            self.logger.warning(f"Failed to save quota ledger: {e}")
+    
+    def _roll_day(self) -> None:
+        """Start a fresh daily ledger after midnight."""
+        today = date.today().isoformat()
+        if today != self._ledger_day:
+            self._ledger_day = today
+            self._daily_usage = {}
+    
+    def _hunter_shared_pool(self) -> bool:
+        """Check if Hunter reports one pool of requests instead of separate credits."""
+        quotas = self.error_handler.service_quotas
+        return 'hunter_requests' in quotas and 'hunter_searches' not in quotas
+    
+    def _resource_for(self, stage: PipelineStage) -> QuotaResource:
+        """Get the resource a stage draws from, accounting for shared Hunter pools."""
+        if stage == PipelineStage.VERIFICATION and self._hunter_shared_pool():
+            return QuotaResource.HUNTER_SEARCHES
+        return STAGE_RESOURCES[stage]
+    
+    def _daily_budgets(self) -> Dict[QuotaResource, Optional[float]]:
+        return {
+            QuotaResource.LLM_TOKENS: _number(getattr(self.config, 'ai_daily_token_budget', None)),
+            QuotaResource.NOTION_REQUESTS: _number(getattr(self.config, 'notion_daily_request_budget', None))
+        }
+    
+    def remaining(self) -> Dict[QuotaResource, Optional[float]]:
+        """
+        Get the remaining amount of each resource.
+        
+        Returns:
+            Dictionary mapping resource to remaining units, None if unlimited
+        """
+        remaining: Dict[QuotaResource, Optional[float]] = {resource: None for resource in QuotaResource}
+        
+        quotas = self.error_handler.service_quotas
+        hunter_keys = {
+            QuotaResource.HUNTER_SEARCHES: 'hunter_searches',
+            QuotaResource.HUNTER_VERIFICATIONS: 'hunter_verifications'
+        }
+        if self._hunter_shared_pool():
+            hunter_keys = {QuotaResource.HUNTER_SEARCHES: 'hunter_requests'}
+        for resource, key in hunter_keys.items():
+            quota = quotas.get(key)
+            if quota is not None:
+                remaining[resource] = max(0, quota.limit - quota.used)
+        
+        with self._lock:
+            self._roll_day()
+            for resource, budget in self._daily_budgets().items():
+                if budget is not None:
+                    remaining[resource] = max(0.0, budget - self._daily_usage.get(resource.value, 0.0))
+        
+        return remaining
+    
+    def get_fallback_model(self) -> Optional[str]:
+        """Get the cheaper model to switch to, if one is known for the provider."""
+        model = getattr(self.config, 'ai_fallback_model', None)
+        if isinstance(model, str) and model:
+            return model
+        provider = getattr(self.config, 'ai_provider', None)
+        return FALLBACK_MODELS.get(provider) if isinstance(provider, str) else None
+    
+    def _capacity(self, requested: int, remaining: Dict[QuotaResource, Optional[float]],
+                  costs: Dict[PipelineStage, float]) -> Tuple[int, Optional[QuotaResource]]:
+        """Get how many companies the remaining quotas cover and what limits them."""
+        per_company: Dict[QuotaResource, float] = {}
+        for stage, cost in costs.items():
+            resource = self._resource_for(stage)
+            per_company[resource] = per_company.get(resource, 0.0) + cost
+        
+        companies, limiting = requested, None
+        for resource, cost in per_company.items():
+            available = remaining.get(resource)
+            if available is None or cost <= 0:
+                continue
+            affordable = int(available // cost)
+            if affordable < companies:
+                companies, limiting = affordable, resource
+        return companies, limiting
+    
+    def plan(self, requested_companies: int, include_emails: bool = False) -> CampaignPlan:
+        """
+        Plan a campaign against the remaining quotas.
+        
+        Degradations are applied in order of least impact: verification is
+        skipped when Hunter verification credits are short, and a cheaper
+        model is used when the LLM budget is short. Whatever the degraded
+        plan still cannot cover reduces the number of companies.
+        
+        Args:
+            requested_companies: Number of companies the campaign asks for
+            include_emails: Whether outreach emails are generated in the same run
+        
+        Returns:
+            CampaignPlan with the affordable company count and stage reservations
+        """
+        remaining = self.remaining()
+        verify = True
+        fallback_model = None
+        degradations: List[str] = []
+        
+        while True:
+            token_weight = self.FALLBACK_TOKEN_WEIGHT if fallback_model else 1.0
+            costs = self.costs.stage_costs(verify, include_emails, token_weight)
+            companies, limiting = self._capacity(requested_companies, remaining, costs)
+            if limiting is None:
+                break
+            
+            if verify and limiting == self._resource_for(PipelineStage.VERIFICATION):
+                verify = False
+                degradations.append("skip_verification")
+            elif limiting == QuotaResource.LLM_TOKENS and not fallback_model and self.get_fallback_model():
+                fallback_model = self.get_fallback_model()
+                degradations.append(f"fallback_model:{fallback_model}")
+            else:
+                break
+        
+        reservations = {}
+        for stage, cost in costs.items():
+            if cost > 0 and remaining.get(self._resource_for(stage)) is not None:
+                reservations[stage.value] = int(math.ceil(cost * companies))
+        
+        plan = CampaignPlan(
+            requested_companies=requested_companies,
+            companies=max(0, companies),
+            estimated_prospects=int(round(max(0, companies) * self.costs.prospects_per_company)),
+            verify_emails=verify,
+            fallback_model=fallback_model,
+            limiting_resource=limiting.value if limiting else None,
+            degradations=degradations,
+            reservations=reservations,
+            remaining={resource.value: None if value is None else int(value)
+                       for resource, value in remaining.items()}
+        )
+        
+        if plan.is_degraded:
+            self.logger.warning(
+                f"Quota plan: {plan.companies}/{requested_companies} companies "
+                f"(limited by {plan.limiting_resource}), degradations: {degradations or 'none'}"
+            )
+        else:
+            self.logger.info(f"Quota plan: all {requested_companies} companies fit the remaining budgets")
+        return plan
+    
+    def start(self, plan: CampaignPlan) -> None:
+        """
+        Activate a plan: meter usage against its reservations and apply its degradations.
+        
+        Args:
+            plan: Plan returned by plan()
+        """
+        from services.ai_provider_manager import get_provider_manager
+        
+        with self._lock:
+            self.active_plan = plan
+            self._consumed = {stage: 0.0 for stage in PipelineStage}
+            self._exhausted_logged = set()
+        
+        get_api_monitor().add_observer(self._observe_api_call)
+        provider_manager = get_provider_manager()
+        provider_manager.add_usage_observer(self._observe_completion)
+        if plan.fallback_model:
+            self._previous_model = provider_manager.get_model_override()
+            provider_manager.set_model_override(plan.fallback_model)
+    
+    def finish(self) -> Dict[str, Any]:
+        """
+        Deactivate the current plan and persist usage.
+        
+        Returns:
+            Dictionary with the plan and the usage consumed per stage
+        """
+        from services.ai_provider_manager import get_provider_manager
+        
+        get_api_monitor().remove_observer(self._observe_api_call)
+        provider_manager = get_provider_manager()
+        provider_manager.remove_usage_observer(self._observe_completion)
+        
+        with self._lock:
+            plan = self.active_plan
+            consumed = {stage.value: int(round(amount)) for stage, amount in self._consumed.items()}
+            self.active_plan = None
+        
+        if plan and plan.fallback_model:
+            provider_manager.set_model_override(self._previous_model)
+        
+        self.save_ledger()
+        return {'plan': plan.to_dict() if plan else None, 'consumed': consumed}
+    
+    @contextmanager
+    def stage(self, stage: PipelineStage) -> Iterator[None]:
+        """Attribute LLM tokens used by the calling thread to a stage."""
+        previous = getattr(self._local, 'stage', None)
+        self._local.stage = stage
+        try:
+            yield
+        finally:
+            self._local.stage = previous
+    
+    def allow(self, stage: PipelineStage) -> bool:
+        """
+        Check if a stage may still spend.
+        
+        Stages without a reservation (unlimited budgets, or no active plan)
+        are always allowed. Verification is refused when the plan skips it.
+        
+        Args:
+            stage: Pipeline stage about to spend
+        
+        Returns:
+            True if the stage is within its reservation
+        """
+        with self._lock:
+            plan = self.active_plan
+            if plan is None:
+                return True
+            if stage == PipelineStage.VERIFICATION and not plan.verify_emails:
+                return False
+            
+            reserved = plan.reservations.get(stage.value)
+            if reserved is None or self._consumed.get(stage, 0.0) < reserved:
+                return True
+            
+            if stage not in self._exhausted_logged:
+                self._exhausted_logged.add(stage)
+                plan.degradations.append(f"{stage.value}_budget_exhausted")
+                self.logger.warning(f"Reserved {stage.value} budget used up, skipping that stage for the rest of the run")
+            return False
+    
+    def record(self, stage: PipelineStage, amount: float) -> None:
+        """
+        Record usage by a stage.
+        
+        Args:
+            stage: Pipeline stage that spent
+            amount: Units of the stage's resource (budget-weighted tokens for LLM stages)
+        """
+        if amount <= 0:
+            return
+        resource = self._resource_for(stage)
+        with self._lock:
+            self._roll_day()
+            self._daily_usage[resource.value] = self._daily_usage.get(resource.value, 0.0) + amount
+            if self.active_plan is not None:
+                self._consumed[stage] = self._consumed.get(stage, 0.0) + amount
+    
+    def _observe_api_call(self, service: str, endpoint: str, status_code: int,
+                          rate_limit_headers: Optional[Dict[str, str]]) -> None:
+        """APIMonitor observer counting Hunter credits."""
+        if service == 'hunter' and status_code < 400 and endpoint in HUNTER_ENDPOINT_STAGES:
+            self.record(HUNTER_ENDPOINT_STAGES[endpoint], 1)
+    
+    def _observe_completion(self, provider_name: str, response) -> None:
+        """AIProviderManager observer counting LLM tokens."""
+        usage = response.usage or {}
+        tokens = usage.get('total_tokens')
+        if not isinstance(tokens, (int, float)):
+            tokens = sum(value for key, value in usage.items()
+                         if key in ('prompt_tokens', 'completion_tokens', 'input_tokens', 'output_tokens')
+                         and isinstance(value, (int, float)))
+        
+        plan = self.active_plan
+        if plan and plan.fallback_model and response.model == plan.fallback_model:
+            tokens *= self.FALLBACK_TOKEN_WEIGHT
+        
+        self.record(getattr(self._local, 'stage', None) or PipelineStage.ANALYSIS, tokens)
@@ -4,8 +4,8 @@ Website URL extraction from ProductHunt pages.
 
 import logging
 import re
+from typing import List, Optional
 
-import requests
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -13,6 +13,12 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from services.negative_cache import (
+    get_negative_cache,
+    classify_failure,
+    NegativeReason
+)
+from utils.http_client import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +33,12 @@ class WebsiteExtractor:
         self.chrome_options.add_argument('--no-sandbox')
         self.chrome_options.add_argument('--disable-dev-shm-usage')
         self.chrome_options.add_argument('--disable-gpu')
+        
+        # Product pages that produced no website are not scraped again
+        self.negative_cache = get_negative_cache()
+        
+        # HTTP session on the shared connection pools
+        self.session = create_session()
     
     def extract_website_url(self, product_url: str) -> str:
         """
@@ -38,29 +50,48 @@ class WebsiteExtractor:
         Returns:
             Website URL or empty string if not found
         """
+        negative = self.negative_cache.check("website-url", product_url)
+        if negative:
+            logger.info(f"Skipping {product_url} - previous extraction: {negative.reason.value}")
+            return ""
+        
         try:
             logger.info(f"Extracting website URL from {product_url}")
+            failures: List[Optional[NegativeReason]] = []
             
             # Try with Selenium first for JavaScript-rendered content
-            website_url = self._extract_with_selenium(product_url)
+            website_url = self._extract_with_selenium(product_url, failures)
             if website_url:
                 logger.info(f"Found website URL with Selenium: {website_url}")
                 return website_url
             
             # Fall back to requests
-            website_url = self._extract_with_requests(product_url)
+            website_url = self._extract_with_requests(product_url, failures)
             if website_url:
                 logger.info(f"Found website URL with requests: {website_url}")
                 return website_url
             
             logger.warning(f"Could not find website URL for {product_url}")
+            self._record_failure(product_url, failures)
             return ""
             
         except Exception as e:
             logger.error(f"Error extracting website URL: {e}")
             return ""
     
-    def _extract_with_selenium(self, product_url: str) -> str:
+    def _record_failure(self, product_url: str, failures: List[Optional[NegativeReason]]) -> None:
+        """Cache why no website was found, unless every attempt failed for an unknown reason."""
+        if len(failures) < 2:
+            # At least one method loaded the page and found no website
+            reason = NegativeReason.NOT_FOUND
+        else:
+            reason = next((r for r in failures if r is not None), None)
+        
+        if reason is not None:
+            self.negative_cache.record("website-url", product_url, reason)
+    
+    def _extract_with_selenium(self, product_url: str,
+                               failures: Optional[List[Optional[NegativeReason]]] = None) -> str:
         """Extract website URL using Selenium."""
         driver = None
         try:
@@ -93,12 +124,15 @@ class WebsiteExtractor:
             
         except Exception as e:
             logger.warning(f"Selenium extraction failed: {e}")
+            if failures is not None:
+                failures.append(classify_failure(e))
             return ""
         finally:
             if driver:
                 driver.quit()
     
-    def _extract_with_requests(self, product_url: str) -> str:
+    def _extract_with_requests(self, product_url: str,
+                               failures: Optional[List[Optional[NegativeReason]]] = None) -> str:
         """Extract website URL using requests."""
         try:
             headers = {
@@ -107,7 +141,7 @@ class WebsiteExtractor:
                 'Accept-Language': 'en-US,en;q=0.5',
             }
             
-            response = requests.get(product_url, headers=headers, timeout=30)
+            response = self.session.get(product_url, headers=headers, timeout=30)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -133,6 +167,8 @@ class WebsiteExtractor:
             
         except Exception as e:
             logger.warning(f"Requests extraction failed: {e}")
+            if failures is not None:
+                failures.append(classify_failure(e))
             return ""
     
     def _is_likely_company_website(self, url: str) -> bool:
@@ -8,6 +8,14 @@ import pytest
 from tests.test_utilities import (
     TestUtilities, MockExternalServices, PerformanceTestUtilities
 )
+from utils.circuit_breaker import get_circuit_breaker_registry
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Close circuits opened by failures simulated in earlier tests."""
+    get_circuit_breaker_registry().reset()
+    yield
 
 
 # Pytest fixtures for common use
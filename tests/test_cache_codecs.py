@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the cache codec layer.
+"""
+
+import pickle
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from utils.cache_codecs import (
+    CacheCodec, CacheCodecError, is_plain_data,
+    CODEC_MAGIC, HEADER_SIZE, MSGPACK_AVAILABLE, ORJSON_AVAILABLE, ZSTD_AVAILABLE
+)
+from services.caching_service import CacheEntry, PersistentCacheBackend
+
+
+SAMPLE_PROFILE = {
+    'linkedin_url': 'https://linkedin.com/in/jane-doe',
+    'profile': {
+        'name': 'Jane Doe',
+        'current_role': 'CTO at Example',
+        'experience': ['CTO at Example', 'Staff Engineer at Other'] * 10,
+        'skills': ['Python', 'Distributed Systems', 'Leadership'] * 10,
+        'summary': 'Builds developer tools. ' * 50
+    },
+    'cached_at': '2024-01-01T12:00:00',
+    'cache_key': 'abc123'
+}
+
+
+def available_serializers():
+    names = ['json', 'pickle']
+    if ORJSON_AVAILABLE:
+        names.append('orjson')
+    if MSGPACK_AVAILABLE:
+        names.append('msgpack')
+    return names
+
+
+def available_compressors():
+    names = ['none', 'zlib']
+    if ZSTD_AVAILABLE:
+        names.append('zstd')
+    return names
+
+
+class TestCacheCodec:
+    """Test CacheCodec functionality."""
+    
+    @pytest.mark.parametrize("serializer", available_serializers())
+    @pytest.mark.parametrize("compression", available_compressors())
+    def test_round_trip(self, serializer, compression):
+        """Test every serializer/compressor combination round-trips."""
+        codec = CacheCodec(serializer=serializer, compression=compression, compress_threshold=0,
+                           allow_pickle=serializer == 'pickle')
+        
+        data = codec.encode(SAMPLE_PROFILE)
+        
+        assert data.startswith(CODEC_MAGIC)
+        assert codec.decode(data) == SAMPLE_PROFILE
+    
+    def test_decode_is_independent_of_preferred_codec(self):
+        """Test payloads decode with a codec configured differently."""
+        writer = CacheCodec(serializer='json', compression='zlib', compress_threshold=0)
+        reader = CacheCodec()
+        
+        assert reader.decode(writer.encode(SAMPLE_PROFILE)) == SAMPLE_PROFILE
+    
+    @pytest.mark.parametrize("serializer", available_serializers())
+    def test_non_plain_values_fall_back_to_pickle(self, serializer):
+        """Test values a format would change are pickled instead, when allowed."""
+        codec = CacheCodec(serializer=serializer, allow_pickle=True)
+        value = {'pair': (1, 2), 'ids': {1, 2}, 'when': datetime(2024, 1, 1)}
+        
+        decoded = codec.decode(codec.encode(value))
+        
+        assert decoded == value
+        assert isinstance(decoded['pair'], tuple)
+        assert codec.pickle_fallbacks == (0 if serializer == 'pickle' else 1)
+    
+    def test_pickle_is_opt_in(self):
+        """Test the default codec neither pickles nor unpickles."""
+        pickled = CacheCodec(allow_pickle=True).encode({'pair': (1, 2)})
+        codec = CacheCodec()
+        
+        with pytest.raises(CacheCodecError):
+            codec.encode({'pair': (1, 2)})
+        with pytest.raises(CacheCodecError):
+            codec.decode(pickled)
+    
+    def test_codec_without_pickle(self):
+        """Test a codec with pickle disabled neither writes nor reads pickle."""
+        pickled = CacheCodec(serializer='pickle', allow_pickle=True).encode({'a': 1})
+        codec = CacheCodec(serializer='pickle', allow_pickle=True).without_pickle()
+        
+        assert codec.serializer.name != 'pickle'
+        assert codec.decode(codec.encode(SAMPLE_PROFILE)) == SAMPLE_PROFILE
+        with pytest.raises(CacheCodecError):
+            codec.encode({'pair': (1, 2)})
+        with pytest.raises(CacheCodecError):
+            codec.decode(pickled)
+    
+    def test_small_payloads_are_not_compressed(self):
+        """Test payloads below the threshold skip compression."""
+        codec = CacheCodec(serializer='json', compression='zlib', compress_threshold=1024)
+        
+        data = codec.encode({'a': 1})
+        
+        assert data[HEADER_SIZE:] == b'{"a":1}'
+    
+    def test_compact_output_is_smaller_than_indented_json(self):
+        """Test encoded profiles are smaller than indented JSON files."""
+        import json
+        codec = CacheCodec()
+        
+        indented = json.dumps(SAMPLE_PROFILE, indent=2).encode('utf-8')
+        
+        assert len(codec.encode(SAMPLE_PROFILE)) < len(indented)
+    
+    def test_invalid_payloads(self):
+        """Test missing headers, unknown versions and corrupt payloads raise."""
+        codec = CacheCodec()
+        
+        with pytest.raises(CacheCodecError):
+            codec.decode(b"not a cache payload")
+        
+        with pytest.raises(CacheCodecError):
+            codec.decode(CODEC_MAGIC + bytes((99, 1, 0)) + b"{}")
+        
+        with pytest.raises(CacheCodecError):
+            codec.decode(CODEC_MAGIC + bytes((1, 1, 1)) + b"garbage")
+    
+    def test_unknown_serializer_falls_back_to_json(self):
+        """Test unavailable codecs degrade to stdlib implementations."""
+        codec = CacheCodec(serializer='does-not-exist', compression='does-not-exist')
+        
+        assert codec.name == 'json+zlib'
+    
+    def test_is_plain_data(self):
+        """Test plain data detection."""
+        assert is_plain_data({'a': [1, 2.5, 'x', None, True]})
+        assert not is_plain_data({1: 'int key'})
+        assert not is_plain_data([(1, 2)])
+        assert not is_plain_data(object())
+
+
+class TestPersistentBackendCodec:
+    """Test PersistentCacheBackend storage format."""
+    
+    def test_entries_use_codec_header(self):
+        """Test entries are written with the codec instead of pickle."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            backend = PersistentCacheBackend(temp_dir)
+            entry = CacheEntry(
+                key="key",
+                value={"data": [1, 2, 3]},
+                created_at=datetime.now(),
+                expires_at=datetime.now() + timedelta(hours=1)
+            )
+            
+            backend.set("key", entry)
+            
+            data = backend._get_cache_file("key").read_bytes()
+            assert CacheCodec.is_encoded(data)
+            
+            retrieved = backend.get("key")
+            assert retrieved.value == {"data": [1, 2, 3]}
+            assert abs((retrieved.expires_at - entry.expires_at).total_seconds()) < 0.001
+    
+    def test_legacy_pickle_entries_are_migrated(self):
+        """Test pickled entries from older versions are converted once, on open."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            entry = CacheEntry(
+                key="legacy",
+                value="value",
+                created_at=datetime.now(),
+                expires_at=None
+            )
+            cache_file = PersistentCacheBackend(temp_dir)._get_cache_file("legacy")
+            # Simulate a directory written before the codec layer existed
+            (Path(temp_dir) / PersistentCacheBackend.LEGACY_MIGRATION_MARKER).unlink()
+            cache_file.write_bytes(pickle.dumps(entry))
+            
+            backend = PersistentCacheBackend(temp_dir)
+            assert CacheCodec.is_encoded(cache_file.read_bytes())
+            assert backend.get("legacy").value == "value"
+            
+            # Pickled files appearing after the migration are never loaded
+            cache_file.write_bytes(pickle.dumps(entry))
+            assert backend.get("legacy") is None
+            assert not cache_file.exists()
+    
+    def test_non_plain_values_need_pickle_opt_in(self):
+        """Test only caches that opt in persist values that need pickle."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            entry = CacheEntry(key="pair", value=(1, 2), created_at=datetime.now(), expires_at=None)
+            
+            assert not PersistentCacheBackend(temp_dir).set("pair", entry)
+            
+            backend = PersistentCacheBackend(temp_dir, allow_pickle=True)
+            assert backend.set("pair", entry)
+            assert backend.get("pair").value == (1, 2)
@@ -13,8 +13,10 @@ from unittest.mock import Mock, patch, MagicMock
 
 from services.caching_service import (
     CachingService, CacheEntry, CacheStats, 
-    MemoryCacheBackend, PersistentCacheBackend
+    MemoryCacheBackend, PersistentCacheBackend, CacheRefreshScheduler,
+    SQLiteCacheBackend, RedisCacheBackend, create_shared_backend, _entry_to_dict
 )
+from utils.cache_codecs import CacheCodec
 
 
 class TestCacheEntry:
@@ -79,6 +81,19 @@ class TestCacheEntry:
         
         entry.touch()
         assert entry.access_count == 2
+    
+    def test_cache_entry_stale(self):
+        """Test soft TTL staleness is independent of expiration."""
+        entry = CacheEntry(
+            key="stale",
+            value="value",
+            created_at=datetime.now() - timedelta(minutes=10),
+            expires_at=datetime.now() + timedelta(minutes=10),
+            stale_at=datetime.now() - timedelta(minutes=5)
+        )
+        
+        assert entry.is_stale()
+        assert entry.is_valid()
 
 
 class TestCacheStats:
@@ -507,6 +522,89 @@ class TestCachingService:
         assert memory_entry is not None
         assert memory_entry.value == "value"
     
+    def test_stale_while_revalidate(self, caching_service):
+        """Test stale values are served while one background refresh runs."""
+        caching_service.set("swr_key", "old_value", ttl=3600, soft_ttl=1)
+        time.sleep(1.1)
+        
+        refresh_started = threading.Event()
+        release_refresh = threading.Event()
+        calls = []
+        
+        def slow_refresh():
+            calls.append(1)
+            refresh_started.set()
+            release_refresh.wait(timeout=5)
+            return "new_value"
+        
+        # Stale value is returned immediately, refresh runs once in background
+        assert caching_service.get_or_set("swr_key", slow_refresh, ttl=3600, soft_ttl=1) == "old_value"
+        assert refresh_started.wait(timeout=5)
+        assert caching_service.get("swr_key", refresh=slow_refresh) == "old_value"
+        assert len(calls) == 1
+        
+        release_refresh.set()
+        for _ in range(50):
+            if caching_service.get("swr_key") == "new_value":
+                break
+            time.sleep(0.05)
+        
+        assert caching_service.get("swr_key") == "new_value"
+        stats = caching_service.get_stats()
+        assert stats.stale_hit_count >= 2
+        assert stats.refresh_count == 1
+    
+    def test_hard_ttl_blocks_on_factory(self, caching_service):
+        """Test callers regenerate synchronously once the hard TTL passed."""
+        caching_service.set("hard_key", "old_value", ttl=1, soft_ttl=0)
+        time.sleep(1.1)
+        
+        assert caching_service.get_or_set("hard_key", lambda: "fresh_value", ttl=60) == "fresh_value"
+    
+    def test_failed_refresh_keeps_stale_value(self, caching_service):
+        """Test a failing background refresh leaves the stale value in place."""
+        caching_service.set("fail_key", "old_value", ttl=3600, soft_ttl=1)
+        time.sleep(1.1)
+        
+        refresh_ran = threading.Event()
+        
+        def failing_refresh():
+            refresh_ran.set()
+            raise RuntimeError("upstream down")
+        
+        assert caching_service.get("fail_key", refresh=failing_refresh) == "old_value"
+        assert refresh_ran.wait(timeout=5)
+        # The key is released once the failed refresh has been handled
+        for _ in range(100):
+            if not caching_service._refreshing:
+                break
+            time.sleep(0.05)
+        
+        assert not caching_service._refreshing
+        assert caching_service.get("fail_key") == "old_value"
+    
+    def test_scheduled_refresh(self, caching_service):
+        """Test warm_cache keeps refresh_interval keys warm in the background."""
+        counter = {'value': 0}
+        
+        def factory():
+            counter['value'] += 1
+            return counter['value']
+        
+        caching_service.warm_cache({
+            "scheduled_key": {"factory": factory, "ttl": 3600, "refresh_interval": 0.1}
+        })
+        
+        assert "scheduled_key" in caching_service.refresh_scheduler.scheduled_jobs()
+        for _ in range(50):
+            if caching_service.get("scheduled_key") > 1:
+                break
+            time.sleep(0.05)
+        
+        assert caching_service.get("scheduled_key") > 1
+        assert caching_service.cancel_refresh("scheduled_key")
+        caching_service.refresh_scheduler.shutdown()
+    
     def test_context_manager(self, mock_config):
         """Test context manager functionality."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -546,5 +644,152 @@ class TestCachingService:
                 assert caching_service.get(key) == expected_value
 
 
+class TestSharedCacheBackends:
+    """Test cross-process cache backends."""
+    
+    def _entry(self, key, value, ttl=None):
+        now = datetime.now()
+        return CacheEntry(
+            key=key,
+            value=value,
+            created_at=now,
+            expires_at=now + timedelta(seconds=ttl) if ttl else None
+        )
+    
+    def test_sqlite_backend_shared_between_instances(self):
+        """Test two backends on one database file see each other's entries."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "shared.db"
+            writer = SQLiteCacheBackend(db_path)
+            reader = SQLiteCacheBackend(db_path)
+            
+            assert writer.set("profile", self._entry("profile", {"name": "Jane"}))
+            retrieved = reader.get("profile")
+            
+            assert retrieved is not None
+            assert retrieved.value == {"name": "Jane"}
+            assert reader.keys() == ["profile"]
+            
+            assert reader.delete("profile")
+            assert writer.get("profile") is None
+    
+    def test_sqlite_backend_expiration(self):
+        """Test expired rows are not returned and are removed."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            backend = SQLiteCacheBackend(Path(temp_dir) / "shared.db")
+            entry = self._entry("old", "value")
+            entry.expires_at = datetime.now() - timedelta(seconds=1)
+            backend.set("old", entry)
+            backend.set("fresh", self._entry("fresh", "value", ttl=60))
+            
+            assert backend.keys() == ["fresh"]
+            assert backend.get("old") is None
+            assert backend.clear()
+            assert backend.keys() == []
+    
+    def test_redis_backend_with_in_process_server(self):
+        """Test the Redis backend against the in-process stand-in."""
+        first = RedisCacheBackend("memory://test-redis-backend")
+        second = RedisCacheBackend("memory://test-redis-backend")
+        first.clear()
+        
+        assert first.set("hunter", self._entry("hunter", {"email": "jane@example.com"}, ttl=60))
+        assert second.get("hunter").value == {"email": "jane@example.com"}
+        assert second.keys() == ["hunter"]
+        
+        assert first.clear()
+        assert second.get("hunter") is None
+    
+    def test_shared_backends_never_unpickle(self):
+        """Test pickled payloads in a shared store are misses, and need-pickle values are not stored."""
+        backend = RedisCacheBackend("memory://test-redis-pickle")
+        backend.clear()
+        entry = self._entry("profile", {"name": "Jane"}, ttl=60)
+        payload = CacheCodec(serializer='pickle', allow_pickle=True).encode(_entry_to_dict(entry))
+        backend.client.set(backend.prefix + "profile", payload)
+        
+        assert backend.get("profile") is None
+        assert not backend.set("pair", self._entry("pair", (1, 2), ttl=60))
+        assert backend.keys() == ["profile"]
+    
+    def test_create_shared_backend(self):
+        """Test URL dispatch for shared backends."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            backend = create_shared_backend(f"sqlite://{temp_dir}/cache.db")
+            assert isinstance(backend, SQLiteCacheBackend)
+        
+        assert isinstance(create_shared_backend("memory://dispatch"), RedisCacheBackend)
+    
+    def test_caching_services_share_values(self, mock_config):
+        """Test a value cached by one service is visible to another."""
+        url = "memory://test-shared-services"
+        first = CachingService(mock_config, persistent_backend=False, shared_backend=url)
+        second = CachingService(mock_config, persistent_backend=False, shared_backend=url)
+        first.clear()
+        
+        assert first.backend_priority == ['memory', 'shared', 'persistent']
+        first.set("company:acme", {"domain": "acme.com"}, ttl=60)
+        
+        assert second.get("company:acme") == {"domain": "acme.com"}
+        # Promoted to the local memory tier
+        assert second.backends['memory'].get(second._normalize_key("company:acme")) is not None
+    
+    def test_shared_backend_from_config(self, mock_config):
+        """Test the shared backend is read from configuration."""
+        mock_config.shared_cache_url = "memory://test-config-url"
+        service = CachingService(mock_config, persistent_backend=False)
+        
+        assert 'shared' in service.backends
+
+
+class TestCacheRefreshScheduler:
+    """Test CacheRefreshScheduler functionality."""
+    
+    def test_recurring_job_and_cancel(self):
+        """Test jobs run repeatedly until cancelled."""
+        scheduler = CacheRefreshScheduler()
+        runs = []
+        
+        try:
+            scheduler.schedule("job", lambda: runs.append(time.time()), 0.05, run_immediately=True)
+            for _ in range(50):
+                if len(runs) >= 3:
+                    break
+                time.sleep(0.05)
+            assert len(runs) >= 3
+            
+            assert scheduler.cancel("job")
+            assert not scheduler.cancel("job")
+            time.sleep(0.1)
+            count = len(runs)
+            time.sleep(0.2)
+            assert len(runs) == count
+        finally:
+            scheduler.shutdown()
+    
+    def test_reschedule_replaces_job(self):
+        """Test scheduling a job id again leaves a single recurring job."""
+        scheduler = CacheRefreshScheduler()
+        old_runs = []
+        runs = []
+        
+        try:
+            scheduler.schedule("job", lambda: old_runs.append(1), 0.1, run_immediately=True)
+            scheduler.schedule("job", lambda: runs.append(1), 0.1, run_immediately=True)
+            time.sleep(0.35)
+            # One run at most every interval; a duplicate entry would double this
+            assert 1 <= len(runs) <= 5
+            assert len(old_runs) <= 1
+            assert scheduler.scheduled_jobs() == ["job"]
+        finally:
+            scheduler.shutdown()
+    
+    def test_invalid_interval(self):
+        """Test non-positive intervals are rejected."""
+        scheduler = CacheRefreshScheduler()
+        with pytest.raises(ValueError):
+            scheduler.schedule("job", lambda: None, 0)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
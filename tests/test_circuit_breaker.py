@@ -0,0 +1,225 @@
+"""
+Tests for per-upstream circuit breakers.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from services.ai_provider_manager import get_provider_manager
+from services.openai_client_manager import CompletionRequest, CompletionResponse
+from utils.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerAdapter,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    CircuitState,
+    get_circuit_breaker,
+    install_circuit_breaker,
+    is_upstream_failure,
+    upstream_name
+)
+from utils.error_handling import ErrorCategory, ErrorHandler
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def make_response(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return response
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker state transitions."""
+    
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+    
+    @pytest.fixture
+    def breaker(self, clock):
+        return CircuitBreaker("hunter", failure_threshold=3, recovery_timeout=10.0, clock=clock)
+    
+    def fail(self, breaker, times):
+        for _ in range(times):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                breaker.call(Mock(side_effect=requests.exceptions.ConnectionError("down")))
+    
+    def test_opens_after_consecutive_failures(self, breaker):
+        """Test the circuit opens at the threshold and then fails fast."""
+        self.fail(breaker, 2)
+        breaker.call(Mock(return_value="ok"))
+        self.fail(breaker, 2)
+        assert breaker.state == CircuitState.CLOSED
+        
+        self.fail(breaker, 1)
+        assert breaker.state == CircuitState.OPEN
+        
+        func = Mock()
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.call(func)
+        func.assert_not_called()
+        assert exc_info.value.retry_in == 10.0
+        assert breaker.get_metrics()['rejected'] == 1
+    
+    def test_client_errors_do_not_count(self, breaker):
+        """Test errors that are not the upstream's fault leave the circuit closed."""
+        error = requests.exceptions.HTTPError("not found", response=make_response(404))
+        for _ in range(5):
+            with pytest.raises(requests.exceptions.HTTPError):
+                breaker.call(Mock(side_effect=error))
+        with pytest.raises(ValueError):
+            breaker.call(Mock(side_effect=ValueError("bad input")))
+        
+        assert breaker.state == CircuitState.CLOSED
+    
+    def test_half_open_probe_success_closes(self, breaker, clock):
+        """Test one probe is let through after the recovery timeout."""
+        self.fail(breaker, 3)
+        clock.now = 10.0
+        assert breaker.state == CircuitState.HALF_OPEN
+        
+        # Only one probe may be in flight
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request()
+    
+    def test_half_open_probe_failure_reopens(self, breaker, clock):
+        """Test a failed probe opens the circuit for another recovery timeout."""
+        self.fail(breaker, 3)
+        clock.now = 10.0
+        self.fail(breaker, 1)
+        
+        assert breaker.state == CircuitState.OPEN
+        metrics = breaker.get_metrics()
+        assert metrics['opened_count'] == 2
+        assert metrics['retry_in'] == 10.0
+    
+    def test_raise_if_open_does_not_claim_probe(self, breaker, clock):
+        """Test the fast-fail check leaves the half-open probe available."""
+        breaker.raise_if_open()
+        self.fail(breaker, 3)
+        with pytest.raises(CircuitOpenError):
+            breaker.raise_if_open()
+        
+        clock.now = 10.0
+        breaker.raise_if_open()
+        assert breaker.allow_request()
+    
+    def test_registry(self, clock):
+        """Test breakers are shared by name and report metrics."""
+        registry = CircuitBreakerRegistry(failure_threshold=1, clock=clock)
+        assert registry.get("notion") is registry.get("notion")
+        assert registry.get("slow", failure_threshold=4).failure_threshold == 4
+        
+        registry.get("notion").record_failure()
+        assert registry.get_metrics()['notion']['state'] == "open"
+        registry.reset()
+        assert registry.get_metrics()['notion']['state'] == "closed"
+
+
+class TestUpstreamFailures:
+    """Test classifying errors and naming upstreams."""
+    
+    def test_is_upstream_failure(self):
+        assert is_upstream_failure(requests.exceptions.ReadTimeout())
+        assert is_upstream_failure(TimeoutError())
+        assert is_upstream_failure(requests.exceptions.HTTPError(response=make_response(503)))
+        assert not is_upstream_failure(requests.exceptions.HTTPError(response=make_response(429)))
+        assert not is_upstream_failure(CircuitOpenError("hunter", 1.0))
+        assert not is_upstream_failure(KeyError("data"))
+    
+    def test_upstream_name(self):
+        assert upstream_name("https://api.hunter.io/v2/domain-search") == "hunter"
+        assert upstream_name("https://www.linkedin.com/in/someone") == "linkedin"
+        assert upstream_name("https://www.example.com/about") == "example.com"
+
+
+class TestCircuitBreakerAdapter:
+    """Test circuit breakers mounted on requests sessions."""
+    
+    def test_session_fails_fast_when_open(self):
+        """Test 5xx responses open the circuit and later requests are not sent."""
+        registry = CircuitBreakerRegistry(failure_threshold=2)
+        session = requests.Session()
+        adapter = CircuitBreakerAdapter(registry=registry)
+        session.mount("https://", adapter)
+        
+        with patch('requests.adapters.HTTPAdapter.send', return_value=make_response(502)) as send:
+            session.get("https://api.hunter.io/v2/email-finder")
+            session.get("https://api.hunter.io/v2/email-finder")
+            with pytest.raises(CircuitOpenError):
+                session.get("https://api.hunter.io/v2/domain-search")
+            # Other hosts have their own circuits
+            session.get("https://example.com/")
+        
+        assert send.call_count == 3
+        assert registry.get_metrics()['hunter']['state'] == "open"
+    
+    def test_rate_limit_responses_count_as_healthy(self):
+        """Test 429 and connection errors are classified separately."""
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        session = requests.Session()
+        session.mount("https://", CircuitBreakerAdapter("notion", registry=registry))
+        
+        with patch('requests.adapters.HTTPAdapter.send', return_value=make_response(429)):
+            session.get("https://api.notion.com/v1/pages")
+        assert registry.get("notion").state == CircuitState.CLOSED
+        
+        with patch('requests.adapters.HTTPAdapter.send',
+                   side_effect=requests.exceptions.ConnectionError("reset")):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                session.get("https://api.notion.com/v1/pages")
+        assert registry.get("notion").state == CircuitState.OPEN
+    
+    def test_install_circuit_breaker(self):
+        session = install_circuit_breaker(requests.Session())
+        assert isinstance(session.get_adapter("https://api.hunter.io/"), CircuitBreakerAdapter)
+        assert isinstance(session.get_adapter("http://example.com/"), CircuitBreakerAdapter)
+
+
+class TestCircuitBreakerIntegration:
+    """Test the retry and AI completion paths consult the breakers."""
+    
+    def test_open_circuit_is_not_retried(self, tmp_path):
+        handler = ErrorHandler(config_path=str(tmp_path / "errors.json"))
+        func = Mock(side_effect=CircuitOpenError("hunter", 5.0), __name__="find", __module__="test")
+        
+        with patch('utils.error_handling.time.sleep') as sleep:
+            with pytest.raises(CircuitOpenError):
+                handler.retry_with_backoff(func, category=ErrorCategory.NETWORK)
+        
+        assert func.call_count == 1
+        sleep.assert_not_called()
+    
+    def test_ai_completion_fails_fast(self):
+        """Test connection failures reported by a provider open its circuit."""
+        manager = get_provider_manager()
+        provider = Mock()
+        provider.make_completion.return_value = CompletionResponse(
+            content="", model="gpt-4", usage={}, finish_reason="connection_error",
+            success=False, error_message="API connection error: connection reset"
+        )
+        breaker = get_circuit_breaker("openai")
+        
+        with patch.object(manager, 'get_provider', return_value=provider):
+            for _ in range(breaker.failure_threshold):
+                manager.make_completion(CompletionRequest(messages=[]), provider_name="openai")
+            response = manager.make_completion(CompletionRequest(messages=[]), provider_name="openai")
+        
+        assert provider.make_completion.call_count == breaker.failure_threshold
+        assert not response.success
+        assert response.finish_reason == "circuit_open"
@@ -0,0 +1,202 @@
+"""
+Tests for deadline propagation and hedged requests.
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from services.ai_provider_manager import get_provider_manager
+from services.openai_client_manager import CompletionRequest, CompletionResponse
+from utils.deadline import (
+    DeadlineExceeded,
+    LatencyTracker,
+    RequestHedger,
+    call_timeout,
+    current_deadline,
+    deadline_scope,
+    remaining_time,
+    with_current_deadline
+)
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self):
+        self.now = 100.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestDeadline:
+    """Test deadline scopes and derived timeouts."""
+    
+    def test_call_timeout_without_deadline(self):
+        assert current_deadline() is None
+        assert remaining_time() is None
+        assert call_timeout(30) == 30
+    
+    def test_call_timeout_uses_remaining_budget(self):
+        clock = FakeClock()
+        with deadline_scope(10, clock=clock) as deadline:
+            assert call_timeout(30) == 10
+            assert call_timeout(3) == 3
+            
+            clock.now += 9.8
+            with pytest.raises(DeadlineExceeded):
+                call_timeout(30)
+            assert deadline.expired is False
+            
+            clock.now += 1
+            assert deadline.expired
+        assert current_deadline() is None
+    
+    def test_nested_scope_cannot_extend(self):
+        clock = FakeClock()
+        with deadline_scope(5, clock=clock) as outer:
+            with deadline_scope(60, clock=clock) as inner:
+                assert inner is outer
+            with deadline_scope(2, clock=clock) as inner:
+                assert inner.remaining() == 2
+            with deadline_scope(None) as inner:
+                assert inner is outer
+            assert current_deadline() is outer
+    
+    def test_deadline_is_per_thread(self):
+        seen = {}
+        with deadline_scope(10):
+            thread = threading.Thread(target=lambda: seen.update(plain=current_deadline()))
+            thread.start()
+            thread.join()
+            
+            wrapped = with_current_deadline(lambda: current_deadline())
+            result = []
+            thread = threading.Thread(target=lambda: result.append(wrapped()))
+            thread.start()
+            thread.join()
+            
+            assert seen['plain'] is None
+            assert result[0] is current_deadline()
+
+
+class TestRequestHedger:
+    """Test hedging slow idempotent calls."""
+    
+    def make_hedger(self):
+        return RequestHedger(max_workers=4, tracker=LatencyTracker())
+    
+    def test_no_hedge_without_samples(self):
+        hedger = self.make_hedger()
+        func = Mock(return_value="page")
+        
+        assert hedger.call("product_page", func, "url") == "page"
+        func.assert_called_once_with("url")
+        assert hedger.hedges_sent == 0
+        assert hedger.tracker.get_stats()['product_page']['samples'] == 1
+    
+    def test_percentile(self):
+        tracker = LatencyTracker()
+        for i in range(1, 21):
+            tracker.record("llm", i / 10)
+        assert tracker.percentile("llm") == 2.0
+        assert tracker.percentile("llm", 0.5) == 1.1
+        assert tracker.percentile("other") is None
+    
+    def test_hedge_wins_when_primary_is_slow(self):
+        hedger = self.make_hedger()
+        calls = []
+        release = threading.Event()
+        
+        def fetch():
+            calls.append(1)
+            if len(calls) == 1:
+                # First copy stalls
+                release.wait(5)
+                return "slow"
+            return "fast"
+        
+        try:
+            assert hedger.call("linkedin", fetch, hedge_after=0.05) == "fast"
+        finally:
+            release.set()
+        assert len(calls) == 2
+        assert hedger.get_stats()['hedges_sent'] == 1
+        assert hedger.get_stats()['hedges_won'] == 1
+    
+    def test_hedge_needs_a_permit(self):
+        hedger = self.make_hedger()
+        func = Mock(side_effect=lambda: time.sleep(0.2) or "page")
+        permit = Mock(return_value=False)
+        
+        assert hedger.call("product_page", func, hedge_after=0.05, hedge_permit=permit) == "page"
+        permit.assert_called_once_with()
+        assert func.call_count == 1
+        assert hedger.get_stats()['hedges_sent'] == 0
+        assert hedger.get_stats()['hedges_skipped'] == 1
+    
+    def test_fast_primary_is_not_hedged(self):
+        hedger = self.make_hedger()
+        func = Mock(return_value="page")
+        
+        assert hedger.call("product_page", func, hedge_after=1.0) == "page"
+        assert func.call_count == 1
+        assert hedger.hedges_sent == 0
+    
+    def test_failed_copy_falls_back_to_other(self):
+        hedger = self.make_hedger()
+        calls = []
+        
+        def fetch():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.2)
+                raise ConnectionError("reset")
+            time.sleep(0.3)
+            return "ok"
+        
+        assert hedger.call("product_page", fetch, hedge_after=0.05) == "ok"
+    
+    def test_skips_hedge_when_deadline_is_too_close(self):
+        hedger = self.make_hedger()
+        func = Mock(return_value="page")
+        
+        with deadline_scope(0.01):
+            assert hedger.call("product_page", func, hedge_after=1.0) == "page"
+        assert hedger.hedges_sent == 0
+
+
+class TestDeadlinePropagation:
+    """Test service calls derive their timeouts from the deadline."""
+    
+    def test_completion_timeout_follows_deadline(self):
+        manager = get_provider_manager()
+        provider = Mock()
+        provider.make_completion.return_value = CompletionResponse(
+            content="ok", model="gpt-4", usage={}, finish_reason="stop"
+        )
+        
+        with patch.object(manager, 'get_provider', return_value=provider):
+            request = CompletionRequest(messages=[])
+            with deadline_scope(20):
+                manager.make_completion(request)
+            assert 19 < provider.make_completion.call_args[0][0].timeout <= 20
+            
+            request = CompletionRequest(messages=[])
+            manager.make_completion(request)
+            assert request.timeout is None
+    
+    def test_completion_fails_fast_after_deadline(self):
+        manager = get_provider_manager()
+        provider = Mock()
+        
+        with patch.object(manager, 'get_provider', return_value=provider):
+            with deadline_scope(0.1):
+                response = manager.make_completion(CompletionRequest(messages=[]))
+        
+        provider.make_completion.assert_not_called()
+        assert not response.success
+        assert response.finish_reason == "deadline_exceeded"
@@ -0,0 +1,90 @@
+"""
+Tests for the single-pass DOM index used by the ProductHunt scraper.
+"""
+
+import os
+import re
+
+import pytest
+from bs4 import BeautifulSoup
+
+from services.dom_index import (
+    HTML_PARSER,
+    LXML_AVAILABLE,
+    DomIndex,
+    parse_html
+)
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       "archive", "producthunt_raw.html")
+
+PAGE = """
+<html><body>
+    <div class="styles_item__x"><a href="/products/acme">1. Acme</a></div>
+    <article class="ProductCard"><a href="/posts/widget">Widget</a></article>
+    <section class="makers">
+        <h3>Meet the <b>Team</b></h3>
+        <div class="member"><a href="https://LinkedIn.com/in/jane">Jane Doe</a></div>
+    </section>
+    <div data-test="maker-list"><span>Founder</span></div>
+    <div>Find us on LinkedIn</div>
+    <a href="https://acme.io">Website</a>
+    <a href="https://www.producthunt.com/topics/ai">AI</a>
+</body></html>
+"""
+
+
+class TestDomIndex:
+    """Test that index queries match the find_all walks they replace."""
+    
+    @pytest.fixture
+    def soup(self):
+        return BeautifulSoup(PAGE, 'html.parser')
+    
+    def test_links(self, soup):
+        index = DomIndex(soup)
+        
+        assert [a['href'] for a in index.links_containing('/products/')] == ['/products/acme']
+        assert [a['href'] for a in index.links_containing('linkedin.com/in/', ignore_case=True)] == [
+            'https://LinkedIn.com/in/jane'
+        ]
+        assert index.links_containing('linkedin.com') == []
+        assert [a['href'] for a in index.external_links()] == ['https://LinkedIn.com/in/jane', 'https://acme.io']
+    
+    def test_class_and_attribute_matches(self, soup):
+        index = DomIndex(soup)
+        
+        assert index.with_class(('product', 'item'), ('div', 'article')) == soup.find_all(
+            ['div', 'article'], class_=re.compile(r'.*product.*|.*item.*', re.I))
+        assert [s.name for s in index.with_class(('team', 'maker', 'creator'), ('div', 'section'))] == ['section']
+        assert index.team_data_test == soup.find_all(['div'], attrs={'data-test': re.compile(r'.*team.*|.*maker.*', re.I)})
+        assert index.linkedin_text_sections == soup.find_all(['div', 'section'], string=re.compile(r'linkedin', re.I))
+    
+    def test_team_sections_are_nearest_containers(self, soup):
+        sections = DomIndex(soup).team_sections()
+        
+        assert [s.name for s in sections] == ['section', 'div']
+        assert sections[1].get('data-test') == 'maker-list'
+    
+    def test_index_is_shared_per_document(self, soup):
+        index = DomIndex.of(soup)
+        
+        assert DomIndex.of(soup) is index
+        assert DomIndex.of(BeautifulSoup(PAGE, 'html.parser')) is not index
+        assert index.get_text() is index.get_text()
+    
+    def test_parse_html_uses_lxml_when_available(self):
+        assert HTML_PARSER == ('lxml' if LXML_AVAILABLE else 'html.parser')
+        assert parse_html(PAGE).find('a')['href'] == '/products/acme'
+    
+    @pytest.mark.skipif(not os.path.exists(FIXTURE), reason="saved ProductHunt page not present")
+    def test_saved_page_matches_find_all(self):
+        with open(FIXTURE, encoding="utf-8") as f:
+            soup = BeautifulSoup(f.read(), 'html.parser')
+        index = DomIndex(soup)
+        
+        expected = [a for a in soup.find_all('a', href=True) if '/products/' in a.get('href', '')]
+        assert index.links_containing('/products/') == expected
+        assert len(expected) > 0
+        assert index.with_class(('team', 'maker', 'creator'), ('div', 'section')) == soup.find_all(
+            ['div', 'section'], class_=re.compile(r'.*team.*|.*maker.*|.*creator.*', re.I))
@@ -386,7 +386,24 @@ class TestUtilityMethods:
         
         assert len(results) == 2
         assert all(result.status == "sent" for result in results)
-        mock_sleep.assert_called_once_with(0.5)  # Called once between emails
+        # Only the part of the delay not spent sending is waited, once between emails
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args[0][0] <= 0.5
+    
+    @patch('resend.Emails.send')
+    def test_send_bulk_emails_without_delay(self, mock_send, email_sender):
+        """Test bulk sends are only paced by the Resend rate limit by default."""
+        mock_send.return_value = Mock(id="test_email_id")
+        email_list = [
+            {"recipient_email": f"user{i}@example.com", "subject": "Subject", "html_body": "<p>Body</p>"}
+            for i in range(3)
+        ]
+        
+        with patch('time.sleep') as mock_sleep:
+            results = email_sender.send_bulk_emails(email_list)
+        
+        assert [result.status for result in results] == ["sent"] * 3
+        mock_sleep.assert_not_called()
     
     @patch('resend.Emails.send')
     def test_send_bulk_emails_with_error(self, mock_send, email_sender):
@@ -0,0 +1,170 @@
+"""
+Tests for the shared HTTP connection pools.
+"""
+
+import socket
+import threading
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer
+)
+from unittest.mock import Mock, patch
+
+import pytest
+
+from utils.circuit_breaker import CircuitBreakerAdapter
+from utils.http_client import (
+    DEFAULT_POOL_MAXSIZE,
+    DNSCache,
+    build_retry,
+    create_session,
+    get_connection_stats,
+    get_dns_cache,
+    get_http_adapter,
+    reset_http_client
+)
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers GETs over HTTP/1.1 keep-alive, failing the first few (503 by default)."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        server = self.server
+        server.hits += 1
+        status = server.failure_status if server.failures_left > 0 else 200
+        server.failures_left = max(0, server.failures_left - 1)
+        body = b"ok"
+        self.send_response(status)
+        if status != 200:
+            self.send_header("Retry-After", "1")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def fresh_http_client():
+    reset_http_client()
+    yield
+    reset_http_client()
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    httpd.hits = 0
+    httpd.failures_left = 0
+    httpd.failure_status = 503
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def resolve_to_server(server):
+    """Patch DNS so every host name resolves to the test server."""
+    address = [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('127.0.0.1', server.server_address[1]))]
+    return patch('socket.getaddrinfo', return_value=address)
+
+
+class TestCreateSession:
+    """Test sessions share one pooled adapter."""
+    
+    def test_sessions_share_adapter(self):
+        first = create_session(headers={'User-Agent': 'first'})
+        second = create_session()
+        
+        adapter = first.get_adapter("https://example.com/")
+        assert isinstance(adapter, CircuitBreakerAdapter)
+        assert adapter is second.get_adapter("http://example.com/")
+        assert first.headers['User-Agent'] == 'first'
+        assert 'gzip' in first.headers['Accept-Encoding']
+    
+    def test_pool_size_from_config(self):
+        assert get_http_adapter(Mock(http_pool_maxsize=4))._pool_maxsize == 4
+        reset_http_client()
+        # Mock attributes that are not numbers fall back to the defaults
+        assert get_http_adapter(Mock())._pool_maxsize == DEFAULT_POOL_MAXSIZE
+    
+    def test_retry_after_only_honoured_on_503(self):
+        retry = build_retry()
+        assert not retry.is_retry('GET', 429, True)
+        assert retry.is_retry('GET', 503, True)
+        assert type(retry.increment('GET', '/', error=ConnectionError())) is type(retry)
+    
+    def test_closing_a_session_keeps_shared_pools(self):
+        session = create_session()
+        pools = session.get_adapter("https://example.com/").poolmanager.pools
+        pools['marker'] = Mock()
+        session.close()
+        assert 'marker' in get_http_adapter().poolmanager.pools
+
+
+class TestConnectionReuse:
+    """Test requests from several sessions reuse pooled connections."""
+    
+    def test_keep_alive_across_sessions(self, server):
+        url = f"http://shared.test:{server.server_address[1]}/"
+        with resolve_to_server(server) as getaddrinfo:
+            for session in (create_session(), create_session(), create_session()):
+                assert session.get(url, timeout=5).text == "ok"
+        
+        metrics = get_connection_stats().get_metrics()
+        assert metrics['requests'] == 3
+        assert metrics['new_connections'] == 1
+        assert metrics['reused_connections'] == 2
+        assert metrics['reuse_rate'] == pytest.approx(0.667)
+        assert metrics['hosts']['shared.test'] == {'requests': 3, 'connections': 1}
+        # One lookup by the DNS cache, plus urllib3 connecting to the cached address
+        assert metrics['dns_cache']['misses'] == 1
+        assert getaddrinfo.call_args_list[0].args[0] == "shared.test"
+    
+    def test_server_errors_are_retried(self, server):
+        server.failures_left = 1
+        url = f"http://retry.test:{server.server_address[1]}/"
+        with resolve_to_server(server):
+            response = create_session().get(url, timeout=5)
+        
+        assert response.status_code == 200
+        assert server.hits == 2
+    
+    def test_rate_limit_responses_reach_the_caller(self, server):
+        server.failures_left = 1
+        server.failure_status = 429
+        url = f"http://limited.test:{server.server_address[1]}/"
+        with resolve_to_server(server):
+            response = create_session().get(url, timeout=5)
+        
+        assert response.status_code == 429
+        assert server.hits == 1
+
+
+class TestDNSCache:
+    """Test DNS lookups are reused until they expire."""
+    
+    def test_lookups_expire(self):
+        cache = DNSCache(ttl=60)
+        address = [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('10.0.0.1', 443))]
+        with patch('socket.getaddrinfo', return_value=address) as getaddrinfo, \
+                patch('utils.http_client.time.monotonic', side_effect=[0, 30, 61]):
+            assert cache.resolve("example.com", 443) == '10.0.0.1'
+            assert cache.resolve("example.com", 443) == '10.0.0.1'
+            assert cache.resolve("example.com", 443) == '10.0.0.1'
+        
+        assert getaddrinfo.call_count == 2
+        assert cache.get_metrics() == {'entries': 1, 'hits': 1, 'misses': 2}
+    
+    def test_ip_addresses_and_disabled_cache_skip_lookup(self):
+        with patch('socket.getaddrinfo') as getaddrinfo:
+            assert DNSCache().resolve("127.0.0.1", 80) == "127.0.0.1"
+            assert DNSCache(ttl=0).resolve("example.com", 80) == "example.com"
+        getaddrinfo.assert_not_called()
+    
+    def test_ttl_from_config(self):
+        assert get_dns_cache(Mock(http_dns_cache_ttl=0)).ttl == 0
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the LinkedIn profile cache.
+"""
+
+import json
+import tempfile
+from datetime import datetime
+
+import pytest
+
+from models.data_models import LinkedInProfile
+from services.linkedin_profile_cache import LinkedInProfileCache
+from utils.cache_codecs import CacheCodec
+
+
+@pytest.fixture
+def cache_dir():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield temp_dir
+
+
+def make_profile(index: int = 0) -> LinkedInProfile:
+    return LinkedInProfile(
+        name=f"Person {index}",
+        current_role="Engineer",
+        experience=["Engineer at Example"],
+        skills=["Python"],
+        summary="Experienced engineer building developer tools."
+    )
+
+
+class TestLinkedInProfileCacheStorage:
+    """Test LinkedIn profile cache file storage."""
+    
+    def test_cache_and_read_profile(self, cache_dir):
+        """Test profiles round-trip through the compact file format."""
+        cache = LinkedInProfileCache(cache_dir=cache_dir)
+        url = "https://linkedin.com/in/person-0"
+        
+        cache.cache_profile(url, make_profile())
+        cache.memory_cache.clear()
+        
+        cache_file = cache._get_cache_file(cache._get_cache_key(url))
+        assert CacheCodec.is_encoded(cache_file.read_bytes())
+        assert cache.get_cached_profile(url).name == "Person 0"
+    
+    def test_legacy_json_is_read_and_migrated(self, cache_dir):
+        """Test indented JSON files written by older versions are migrated."""
+        cache = LinkedInProfileCache(cache_dir=cache_dir)
+        url = "https://linkedin.com/in/legacy"
+        cache_key = cache._get_cache_key(url)
+        legacy_file = cache._get_legacy_cache_file(cache_key)
+        legacy_file.write_text(json.dumps({
+            'linkedin_url': url,
+            'profile': make_profile().to_dict(),
+            'cached_at': datetime.now().isoformat(),
+            'cache_key': cache_key
+        }, indent=2))
+        
+        assert cache.get_cached_profile(url).name == "Person 0"
+        assert not legacy_file.exists()
+        assert cache._get_cache_file(cache_key).exists()
+    
+    def test_corrupted_file_is_removed(self, cache_dir):
+        """Test corrupted cache files are dropped."""
+        cache = LinkedInProfileCache(cache_dir=cache_dir)
+        url = "https://linkedin.com/in/corrupt"
+        cache_file = cache._get_cache_file(cache._get_cache_key(url))
+        cache_file.write_bytes(b"corrupted")
+        
+        assert cache.get_cached_profile(url) is None
+        assert not cache_file.exists()
+    
+    def test_clear_all_cache(self, cache_dir):
+        """Test clearing removes all profile files."""
+        cache = LinkedInProfileCache(cache_dir=cache_dir)
+        for i in range(3):
+            cache.cache_profile(f"https://linkedin.com/in/person-{i}", make_profile(i))
+        
+        assert cache.get_cache_stats()['file_cache_entries'] == 3
+        cache.clear_all_cache()
+        assert cache.get_cache_stats()['file_cache_entries'] == 0
+
+
+class TestLinkedInProfileCacheMemoryTier:
+    """Test the LRU memory tier and index."""
+    
+    def test_lru_evicts_least_recently_used(self, cache_dir):
+        """Test the memory tier keeps admitting profiles and evicts LRU entries."""
+        cache = LinkedInProfileCache(cache_dir=cache_dir, max_memory_cache_size=2)
+        urls = [f"https://linkedin.com/in/person-{i}" for i in range(3)]
+        
+        cache.cache_profile(urls[0], make_profile(0))
+        cache.cache_profile(urls[1], make_profile(1))
+        cache.get_cached_profile(urls[0])  # person-0 becomes most recently used
+        cache.cache_profile(urls[2], make_profile(2))
+        
+        keys = list(cache.memory_cache.keys())
+        assert keys == [cache._get_cache_key(urls[0]), cache._get_cache_key(urls[2])]
+        assert cache.get_cache_stats()['evictions'] == 1
+    
+    def test_memory_hits_return_decoded_profiles(self, cache_dir):
+        """Test memory hits return the decoded profile without touching disk."""
+        cache = LinkedInProfileCache(cache_dir=cache_dir)
+        url = "https://linkedin.com/in/person-0"
+        profile = make_profile()
+        cache.cache_profile(url, profile)
+        
+        cache._get_cache_file(cache._get_cache_key(url)).unlink()
+        
+        assert cache.get_cached_profile(url) is profile
+        assert cache.get_cache_stats()['memory_hits'] == 1
+    
+    def test_hit_miss_stats(self, cache_dir):
+        """Test memory hits, disk hits and misses are counted."""
+        cache = LinkedInProfileCache(cache_dir=cache_dir)
+        url = "https://linkedin.com/in/person-0"
+        cache.cache_profile(url, make_profile())
+        
+        cache.get_cached_profile(url)
+        cache.memory_cache.clear()
+        cache.get_cached_profile(url)
+        cache.get_cached_profile("https://linkedin.com/in/unknown")
+        
+        stats = cache.get_cache_stats()
+        assert stats['memory_hits'] == 1
+        assert stats['disk_hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == pytest.approx(2 / 3)
+    
+    def test_index_survives_restart(self, cache_dir):
+        """Test a new instance reads the index instead of scanning files."""
+        cache = LinkedInProfileCache(cache_dir=cache_dir)
+        for i in range(3):
+            cache.cache_profile(f"https://linkedin.com/in/person-{i}", make_profile(i))
+        cache.flush_index()
+        
+        reopened = LinkedInProfileCache(cache_dir=cache_dir)
+        
+        assert reopened.get_cache_stats()['file_cache_entries'] == 3
+    
+    def test_index_saves_are_batched(self, cache_dir):
+        """Test index changes are written in batches, not on every profile."""
+        cache = LinkedInProfileCache(cache_dir=cache_dir)
+        cache.INDEX_SAVE_BATCH = 3
+        index_file = cache.cache_dir / cache.INDEX_FILE
+        
+        for i in range(2):
+            cache.cache_profile(f"https://linkedin.com/in/person-{i}", make_profile(i))
+        assert not index_file.exists()
+        
+        cache.cache_profile("https://linkedin.com/in/person-2", make_profile(2))
+        assert len(cache._read_index()) == 3
+        assert [p.name for p in cache.cache_dir.iterdir() if p.suffix == ".tmp"] == []
+    
+    def test_index_merges_entries_of_other_processes(self, cache_dir):
+        """Test two instances sharing a directory keep each other's index entries."""
+        first = LinkedInProfileCache(cache_dir=cache_dir)
+        second = LinkedInProfileCache(cache_dir=cache_dir)
+        
+        first.cache_profile("https://linkedin.com/in/first", make_profile(0))
+        first.flush_index()
+        second.cache_profile("https://linkedin.com/in/second", make_profile(1))
+        second.flush_index()
+        
+        assert len(second._read_index()) == 2
+        assert second.get_cache_stats()['file_cache_entries'] == 2
+    
+    def test_clear_expired_uses_index(self, cache_dir):
+        """Test expired files are removed based on index timestamps."""
+        cache = LinkedInProfileCache(cache_dir=cache_dir, cache_ttl_hours=1)
+        url = "https://linkedin.com/in/old"
+        cache.cache_profile(url, make_profile())
+        cache.cache_profile("https://linkedin.com/in/new", make_profile(1))
+        
+        cache_key = cache._get_cache_key(url)
+        cache._index[cache_key] -= 7200
+        cache.memory_cache.clear()
+        
+        assert cache.clear_expired_cache() == 1
+        assert not cache._get_cache_file(cache_key).exists()
+        assert cache.get_cache_stats()['file_cache_entries'] == 1
@@ -120,9 +120,16 @@ class TestLinkedInScraper:
         assert not linkedin_scraper._is_valid_linkedin_url("invalid-url")
         assert not linkedin_scraper._is_valid_linkedin_url("")
     
-    def test_enforce_rate_limit(self, linkedin_scraper):
+    def test_enforce_rate_limit(self, linkedin_scraper, mock_config, tmp_path):
         """Test rate limiting functionality."""
         import time
+        from utils.rate_limiting import RateLimitingService
+        
+        # Use a fresh scheduler so earlier tests' requests do not count
+        linkedin_scraper.rate_limiter = RateLimitingService(
+            mock_config, config_path=str(tmp_path / "limits.json"),
+            learned_limits_path=str(tmp_path / "learned.json")
+        )
         
         # First call should not sleep
         start_time = time.time()
@@ -155,7 +162,7 @@ class TestLinkedInScraper:
         linkedin_scraper.webdriver_manager.get_driver.return_value = mock_context_manager
         
         # Mock WebDriverWait
-        with patch('services.linkedin_scraper.WebDriverWait'):
+        with patch('utils.webdriver_manager.WebDriverWait'):
             # Mock find_element calls for different selectors
             mock_name_element = MagicMock()
             mock_name_element.text = "John Doe"
@@ -209,7 +216,7 @@ class TestLinkedInScraper:
         mock_context_manager.__exit__.return_value = None
         linkedin_scraper.webdriver_manager.get_driver.return_value = mock_context_manager
         
-        with patch('services.linkedin_scraper.WebDriverWait'):
+        with patch('utils.webdriver_manager.WebDriverWait'):
             # Mock find_element to raise exception for name selectors
             mock_driver.find_element.side_effect = NoSuchElementException()
             mock_driver.find_elements.return_value = []
@@ -281,7 +288,7 @@ class TestLinkedInScraper:
         mock_context_manager.__exit__.return_value = None
         linkedin_scraper.webdriver_manager.get_driver.return_value = mock_context_manager
         
-        with patch('services.linkedin_scraper.WebDriverWait'):
+        with patch('utils.webdriver_manager.WebDriverWait'):
             # Mock successful extraction
             mock_name_element = MagicMock()
             mock_name_element.text = "Test User"
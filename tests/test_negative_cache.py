@@ -0,0 +1,141 @@
+"""
+Tests for the negative-result cache.
+"""
+
+import socket
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from models.data_models import TeamMember
+from services.caching_service import CachingService
+from services.email_finder import EmailFinder
+from services.linkedin_finder import LinkedInFinder
+from services.negative_cache import (
+    NegativeCache,
+    NegativeReason,
+    classify_failure
+)
+
+
+class TestNegativeCache:
+    """Test NegativeCache functionality."""
+    
+    @pytest.fixture
+    def negative_cache(self, mock_config):
+        """Create a memory-only negative cache."""
+        service = CachingService(mock_config, persistent_backend=False)
+        return NegativeCache(service)
+    
+    def test_record_and_check(self, negative_cache):
+        """Test recorded dead ends are returned with their reason."""
+        assert negative_cache.check("hunter-person", "acme.com:jane doe") is None
+        
+        negative_cache.record("hunter-person", "acme.com:jane doe", NegativeReason.NOT_FOUND, detail="no match")
+        result = negative_cache.check("hunter-person", "ACME.com:Jane Doe")
+        
+        assert result is not None
+        assert result.reason == NegativeReason.NOT_FOUND
+        assert result.detail == "no match"
+        
+        # Namespaces are independent
+        assert negative_cache.check("website-url", "acme.com:jane doe") is None
+    
+    def test_per_reason_ttl(self, mock_config):
+        """Test each reason expires after its own TTL."""
+        service = CachingService(mock_config, persistent_backend=False)
+        negative_cache = NegativeCache(service, ttls={NegativeReason.TIMEOUT: 1})
+        
+        negative_cache.record("linkedin-search", "slow", NegativeReason.TIMEOUT)
+        negative_cache.record("linkedin-search", "missing", NegativeReason.NOT_FOUND)
+        
+        time.sleep(1.1)
+        assert negative_cache.check("linkedin-search", "slow") is None
+        assert negative_cache.check("linkedin-search", "missing").reason == NegativeReason.NOT_FOUND
+    
+    def test_record_failure_and_clear(self, negative_cache):
+        """Test exceptions are classified and unknown failures are not cached."""
+        assert negative_cache.record_failure("website-url", "a", requests.exceptions.ReadTimeout()) == NegativeReason.TIMEOUT
+        assert negative_cache.record_failure("website-url", "b", ValueError("parse error")) is None
+        
+        assert negative_cache.check("website-url", "a").reason == NegativeReason.TIMEOUT
+        assert negative_cache.check("website-url", "b") is None
+        
+        assert negative_cache.clear("website-url", "a")
+        assert negative_cache.check("website-url", "a") is None
+    
+    def test_persists_across_instances(self, mock_config, tmp_path):
+        """Test negative results survive a restart through the persistent backend."""
+        first = NegativeCache(CachingService(mock_config, cache_dir=tmp_path))
+        first.record("hunter-person", "acme.com:jane doe", NegativeReason.BLOCKED)
+        
+        second = NegativeCache(CachingService(mock_config, cache_dir=tmp_path))
+        assert second.check("hunter-person", "acme.com:jane doe").reason == NegativeReason.BLOCKED
+    
+    def test_person_lookup_retries_before_recording_timeout(self, mock_config):
+        """Test a timing out Hunter lookup is retried, then remembered as a timeout."""
+        finder = EmailFinder(mock_config)
+        finder.api_monitor = Mock()
+        finder.negative_cache = NegativeCache(CachingService(mock_config, persistent_backend=False))
+        finder.session = Mock()
+        finder.session.get.side_effect = requests.exceptions.ReadTimeout("slow")
+        
+        with patch('services.email_finder.wait_for_service'), patch('utils.error_handling.time.sleep'):
+            with pytest.raises(requests.exceptions.ReadTimeout):
+                finder.find_person_email("Jane Doe", "acme.com")
+        
+        assert finder.session.get.call_count == 5
+        cache_key = finder._person_cache_key("Jane Doe", "acme.com")
+        assert finder.negative_cache.check("hunter-person", cache_key).reason == NegativeReason.TIMEOUT
+        
+        # Later lookups skip the dead end without calling Hunter
+        assert finder.find_person_email("Jane Doe", "acme.com") is None
+        assert finder.session.get.call_count == 5
+    
+    def test_linkedin_search_outage_is_not_cached_as_not_found(self, mock_config):
+        """Test only completed searches are remembered as "not found"."""
+        finder = LinkedInFinder(mock_config)
+        finder.rate_limiter = Mock()
+        finder.negative_cache = NegativeCache(CachingService(mock_config, persistent_backend=False))
+        finder.session = Mock()
+        member = TeamMember(name="Madonna", role="CEO", company="Acme")
+        search_key = finder._search_key(member)
+        
+        finder.session.get.side_effect = requests.exceptions.ConnectionError("offline")
+        finder.find_linkedin_urls_for_team([member])
+        assert finder.negative_cache.check("linkedin-search", search_key) is None
+        
+        finder.session.get.side_effect = None
+        finder.session.get.return_value = Mock(status_code=429)
+        finder.find_linkedin_urls_for_team([member])
+        assert finder.negative_cache.check("linkedin-search", search_key) is None
+        
+        finder.session.get.return_value = Mock(status_code=200, content=b"<html></html>")
+        finder.find_linkedin_urls_for_team([member])
+        assert finder.negative_cache.check("linkedin-search", search_key).reason == NegativeReason.NOT_FOUND
+
+
+class TestClassifyFailure:
+    """Test mapping of exceptions to reason codes."""
+    
+    def _http_error(self, status_code):
+        response = Mock()
+        response.status_code = status_code
+        return requests.exceptions.HTTPError(response=response)
+    
+    def test_timeouts(self):
+        assert classify_failure(requests.exceptions.ConnectTimeout()) == NegativeReason.TIMEOUT
+        assert classify_failure(socket.timeout()) == NegativeReason.TIMEOUT
+    
+    def test_blocked_status_codes(self):
+        assert classify_failure(self._http_error(403)) == NegativeReason.BLOCKED
+        assert classify_failure(self._http_error(999)) == NegativeReason.BLOCKED
+        assert classify_failure(self._http_error(500)) is None
+        # Rate limiting is transient and left to the rate limiter
+        assert classify_failure(self._http_error(429)) is None
+    
+    def test_unknown_errors(self):
+        assert classify_failure(RuntimeError("boom")) is None
+
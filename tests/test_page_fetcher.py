@@ -0,0 +1,124 @@
+"""
+Tests for the tiered HTTP/browser page fetcher.
+"""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from services.caching_service import CachingService
+from services.page_fetcher import (
+    FetchTier,
+    FetchTierCache,
+    PageFetcher,
+    fetch_domain,
+    needs_javascript
+)
+
+SERVER_RENDERED = "<html><body><h1>Acme</h1><p>" + "Acme builds analytics for teams. " * 20 + "</p></body></html>"
+SPA_SHELL = '<html><head><script src="/app.js"></script></head><body><div id="root"></div></body></html>'
+RENDERED = "<html><body><div id=\"root\"><p>" + "Rendered in the browser. " * 20 + "</p></div></body></html>"
+
+
+class TestNeedsJavascript:
+    """Test the heuristics that decide when to escalate to a browser."""
+    
+    def test_server_rendered_page_is_usable(self):
+        assert needs_javascript(SERVER_RENDERED) is None
+    
+    def test_empty_body(self):
+        assert needs_javascript("  ") == "empty body"
+    
+    def test_empty_app_root(self):
+        assert needs_javascript(SPA_SHELL) == "empty app root"
+    
+    def test_script_text_does_not_count(self):
+        html = "<html><body><script>" + "var x = 1; " * 100 + "</script><p>Loading</p></body></html>"
+        assert needs_javascript(html).startswith("only")
+    
+    def test_missing_expected_selectors(self):
+        assert needs_javascript(SERVER_RENDERED, ["img[src*='avatar']"]) == "expected selectors missing"
+        assert needs_javascript(SERVER_RENDERED, ["img[src*='avatar']", "h1"]) is None
+    
+    def test_fetch_domain(self):
+        assert fetch_domain("https://www.Acme.io:443/pricing") == "acme.io"
+
+
+class TestPageFetcher:
+    """Test tier selection and per-domain learning."""
+    
+    @pytest.fixture
+    def tier_cache(self):
+        return FetchTierCache(CachingService(None, persistent_backend=False))
+    
+    def make_fetcher(self, tier_cache, http_html=None, browser_html=None, http_error=None):
+        session = Mock()
+        if http_error:
+            session.get.side_effect = http_error
+        else:
+            session.get.return_value = Mock(text=http_html)
+        
+        driver = Mock(page_source=browser_html)
+        manager = MagicMock()
+        manager.get_driver.return_value.__enter__.return_value = driver
+        return PageFetcher(session=session, webdriver_manager=manager, tier_cache=tier_cache)
+    
+    def test_http_tier_skips_browser(self, tier_cache):
+        fetcher = self.make_fetcher(tier_cache, http_html=SERVER_RENDERED)
+        
+        assert fetcher.fetch("https://acme.io") == SERVER_RENDERED
+        fetcher.webdriver_manager.get_driver.assert_not_called()
+        assert tier_cache.get("acme.io") is FetchTier.HTTP
+        assert fetcher.get_stats()['http_pages'] == 1
+    
+    def test_escalates_and_learns_browser_tier(self, tier_cache):
+        fetcher = self.make_fetcher(tier_cache, http_html=SPA_SHELL, browser_html=RENDERED)
+        
+        assert fetcher.fetch("https://app.acme.io/page") == RENDERED
+        assert tier_cache.get("app.acme.io") is FetchTier.BROWSER
+        assert fetcher.get_stats()['escalations'] == 1
+        
+        # The next page on the same domain goes straight to the browser
+        fetcher.session.get.reset_mock()
+        assert fetcher.fetch("https://app.acme.io/other") == RENDERED
+        fetcher.session.get.assert_not_called()
+        assert fetcher.get_stats()['learned_browser_skips'] == 1
+    
+    def test_learned_tier_is_shared_through_cache(self, tier_cache):
+        tier_cache.record("acme.io", FetchTier.BROWSER)
+        fetcher = self.make_fetcher(tier_cache, http_html=SERVER_RENDERED, browser_html=RENDERED)
+        
+        assert fetcher.fetch("https://www.acme.io") == RENDERED
+        fetcher.session.get.assert_not_called()
+    
+    def test_tiers_learned_per_selector_set(self, tier_cache):
+        """Test a browser tier learned for some selectors does not apply to other fetches."""
+        fetcher = self.make_fetcher(tier_cache, http_html=SERVER_RENDERED, browser_html=RENDERED)
+        tier_cache.record("acme.io", FetchTier.BROWSER, expected_selectors=["img[src*='avatar']"])
+        
+        assert fetcher.fetch("https://acme.io") == SERVER_RENDERED
+        fetcher.webdriver_manager.get_driver.assert_not_called()
+        
+        assert tier_cache.get("acme.io") is FetchTier.HTTP
+        assert tier_cache.get("acme.io", ["img[src*='avatar']"]) is FetchTier.BROWSER
+    
+    def test_http_response_used_when_browser_fails(self, tier_cache):
+        fetcher = self.make_fetcher(tier_cache, http_html=SPA_SHELL)
+        fetcher.webdriver_manager.get_driver.side_effect = Exception("no chrome")
+        
+        assert fetcher.fetch("https://acme.io") == SPA_SHELL
+        assert tier_cache.get("acme.io") is None
+    
+    def test_http_failure_escalates_without_learning(self, tier_cache):
+        fetcher = self.make_fetcher(tier_cache, browser_html=RENDERED,
+                                    http_error=ConnectionError("reset"))
+        
+        assert fetcher.fetch("https://acme.io") == RENDERED
+        assert tier_cache.get("acme.io") is None
+    
+    def test_both_tiers_failing_raises(self, tier_cache):
+        fetcher = self.make_fetcher(tier_cache, http_error=ConnectionError("reset"))
+        fetcher.webdriver_manager.get_driver.side_effect = Exception("no chrome")
+        
+        with pytest.raises(Exception, match="no chrome"):
+            fetcher.fetch("https://acme.io")
@@ -7,6 +7,8 @@ from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 import json
 
+from bs4 import BeautifulSoup
+
 from services.product_analyzer import (
     ProductAnalyzer, Feature, PricingInfo, MarketAnalysis, 
     ComprehensiveProductInfo, RateLimiter
@@ -198,11 +200,12 @@ class TestComprehensiveProductInfo(unittest.TestCase):
         self.assertEqual(result_dict['launch_date'], launch_date.isoformat())
 
 
+@patch('utils.rate_limiting._global_rate_limiter', None)
 class TestRateLimiter(unittest.TestCase):
-    """Test cases for RateLimiter."""
+    """Test cases for RateLimiter without a central scheduler."""
     
-    @patch('services.product_analyzer.time.time')
-    @patch('services.product_analyzer.time.sleep')
+    @patch('utils.rate_limiting.time.time')
+    @patch('utils.rate_limiting.time.sleep')
     def test_rate_limiter_waits_when_needed(self, mock_sleep, mock_time):
         """Test that rate limiter waits when requests are too frequent."""
         # Set up time sequence: current time when checking, then time after setting last_request_time
@@ -214,8 +217,8 @@ class TestRateLimiter(unittest.TestCase):
         
         mock_sleep.assert_called_once_with(1.0)  # Should sleep for 1 second (2.0 - 1.0)
     
-    @patch('services.product_analyzer.time.time')
-    @patch('services.product_analyzer.time.sleep')
+    @patch('utils.rate_limiting.time.time')
+    @patch('utils.rate_limiting.time.sleep')
     def test_rate_limiter_no_wait_when_enough_time_passed(self, mock_sleep, mock_time):
         """Test that rate limiter doesn't wait when enough time has passed."""
         mock_time.side_effect = [3.0, 3.0]  # Current time is 3.0, enough time has passed
@@ -369,6 +372,64 @@ class TestProductAnalyzer(unittest.TestCase):
         self.assertEqual(result.name, "Fallback Product")
         self.assertEqual(result.description, "Fallback description")
     
+    @patch('services.product_analyzer.ProductAnalyzer._scrape_page_content')
+    @patch('services.product_analyzer.AIParser')
+    def test_analyze_product_fetches_each_page_once(self, mock_ai_parser, mock_scrape):
+        """Test every extractor shares one fetch and parse of each URL."""
+        mock_ai_parser.side_effect = Exception("AI parser unavailable")
+        mock_scrape.side_effect = lambda url: f"""
+        <html>
+            <head><title>{url}</title></head>
+            <body><p>Our team raised seed funding. Free and premium plans.</p></body>
+        </html>
+        """
+        
+        analyzer = ProductAnalyzer(self.config)
+        analyzer.rate_limiter = Mock()
+        
+        parsed = []
+        
+        class CountingSoup(BeautifulSoup):
+            def __init__(self, *args, **kwargs):
+                parsed.append(args[0])
+                super().__init__(*args, **kwargs)
+        
+        with patch('services.product_analyzer.BeautifulSoup', CountingSoup):
+            result = analyzer.analyze_product(
+                "https://www.producthunt.com/posts/test", "https://example.com"
+            )
+        
+        self.assertEqual(result.basic_info.name, "https://www.producthunt.com/posts/test")
+        self.assertEqual(result.funding_info['status'], 'funded')
+        self.assertEqual(mock_scrape.call_count, 2)
+        self.assertEqual(len(parsed), 2)
+        self.assertEqual(analyzer.rate_limiter.wait_if_needed.call_count, 2)
+        
+        # The cache only lives for one analysis
+        analyzer.analyze_product("https://www.producthunt.com/posts/test")
+        self.assertEqual(mock_scrape.call_count, 3)
+    
+    @patch('services.product_analyzer.ProductAnalyzer._scrape_page_content')
+    @patch('services.product_analyzer.AIParser')
+    def test_failed_page_fetch_is_not_retried_within_analysis(self, mock_ai_parser, mock_scrape):
+        """Test extractors do not refetch a page that already failed."""
+        mock_ai_parser.side_effect = Exception("AI parser unavailable")
+        mock_scrape.side_effect = lambda url: self._fail_for_website(url)
+        
+        analyzer = ProductAnalyzer(self.config)
+        analyzer.rate_limiter = Mock()
+        result = analyzer.analyze_product("https://example.com/product", "https://example.com")
+        
+        self.assertIsNone(result.funding_info)
+        urls = [call.args[0] for call in mock_scrape.call_args_list]
+        self.assertEqual(urls.count("https://example.com"), 1)
+    
+    @staticmethod
+    def _fail_for_website(url):
+        if url == "https://example.com":
+            raise ConnectionError("connection refused")
+        return "<html><head><title>Product</title></head></html>"
+    
     @patch('services.product_analyzer.ProductAnalyzer._extract_features_from_url')
     @patch('services.product_analyzer.AIParser')
     def test_extract_features(self, mock_ai_parser, mock_extract):
@@ -442,34 +503,51 @@ class TestProductAnalyzer(unittest.TestCase):
         self.assertEqual(len(result.competitors), 2)
         self.assertEqual(result.market_position, "Strong position")
     
-    @patch('services.product_analyzer.webdriver.Chrome')
+    @patch('requests.Session.get')
     @patch('services.product_analyzer.AIParser')
-    def test_scrape_page_content_selenium(self, mock_ai_parser, mock_webdriver):
-        """Test page content scraping with Selenium."""
+    def test_scrape_page_content_http_first(self, mock_ai_parser, mock_get):
+        """Test server-rendered pages are fetched without a browser."""
         mock_ai_parser.return_value = Mock()
+        html = "<html><body><p>" + "Server rendered landing page. " * 20 + "</p></body></html>"
+        mock_get.return_value = Mock(text=html)
+        
+        analyzer = ProductAnalyzer(self.config)
+        analyzer.page_fetcher.tier_cache = Mock(get=Mock(return_value=None))
+        analyzer.page_fetcher.webdriver_manager = MagicMock()
+        result = analyzer._scrape_page_content("https://example.com")
+        
+        self.assertEqual(result, html)
+        analyzer.page_fetcher.webdriver_manager.get_driver.assert_not_called()
+    
+    @patch('requests.Session.get')
+    @patch('services.product_analyzer.AIParser')
+    def test_scrape_page_content_selenium(self, mock_ai_parser, mock_get):
+        """Test JavaScript-rendered pages are loaded with a pooled WebDriver."""
+        mock_ai_parser.return_value = Mock()
+        mock_get.return_value = Mock(text='<html><body><div id="root"></div></body></html>')
         
         # Setup mock driver
         mock_driver = Mock()
         mock_driver.page_source = "<html><body>Test content</body></html>"
-        mock_webdriver.return_value = mock_driver
         
         analyzer = ProductAnalyzer(self.config)
+        analyzer.page_fetcher.tier_cache = Mock(get=Mock(return_value=None))
+        analyzer.page_fetcher.webdriver_manager = MagicMock()
+        analyzer.page_fetcher.webdriver_manager.get_driver.return_value.__enter__.return_value = mock_driver
         result = analyzer._scrape_page_content("https://example.com")
         
         self.assertEqual(result, "<html><body>Test content</body></html>")
         mock_driver.get.assert_called_once_with("https://example.com")
-        mock_driver.quit.assert_called_once()
+        # The driver goes back to the pool instead of being quit
+        analyzer.page_fetcher.webdriver_manager.get_driver.assert_called_once_with("product_analyzer")
+        mock_driver.quit.assert_not_called()
     
-    @patch('services.product_analyzer.webdriver.Chrome')
-    @patch('services.product_analyzer.requests.Session.get')
+    @patch('requests.Session.get')
     @patch('services.product_analyzer.AIParser')
-    def test_scrape_page_content_fallback_to_requests(self, mock_ai_parser, mock_get, mock_webdriver):
-        """Test page content scraping fallback to requests when Selenium fails."""
+    def test_scrape_page_content_fallback_to_requests(self, mock_ai_parser, mock_get):
+        """Test the HTTP response is used when Selenium fails."""
         mock_ai_parser.return_value = Mock()
         
-        # Make Selenium fail
-        mock_webdriver.side_effect = Exception("Selenium failed")
-        
         # Setup requests mock
         mock_response = Mock()
         mock_response.text = "<html><body>Requests content</body></html>"
@@ -477,6 +555,12 @@ class TestProductAnalyzer(unittest.TestCase):
         mock_get.return_value = mock_response
         
         analyzer = ProductAnalyzer(self.config)
+        analyzer.page_fetcher.tier_cache = Mock(get=Mock(return_value=None))
+        
+        # Make Selenium fail
+        analyzer.page_fetcher.webdriver_manager = MagicMock()
+        analyzer.page_fetcher.webdriver_manager.get_driver.side_effect = Exception("Selenium failed")
+        
         result = analyzer._scrape_page_content("https://example.com")
         
         self.assertEqual(result, "<html><body>Requests content</body></html>")
@@ -0,0 +1,129 @@
+"""
+Tests for the incremental ProductHunt crawler and its seen-set store.
+"""
+
+import threading
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from services.product_hunt_crawler import (
+    ProductHuntCrawler,
+    SeenProductStore,
+    product_slug
+)
+from services.product_hunt_scraper import ProductData
+
+
+def product(slug):
+    return ProductData(
+        name=slug.title(),
+        company_name=slug.title(),
+        website_url=f"https://{slug}.io",
+        product_url=f"https://www.producthunt.com/products/{slug}",
+        description=f"{slug} description",
+        launch_date=datetime(2025, 7, 23, 0, 1)
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SeenProductStore(tmp_path / "crawler.db")
+
+
+def test_product_slug():
+    assert product_slug("https://www.producthunt.com/products/Acme-2/") == "acme-2"
+    assert product_slug("https://www.producthunt.com/posts/widget?ref=home") == "widget"
+
+
+class TestSeenProductStore:
+    """Test the persistent seen-set and queue."""
+    
+    def test_only_new_slugs_are_queued(self, store):
+        assert [p.name for p in store.add([product("acme"), product("widget")])] == ["Acme", "Widget"]
+        assert [p.name for p in store.add([product("widget"), product("gizmo")])] == ["Gizmo"]
+        assert store.pending_count() == 3
+        assert store.seen_count() == 3
+    
+    def test_take_is_oldest_first_and_once(self, store):
+        store.add([product("acme"), product("widget"), product("gizmo")])
+        
+        first = store.take(2)
+        assert [p.name for p in first] == ["Acme", "Widget"]
+        assert first[0] == product("acme")
+        assert [p.name for p in store.take(5)] == ["Gizmo"]
+        assert store.take(5) == []
+    
+    def test_taken_products_are_never_queued(self, store):
+        store.add([product("acme")], taken=True)
+        
+        assert store.add([product("acme")]) == []
+        assert store.pending_count() == 0
+    
+    def test_queue_survives_reopening(self, store, tmp_path):
+        store.add([product("acme")])
+        store.set_state("last_crawl", "2025-07-23T00:00:00")
+        
+        reopened = SeenProductStore(tmp_path / "crawler.db")
+        assert [p.name for p in reopened.take(5)] == ["Acme"]
+        assert reopened.get_state("last_crawl") == "2025-07-23T00:00:00"
+
+
+class TestProductHuntCrawler:
+    """Test incremental crawls and the background thread."""
+    
+    def test_crawl_queues_new_launches_since_last_crawl(self, store):
+        scraper = Mock()
+        scraper.get_latest_products.return_value = [product("acme"), product("widget")]
+        crawler = ProductHuntCrawler(scraper=scraper, store=store, fetch_limit=20)
+        
+        assert crawler.crawl() == 2
+        scraper.get_latest_products.assert_called_with(20, posted_after=None)
+        
+        scraper.get_latest_products.return_value = [product("widget"), product("gizmo")]
+        assert crawler.crawl() == 1
+        assert scraper.get_latest_products.call_args.kwargs['posted_after'] is not None
+        
+        stats = crawler.get_stats()
+        assert stats['crawls'] == 2
+        assert stats['pending'] == 3
+        assert stats['last_crawl'] is not None
+    
+    def test_products_seen_elsewhere_are_skipped(self, store):
+        scraper = Mock()
+        scraper.get_latest_products.return_value = [product("acme")]
+        crawler = ProductHuntCrawler(scraper=scraper, store=store)
+        
+        crawler.mark_seen([product("acme")])
+        
+        assert crawler.crawl() == 0
+        assert crawler.take(5) == []
+    
+    def test_background_crawl(self, store):
+        crawled = threading.Event()
+        scraper = Mock()
+        
+        def latest(limit, posted_after=None):
+            crawled.set()
+            return [product("acme")]
+        scraper.get_latest_products.side_effect = latest
+        crawler = ProductHuntCrawler(scraper=scraper, store=store)
+        
+        crawler.start(interval=60)
+        try:
+            assert crawled.wait(5)
+        finally:
+            crawler.stop()
+        
+        assert [p.name for p in crawler.take(5)] == ["Acme"]
+    
+    def test_failed_crawl_is_recorded(self, store):
+        scraper = Mock()
+        scraper.get_latest_products.side_effect = Exception("ProductHunt down")
+        crawler = ProductHuntCrawler(scraper=scraper, store=store)
+        
+        crawler.start(interval=60)
+        crawler.stop()
+        
+        assert crawler.get_stats()['last_error'] == "ProductHunt down"
@@ -0,0 +1,131 @@
+"""
+Tests for ProductHunt structured data extraction and the GraphQL client.
+"""
+
+import json
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from services.product_hunt_data import (
+    ProductHuntGraphQLClient,
+    extract_makers,
+    extract_payloads,
+    extract_posts
+)
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       "archive", "producthunt_raw.html")
+
+
+def post(post_id, name, slug, **extra):
+    node = {"__typename": "Post", "id": post_id, "name": name, "slug": slug,
+            "tagline": f"{name} tagline", "createdAt": "2025-07-23T00:01:00-07:00"}
+    node.update(extra)
+    return node
+
+
+HOMEPAGE = (
+    '<html><head><script>(window[Symbol.for("ApolloSSRDataTransport")] ??= []).push('
+    + json.dumps({"rehydrate": {"_R_1_": {"data": {"homefeed": {"edges": [{"node": {"items": [
+        post("1", "Acme ", "acme", product={"__typename": "Product", "slug": "acme-2"}),
+        post("2", "Widget", "widget", website="https://www.producthunt.com/r/abc"),
+    ]}}]}}}}}).replace('"missing": null', '"missing": undefined')
+    + ')</script></head><body></body></html>'
+)
+
+PRODUCT_PAGE = (
+    '<html><body><script id="__NEXT_DATA__" type="application/json">'
+    + json.dumps({"props": {"apolloState": {
+        "Post:1": post("1", "Acme", "acme", makers=[{"__ref": "User:7"}, {"__ref": "User:8"}]),
+        "User:7": {"__typename": "User", "name": "Jane Doe", "username": "jane",
+                   "headline": "Founder & CEO", "links": [{"url": "https://www.linkedin.com/in/janedoe"}]},
+        "User:8": {"__typename": "User", "name": "Sam Roe", "username": "sam", "headline": None},
+        "User:9": {"__typename": "User", "name": "A Commenter", "username": "commenter"},
+    }}})
+    + '</script></body></html>'
+)
+
+
+class TestEmbeddedData:
+    """Test reading posts and makers from embedded page JSON."""
+    
+    def test_apollo_transport_tolerates_undefined(self):
+        html = '<script>(window[Symbol.for("ApolloSSRDataTransport")] ??= []).push({"a":undefined,"b":[undefined]})</script>'
+        assert extract_payloads(html) == [{"a": None, "b": [None]}]
+    
+    def test_extract_posts(self):
+        posts = extract_posts(HOMEPAGE)
+        
+        assert [p.name for p in posts] == ["Acme", "Widget"]
+        assert posts[0].product_url == "https://www.producthunt.com/products/acme-2"
+        assert posts[1].product_url == "https://www.producthunt.com/posts/widget"
+        assert posts[1].website_url == ""
+        assert posts[0].created_at.isoformat() == "2025-07-23T00:01:00-07:00"
+        assert len(extract_posts(HOMEPAGE.encode(), limit=1)) == 1
+    
+    def test_extract_makers_follows_cache_references(self):
+        makers = extract_makers(PRODUCT_PAGE)
+        
+        assert [m.name for m in makers] == ["Jane Doe", "Sam Roe"]
+        assert makers[0].linkedin_url == "https://www.linkedin.com/in/janedoe"
+        assert makers[0].headline == "Founder & CEO"
+        assert extract_posts(PRODUCT_PAGE)[0].makers == makers
+    
+    def test_page_without_payload(self):
+        assert extract_posts("<html><body><a href='/products/x'>X</a></body></html>") == []
+        assert extract_makers(b"") == []
+    
+    @pytest.mark.skipif(not os.path.exists(FIXTURE), reason="saved ProductHunt page not present")
+    def test_saved_homepage(self):
+        with open(FIXTURE, encoding="utf-8") as f:
+            posts = extract_posts(f.read())
+        
+        assert len(posts) > 15
+        assert posts[0].name == "Trickle - Magic Canvas"
+        assert posts[0].product_url == "https://www.producthunt.com/products/trickle-3"
+
+
+class TestGraphQLClient:
+    """Test cursor pagination against the GraphQL API."""
+    
+    def page(self, posts, end_cursor, has_next):
+        response = Mock()
+        response.json.return_value = {"data": {"posts": {
+            "pageInfo": {"endCursor": end_cursor, "hasNextPage": has_next},
+            "edges": [{"node": node} for node in posts]
+        }}}
+        return response
+    
+    def test_follows_cursors_until_limit(self):
+        session = Mock()
+        session.post.side_effect = [
+            self.page([post("1", "One", "one"), post("2", "Two", "two")], "c1", True),
+            self.page([post("3", "Three", "three"), post("4", "Four", "four")], "c2", True),
+        ]
+        client = ProductHuntGraphQLClient("token", session=session, page_size=2)
+        
+        posts = client.get_posts(3)
+        
+        assert [p.name for p in posts] == ["One", "Two", "Three"]
+        assert session.post.call_count == 2
+        second = session.post.call_args_list[1]
+        assert second.kwargs['json']['variables']['after'] == "c1"
+        assert second.kwargs['headers']['Authorization'] == "Bearer token"
+    
+    def test_stops_at_last_page(self):
+        session = Mock()
+        session.post.return_value = self.page([post("1", "One", "one")], "c1", False)
+        client = ProductHuntGraphQLClient("token", session=session)
+        
+        assert len(client.get_posts(50)) == 1
+        assert session.post.call_count == 1
+    
+    def test_graphql_errors_raise(self):
+        session = Mock()
+        session.post.return_value.json.return_value = {"errors": [{"message": "invalid_oauth_token"}]}
+        client = ProductHuntGraphQLClient("bad", session=session)
+        
+        with pytest.raises(RuntimeError, match="invalid_oauth_token"):
+            client.get_posts(5)
@@ -2,6 +2,7 @@
 Unit tests for ProductHunt scraper functionality.
 """
 
+import json
 import pytest
 import time
 from unittest.mock import Mock, patch, MagicMock
@@ -15,12 +16,14 @@ from services.product_hunt_scraper import (
     ProductData, 
     retry_with_backoff
 )
+from services.product_hunt_data import EmbeddedPost
 from models.data_models import TeamMember
 from utils.config import Config
 
 
+@patch('utils.rate_limiting._global_rate_limiter', None)
 class TestRateLimiter:
-    """Test cases for the RateLimiter class."""
+    """Test cases for the RateLimiter class without a central scheduler."""
     
     def test_rate_limiter_initialization(self):
         """Test RateLimiter initialization with default and custom delay."""
@@ -270,6 +273,65 @@ class TestProductHuntScraper:
         # but we can verify the HTTP request was made
         mock_get.assert_called_once_with(product_url, timeout=30)
         scraper.rate_limiter.wait_if_needed.assert_called_once()
+        # The AI extractor reuses the page instead of fetching it again
+        mock_ai_team_extractor.return_value.extract_team_from_product_url.assert_called_once_with(
+            product_url, "Test Product", html=mock_response.content
+        )
+    
+    def test_get_latest_products_from_embedded_data(self, scraper):
+        """Test that the homepage's embedded JSON is used without a browser."""
+        items = [{"__typename": "Post", "id": str(i), "name": f"Product {i}", "slug": f"product-{i}",
+                  "tagline": f"Tagline {i}", "product": {"__typename": "Product", "slug": f"product-{i}"}}
+                 for i in range(20)]
+        payload = json.dumps({"rehydrate": {"_R_": {"data": {"homefeed": {"items": items}}}}})
+        html = ('<script>(window[Symbol.for("ApolloSSRDataTransport")] ??= []).push('
+                + payload + ')</script>')
+        scraper.session.get = Mock(return_value=Mock(content=html.encode()))
+        scraper.rate_limiter.wait_if_needed = Mock()
+        
+        products = scraper.get_latest_products(limit=18)
+        
+        assert len(products) == 18
+        assert products[0].name == "Product 0"
+        assert products[0].description == "Tagline 0"
+        assert products[0].product_url == "https://www.producthunt.com/products/product-0"
+        scraper.webdriver_manager.get_driver.assert_not_called()
+    
+    def test_get_latest_products_from_graphql(self, scraper):
+        """Test that a configured GraphQL client is used before scraping the homepage."""
+        scraper.graphql_client = Mock()
+        scraper.graphql_client.get_posts.return_value = [
+            EmbeddedPost(id="1", name="Acme", slug="acme", tagline="Analytics", website_url="https://acme.io")
+        ]
+        scraper.session.get = Mock()
+        scraper.rate_limiter.wait_if_needed = Mock()
+        
+        products = scraper.get_latest_products(limit=30)
+        
+        assert [p.name for p in products] == ["Acme"]
+        assert products[0].website_url == "https://acme.io"
+        scraper.graphql_client.get_posts.assert_called_once_with(30, None)
+        scraper.session.get.assert_not_called()
+    
+    @patch('services.product_hunt_scraper.AITeamExtractor')
+    def test_extract_team_info_from_embedded_makers(self, mock_ai_team_extractor, scraper):
+        """Test that makers in the page's embedded JSON skip the AI extractor."""
+        state = {"props": {"apolloState": {
+            "Post:1": {"__typename": "Post", "id": "1", "name": "Acme", "slug": "acme",
+                       "makers": [{"__ref": "User:1"}]},
+            "User:1": {"__typename": "User", "name": "Jane Doe", "username": "jane", "headline": "CEO",
+                       "linkedinUrl": "https://www.linkedin.com/in/janedoe"}
+        }}}
+        html = f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(state)}</script>'
+        scraper.session.get = Mock(return_value=Mock(content=html))
+        scraper.rate_limiter.wait_if_needed = Mock()
+        
+        team_members = scraper.extract_team_info("https://www.producthunt.com/products/acme")
+        
+        assert [(m.name, m.role, m.linkedin_url) for m in team_members] == [
+            ("Jane Doe", "CEO", "https://www.linkedin.com/in/janedoe")
+        ]
+        mock_ai_team_extractor.assert_not_called()
     
     def test_extract_company_domain_from_url(self, scraper):
         """Test domain extraction from website URL."""
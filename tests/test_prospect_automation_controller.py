@@ -2,6 +2,8 @@
 Integration tests for the ProspectAutomationController.
 """
 
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
@@ -9,6 +11,10 @@ from typing import List
 
 from controllers.prospect_automation_controller import ProspectAutomationController
 from models.data_models import CompanyData, TeamMember, Prospect, ProspectStatus, LinkedInProfile, EmailData
+from services.product_hunt_crawler import (
+    ProductHuntCrawler,
+    SeenProductStore
+)
 from services.product_hunt_scraper import ProductData
 from utils.config import Config
 
@@ -119,6 +125,63 @@ class TestProspectAutomationController:
         assert companies[0].name == "Test Company"
         assert companies[0].domain == "testcompany.com"
     
+    @patch('controllers.prospect_automation_controller.ProductHuntScraper')
+    @patch('controllers.prospect_automation_controller.NotionDataManager')
+    @patch('controllers.prospect_automation_controller.EmailFinder')
+    @patch('controllers.prospect_automation_controller.LinkedInScraper')
+    @patch('controllers.prospect_automation_controller.EmailGenerator')
+    def test_discover_companies_from_crawler_queue(self, mock_email_gen, mock_linkedin, mock_email_finder,
+                                                   mock_notion, mock_scraper, mock_config):
+        """Test that queued crawler products are used without scraping the homepage."""
+        queued = ProductData(
+            name="Queued Company",
+            company_name="Queued Company",
+            website_url="https://queued.io",
+            product_url="https://www.producthunt.com/products/queued",
+            description="Found by the background crawler",
+            launch_date=datetime.now()
+        )
+        controller = ProspectAutomationController(mock_config)
+        controller.product_crawler = Mock()
+        controller.product_crawler.take.return_value = [queued]
+        controller._filter_unprocessed_companies = Mock(side_effect=lambda companies: companies)
+        
+        companies = controller._discover_companies(1)
+        
+        assert [c.domain for c in companies] == ["queued.io"]
+        mock_scraper.return_value.get_latest_products.assert_not_called()
+    
+    @patch('controllers.prospect_automation_controller.ProductHuntScraper')
+    @patch('controllers.prospect_automation_controller.NotionDataManager')
+    @patch('controllers.prospect_automation_controller.EmailFinder')
+    @patch('controllers.prospect_automation_controller.LinkedInScraper')
+    @patch('controllers.prospect_automation_controller.EmailGenerator')
+    def test_discover_companies_keeps_unused_queued_products(self, mock_email_gen, mock_linkedin,
+                                                             mock_email_finder, mock_notion, mock_scraper,
+                                                             mock_config, tmp_path):
+        """Test that queued launches beyond the limit stay in the crawler queue."""
+        store = SeenProductStore(tmp_path / "crawler.db")
+        store.add([
+            ProductData(
+                name=f"Company {i}",
+                company_name=f"Company {i}",
+                website_url=f"https://company{i}.io",
+                product_url=f"https://www.producthunt.com/products/company-{i}",
+                description="Found by the background crawler",
+                launch_date=datetime.now()
+            )
+            for i in range(15)
+        ])
+        controller = ProspectAutomationController(mock_config)
+        controller.product_crawler = ProductHuntCrawler(mock_config, scraper=Mock(), store=store)
+        controller._filter_unprocessed_companies = Mock(side_effect=lambda companies: companies)
+        
+        companies = controller._discover_companies(5)
+        
+        assert [c.domain for c in companies] == [f"company{i}.io" for i in range(5)]
+        assert store.pending_count() == 10
+        assert [p.company_name for p in store.take(1)] == ["Company 5"]
+    
     @patch('controllers.prospect_automation_controller.ProductHuntScraper')
     @patch('controllers.prospect_automation_controller.NotionDataManager')
     @patch('controllers.prospect_automation_controller.EmailFinder')
@@ -169,7 +232,7 @@ class TestProspectAutomationController:
         
         # Verify email finder was called
         mock_email_finder_instance.find_and_verify_team_emails.assert_called_once_with(
-            sample_team_members, "testcompany.com"
+            sample_team_members, "testcompany.com", verify=True
         )
         mock_email_finder_instance.get_best_emails.assert_called_once_with(mock_email_results, min_confidence=70)
         
@@ -360,6 +423,37 @@ class TestProspectAutomationController:
         
         assert prospects == []
     
+    @patch('controllers.prospect_automation_controller.ProductHuntScraper')
+    @patch('controllers.prospect_automation_controller.NotionDataManager')
+    @patch('controllers.prospect_automation_controller.EmailFinder')
+    @patch('controllers.prospect_automation_controller.LinkedInScraper')
+    @patch('controllers.prospect_automation_controller.EmailGenerator')
+    def test_process_company_returns_partial_results_at_deadline(self, mock_email_gen, mock_linkedin,
+                                                                 mock_email_finder, mock_notion, mock_scraper,
+                                                                 mock_config, sample_company_data,
+                                                                 sample_team_members):
+        """Test steps that no longer fit the company deadline are skipped."""
+        mock_config.company_deadline_seconds = 0.1
+        mock_notion.return_value.store_prospect.return_value = "page_id"
+        controller = ProspectAutomationController(mock_config)
+    
+        def slow_team_extraction(company_data):
+            time.sleep(0.2)
+            return sample_team_members
+        
+        with patch.object(controller, '_analyze_product_with_ai_structuring', return_value=None), \
+             patch.object(controller, '_extract_team_members_with_ai', side_effect=slow_team_extraction), \
+             patch.object(controller, '_find_team_emails') as find_emails, \
+             patch.object(controller, '_extract_linkedin_profiles_with_ai') as extract_profiles, \
+             patch.object(controller, '_structure_prospect_data_with_ai') as structure:
+            prospects = controller.process_company(sample_company_data)
+        
+        find_emails.assert_not_called()
+        extract_profiles.assert_not_called()
+        structure.assert_not_called()
+        assert len(prospects) == len(sample_team_members)
+        assert controller.stats['companies_partial'] == 1
+    
     @patch('controllers.prospect_automation_controller.ProductHuntScraper')
     @patch('controllers.prospect_automation_controller.NotionDataManager')
     @patch('controllers.prospect_automation_controller.EmailFinder')
@@ -0,0 +1,217 @@
+"""
+Tests for quota budgeting and campaign planning.
+"""
+
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from services.ai_provider_manager import get_provider_manager
+from services.email_finder import EmailFinder
+from services.openai_client_manager import CompletionRequest, CompletionResponse
+from services.quota_planner import (
+    CostEstimate,
+    PipelineStage,
+    QuotaPlanner,
+    QuotaResource
+)
+from utils.api_monitor import get_api_monitor
+from utils.error_handling import ErrorHandler
+
+
+def make_config(**overrides):
+    values = {
+        'ai_provider': 'openai',
+        'ai_daily_token_budget': None,
+        'ai_fallback_model': None,
+        'notion_daily_request_budget': None,
+        'max_prospects_per_company': 10
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestQuotaPlanner:
+    """Test QuotaPlanner planning and metering."""
+    
+    @pytest.fixture
+    def costs(self):
+        return CostEstimate(
+            prospects_per_company=2,
+            llm_tokens_per_company=1000,
+            llm_tokens_per_prospect=500,
+            notion_requests_per_prospect=3
+        )
+    
+    def make_planner(self, tmp_path, costs, **config):
+        planner = QuotaPlanner(make_config(**config), costs=costs,
+                               ledger_path=str(tmp_path / "quota_usage.json"))
+        planner.error_handler = ErrorHandler(config_path=str(tmp_path / "errors.json"))
+        return planner
+    
+    def set_hunter_quota(self, planner, quota_type, used, limit):
+        planner.error_handler.update_service_quota(
+            'hunter', quota_type, used, limit, datetime.now() + timedelta(days=30)
+        )
+    
+    def test_unlimited_without_budgets(self, tmp_path, costs):
+        """Test unknown quotas do not limit the campaign."""
+        planner = self.make_planner(tmp_path, costs)
+        plan = planner.plan(10)
+        
+        assert plan.companies == 10
+        assert plan.estimated_prospects == 20
+        assert plan.verify_emails
+        assert plan.degradations == []
+        assert plan.reservations == {}
+        assert not plan.is_degraded
+    
+    def test_skips_verification_when_credits_short(self, tmp_path, costs):
+        """Test verification is dropped before companies are cut."""
+        planner = self.make_planner(tmp_path, costs)
+        self.set_hunter_quota(planner, 'searches', 0, 100)
+        self.set_hunter_quota(planner, 'verifications', 0, 4)
+        
+        plan = planner.plan(10)
+        
+        assert plan.companies == 10
+        assert not plan.verify_emails
+        assert plan.degradations == ["skip_verification"]
+        assert plan.reservations == {'email_finding': 20}
+    
+    def test_shared_hunter_pool(self, tmp_path, costs):
+        """Test single-pool plans charge searches and verifications to one quota."""
+        planner = self.make_planner(tmp_path, costs)
+        self.set_hunter_quota(planner, 'requests', 8, 20)
+        
+        plan = planner.plan(10)
+        
+        # 12 requests left: 3 companies with verification, 6 without
+        assert plan.companies == 6
+        assert not plan.verify_emails
+        assert plan.limiting_resource == QuotaResource.HUNTER_SEARCHES.value
+        assert plan.remaining['hunter_searches'] == 12
+    
+    def test_falls_back_to_cheaper_model(self, tmp_path, costs):
+        """Test a short token budget switches models before cutting companies."""
+        planner = self.make_planner(tmp_path, costs, ai_daily_token_budget=10000)
+        
+        # 2000 budget tokens per company at full price, 500 on the fallback model
+        plan = planner.plan(10)
+        assert plan.companies == 10
+        assert plan.fallback_model == "gpt-4o-mini"
+        assert plan.degradations == ["fallback_model:gpt-4o-mini"]
+        
+        plan = planner.plan(30)
+        assert plan.companies == 20
+        assert plan.limiting_resource == QuotaResource.LLM_TOKENS.value
+    
+    def test_no_fallback_model_cuts_companies(self, tmp_path, costs):
+        """Test providers without a known cheaper model just process fewer companies."""
+        planner = self.make_planner(tmp_path, costs, ai_provider='deepseek', ai_daily_token_budget=10000)
+        plan = planner.plan(10)
+        
+        assert plan.companies == 5
+        assert plan.fallback_model is None
+        assert plan.reservations == {'analysis': 5000, 'structuring': 5000}
+    
+    def test_stage_reservation_is_enforced(self, tmp_path, costs):
+        """Test a stage stops spending once its reservation is used up."""
+        planner = self.make_planner(tmp_path, costs)
+        self.set_hunter_quota(planner, 'searches', 0, 4)
+        self.set_hunter_quota(planner, 'verifications', 0, 100)
+        plan = planner.plan(5)
+        assert plan.companies == 2
+        
+        planner.start(plan)
+        try:
+            monitor = get_api_monitor()
+            for _ in range(4):
+                assert planner.allow(PipelineStage.EMAIL_FINDING)
+                monitor.record_api_call('hunter', 'email-finder', 0.1, 200, True)
+            # Failed calls are not charged
+            monitor.record_api_call('hunter', 'email-verifier', 0.1, 500, False)
+            
+            assert not planner.allow(PipelineStage.EMAIL_FINDING)
+            assert planner.allow(PipelineStage.VERIFICATION)
+            assert "email_finding_budget_exhausted" in plan.degradations
+        finally:
+            usage = planner.finish()
+        
+        assert usage['consumed']['email_finding'] == 4
+        assert usage['consumed']['verification'] == 0
+        
+        # Without an active plan nothing is refused
+        assert planner.allow(PipelineStage.EMAIL_FINDING)
+    
+    def test_token_usage_and_fallback_model(self, tmp_path, costs):
+        """Test LLM tokens are metered per stage and the fallback model is applied."""
+        planner = self.make_planner(tmp_path, costs, ai_daily_token_budget=10000)
+        plan = planner.plan(10)
+        
+        manager = get_provider_manager()
+        provider = Mock()
+        provider.make_completion.side_effect = lambda request: CompletionResponse(
+            content="ok", model=request.model or "gpt-4",
+            usage={'prompt_tokens': 300, 'completion_tokens': 100}, finish_reason="stop"
+        )
+        
+        planner.start(plan)
+        try:
+            with patch.object(manager, 'get_provider', return_value=provider):
+                with planner.stage(PipelineStage.STRUCTURING):
+                    manager.make_completion(CompletionRequest(messages=[]))
+                manager.make_completion(CompletionRequest(messages=[], model="gpt-4"))
+            
+            sent = provider.make_completion.call_args_list[0][0][0]
+            assert sent.model == "gpt-4o-mini"
+        finally:
+            usage = planner.finish()
+        
+        assert manager.get_model_override() is None
+        # Fallback tokens count at a quarter of their size
+        assert usage['consumed']['structuring'] == 100
+        assert usage['consumed']['analysis'] == 400
+    
+    def test_daily_usage_persists(self, tmp_path, costs):
+        """Test the daily ledger carries usage over to the next run."""
+        planner = self.make_planner(tmp_path, costs, notion_daily_request_budget=30)
+        planner.record(PipelineStage.STORAGE, 12)
+        planner.save_ledger()
+        
+        ledger = json.loads((tmp_path / "quota_usage.json").read_text())
+        assert ledger['usage'] == {'notion_requests': 12.0}
+        
+        second = self.make_planner(tmp_path, costs, notion_daily_request_budget=30)
+        assert second.remaining()[QuotaResource.NOTION_REQUESTS] == 18
+        assert second.plan(10).companies == 3
+
+
+class TestHunterAccountQuota:
+    """Test reading Hunter.io credits from the account endpoint."""
+    
+    def test_get_account_quota(self, mock_config):
+        finder = EmailFinder(mock_config)
+        finder.api_monitor = Mock()
+        response = Mock(status_code=200)
+        response.json.return_value = {'data': {
+            'reset_date': '2026-11-01',
+            'requests': {
+                'searches': {'used': 20, 'available': 50},
+                'verifications': {'used': 5, 'available': 100}
+            }
+        }}
+        finder.session = Mock()
+        finder.session.get.return_value = response
+        
+        with patch('services.email_finder.wait_for_service'):
+            quotas = finder.get_account_quota()
+        
+        assert quotas['searches'] == {'used': 20, 'available': 50}
+        assert quotas['reset_time'] == datetime(2026, 11, 1)
+        finder.api_monitor.update_quota_usage.assert_any_call(
+            'hunter', 'verifications', 5, 100, datetime(2026, 11, 1)
+        )
@@ -11,11 +11,16 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import json
 import tempfile
+import asyncio
+from types import SimpleNamespace
 
 from utils.rate_limiting import (
     RateLimitingService, RateLimitConfig, RateLimitStatus, RateLimitStrategy,
-    TokenBucket, SlidingWindowCounter, get_rate_limiter, wait_for_service, can_make_request
+    TokenBucket, SlidingWindowCounter, get_rate_limiter, wait_for_service, can_make_request,
+    RateLimitTimeoutError, parse_rate_limit_headers, resolve_host, HostRateLimiter,
+    PriorityLanes, RequestPriority, current_priority, request_priority
 )
+from utils.rate_limit_backends import RedisRateLimitBackend, create_rate_limit_backend
 from utils.config import Config
 
 
@@ -261,6 +266,22 @@ class TestSlidingWindowCounter:
         assert wait_time > 0
         assert wait_time <= 2.0
     
+    def test_pruning_with_clock(self):
+        """Test expired requests are pruned and wait time uses the right entry."""
+        now = [100.0]
+        window = SlidingWindowCounter(window_size=10, max_requests=2, clock=lambda: now[0])
+        
+        for offset in (0.0, 4.0, 8.0):
+            now[0] = 100.0 + offset
+            window.record_request()
+        
+        # Three requests in the window: a slot opens when the second one expires
+        assert window.get_wait_time() == pytest.approx(6.0)
+        
+        now[0] = 114.5
+        assert window.can_proceed() is True
+        assert list(window.requests) == [108.0]
+    
     def test_thread_safety(self):
         """Test thread safety of sliding window counter."""
         window = SlidingWindowCounter(window_size=60, max_requests=50)
@@ -502,6 +523,623 @@ class TestRateLimitingService:
             Path(config_path).unlink(missing_ok=True)
 
 
+class SimulatedClock:
+    """Thread-safe fake clock; sleeping advances time instead of blocking."""
+    
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+        self._lock = threading.Lock()
+    
+    def time(self) -> float:
+        with self._lock:
+            return self.now
+    
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.now += max(0.0, seconds)
+
+
+class TestAtomicAcquire:
+    """Test cases for the atomic acquire() API."""
+    
+    @pytest.fixture
+    def clock(self):
+        return SimulatedClock()
+    
+    @pytest.fixture
+    def rate_limiter(self, clock, tmp_path):
+        config = SimpleNamespace(hunter_requests_per_minute=10, scraping_delay=0.3,
+                                 resend_requests_per_minute=100)
+        with patch('utils.rate_limiting.get_logger'):
+            return RateLimitingService(config, config_path=str(tmp_path / "limits.json"),
+                                       clock=clock.time, sleep=clock.sleep)
+    
+    def _assert_within_limit(self, times, window, limit):
+        times = sorted(times)
+        for i in range(len(times) - limit):
+            assert times[i + limit] - times[i] >= window - 1e-9
+    
+    def test_concurrent_sliding_window_never_overshoots(self, rate_limiter):
+        """Test 64 threads never exceed the sliding window limit."""
+        rate_limiter.add_rate_limit(RateLimitConfig(
+            service_name="hunter", operation="stress", requests_per_minute=10,
+            strategy=RateLimitStrategy.SLIDING_WINDOW
+        ))
+        proceed_times = []
+        barrier = threading.Barrier(64)
+        
+        def worker():
+            barrier.wait()
+            proceed_times.append(rate_limiter.acquire("hunter", "stress"))
+        
+        threads = [threading.Thread(target=worker) for _ in range(64)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(proceed_times) == 64
+        self._assert_within_limit(proceed_times, 60, 10)
+        # Slots are packed: 64 requests at 10 RPM need exactly 6 extra windows
+        assert max(proceed_times) - min(proceed_times) == pytest.approx(360)
+    
+    def test_concurrent_token_bucket_never_overshoots(self, rate_limiter, clock):
+        """Test 64 threads drain a token bucket at exactly its refill rate."""
+        rate_limiter.add_rate_limit(RateLimitConfig(
+            service_name="openai", operation="stress", requests_per_minute=60, burst_limit=4,
+            strategy=RateLimitStrategy.TOKEN_BUCKET
+        ))
+        start = clock.time()
+        proceed_times = []
+        barrier = threading.Barrier(64)
+        
+        def worker():
+            barrier.wait()
+            proceed_times.append(rate_limiter.acquire("openai", "stress"))
+        
+        threads = [threading.Thread(target=worker) for _ in range(64)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        proceed_times.sort()
+        # Burst of 4, then one token per second
+        assert proceed_times[3] == pytest.approx(start)
+        assert proceed_times[-1] == pytest.approx(start + 60)
+    
+    def test_fifo_order(self, rate_limiter):
+        """Test slots are handed out in arrival order."""
+        rate_limiter.add_rate_limit(RateLimitConfig(
+            service_name="hunter", operation="fifo", requests_per_minute=1,
+            strategy=RateLimitStrategy.SLIDING_WINDOW
+        ))
+        slots = [rate_limiter._reserve("hunter.fifo") for _ in range(3)]
+        
+        assert slots == sorted(slots)
+        assert slots[1] - slots[0] == pytest.approx(60)
+    
+    def test_timeout_does_not_reserve(self, rate_limiter, clock):
+        """Test a timed out acquire leaves the window untouched."""
+        rate_limiter.add_rate_limit(RateLimitConfig(
+            service_name="hunter", operation="timeout", requests_per_minute=1,
+            strategy=RateLimitStrategy.SLIDING_WINDOW
+        ))
+        rate_limiter.acquire("hunter", "timeout")
+        
+        with pytest.raises(RateLimitTimeoutError):
+            rate_limiter.acquire("hunter", "timeout", timeout=5)
+        
+        assert len(rate_limiter.sliding_windows["hunter.timeout"].requests) == 1
+        assert rate_limiter.acquire("hunter", "timeout", timeout=60) == pytest.approx(clock.time())
+    
+    def test_multiple_tokens(self, rate_limiter):
+        """Test reserving several requests at once."""
+        rate_limiter.add_rate_limit(RateLimitConfig(
+            service_name="hunter", operation="batch", requests_per_minute=2,
+            strategy=RateLimitStrategy.SLIDING_WINDOW
+        ))
+        start = rate_limiter.acquire("hunter", "batch", tokens=2)
+        assert rate_limiter.acquire("hunter", "batch", tokens=2) == pytest.approx(start + 60)
+    
+    def test_acquire_async(self, clock, tmp_path):
+        """Test the async twin reserves the same slots."""
+        config = SimpleNamespace(hunter_requests_per_minute=10, scraping_delay=0.3,
+                                 resend_requests_per_minute=100)
+        with patch('utils.rate_limiting.get_logger'):
+            rate_limiter = RateLimitingService(config, config_path=str(tmp_path / "limits.json"))
+        rate_limiter.add_rate_limit(RateLimitConfig(
+            service_name="notion", operation="async", requests_per_minute=600, burst_limit=2,
+            strategy=RateLimitStrategy.TOKEN_BUCKET
+        ))
+        
+        async def run():
+            return await asyncio.gather(*[
+                rate_limiter.acquire_async("notion", "async") for _ in range(4)
+            ])
+        
+        start = time.time()
+        proceed_times = asyncio.run(run())
+        elapsed = time.time() - start
+        
+        # Two burst tokens, then 10 per second
+        assert sorted(proceed_times)[-1] - start == pytest.approx(0.2, abs=0.05)
+        assert 0.15 <= elapsed < 1.0
+
+
+class TestAdaptiveLimits:
+    """Test cases for limits learned from API responses."""
+    
+    @pytest.fixture
+    def clock(self):
+        return SimulatedClock()
+    
+    def _make_limiter(self, clock, tmp_path):
+        config = SimpleNamespace(hunter_requests_per_minute=10, scraping_delay=0.3,
+                                 resend_requests_per_minute=100)
+        with patch('utils.rate_limiting.get_logger'):
+            return RateLimitingService(config, config_path=str(tmp_path / "limits.json"),
+                                       clock=clock.time, sleep=clock.sleep,
+                                       learned_limits_path=str(tmp_path / "learned.json"))
+    
+    @pytest.fixture
+    def rate_limiter(self, clock, tmp_path):
+        return self._make_limiter(clock, tmp_path)
+    
+    def test_parse_headers_case_insensitive(self):
+        """Test header families and duration formats are understood."""
+        parsed = parse_rate_limit_headers({'x-ratelimit-limit': '100', 'X-RATELIMIT-REMAINING': '7',
+                                           'X-RateLimit-Reset': '30', 'Retry-After': '12'})
+        assert (parsed.limit, parsed.remaining, parsed.reset_seconds, parsed.retry_after) == (100, 7, 30.0, 12.0)
+        
+        openai_style = parse_rate_limit_headers({'x-ratelimit-remaining-requests': '59',
+                                                 'x-ratelimit-reset-requests': '1m0.5s'})
+        assert openai_style.remaining == 59
+        assert openai_style.reset_seconds == pytest.approx(60.5)
+        
+        assert parse_rate_limit_headers({'Content-Type': 'application/json'}).remaining is None
+    
+    def test_429_halves_rate_and_honours_retry_after(self, rate_limiter, clock):
+        """Test a 429 backs off the refill rate and pauses the key."""
+        bucket = rate_limiter.token_buckets["notion.api_call"]
+        rate_limiter.observe_response("notion", "api_call", 429, {'Retry-After': '30'})
+        
+        assert bucket.refill_rate == pytest.approx(50 / 60.0)
+        assert bucket.capacity == 5
+        assert rate_limiter.get_status("notion")["notion.api_call"].is_limited is True
+        
+        # A duplicate report during the pause does not back off twice
+        rate_limiter.observe_response("notion", "api_call", 429)
+        assert bucket.refill_rate == pytest.approx(50 / 60.0)
+        
+        start = clock.time()
+        proceed_at = rate_limiter.acquire("notion", "api_call")
+        assert proceed_at - start == pytest.approx(30.0)
+    
+    def test_successes_recover_to_configured_rate(self, rate_limiter, clock):
+        """Test rates grow back after successes but not past the configuration without headers."""
+        window = rate_limiter.sliding_windows["hunter.email-finder"]
+        rate_limiter.observe_response("hunter", "email-finder", 429)
+        assert window.max_requests == 5
+        
+        clock.sleep(60)
+        for _ in range(200):
+            rate_limiter.observe_response("hunter", "email-finder", 200, {})
+        
+        assert window.max_requests == 9  # Just under the rate that was throttled
+        assert rate_limiter.adaptive_limits["hunter.email-finder"].current_rpm <= 10
+    
+    def test_headers_raise_rate_to_quota(self, rate_limiter):
+        """Test remaining quota headers let the limiter run at the real ceiling."""
+        rate_limiter.observe_response("hunter", "domain-search", 200,
+                                      {'X-RateLimit-Limit': '60', 'X-RateLimit-Remaining': '45',
+                                       'X-RateLimit-Reset': '30'})
+        
+        assert rate_limiter.sliding_windows["hunter.domain-search"].max_requests == 90
+        assert rate_limiter.get_status("hunter")["hunter.domain-search"].remaining_requests == 45
+        # Other operations keep their own limits
+        assert rate_limiter.sliding_windows["hunter.email-finder"].max_requests == 10
+    
+    def test_unknown_operation_adapts_whole_service(self, rate_limiter):
+        """Test responses for an unlimited endpoint adapt every limit of the service."""
+        rate_limiter.observe_response("hunter", "account-info", 429)
+        
+        for operation in ("domain-search", "email-finder", "email-verifier"):
+            assert rate_limiter.sliding_windows[f"hunter.{operation}"].max_requests == 5
+    
+    def test_learned_limits_persist(self, rate_limiter, clock, tmp_path):
+        """Test learned limits are reloaded by a new service instance."""
+        rate_limiter.observe_response("openai", "completion", 429)
+        
+        restarted = self._make_limiter(clock, tmp_path)
+        assert restarted.token_buckets["openai.completion"].refill_rate == pytest.approx(1.0)
+        assert restarted.get_adaptive_limits()["openai.completion"]["current_rpm"] == 60
+        
+        # Explicit reconfiguration discards what was learned
+        restarted.update_rate_limit("openai", "completion", requests_per_minute=30)
+        assert "openai.completion" not in restarted.get_adaptive_limits()
+    
+    def test_learned_limits_saves_are_debounced(self, rate_limiter, clock, tmp_path):
+        """Test the learned limits file is not rewritten on every response."""
+        learned_file = tmp_path / "learned.json"
+        rate_limiter.observe_response("openai", "completion", 429)
+        saved = learned_file.read_text()
+        
+        clock.sleep(1)
+        rate_limiter.observe_response("notion", "api_call", 429)
+        assert learned_file.read_text() == saved
+        
+        rate_limiter.flush_learned_limits()
+        assert "notion.api_call" in json.loads(learned_file.read_text())['limits']
+    
+    def test_timeout_during_pause_keeps_local_capacity(self, rate_limiter):
+        """Test callers that cannot wait out a pause do not use up tokens."""
+        bucket = rate_limiter.token_buckets["notion.api_call"]
+        rate_limiter.adaptive_limits["notion.api_call"] = Mock(paused_until=rate_limiter._clock() + 30)
+        tokens = bucket.tokens
+        
+        assert not rate_limiter.try_acquire("notion", "api_call")
+        with pytest.raises(RateLimitTimeoutError):
+            rate_limiter.acquire("notion", "api_call", timeout=5)
+        assert bucket.tokens == tokens
+    
+    def test_api_monitor_observer(self, rate_limiter, tmp_path):
+        """Test APIMonitor forwards recorded calls to the limiter."""
+        from utils.api_monitor import APIMonitor
+        monitor = APIMonitor(config_path=str(tmp_path / "monitor.json"))
+        monitor.add_observer(rate_limiter.observe_response)
+        
+        monitor.record_api_call("hunter", "email-verifier", 0.1, 429, False,
+                                rate_limit_headers={'Retry-After': '5'})
+        
+        assert rate_limiter.sliding_windows["hunter.email-verifier"].max_requests == 5
+
+
+class TestCentralScheduler:
+    """Test cases for services sharing the central scheduler."""
+    
+    @pytest.fixture
+    def clock(self):
+        return SimulatedClock()
+    
+    @pytest.fixture
+    def rate_limiter(self, clock, tmp_path):
+        config = SimpleNamespace(hunter_requests_per_minute=10, scraping_delay=2.0,
+                                 resend_requests_per_minute=100)
+        with patch('utils.rate_limiting.get_logger'):
+            return RateLimitingService(config, config_path=str(tmp_path / "limits.json"),
+                                       clock=clock.time, sleep=clock.sleep,
+                                       learned_limits_path=str(tmp_path / "learned.json"))
+    
+    def test_resolve_host(self):
+        """Test URLs map to known upstreams or per-host keys."""
+        assert resolve_host("https://www.linkedin.com/in/jane") == ("linkedin", "scraping")
+        assert resolve_host("https://www.producthunt.com/posts/x") == ("producthunt", "scraping")
+        assert resolve_host("https://Acme.io/pricing") == ("web", "acme.io")
+        assert resolve_host("docs.acme.io") == ("web", "docs.acme.io")
+        assert resolve_host(None) == ("web", "default")
+    
+    def test_register_keeps_existing_limit(self, rate_limiter):
+        """Test the first registration of an upstream wins."""
+        rate_limiter.register("web", "acme.io", min_interval=2.0)
+        rate_limiter.register("web", "acme.io", min_interval=0.1)
+        assert rate_limiter.rate_limits["web.acme.io"].requests_per_minute == 30
+        
+        rate_limiter.register("hunter", "email-finder", min_interval=0.1)
+        assert rate_limiter.rate_limits["hunter.email-finder"].requests_per_minute == 10
+    
+    def test_handles_share_one_limit_per_host(self, rate_limiter, clock):
+        """Test two scrapers of one host are spaced once, not throttled twice."""
+        first = HostRateLimiter(delay=2.0, rate_limiter=rate_limiter)
+        second = HostRateLimiter(delay=2.0, rate_limiter=rate_limiter)
+        
+        start = clock.time()
+        first.wait_if_needed("https://acme.io/features")
+        second.wait_if_needed("https://acme.io/pricing")
+        second.wait_if_needed("https://other.io/")
+        
+        assert clock.time() - start == pytest.approx(2.0)
+    
+    def test_try_acquire_never_waits(self, rate_limiter, clock):
+        """Test optional requests only take a slot that is open now."""
+        handle = HostRateLimiter(delay=2.0, rate_limiter=rate_limiter)
+        
+        start = clock.time()
+        handle.wait_if_needed("https://acme.io/features")
+        assert not handle.try_acquire("https://acme.io/pricing")
+        assert handle.try_acquire("https://other.io/")
+        clock.sleep(2.0)
+        assert handle.try_acquire("https://acme.io/pricing")
+        assert not rate_limiter.try_acquire("web", "acme.io")
+        assert clock.time() - start == pytest.approx(2.0)
+    
+    def test_metrics_report_wait_time_and_utilization(self, rate_limiter, clock):
+        """Test per-service quota, utilization and limiter wait metrics."""
+        for _ in range(3):
+            rate_limiter.acquire("producthunt", "scraping")
+        
+        metrics = rate_limiter.get_metrics("producthunt")["producthunt"]
+        limit = metrics['limits']['scraping']
+        
+        assert metrics['total_wait_time'] == pytest.approx(4.0)  # Second and third wait 2s each
+        assert metrics['waited_requests'] == 2
+        assert limit['quota_rpm'] == 30
+        assert limit['max_wait_time'] == pytest.approx(2.0)
+        assert limit['requests_last_minute'] == 3
+        assert limit['utilization'] == pytest.approx(0.1)
+    
+    def test_avoided_sleep_accounting(self, rate_limiter, clock):
+        """Test skipped fixed sleeps are totalled per call site."""
+        rate_limiter.record_avoided_sleep("batch_company_delay", 2.0)
+        rate_limiter.record_avoided_sleep("batch_company_delay", 2.0)
+        rate_limiter.record_avoided_sleep("producthunt_expansion", 3.0 - 0.4)
+        # Waiting longer than the old sleep saves nothing
+        rate_limiter.record_avoided_sleep("producthunt_expansion", 3.0 - 5.0)
+        
+        assert rate_limiter.get_avoided_sleep() == {
+            'batch_company_delay': pytest.approx(4.0),
+            'producthunt_expansion': pytest.approx(2.6)
+        }
+        
+        rate_limiter.acquire("producthunt", "scraping")
+        rate_limiter.acquire("producthunt", "scraping")
+        assert rate_limiter.get_total_wait_time() == pytest.approx(2.0)
+    
+    def test_thread_wait_time(self, rate_limiter, clock):
+        """Test a step can subtract the rate limit waits it took from the sleep it replaced."""
+        waited_before = rate_limiter.thread_wait_time()
+        rate_limiter.acquire("producthunt", "scraping")
+        rate_limiter.acquire("producthunt", "scraping")
+        waited = rate_limiter.thread_wait_time() - waited_before
+        
+        assert waited == pytest.approx(2.0)
+        rate_limiter.record_avoided_sleep("batch_company_delay", 3.0 - waited)
+        assert rate_limiter.get_avoided_sleep() == {'batch_company_delay': pytest.approx(1.0)}
+        
+        # Other threads' waits are not counted
+        other = []
+        thread = threading.Thread(target=lambda: other.append(rate_limiter.thread_wait_time()))
+        thread.start()
+        thread.join()
+        assert other == [0.0]
+
+
+class TestSharedBackend:
+    """Test cases for rate limits shared between processes and hosts."""
+    
+    @pytest.fixture
+    def clock(self):
+        return SimulatedClock()
+    
+    @pytest.fixture(params=["sqlite", "memory"])
+    def backend_url(self, request, tmp_path):
+        if request.param == "sqlite":
+            return f"sqlite://{tmp_path / 'ratelimits.db'}"
+        return f"memory://ratelimits-{tmp_path.name}"
+    
+    def _make_host(self, clock, tmp_path, backend_url, name):
+        config = SimpleNamespace(hunter_requests_per_minute=10, scraping_delay=2.0,
+                                 resend_requests_per_minute=100, rate_limit_backend_url=backend_url)
+        with patch('utils.rate_limiting.get_logger'):
+            return RateLimitingService(config, config_path=str(tmp_path / f"{name}-limits.json"),
+                                       clock=clock.time, sleep=clock.sleep,
+                                       learned_limits_path=str(tmp_path / f"{name}-learned.json"))
+    
+    def test_hosts_share_one_bucket(self, clock, tmp_path, backend_url):
+        """Test two hosts together stay within one account's limit."""
+        first = self._make_host(clock, tmp_path, backend_url, "first")
+        second = self._make_host(clock, tmp_path, backend_url, "second")
+        
+        # notion.api_call: 100 RPM with a burst of 10, split between whoever asks
+        start = clock.time()
+        slots = [host._reserve("notion.api_call") - start for _ in range(6) for host in (first, second)]
+        
+        assert slots[:10] == [0.0] * 10
+        assert slots[10] == pytest.approx(0.6)
+        assert slots[11] == pytest.approx(1.2)
+        
+        state = first.backend.get_state("notion.api_call")
+        assert state['tokens'] == pytest.approx(-2.0)
+    
+    def test_timeout_does_not_lease(self, clock, tmp_path, backend_url):
+        """Test a lease that would start too late is refused without spending tokens."""
+        host = self._make_host(clock, tmp_path, backend_url, "host")
+        for _ in range(10):
+            host._reserve("notion.api_call")
+        
+        with pytest.raises(RateLimitTimeoutError):
+            host._reserve("notion.api_call", timeout=0.1)
+        assert host.backend.get_state("notion.api_call")['tokens'] == pytest.approx(0.0)
+    
+    def test_release_refunds_unused_tokens(self, clock, tmp_path):
+        """Test released leases return their unused tokens, up to capacity."""
+        backend = create_rate_limit_backend(f"memory://refund-{tmp_path.name}", clock=clock.time)
+        lease = backend.reserve("openai.completion", 3, capacity=5, refill_rate=1.0)
+        lease.used = 1
+        
+        backend.release(lease)
+        assert backend.get_state("openai.completion")['tokens'] == pytest.approx(4.0)
+        
+        # Releasing twice refunds nothing more
+        backend.release(lease)
+        assert backend.get_state("openai.completion")['tokens'] == pytest.approx(4.0)
+    
+    def test_throttle_pauses_every_host(self, clock, tmp_path, backend_url):
+        """Test a 429 seen by one host pauses the others until Retry-After."""
+        first = self._make_host(clock, tmp_path, backend_url, "first")
+        second = self._make_host(clock, tmp_path, backend_url, "second")
+        first.acquire("notion", "api_call")
+        
+        first.observe_response("notion", "api_call", 429, {'Retry-After': '30'})
+        
+        start = clock.time()
+        assert second.acquire("notion", "api_call") - start == pytest.approx(30.0)
+    
+    def test_sliding_window_limits_are_shared(self, clock, tmp_path, backend_url):
+        """Test sliding-window limits are shared as a bucket with the same rate."""
+        first = self._make_host(clock, tmp_path, backend_url, "first")
+        second = self._make_host(clock, tmp_path, backend_url, "second")
+        
+        # hunter.email-finder: 10 per minute with a burst of 3
+        start = clock.time()
+        slots = [host._reserve("hunter.email-finder") - start for host in (first, second, first, second)]
+        assert slots == [0.0, 0.0, 0.0, pytest.approx(6.0)]
+    
+    def test_backend_is_called_without_the_service_lock(self, clock, tmp_path, backend_url):
+        """Test shared store round-trips never hold the lock other services wait on."""
+        host = self._make_host(clock, tmp_path, backend_url, "host")
+        lock_held = []
+        for name in ('reserve', 'get_state', 'pause'):
+            original = getattr(host.backend, name)
+            
+            def checked(*args, _original=original, **kwargs):
+                lock_held.append(host._lock.locked())
+                return _original(*args, **kwargs)
+            setattr(host.backend, name, checked)
+        
+        host._reserve("notion.api_call")
+        host.acquire("notion", "api_call", priority=RequestPriority.DISCOVERY)
+        host.observe_response("notion", "api_call", 429, {'Retry-After': '30'})
+        
+        assert lock_held and not any(lock_held)
+    
+    def test_lock_release_keeps_another_holders_lock(self, tmp_path):
+        """Test an expired lock taken over by another host is not released by the first."""
+        backend = create_rate_limit_backend(f"memory://lock-{tmp_path.name}")
+        lock_name = f"{backend.prefix}lock:notion.api_call"
+        
+        def update(state):
+            # Our lock expires and another host takes it mid-update
+            backend.client.set(lock_name, "other-host")
+            return None, None
+        
+        backend._update("notion.api_call", update)
+        assert backend.client.get(lock_name) == b"other-host"
+    
+    def test_unavailable_backend_limits_locally(self, clock, tmp_path):
+        """Test limiting falls back to the local bucket when the store fails."""
+        backend = RedisRateLimitBackend(client=Mock(), clock=clock.time)
+        backend.client.set.side_effect = ConnectionError("store down")
+        
+        config = SimpleNamespace(hunter_requests_per_minute=10, scraping_delay=2.0,
+                                 resend_requests_per_minute=100)
+        with patch('utils.rate_limiting.get_logger'):
+            host = RateLimitingService(config, config_path=str(tmp_path / "limits.json"),
+                                       clock=clock.time, sleep=clock.sleep,
+                                       learned_limits_path=str(tmp_path / "learned.json"),
+                                       backend=backend)
+        
+        start = clock.time()
+        slots = [host._reserve("producthunt.scraping") - start for _ in range(2)]
+        assert slots == [0.0, pytest.approx(2.0)]
+
+
+class TestPriorityLanes:
+    """Test cases for priority lanes in the scheduler."""
+    
+    @pytest.fixture
+    def clock(self):
+        return SimulatedClock()
+    
+    def _make_limiter(self, tmp_path, **kwargs):
+        config = SimpleNamespace(hunter_requests_per_minute=10, scraping_delay=2.0,
+                                 resend_requests_per_minute=100)
+        with patch('utils.rate_limiting.get_logger'):
+            return RateLimitingService(config, config_path=str(tmp_path / "limits.json"),
+                                       learned_limits_path=str(tmp_path / "learned.json"), **kwargs)
+    
+    def test_weighted_fair_order(self):
+        """Test backlogged lanes are served in proportion to their weights."""
+        lanes = PriorityLanes(RateLimitingService.PRIORITY_WEIGHTS, threading.Lock())
+        for _ in range(4):
+            lanes.enqueue(RequestPriority.DISCOVERY, 1, 0.0)
+        for _ in range(4):
+            lanes.enqueue(RequestPriority.SENDING, 1, 0.0)
+        
+        order = []
+        with lanes.condition:
+            while lanes.waiting:
+                head = lanes.head()
+                lanes.remove(head)
+                order.append(head.priority)
+        
+        sending, discovery = RequestPriority.SENDING, RequestPriority.DISCOVERY
+        assert order[:6] == [sending, discovery, sending, sending, discovery, sending]
+    
+    def test_request_priority_context(self):
+        """Test the priority context nests and defaults to interactive."""
+        assert current_priority() == RequestPriority.INTERACTIVE
+        with request_priority(RequestPriority.DISCOVERY):
+            with request_priority(None):
+                assert current_priority() == RequestPriority.DISCOVERY
+            with request_priority(RequestPriority.SENDING):
+                assert current_priority() == RequestPriority.SENDING
+            assert current_priority() == RequestPriority.DISCOVERY
+        assert current_priority() == RequestPriority.INTERACTIVE
+    
+    def test_single_batch_caller_gets_same_slots(self, clock, tmp_path):
+        """Test a batch lane without contention is scheduled like an interactive one."""
+        limiter = self._make_limiter(tmp_path, clock=clock.time, sleep=clock.sleep)
+        start = clock.time()
+        slots = [limiter.acquire("producthunt", "scraping", priority=RequestPriority.DISCOVERY) - start
+                 for _ in range(3)]
+        assert slots == [0.0, pytest.approx(2.0), pytest.approx(4.0)]
+    
+    def test_interactive_skips_batch_backlog(self, tmp_path):
+        """Test an interactive call is served within a slot or two of a batch backlog."""
+        limiter = self._make_limiter(tmp_path)
+        limiter.add_rate_limit(RateLimitConfig(
+            service_name="notion", operation="lanes", requests_per_minute=600, burst_limit=1,
+            strategy=RateLimitStrategy.TOKEN_BUCKET
+        ))
+        
+        def batch_worker():
+            with request_priority(RequestPriority.DISCOVERY):
+                limiter.acquire("notion", "lanes")
+        
+        threads = [threading.Thread(target=batch_worker) for _ in range(12)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.15)
+        
+        start = time.time()
+        limiter.acquire("notion", "lanes")
+        interactive_wait = time.time() - start
+        
+        for thread in threads:
+            thread.join()
+        
+        # The batch backlog needs more than a second at 10 requests per second
+        assert interactive_wait < 0.35
+        assert time.time() - start > 0.7
+    
+    def test_starving_batch_call_reserves(self, clock, tmp_path):
+        """Test a batch call deferred for too long reserves despite interactive load."""
+        limiter = self._make_limiter(tmp_path, clock=clock.time, sleep=clock.sleep)
+        limiter.PRIORITY_MAX_DEFER = 5.0
+        limiter._reserve("hunter.email-finder", 10)
+        
+        with limiter._lock:
+            request = limiter._enqueue("hunter.email-finder", 1, RequestPriority.ANALYTICS)
+            pause = limiter._defer_step("hunter.email-finder", request, None)
+            assert pause == pytest.approx(5.0)
+            clock.sleep(pause)
+            assert limiter._defer_step("hunter.email-finder", request, None) is None
+        assert limiter.get_metrics("hunter")["hunter"]["limits"]["email-finder"]["queued_requests"] == 0
+    
+    def test_batch_timeout_leaves_queue(self, clock, tmp_path):
+        """Test a batch call that cannot be served in time gives up its place."""
+        limiter = self._make_limiter(tmp_path, clock=clock.time, sleep=clock.sleep)
+        limiter.acquire("producthunt", "scraping")
+        
+        with pytest.raises(RateLimitTimeoutError):
+            limiter.acquire("producthunt", "scraping", timeout=1.0, priority=RequestPriority.ANALYTICS)
+        
+        assert limiter._lanes["producthunt.scraping"].waiting == []
+        start = clock.time()
+        assert limiter.acquire("producthunt", "scraping") - start == pytest.approx(2.0)
+
+
 class TestGlobalFunctions:
     """Test cases for global convenience functions."""
     
@@ -112,6 +112,7 @@ class TestUtilities:
             'openai_delay': 0.1,  # Faster for tests
             'max_parallel_workers': 2,  # Fewer workers for tests
             'cache_directory': '/tmp/test_cache',
+            'shared_cache_url': None,
             'log_level': 'DEBUG'
         }
         
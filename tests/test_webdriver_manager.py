@@ -11,13 +11,20 @@ from queue import Queue
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    WebDriverException
+)
+from selenium.webdriver.common.by import By
 
 from utils.webdriver_manager import (
     WebDriverManager, 
     WebDriverPool, 
+    WebDriverPoolExhausted,
     WebDriverConfig,
-    get_webdriver_manager
+    BrowserTabPool,
+    get_webdriver_manager,
+    load_page
 )
 from utils.config import Config
 
@@ -170,6 +177,112 @@ class TestWebDriverPool:
         assert driver1 == driver2
         # Chrome should only be called once (for initial creation)
         assert mock_chrome.call_count == 1
+        assert pool.drivers_created == 1
+        assert pool.drivers_reused == 1
+    
+    @patch('utils.webdriver_manager.webdriver.Chrome')
+    def test_return_driver_restores_page_load_timeout(self, mock_chrome, mock_driver, webdriver_config):
+        """Test per-page timeouts do not leak to the next user of a driver."""
+        mock_chrome.return_value = mock_driver
+        pool = WebDriverPool(max_size=2, config=webdriver_config)
+        
+        driver = pool.get_driver()
+        driver.set_page_load_timeout(3)
+        pool.return_driver(driver)
+        
+        mock_driver.set_page_load_timeout.assert_called_with(15)
+    
+    @patch('utils.webdriver_manager.webdriver.Chrome')
+    def test_get_driver_blocks_at_capacity(self, mock_chrome, webdriver_config):
+        """Test callers wait for a returned driver instead of starting another."""
+        mock_chrome.side_effect = lambda *args, **kwargs: Mock(current_url="about:blank")
+        pool = WebDriverPool(max_size=1, config=webdriver_config)
+        
+        driver = pool.get_driver()
+        timer = threading.Timer(0.1, pool.return_driver, args=(driver,))
+        timer.start()
+        try:
+            assert pool.get_driver(timeout=5) is driver
+        finally:
+            timer.cancel()
+        
+        assert mock_chrome.call_count == 1
+        assert pool.get_stats()['max_wait_seconds'] >= 0.05
+    
+    @patch('utils.webdriver_manager.webdriver.Chrome')
+    def test_get_driver_times_out_at_capacity(self, mock_chrome, webdriver_config):
+        """Test acquiring from an exhausted pool fails after the timeout."""
+        mock_chrome.side_effect = lambda *args, **kwargs: Mock(current_url="about:blank")
+        pool = WebDriverPool(max_size=1, config=webdriver_config)
+        pool.get_driver()
+        
+        with pytest.raises(WebDriverPoolExhausted):
+            pool.get_driver(timeout=0.05)
+        
+        assert mock_chrome.call_count == 1
+        assert pool.get_stats()['acquire_timeouts'] == 1
+    
+    @patch('utils.webdriver_manager.webdriver.Chrome')
+    def test_driver_recycled_after_max_pages(self, mock_chrome, webdriver_config):
+        """Test a driver is replaced once it has served max_pages_per_driver pages."""
+        mock_chrome.side_effect = lambda *args, **kwargs: Mock(current_url="about:blank")
+        pool = WebDriverPool(max_size=1, config=webdriver_config, max_pages_per_driver=2)
+        
+        first = pool.get_driver()
+        pool.return_driver(first)
+        assert pool.get_driver() is first
+        pool.return_driver(first)
+        
+        first.quit.assert_called_once()
+        second = pool.get_driver()
+        assert second is not first
+        assert pool.get_stats()['recycles'] == 1
+        assert pool.get_stats()['total_drivers'] == 1
+    
+    @patch('utils.webdriver_manager.webdriver.Chrome')
+    def test_driver_recycled_over_memory_limit(self, mock_chrome, mock_driver, webdriver_config):
+        """Test a driver using more memory than max_rss_mb is quit on return."""
+        mock_chrome.return_value = mock_driver
+        pool = WebDriverPool(max_size=1, config=webdriver_config, max_rss_mb=500)
+        
+        driver = pool.get_driver()
+        with patch.object(pool, '_driver_rss_mb', return_value=800.0):
+            pool.return_driver(driver)
+        
+        mock_driver.quit.assert_called_once()
+        assert pool.pool.qsize() == 0
+        assert pool.get_stats()['recycles'] == 1
+    
+    @patch('utils.webdriver_manager.webdriver.Chrome')
+    def test_warm(self, mock_chrome, webdriver_config):
+        """Test pre-warming starts idle drivers up to the cap."""
+        mock_chrome.side_effect = lambda *args, **kwargs: Mock(current_url="about:blank")
+        pool = WebDriverPool(max_size=2, config=webdriver_config)
+        
+        assert pool.warm(3) == 2
+        assert pool.pool.qsize() == 2
+        
+        pool.get_driver()
+        assert mock_chrome.call_count == 2
+        assert pool.drivers_reused == 1
+    
+    @patch('utils.webdriver_manager.webdriver.Chrome')
+    def test_check_idle_drivers_retires_unhealthy(self, mock_chrome, webdriver_config):
+        """Test health probes replace idle drivers that have crashed."""
+        healthy = Mock(current_url="about:blank")
+        crashed = Mock()
+        type(crashed).current_url = PropertyMock(side_effect=WebDriverException("Driver crashed"))
+        mock_chrome.side_effect = [healthy, crashed]
+        pool = WebDriverPool(max_size=2, config=webdriver_config)
+        pool.warm(2)
+        
+        assert pool.check_idle_drivers() == 1
+        
+        crashed.quit.assert_called_once()
+        assert pool.pool.qsize() == 1
+        stats = pool.get_stats()
+        assert stats['health_check_failures'] == 1
+        assert stats['total_drivers'] == 1
     
     @patch('utils.webdriver_manager.webdriver.Chrome')
     def test_cleanup(self, mock_chrome, webdriver_config):
@@ -212,6 +325,29 @@ class TestWebDriverPool:
         assert "--disable-dev-shm-usage" in arguments
         assert "--window-size=1024,768" in arguments
     
+    @patch('utils.webdriver_manager.webdriver.Chrome')
+    def test_scrape_profile(self, mock_chrome, mock_driver, webdriver_config):
+        """Test drivers load eagerly and block heavy and tracking requests."""
+        mock_chrome.return_value = mock_driver
+        pool = WebDriverPool(max_size=1, config=webdriver_config)
+        
+        assert pool._create_chrome_options().page_load_strategy == "eager"
+        
+        pool.get_driver()
+        mock_driver.execute_cdp_cmd.assert_any_call("Network.enable", {})
+        blocked = mock_driver.execute_cdp_cmd.call_args_list[-1][0][1]['urls']
+        assert "*.woff2" in blocked
+        assert "*google-analytics.com*" in blocked
+    
+    @patch('utils.webdriver_manager.webdriver.Chrome')
+    def test_resource_blocking_can_be_disabled(self, mock_chrome, mock_driver):
+        """Test no CDP blocking is set up without blocked patterns."""
+        mock_chrome.return_value = mock_driver
+        pool = WebDriverPool(max_size=1, config=WebDriverConfig(blocked_url_patterns=()))
+        
+        pool.get_driver()
+        mock_driver.execute_cdp_cmd.assert_not_called()
+    
     @patch('utils.webdriver_manager.webdriver.Chrome')
     def test_create_chrome_options_with_proxy(self, mock_chrome):
         """Test Chrome options with proxy configuration."""
@@ -233,6 +369,186 @@ class TestWebDriverPool:
         assert hasattr(options, '_experimental_options')
 
 
+class TestBrowserTabPool:
+    """Test isolated tabs sharing a few Chrome processes."""
+    
+    @pytest.fixture
+    def chrome(self):
+        """Patch Chrome to hand out mock drivers with CDP target support."""
+        created = []
+        
+        def make_driver(options=None, **kwargs):
+            driver = Mock(current_url="about:blank")
+            driver.options = options
+            driver.capabilities = {'goog:chromeOptions': {'debuggerAddress': f"127.0.0.1:{9000 + len(created)}"}}
+            counter = iter(range(1000))
+            driver.execute_cdp_cmd.side_effect = lambda cmd, params: {
+                'browserContextId': f"ctx-{next(counter)}", 'targetId': f"target-{next(counter)}"
+            }
+            created.append(driver)
+            return driver
+        
+        with patch('utils.webdriver_manager.webdriver.Chrome', side_effect=make_driver):
+            yield created
+    
+    def test_tabs_share_browsers(self, chrome):
+        """Test a new browser starts only when running ones are full."""
+        pool = BrowserTabPool(max_browsers=2, tabs_per_browser=2)
+        
+        drivers = [pool.get_driver() for _ in range(3)]
+        
+        stats = pool.get_stats()
+        assert stats['browsers'] == 2
+        assert stats['tabs'] == 3
+        assert stats['busy_tabs'] == 3
+        # Two owners launched Chrome; each tab is a session attached to one of them
+        assert len(chrome) == 5
+        owners = [chrome[0], chrome[3]]
+        assert drivers[0].options.debugger_address == "127.0.0.1:9000"
+        assert drivers[1].options.debugger_address == "127.0.0.1:9000"
+        assert drivers[2].options.debugger_address == "127.0.0.1:9003"
+        assert all(owner not in drivers for owner in owners)
+        drivers[0].switch_to.window.assert_called_once()
+        drivers[0].set_page_load_timeout.assert_called_with(30.0)
+    
+    def test_get_driver_times_out_when_all_tabs_busy(self, chrome):
+        """Test acquiring beyond browsers x tabs blocks and then fails."""
+        pool = BrowserTabPool(max_browsers=1, tabs_per_browser=2)
+        pool.get_driver()
+        pool.get_driver()
+        
+        with pytest.raises(WebDriverPoolExhausted):
+            pool.get_driver(timeout=0.05)
+        assert pool.get_stats()['acquire_timeouts'] == 1
+    
+    def test_returned_tab_gets_fresh_context(self, chrome):
+        """Test a reused tab starts in a new browser context."""
+        pool = BrowserTabPool(max_browsers=1, tabs_per_browser=2)
+        
+        driver = pool.get_driver()
+        pool.return_driver(driver)
+        
+        driver.execute_cdp_cmd.assert_any_call("Target.disposeBrowserContext", {"browserContextId": "ctx-0"})
+        assert pool.get_driver() is driver
+        assert pool.get_stats()['tabs_reused'] == 1
+    
+    def test_crashed_tab_is_replaced(self, chrome):
+        """Test an unhealthy tab is closed and its slot reused."""
+        pool = BrowserTabPool(max_browsers=1, tabs_per_browser=1)
+        
+        driver = pool.get_driver()
+        type(driver).current_url = PropertyMock(side_effect=WebDriverException("tab crashed"))
+        pool.return_driver(driver)
+        
+        driver.quit.assert_called_once()
+        assert pool.get_driver() is not driver
+        assert pool.get_stats()['browsers'] == 1
+    
+    def test_returned_tab_gets_default_timeouts(self, chrome):
+        """Test per-page timeouts set by one user do not leak to the next."""
+        pool = BrowserTabPool(max_browsers=1, tabs_per_browser=1, tab_timeout=30.0)
+        
+        driver = pool.get_driver()
+        driver.set_page_load_timeout(0.6)
+        pool.return_driver(driver)
+        
+        assert pool.get_driver() is driver
+        driver.set_page_load_timeout.assert_called_with(30.0)
+        driver.set_script_timeout.assert_called_with(30.0)
+    
+    def test_browser_recycled_after_max_pages(self, chrome):
+        """Test a browser is quit once its last busy tab comes back after the page limit."""
+        pool = BrowserTabPool(max_browsers=1, tabs_per_browser=2, max_pages_per_browser=2)
+        
+        first = pool.get_driver()
+        second = pool.get_driver()
+        owner = chrome[0]
+        
+        pool.return_driver(first)
+        # The page limit is reached: no new tabs from this browser, busy ones finish first
+        assert pool.get_stats()['browsers'] == 0
+        owner.quit.assert_not_called()
+        
+        pool.return_driver(second)
+        owner.quit.assert_called_once()
+        first.quit.assert_called_once()
+        second.quit.assert_called_once()
+        
+        assert pool.get_driver() not in (first, second)
+        stats = pool.get_stats()
+        assert stats['recycles'] == 1
+        assert stats['browsers_started'] == 2
+    
+    def test_health_check_retires_crashed_browser(self, chrome):
+        """Test probing idle browsers retires crashed ones and their tabs."""
+        pool = BrowserTabPool(max_browsers=1, tabs_per_browser=2)
+        driver = pool.get_driver()
+        pool.return_driver(driver)
+        type(chrome[0]).current_url = PropertyMock(side_effect=WebDriverException("browser crashed"))
+        
+        assert pool.check_idle_drivers() == 1
+        
+        driver.quit.assert_called_once()
+        stats = pool.get_stats()
+        assert stats['browsers'] == 0
+        assert stats['health_check_failures'] == 1
+    
+    def test_warm_opens_idle_tabs(self, chrome):
+        pool = BrowserTabPool(max_browsers=2, tabs_per_browser=2)
+        
+        assert pool.warm(3) == 3
+        
+        stats = pool.get_stats()
+        assert stats['browsers'] == 2
+        assert stats['tabs'] == 3
+        assert stats['busy_tabs'] == 0
+        pool.get_driver()
+        assert pool.get_stats()['tabs_reused'] == 1
+    
+    def test_manager_uses_tabs_when_enabled(self, chrome, mock_config):
+        """Test WebDriverManager.get_driver hands out tabs in tab mode."""
+        WebDriverManager._instance = None
+        mock_config.webdriver_tabs_per_browser = 4
+        
+        manager = WebDriverManager(mock_config)
+        try:
+            with manager.get_driver("test") as driver:
+                assert manager.get_pool_stats()['tabs']['busy_tabs'] == 1
+            assert driver.options.debugger_address == "127.0.0.1:9000"
+            assert manager.get_pool_stats()['tabs']['max_tabs'] == 12
+            # The process pool is not used in tab mode
+            assert manager.driver_pool.get_stats()['total_drivers'] == 0
+            assert manager.tab_pool._health_thread is not None
+        finally:
+            manager.cleanup()
+            WebDriverManager._instance = None
+
+
+class TestLoadPage:
+    """Test page loads that wait on specific elements."""
+    
+    def test_load_page_reports_time_and_bytes(self):
+        driver = Mock()
+        driver.execute_script.return_value = 250 * 1024
+        load = load_page(driver, "https://example.com", wait_for=[(By.CSS_SELECTOR, "h1")], timeout=1)
+        
+        driver.get.assert_called_once_with("https://example.com")
+        driver.find_element.assert_called_with(By.CSS_SELECTOR, "h1")
+        assert load.ready
+        assert load.transferred_bytes == 250 * 1024
+        assert load.seconds >= 0
+    
+    def test_load_page_not_ready_when_elements_missing(self):
+        driver = Mock()
+        driver.find_element.side_effect = NoSuchElementException("missing")
+        driver.execute_script.return_value = None
+        
+        load = load_page(driver, "https://example.com", wait_for=[(By.CSS_SELECTOR, "h1")], timeout=0.1)
+        
+        assert not load.ready
+        assert load.transferred_bytes is None
+
+
 class TestWebDriverManager:
     """Test WebDriverManager class."""
     
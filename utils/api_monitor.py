@@ -4,6 +4,7 @@ API monitoring system for tracking rate limits, quotas, and service health.
 
 import json
 from typing import (
+    Callable,
     Dict,
     List,
     Optional,
@@ -101,6 +102,9 @@ class APIMonitor:
         self.max_calls_to_store = 1000  # Keep last 1000 calls
         self.health_check_window = timedelta(hours=1)  # 1 hour window for health checks
         
+        # Callbacks notified of every recorded call, e.g. adaptive rate limiters
+        self._observers: List[Callable[[str, str, int, Optional[Dict[str, str]]], None]] = []
+        
         # Load existing data
         self._load_monitoring_data()
     
@@ -148,6 +152,13 @@ class APIMonitor:
         # Update service health
         self._update_service_health(service)
         
+        # Notify observers
+        for observer in list(self._observers):
+            try:
+                observer(service, endpoint, status_code, rate_limit_headers)
+            except Exception as e:
+                self.logger.debug(f"API call observer failed for {service}: {e}")
+        
         # Check for rate limit issues
         if status_code == 429:
             self.logger.warning(f"Rate limit hit for {service} on {endpoint}")
@@ -166,6 +177,21 @@ class APIMonitor:
         if len(self.api_calls) % 10 == 0:  # Save every 10 calls
             self._save_monitoring_data()
     
+    def add_observer(self, observer: Callable[[str, str, int, Optional[Dict[str, str]]], None]) -> None:
+        """
+        Register a callback for recorded API calls.
+        
+        Args:
+            observer: Called with (service, endpoint, status_code, rate_limit_headers)
+        """
+        if observer not in self._observers:
+            self._observers.append(observer)
+    
+    def remove_observer(self, observer: Callable[[str, str, int, Optional[Dict[str, str]]], None]) -> None:
+        """Unregister a callback added with add_observer()."""
+        if observer in self._observers:
+            self._observers.remove(observer)
+    
     def update_quota_usage(self, 
                           service: str,
                           quota_type: str,
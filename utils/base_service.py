@@ -24,6 +24,11 @@ from dataclasses import dataclass
 
 from utils.config import Config
 from utils.logging_config import get_logger
+from utils.rate_limiting import get_rate_limiter
+from utils.circuit_breaker import (
+    CircuitBreaker,
+    get_circuit_breaker
+)
 from utils.error_handling import (
     ErrorHandler,
     ErrorCategory,
@@ -40,6 +45,7 @@ class ServiceConfig:
     """Configuration for service-specific settings."""
     name: str
     rate_limit_delay: float = 1.0
+    rate_limit_service: Optional[str] = None  # Upstream API the limit is shared under (defaults to name)
     max_retries: int = 3
     timeout: int = 30
     enable_caching: bool = False
@@ -95,20 +101,24 @@ class BaseService(ABC):
         """
         Apply rate limiting for the specified operation.
         
+        Waits on the central rate limiter, where the operation is registered
+        with one request per rate_limit_delay unless the upstream already has
+        a limit, so instances sharing an upstream share one limit.
+        
         Args:
             operation: Operation name for rate limiting
         """
-        current_time = time.time()
-        last_time = self._last_operation_time.get(operation, 0)
-        
-        time_since_last = current_time - last_time
-        if time_since_last < self.service_config.rate_limit_delay:
-            sleep_time = self.service_config.rate_limit_delay - time_since_last
-            self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
+        service_name = self.service_config.rate_limit_service or self.service_config.name
+        rate_limiter = get_rate_limiter(self.config)
+        rate_limiter.register(service_name, operation, min_interval=self.service_config.rate_limit_delay)
+        rate_limiter.acquire(service_name, operation)
         
         self._last_operation_time[operation] = time.time()
     
+    def _circuit_breaker(self) -> CircuitBreaker:
+        """Get the circuit breaker for this service's upstream API."""
+        return get_circuit_breaker(self.service_config.rate_limit_service or self.service_config.name)
+    
     def _track_operation(self, operation: str, duration: float) -> None:
         """
         Track operation performance metrics.
@@ -138,6 +148,9 @@ class BaseService(ABC):
         """
         Make an API call with standardized error handling and rate limiting.
         
+        Calls go through the upstream's circuit breaker, so a service whose
+        upstream keeps failing fails fast instead of retrying.
+        
         Args:
             func: Function to call
             *args: Function arguments
@@ -150,16 +163,25 @@ class BaseService(ABC):
             Function result
             
         Raises:
+            CircuitOpenError: If the upstream's circuit is open
             Exception: If all retry attempts fail
         """
+        breaker = self._circuit_breaker()
+        # Fail before waiting on the rate limiter if the upstream is down
+        breaker.raise_if_open()
+        
         if apply_rate_limit:
             self._apply_rate_limit(operation)
         
+        @wraps(func)
+        def guarded(*call_args, **call_kwargs):
+            return breaker.call(func, *call_args, **call_kwargs)
+        
         start_time = time.time()
         
         try:
             result = self.error_handler.retry_with_backoff(
-                func,
+                guarded,
                 *args,
                 category=category,
                 context={
@@ -0,0 +1,416 @@
+"""
+Compact binary serialization for cache entries.
+
+This module provides a pluggable codec layer used by the persistent caches.
+Every encoded payload starts with a small header so that files written with
+one serializer/compressor combination can always be decoded later, even if
+the preferred codec changes or an optional dependency is missing:
+    
+    magic (3 bytes) | format version (1) | serializer id (1) | compressor id (1) | payload
+
+Serializers: msgpack and orjson (optional, fastest), stdlib JSON (always
+available) and pickle.
+
+Unpickling runs code chosen by whoever wrote the payload, so pickle is off
+by default: a codec refuses to encode values the other formats cannot
+represent without loss (e.g. tuples, datetimes or custom objects) and to
+decode pickled payloads. Trusted local caches that need such values opt in
+with allow_pickle=True; every value pickled is logged and counted.
+Compressors: zstd (optional), zlib (stdlib) or none.
+"""
+
+import json
+import pickle
+import zlib
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Union
+)
+
+from utils.logging_config import get_logger
+
+# Optional fast serializers and compressors
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstandard = None
+
+
+CODEC_MAGIC = b"PCC"
+CODEC_FORMAT_VERSION = 1
+HEADER_SIZE = len(CODEC_MAGIC) + 3
+
+
+class CacheCodecError(Exception):
+    """Raised when a cache payload cannot be encoded or decoded."""
+    pass
+
+
+class CacheSerializer:
+    """Base class for cache value serializers."""
+    
+    codec_id: int = -1
+    name: str = ""
+    # Lossless serializers raise on values they cannot round-trip exactly;
+    # the others need values checked with is_plain_data() first
+    lossless: bool = False
+    
+    def dumps(self, value: Any) -> bytes:
+        raise NotImplementedError
+    
+    def loads(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+
+class PickleSerializer(CacheSerializer):
+    """Pickle serializer, used as a lossless fallback for arbitrary objects."""
+    
+    codec_id = 0
+    name = "pickle"
+    lossless = True
+    
+    def dumps(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    def loads(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+class JsonSerializer(CacheSerializer):
+    """Compact stdlib JSON serializer."""
+    
+    codec_id = 1
+    name = "json"
+    
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data.decode('utf-8'))
+
+
+class OrjsonSerializer(CacheSerializer):
+    """orjson serializer."""
+    
+    codec_id = 2
+    name = "orjson"
+    
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+    
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackSerializer(CacheSerializer):
+    """MessagePack serializer (strict types, so tuples and subclasses raise)."""
+    
+    codec_id = 3
+    name = "msgpack"
+    lossless = True
+    
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True, strict_types=True)
+    
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+class CacheCompressor:
+    """Base class for payload compressors."""
+    
+    codec_id: int = -1
+    name: str = ""
+    
+    def compress(self, data: bytes) -> bytes:
+        raise NotImplementedError
+    
+    def decompress(self, data: bytes) -> bytes:
+        raise NotImplementedError
+
+
+class NoCompressor(CacheCompressor):
+    """Pass-through compressor."""
+    
+    codec_id = 0
+    name = "none"
+    
+    def compress(self, data: bytes) -> bytes:
+        return data
+    
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+
+class ZlibCompressor(CacheCompressor):
+    """zlib compressor from the standard library."""
+    
+    codec_id = 1
+    name = "zlib"
+    
+    def __init__(self, level: int = 6):
+        self.level = level
+    
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+    
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class ZstdCompressor(CacheCompressor):
+    """Zstandard compressor."""
+    
+    codec_id = 2
+    name = "zstd"
+    
+    def __init__(self, level: int = 3):
+        self.level = level
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+    
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+    
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+
+def _available_serializers() -> Dict[str, CacheSerializer]:
+    serializers: Dict[str, CacheSerializer] = {
+        'pickle': PickleSerializer(),
+        'json': JsonSerializer()
+    }
+    if ORJSON_AVAILABLE:
+        serializers['orjson'] = OrjsonSerializer()
+    if MSGPACK_AVAILABLE:
+        serializers['msgpack'] = MsgpackSerializer()
+    return serializers
+
+
+def _available_compressors() -> Dict[str, CacheCompressor]:
+    compressors: Dict[str, CacheCompressor] = {
+        'none': NoCompressor(),
+        'zlib': ZlibCompressor()
+    }
+    if ZSTD_AVAILABLE:
+        compressors['zstd'] = ZstdCompressor()
+    return compressors
+
+
+def is_plain_data(value: Any, _depth: int = 0) -> bool:
+    """
+    Check whether a value round-trips losslessly through JSON-like formats.
+    
+    Tuples, sets, non-string dict keys and custom objects return False so the
+    codec can fall back to pickle instead of silently changing their type.
+    """
+    if _depth > 64:
+        return False
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return True
+    if type(value) is list:
+        return all(is_plain_data(item, _depth + 1) for item in value)
+    if type(value) is dict:
+        return all(
+            isinstance(k, str) and is_plain_data(v, _depth + 1)
+            for k, v in value.items()
+        )
+    return False
+
+
+class CacheCodec:
+    """
+    Versioned encoder/decoder for cache payloads.
+    
+    Encoding uses the preferred serializer and compressor; decoding reads
+    the header and dispatches to whichever codec wrote the payload.
+    """
+    
+    def __init__(self, serializer: str = "auto", compression: Optional[str] = "auto",
+                 compress_threshold: int = 1024, allow_pickle: bool = False):
+        """
+        Initialize codec.
+        
+        Args:
+            serializer: Serializer name ('auto', 'msgpack', 'orjson', 'json', 'pickle')
+            compression: Compressor name ('auto', 'zstd', 'zlib', 'none' or None)
+            compress_threshold: Only compress payloads of at least this many bytes
+            allow_pickle: Pickle values the other formats cannot represent, and
+                unpickle such payloads (disable for data written by others)
+        """
+        self.logger = get_logger(__name__)
+        self._serializers = _available_serializers()
+        self._compressors = _available_compressors()
+        self._serializers_by_id = {s.codec_id: s for s in self._serializers.values()}
+        self._compressors_by_id = {c.codec_id: c for c in self._compressors.values()}
+        self.compress_threshold = compress_threshold
+        self.allow_pickle = allow_pickle
+        # Values encoded with the pickle fallback
+        self.pickle_fallbacks = 0
+        
+        if not allow_pickle:
+            del self._serializers['pickle']
+            if serializer == 'pickle':
+                serializer = 'auto'
+        
+        if serializer == "auto":
+            serializer = next(
+                name for name in ('msgpack', 'orjson', 'json') if name in self._serializers
+            )
+        if serializer not in self._serializers:
+            self.logger.warning(f"Cache serializer '{serializer}' not available, using json")
+            serializer = 'json'
+        self.serializer = self._serializers[serializer]
+        
+        if compression == "auto":
+            compression = 'zstd' if 'zstd' in self._compressors else 'zlib'
+        compression = compression or 'none'
+        if compression not in self._compressors:
+            self.logger.warning(f"Cache compression '{compression}' not available, using zlib")
+            compression = 'zlib'
+        self.compressor = self._compressors[compression]
+        self._no_compression = self._compressors['none']
+    
+    def without_pickle(self) -> "CacheCodec":
+        """
+        Get a codec writing the same format that never pickles or unpickles.
+        
+        Returns:
+            This codec if pickle is already disabled, otherwise a new codec
+        """
+        if not self.allow_pickle:
+            return self
+        return CacheCodec(
+            serializer=self.serializer.name,
+            compression=self.compressor.name,
+            compress_threshold=self.compress_threshold,
+            allow_pickle=False
+        )
+    
+    def _pickle_fallback(self, value: Any, reason: str) -> CacheSerializer:
+        """Get the pickle serializer for a value the preferred format cannot store."""
+        if not self.allow_pickle:
+            raise CacheCodecError(f"Cache value needs pickle, which this codec does not allow: {reason}")
+        self.pickle_fallbacks += 1
+        self.logger.debug(f"Pickling cache value ({reason})")
+        return self._serializers['pickle']
+    
+    @property
+    def name(self) -> str:
+        """Human readable codec name, e.g. 'msgpack+zstd'."""
+        return f"{self.serializer.name}+{self.compressor.name}"
+    
+    def encode(self, value: Any) -> bytes:
+        """
+        Encode a value with a version header.
+        
+        Args:
+            value: Value to encode
+        
+        Returns:
+            Encoded bytes
+        
+        Raises:
+            CacheCodecError: If the value cannot be serialized
+        """
+        serializer = self.serializer
+        if not serializer.lossless and not is_plain_data(value):
+            serializer = self._pickle_fallback(value, f"{type(value).__name__} is not plain data")
+        
+        try:
+            payload = serializer.dumps(value)
+        except Exception as e:
+            if serializer.codec_id == PickleSerializer.codec_id:
+                raise CacheCodecError(f"Failed to serialize cache value with {serializer.name}: {e}")
+            # e.g. tuples or integers outside the msgpack range
+            serializer = self._pickle_fallback(value, str(e))
+            try:
+                payload = serializer.dumps(value)
+            except Exception as e:
+                raise CacheCodecError(f"Failed to serialize cache value: {e}")
+        
+        compressor = self.compressor
+        if len(payload) < self.compress_threshold:
+            compressor = self._no_compression
+        
+        header = CODEC_MAGIC + bytes((CODEC_FORMAT_VERSION, serializer.codec_id, compressor.codec_id))
+        return header + compressor.compress(payload)
+    
+    def decode(self, data: bytes) -> Any:
+        """
+        Decode bytes produced by encode().
+        
+        Args:
+            data: Encoded bytes
+        
+        Returns:
+            Decoded value
+        
+        Raises:
+            CacheCodecError: If the header is missing/unknown or the payload is corrupt
+        """
+        if not self.is_encoded(data):
+            raise CacheCodecError("Missing cache codec header")
+        
+        version, serializer_id, compressor_id = data[len(CODEC_MAGIC):HEADER_SIZE]
+        if version != CODEC_FORMAT_VERSION:
+            raise CacheCodecError(f"Unsupported cache format version {version}")
+        
+        if serializer_id == PickleSerializer.codec_id and not self.allow_pickle:
+            raise CacheCodecError("Refusing to unpickle cache payload")
+        
+        serializer = self._serializers_by_id.get(serializer_id)
+        compressor = self._compressors_by_id.get(compressor_id)
+        if serializer is None or compressor is None:
+            raise CacheCodecError(
+                f"Cache payload uses unavailable codec (serializer={serializer_id}, "
+                f"compressor={compressor_id})"
+            )
+        
+        try:
+            return serializer.loads(compressor.decompress(data[HEADER_SIZE:]))
+        except Exception as e:
+            raise CacheCodecError(f"Corrupt cache payload: {e}")
+    
+    @staticmethod
+    def is_encoded(data: Union[bytes, bytearray]) -> bool:
+        """Check whether data starts with the codec header."""
+        return len(data) >= HEADER_SIZE and data[:len(CODEC_MAGIC)] == CODEC_MAGIC
+
+
+# Default codecs shared by the cache implementations, with and without pickle
+_default_codecs: Dict[bool, CacheCodec] = {}
+
+
+def get_default_codec(allow_pickle: bool = False) -> CacheCodec:
+    """
+    Get a default cache codec instance.
+    
+    Args:
+        allow_pickle: Get the codec that pickles values other formats cannot store
+    
+    Returns:
+        Shared CacheCodec
+    """
+    if allow_pickle not in _default_codecs:
+        _default_codecs[allow_pickle] = CacheCodec(allow_pickle=allow_pickle)
+    return _default_codecs[allow_pickle]
@@ -0,0 +1,466 @@
+"""
+Per-upstream circuit breakers for outbound calls.
+
+A breaker counts consecutive failures against one upstream (an API service
+such as Hunter.io or OpenAI, or a website host). Once the count reaches the
+threshold the circuit opens and calls fail immediately with
+CircuitOpenError instead of waiting on timeouts and retries. After the
+recovery timeout one probe request is let through (half-open): success
+closes the circuit, failure opens it again.
+
+Only upstream failures count: connection errors, timeouts and 5xx
+responses. Client errors and rate limit responses mean the upstream is up.
+
+Breakers are wired into:
+
+- requests sessions, via install_circuit_breaker() (mounts an adapter)
+- BaseService._make_api_call() and ErrorHandler.retry_with_backoff(),
+  which do not retry an open circuit
+- AIProviderManager.make_completion(), per AI provider
+"""
+
+import re
+import threading
+import time
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    TypeVar
+)
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.logging_config import get_logger
+from utils.upstreams import resolve_host
+
+T = TypeVar('T')
+
+# Error messages that point at the upstream rather than the request
+UPSTREAM_ERROR_PATTERN = re.compile(
+    r"connection|timed out|timeout|unavailable|overloaded|internal server error|bad gateway|\b50[0-9]\b",
+    re.IGNORECASE
+)
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of calling an upstream whose circuit is open."""
+    
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"Circuit open for {name}; retry in {retry_in:.1f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Circuit breaker for one upstream."""
+    
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize circuit breaker.
+        
+        Args:
+            name: Upstream name
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open before a probe
+            clock: Time source in seconds
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.clock = clock
+        self.logger = get_logger(__name__)
+        
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._consecutive_failures = 0
+        
+        self.failures = 0
+        self.successes = 0
+        self.rejected = 0
+        self.opened_count = 0
+    
+    @property
+    def state(self) -> CircuitState:
+        """Get the current state, moving from open to half-open when due."""
+        with self._lock:
+            return self._current_state()
+    
+    def _current_state(self) -> CircuitState:
+        if (self._state == CircuitState.OPEN
+                and self.clock() - self._opened_at >= self.recovery_timeout):
+            self._state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+            self.logger.info(f"Circuit for {self.name} half-open, probing")
+        return self._state
+    
+    def _retry_in(self) -> float:
+        return max(0.0, self._opened_at + self.recovery_timeout - self.clock())
+    
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may go out, claiming the probe when half-open.
+        
+        Returns:
+            True if the call may proceed
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+    
+    def check(self) -> None:
+        """
+        Claim permission for a call.
+        
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if not self.allow_request():
+            with self._lock:
+                retry_in = self._retry_in()
+            raise CircuitOpenError(self.name, retry_in)
+    
+    def raise_if_open(self) -> None:
+        """
+        Fail fast while the circuit is open, without claiming the half-open probe.
+        
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            if self._current_state() != CircuitState.OPEN:
+                return
+            self.rejected += 1
+            retry_in = self._retry_in()
+        raise CircuitOpenError(self.name, retry_in)
+    
+    def record_success(self) -> None:
+        """Record a call that reached a healthy upstream."""
+        with self._lock:
+            self.successes += 1
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+            if self._state != CircuitState.CLOSED:
+                self._state = CircuitState.CLOSED
+                self.logger.info(f"Circuit for {self.name} closed")
+    
+    def record_failure(self) -> None:
+        """Record an upstream failure, opening the circuit if needed."""
+        with self._lock:
+            self.failures += 1
+            self._consecutive_failures += 1
+            self._probe_in_flight = False
+            state = self._current_state()
+            if state == CircuitState.HALF_OPEN or (
+                    state == CircuitState.CLOSED
+                    and self._consecutive_failures >= self.failure_threshold):
+                self._state = CircuitState.OPEN
+                self._opened_at = self.clock()
+                self.opened_count += 1
+                self.logger.warning(
+                    f"Circuit for {self.name} opened after {self._consecutive_failures} "
+                    f"consecutive failures; retry in {self.recovery_timeout:.0f}s"
+                )
+    
+    def call(self, func: Callable[..., T], *args,
+             is_failure: Optional[Callable[[Exception], bool]] = None, **kwargs) -> T:
+        """
+        Call a function through the breaker.
+        
+        Args:
+            func: Function to call
+            *args: Function arguments
+            is_failure: Decides whether an exception counts against the upstream
+                (defaults to is_upstream_failure)
+            **kwargs: Function keyword arguments
+        
+        Returns:
+            Function result
+        
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        self.check()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if (is_failure or is_upstream_failure)(e):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        self.record_success()
+        return result
+    
+    def reset(self) -> None:
+        """Close the circuit and clear the failure count."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get breaker state and counters.
+        
+        Returns:
+            Dictionary with breaker metrics
+        """
+        with self._lock:
+            state = self._current_state()
+            return {
+                'state': state.value,
+                'consecutive_failures': self._consecutive_failures,
+                'failures': self.failures,
+                'successes': self.successes,
+                'rejected': self.rejected,
+                'opened_count': self.opened_count,
+                'retry_in': self._retry_in() if state == CircuitState.OPEN else 0.0
+            }
+
+
+class CircuitBreakerRegistry:
+    """Circuit breakers by upstream name."""
+    
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize registry.
+        
+        Args:
+            failure_threshold: Default failure threshold for new breakers
+            recovery_timeout: Default recovery timeout for new breakers
+            clock: Time source in seconds
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, name: str, **overrides) -> CircuitBreaker:
+        """
+        Get the breaker for an upstream, creating it if needed.
+        
+        Args:
+            name: Upstream name
+            **overrides: failure_threshold/recovery_timeout for a new breaker
+        
+        Returns:
+            Circuit breaker
+        """
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    name,
+                    failure_threshold=overrides.get('failure_threshold', self.failure_threshold),
+                    recovery_timeout=overrides.get('recovery_timeout', self.recovery_timeout),
+                    clock=self.clock
+                )
+                self._breakers[name] = breaker
+            return breaker
+    
+    def reset(self) -> None:
+        """Close every circuit."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.reset()
+    
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get metrics for every breaker."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.get_metrics() for name, breaker in breakers.items()}
+
+
+# Global registry instance
+_registry: Optional[CircuitBreakerRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breaker_registry() -> CircuitBreakerRegistry:
+    """Get the global circuit breaker registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = CircuitBreakerRegistry()
+    return _registry
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """
+    Get the global circuit breaker for an upstream.
+    
+    Args:
+        name: Upstream name (see upstream_name())
+    
+    Returns:
+        Circuit breaker
+    """
+    return get_circuit_breaker_registry().get(name)
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """
+    Check whether an error means the upstream is unhealthy.
+    
+    Args:
+        error: Exception raised by a call
+    
+    Returns:
+        True for connection errors, timeouts and 5xx responses
+    """
+    if isinstance(error, CircuitOpenError):
+        return False
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                          ConnectionError, TimeoutError)):
+        return True
+    
+    response = getattr(error, 'response', None)
+    status = getattr(response, 'status_code', None) or getattr(error, 'status_code', None)
+    if isinstance(status, int):
+        return 500 <= status < 600
+    
+    # SDK errors (openai, anthropic, selenium) without a shared base class
+    name = type(error).__name__
+    if name in ("APIConnectionError", "APITimeoutError", "InternalServerError", "TimeoutException"):
+        return True
+    return False
+
+
+def is_upstream_error_message(message: Optional[str]) -> bool:
+    """
+    Check whether an error message describes an upstream failure.
+    
+    Used for providers that report errors in a response instead of raising.
+    
+    Args:
+        message: Error message
+    
+    Returns:
+        True if the message mentions a connection, timeout or server error
+    """
+    return bool(message) and UPSTREAM_ERROR_PATTERN.search(message) is not None
+
+
+def upstream_name(url: Optional[str]) -> str:
+    """
+    Get the breaker name for a request URL.
+    
+    Known API hosts share their service's breaker; other sites get one per host.
+    
+    Args:
+        url: Request URL
+    
+    Returns:
+        Upstream name
+    """
+    service, operation = resolve_host(url)
+    return operation if service == "web" else service
+
+
+def call_with_circuit_breaker(url: Optional[str], func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Call a function that fetches a URL through the URL's upstream breaker.
+    
+    Meant for fetches outside requests sessions, such as WebDriver page loads.
+    
+    Args:
+        url: URL being fetched
+        func: Function to call
+        *args: Function arguments
+        **kwargs: Function keyword arguments
+    
+    Returns:
+        Function result
+    
+    Raises:
+        CircuitOpenError: If the upstream's circuit is open
+    """
+    return get_circuit_breaker(upstream_name(url)).call(func, *args, **kwargs)
+
+
+class CircuitBreakerAdapter(HTTPAdapter):
+    """
+    HTTP adapter that sends requests through per-upstream circuit breakers.
+    
+    Mounted on a session, it fails requests to an open upstream immediately
+    and records every response or connection error against the upstream.
+    """
+    
+    def __init__(self, name: Optional[str] = None,
+                 registry: Optional[CircuitBreakerRegistry] = None, **kwargs):
+        """
+        Initialize adapter.
+        
+        Args:
+            name: Breaker name for every request (defaults to one per upstream host)
+            registry: Breaker registry (defaults to the global registry)
+            **kwargs: HTTPAdapter arguments
+        """
+        self.breaker_name = name
+        self.registry = registry
+        super().__init__(**kwargs)
+    
+    def _breaker(self, url: str) -> CircuitBreaker:
+        registry = self.registry or get_circuit_breaker_registry()
+        return registry.get(self.breaker_name or upstream_name(url))
+    
+    def send(self, request, **kwargs):
+        breaker = self._breaker(request.url)
+        breaker.check()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception as e:
+            if is_upstream_failure(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        
+        if 500 <= response.status_code < 600:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+
+def install_circuit_breaker(session: requests.Session, name: Optional[str] = None,
+                            **adapter_kwargs) -> requests.Session:
+    """
+    Mount circuit breaker adapters on a session.
+    
+    Args:
+        session: Session to protect
+        name: Breaker name for every request (defaults to one per upstream host)
+        **adapter_kwargs: HTTPAdapter arguments, e.g. pool sizes or max_retries
+    
+    Returns:
+        The session
+    """
+    adapter = CircuitBreakerAdapter(name, **adapter_kwargs)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -241,6 +241,32 @@ class Config:
     notion_user_id: Optional[str] = None  # User's Notion ID for @mentions
     user_email: Optional[str] = None  # User email for notifications
     
+    # Shared Cache Configuration (sqlite:// path, redis:// or memory:// URL)
+    shared_cache_url: Optional[str] = None
+    
+    # Shared Rate Limit State (sqlite:// path, redis:// or memory:// URL; None keeps limits per process)
+    rate_limit_backend_url: Optional[str] = None
+    
+    # Quota Budgeting Configuration (None means no budget)
+    ai_daily_token_budget: Optional[int] = None
+    ai_fallback_model: Optional[str] = None  # Cheaper model used when the token budget runs short
+    notion_daily_request_budget: Optional[int] = None
+    
+    # Tail Latency Control
+    company_deadline_seconds: Optional[float] = None  # Time budget per company (None means no deadline)
+    enable_hedged_requests: bool = False  # Re-send slow idempotent reads after their p95 latency
+    
+    # ProductHunt GraphQL API developer token (lists past the first ~15 homepage posts without a browser)
+    producthunt_api_token: Optional[str] = None
+    
+    # Background ProductHunt crawler feeding the discovery queue
+    enable_producthunt_crawler: bool = False
+    producthunt_crawl_interval: int = 3600  # Seconds between crawls
+    
+    # Shared HTTP connection pools
+    http_pool_maxsize: int = 12  # Connections kept per host (parallel workers plus hedged requests)
+    http_dns_cache_ttl: int = 300  # Seconds DNS lookups are reused (0 disables the cache)
+    
     @classmethod
     def from_env(cls) -> "Config":
         """Create configuration from environment variables."""
@@ -336,6 +362,24 @@ class Config:
             # User Notification Configuration
             notion_user_id=os.getenv("NOTION_USER_ID"),
             user_email=os.getenv("USER_EMAIL"),
+            # Shared Cache Configuration
+            shared_cache_url=os.getenv("SHARED_CACHE_URL"),
+            # Shared Rate Limit State
+            rate_limit_backend_url=os.getenv("RATE_LIMIT_BACKEND_URL"),
+            # Quota Budgeting Configuration
+            ai_daily_token_budget=int(os.getenv("AI_DAILY_TOKEN_BUDGET")) if os.getenv("AI_DAILY_TOKEN_BUDGET") else None,
+            ai_fallback_model=os.getenv("AI_FALLBACK_MODEL"),
+            notion_daily_request_budget=int(os.getenv("NOTION_DAILY_REQUEST_BUDGET")) if os.getenv("NOTION_DAILY_REQUEST_BUDGET") else None,
+            # Tail Latency Control
+            company_deadline_seconds=float(os.getenv("COMPANY_DEADLINE_SECONDS")) if os.getenv("COMPANY_DEADLINE_SECONDS") else None,
+            enable_hedged_requests=os.getenv("ENABLE_HEDGED_REQUESTS", "false").lower() in ("true", "1", "yes"),
+            # ProductHunt GraphQL API
+            producthunt_api_token=os.getenv("PRODUCTHUNT_API_TOKEN"),
+            enable_producthunt_crawler=os.getenv("ENABLE_PRODUCTHUNT_CRAWLER", "false").lower() in ("true", "1", "yes"),
+            producthunt_crawl_interval=int(os.getenv("PRODUCTHUNT_CRAWL_INTERVAL", "3600")),
+            # Shared HTTP connection pools
+            http_pool_maxsize=int(os.getenv("HTTP_POOL_MAXSIZE", "12")),
+            http_dns_cache_ttl=int(os.getenv("HTTP_DNS_CACHE_TTL", "300")),
         )
     
     @classmethod
@@ -0,0 +1,356 @@
+"""
+Deadline propagation and hedged requests for tail latency control.
+
+A deadline is a time budget for a unit of work, such as processing one
+company. It is set for the current thread with deadline_scope(), and the
+services it calls derive each request's timeout from the time remaining
+with call_timeout(), so one slow call cannot use more than the budget.
+
+Hedged requests send a second copy of an idempotent read when the first
+has not answered within the p95 latency seen for that kind of request, and
+use whichever answers first.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    wait
+)
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    Optional,
+    TypeVar
+)
+
+from utils.logging_config import get_logger
+
+T = TypeVar('T')
+
+# Latency samples needed per key before requests are hedged
+HEDGE_MIN_SAMPLES = 20
+HEDGE_PERCENTILE = 0.95
+# Timeouts shorter than this are not worth starting a request for
+MIN_CALL_TIMEOUT = 0.5
+
+logger = get_logger(__name__)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when the current deadline has no time left for a call."""
+
+
+class Deadline:
+    """Point in time by which a unit of work should finish."""
+    
+    def __init__(self, seconds: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize deadline.
+        
+        Args:
+            seconds: Time budget from now
+            clock: Time source in seconds
+        """
+        self.clock = clock
+        self.budget = seconds
+        self.expires_at = clock() + seconds
+    
+    def remaining(self) -> float:
+        """Get the seconds left, never negative."""
+        return max(0.0, self.expires_at - self.clock())
+    
+    @property
+    def expired(self) -> bool:
+        """Check whether the deadline has passed."""
+        return self.remaining() <= 0
+
+
+_deadline_context = threading.local()
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Get the deadline of the work running in this thread, if any."""
+    return getattr(_deadline_context, 'deadline', None)
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float],
+                   clock: Callable[[], float] = time.monotonic) -> Iterator[Optional[Deadline]]:
+    """
+    Run the calls made by this thread under a deadline.
+    
+    A nested scope cannot extend an enclosing deadline.
+    
+    Args:
+        seconds: Time budget, or None to keep the current deadline
+        clock: Time source in seconds
+    
+    Yields:
+        The deadline in effect
+    """
+    previous = current_deadline()
+    deadline = previous
+    if seconds is not None:
+        deadline = Deadline(seconds, clock)
+        if previous is not None and previous.expires_at < deadline.expires_at:
+            deadline = previous
+    _deadline_context.deadline = deadline
+    try:
+        yield deadline
+    finally:
+        _deadline_context.deadline = previous
+
+
+def remaining_time() -> Optional[float]:
+    """Get the seconds left on the current deadline, or None without one."""
+    deadline = current_deadline()
+    return deadline.remaining() if deadline else None
+
+
+def call_timeout(default: float) -> float:
+    """
+    Get the timeout for a call made under the current deadline.
+    
+    Args:
+        default: Timeout to use without a deadline, and the upper bound with one
+    
+    Returns:
+        Timeout in seconds
+    
+    Raises:
+        DeadlineExceeded: If too little time is left to make the call
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return default
+    if remaining < MIN_CALL_TIMEOUT:
+        raise DeadlineExceeded(f"Deadline exceeded ({remaining:.2f}s left)")
+    return min(default, remaining)
+
+
+def with_current_deadline(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Wrap a function to run under the calling thread's deadline.
+    
+    Used when handing work to a thread pool.
+    
+    Args:
+        func: Function to wrap
+    
+    Returns:
+        Wrapped function
+    """
+    deadline = current_deadline()
+    
+    def run(*args, **kwargs):
+        previous = current_deadline()
+        _deadline_context.deadline = deadline
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _deadline_context.deadline = previous
+    
+    return run
+
+
+class LatencyTracker:
+    """Recent latencies per request kind, for choosing when to hedge."""
+    
+    def __init__(self, window: int = 200):
+        """
+        Initialize tracker.
+        
+        Args:
+            window: Samples kept per key
+        """
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, key: str, seconds: float) -> None:
+        """Record the latency of one successful request."""
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+    
+    def percentile(self, key: str, fraction: float = HEDGE_PERCENTILE,
+                   min_samples: int = HEDGE_MIN_SAMPLES) -> Optional[float]:
+        """
+        Get a latency percentile.
+        
+        Args:
+            key: Request kind
+            fraction: Percentile as a fraction (0.95 for p95)
+            min_samples: Samples required for an estimate
+        
+        Returns:
+            Latency in seconds, or None with too few samples
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get sample counts and p50/p95 latencies per key."""
+        with self._lock:
+            keys = list(self._samples)
+        return {
+            key: {
+                'samples': len(self._samples[key]),
+                'p50': self.percentile(key, 0.5, min_samples=1),
+                'p95': self.percentile(key, 0.95, min_samples=1)
+            }
+            for key in keys
+        }
+
+
+class RequestHedger:
+    """
+    Runs idempotent reads with a hedge request after the p95 latency.
+    
+    The slower copy is not cancelled (blocking HTTP calls cannot be
+    interrupted) but its result is discarded. A hedge is an extra request
+    to the upstream, so callers pass a hedge_permit that takes a rate limit
+    slot; the hedge is skipped when no slot is open.
+    """
+    
+    def __init__(self, max_workers: int = 8, tracker: Optional[LatencyTracker] = None):
+        """
+        Initialize hedger.
+        
+        Args:
+            max_workers: Threads available for hedged requests
+            tracker: Latency tracker (a new one by default)
+        """
+        self.tracker = tracker or LatencyTracker()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+        self._stats_lock = threading.Lock()
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        self.hedges_skipped = 0
+    
+    def call(self, key: str, func: Callable[..., T], *args,
+             hedge_after: Optional[float] = None,
+             hedge_permit: Optional[Callable[[], bool]] = None, **kwargs) -> T:
+        """
+        Call an idempotent function, hedging it if it is slow.
+        
+        Without enough latency samples (or a hedge_after override) the call
+        runs directly in the calling thread.
+        
+        Args:
+            key: Request kind whose latencies decide the hedge delay
+            func: Function to call; it must be safe to call twice
+            *args: Function arguments
+            hedge_after: Seconds before sending the hedge (defaults to the key's p95)
+            hedge_permit: Called before sending the hedge; returning False
+                (e.g. no rate limit slot open) skips the hedge
+            **kwargs: Function keyword arguments
+        
+        Returns:
+            Result of whichever call finished first successfully
+        """
+        if hedge_after is None:
+            hedge_after = self.tracker.percentile(key)
+        remaining = remaining_time()
+        if hedge_after is None or (remaining is not None and remaining <= hedge_after):
+            return self.timed(key, func, *args, **kwargs)
+        
+        task = with_current_deadline(lambda: self.timed(key, func, *args, **kwargs))
+        primary = self._executor.submit(task)
+        done, _ = wait([primary], timeout=hedge_after)
+        if done:
+            return primary.result()
+        
+        if hedge_permit is not None and not hedge_permit():
+            with self._stats_lock:
+                self.hedges_skipped += 1
+            logger.debug(f"Not hedging {key} request: rate limit reached")
+            done, _ = wait([primary], timeout=remaining_time())
+            if not done:
+                raise DeadlineExceeded(f"Deadline exceeded waiting for {key}")
+            return primary.result()
+        
+        with self._stats_lock:
+            self.hedges_sent += 1
+        logger.debug(f"Hedging {key} request after {hedge_after:.2f}s")
+        hedge = self._executor.submit(task)
+        
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, timeout=remaining_time(), return_when=FIRST_COMPLETED)
+            if not done:
+                raise DeadlineExceeded(f"Deadline exceeded waiting for {key}")
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        with self._stats_lock:
+                            self.hedges_won += 1
+                    return future.result()
+                error = future.exception()
+        raise error
+    
+    def timed(self, key: str, func: Callable[..., T], *args, **kwargs) -> T:
+        """Call a function directly, recording its latency if it succeeds."""
+        start = time.monotonic()
+        result = func(*args, **kwargs)
+        self.tracker.record(key, time.monotonic() - start)
+        return result
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hedge counts and latency percentiles."""
+        return {
+            'hedges_sent': self.hedges_sent,
+            'hedges_won': self.hedges_won,
+            'hedges_skipped': self.hedges_skipped,
+            'latency': self.tracker.get_stats()
+        }
+
+
+# Global hedger instance
+_hedger: Optional[RequestHedger] = None
+_hedger_lock = threading.Lock()
+
+
+def get_request_hedger() -> RequestHedger:
+    """Get the global request hedger."""
+    global _hedger
+    if _hedger is None:
+        with _hedger_lock:
+            if _hedger is None:
+                _hedger = RequestHedger()
+    return _hedger
+
+
+def hedged_call(key: str, func: Callable[..., T], *args, enabled: bool = True,
+                hedge_permit: Optional[Callable[[], bool]] = None, **kwargs) -> T:
+    """
+    Call an idempotent function through the global hedger.
+    
+    Args:
+        key: Request kind whose latencies decide the hedge delay
+        func: Function to call; it must be safe to call twice
+        *args: Function arguments
+        enabled: Call directly (still recording latency) when False
+        hedge_permit: Called before sending a hedge; returning False skips it
+        **kwargs: Function keyword arguments
+    
+    Returns:
+        Function result
+    """
+    hedger = get_request_hedger()
+    if not enabled:
+        return hedger.timed(key, func, *args, **kwargs)
+    return hedger.call(key, func, *args, hedge_permit=hedge_permit, **kwargs)
@@ -29,6 +29,7 @@ from pathlib import Path
 import random
 
 from utils.logging_config import get_logger
+from utils.circuit_breaker import CircuitOpenError
 
 
 
@@ -234,6 +235,11 @@ class ErrorHandler:
                 
                 return result
                 
+            except CircuitOpenError as error:
+                # The upstream is known to be down; retrying would only wait
+                self.logger.warning(f"Not retrying: {error}")
+                raise
+                
             except Exception as error:
                 last_error = error
                 
@@ -34,6 +34,7 @@ from utils.error_handling import (
     ErrorCategory,
     ErrorSeverity
 )
+from utils.circuit_breaker import get_circuit_breaker_registry
 
 
 
@@ -295,6 +296,7 @@ class ErrorHandlingService:
                 }
                 for service_op, cb in self.circuit_breakers.items()
             },
+            'upstream_circuit_breakers': get_circuit_breaker_registry().get_metrics(),
             'recovery_strategies': self._get_recovery_strategy_stats(),
             'error_patterns': self._get_error_pattern_stats()
         }
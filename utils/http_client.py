@@ -0,0 +1,394 @@
+"""
+Shared HTTP connection pools for scrapers and API clients.
+
+Services used to create their own requests.Session each, so every service
+kept separate connection pools with the requests defaults: ten connections
+per host, pools for only ten hosts, no retries, and a DNS lookup for every
+new connection. create_session() returns sessions that all send through one
+process-wide adapter instead:
+
+- per-host pools sized for the parallel workers (plus hedged duplicates),
+  so concurrent requests to one host do not discard connections
+- keep-alive connections shared across services, so a host contacted by
+  the scraper and later by the page fetcher reuses the same sockets
+- connect retries, and retries on 502/503/504 for idempotent methods,
+  with exponential backoff
+- a TTL cache of DNS lookups
+- per-host circuit breakers (see utils/circuit_breaker.py)
+- counters of requests against new connections, to see how often
+  connections are reused
+
+Responses are decompressed by urllib3, which advertises brotli and zstd
+when their decoders are installed. requests cannot speak HTTP/2, so
+connections stay on HTTP/1.1 keep-alive.
+"""
+
+import ipaddress
+import socket
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple
+)
+from urllib.parse import urlparse
+
+import requests
+from urllib3.connection import (
+    HTTPConnection,
+    HTTPSConnection
+)
+from urllib3.connectionpool import (
+    HTTPConnectionPool,
+    HTTPSConnectionPool
+)
+from urllib3.exceptions import NameResolutionError
+from urllib3.util.connection import allowed_gai_family
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from utils.circuit_breaker import CircuitBreakerAdapter
+from utils.logging_config import get_logger
+
+# Hosts whose pools are kept open (company websites make this much larger than the default 10)
+DEFAULT_POOL_HOSTS = 50
+# Connections kept per host: up to 6 parallel workers, each possibly hedged
+DEFAULT_POOL_MAXSIZE = 12
+DEFAULT_DNS_CACHE_TTL = 300
+
+RETRY_TOTAL = 2
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (502, 503, 504)
+
+
+class PooledRetry(Retry):
+    """
+    Retry policy that only honours Retry-After on 503 responses.
+    
+    urllib3 also retries 413 and 429 responses carrying Retry-After, sleeping
+    inside the adapter for as long as the header asks. A 429 must reach the
+    caller instead, so the adaptive rate limiter and the negative cache see
+    it and the worker's deadline still applies.
+    """
+    
+    RETRY_AFTER_STATUS_CODES = frozenset({503})
+
+
+def build_retry() -> Retry:
+    """
+    Build the retry policy shared by every session.
+    
+    Read timeouts are not retried here: slow reads are handled by hedged
+    requests and the services' own retries. 429 responses are left to the
+    rate limiter.
+    
+    Returns:
+        urllib3 Retry
+    """
+    return PooledRetry(
+        total=RETRY_TOTAL,
+        connect=RETRY_TOTAL,
+        read=0,
+        status=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        raise_on_status=False,
+        respect_retry_after_header=True
+    )
+
+
+class DNSCache:
+    """
+    Time-limited cache of host name lookups.
+    """
+    
+    def __init__(self, ttl: float = DEFAULT_DNS_CACHE_TTL):
+        """
+        Initialize cache.
+        
+        Args:
+            ttl: Seconds a lookup is reused (0 disables caching)
+        """
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Tuple[str, int], Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+    
+    def resolve(self, host: str, port: int) -> str:
+        """
+        Resolve a host to an address, reusing recent lookups.
+        
+        Args:
+            host: Host name or IP address
+            port: Port to connect to
+        
+        Returns:
+            IP address, or the host itself when caching is disabled
+        
+        Raises:
+            socket.gaierror: If the lookup fails
+        """
+        if self.ttl <= 0 or _is_ip_address(host):
+            return host
+        
+        key = (host, port)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+        
+        infos = socket.getaddrinfo(host, port, allowed_gai_family(), socket.SOCK_STREAM)
+        address = infos[0][4][0]
+        with self._lock:
+            self._entries[key] = (now + self.ttl, address)
+            self.misses += 1
+        return address
+    
+    def invalidate(self, host: str, port: int) -> None:
+        """Forget a lookup, e.g. after connecting to its address failed."""
+        with self._lock:
+            self._entries.pop((host, port), None)
+    
+    def clear(self) -> None:
+        """Forget all lookups."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get cache size and hit counts."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+def _is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host.strip('[]'))
+        return True
+    except ValueError:
+        return False
+
+
+class ConnectionStats:
+    """
+    Requests sent and connections opened, per host.
+    
+    A request that did not open a connection reused a pooled one.
+    """
+    
+    def __init__(self):
+        """Initialize counters."""
+        self._hosts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+    
+    def _record(self, host: str, counter: str) -> None:
+        with self._lock:
+            counts = self._hosts.setdefault(host, {'requests': 0, 'connections': 0})
+            counts[counter] += 1
+    
+    def record_request(self, host: str) -> None:
+        """Count a response received from a host."""
+        self._record(host, 'requests')
+    
+    def record_connection(self, host: str) -> None:
+        """Count a new connection opened to a host."""
+        self._record(host, 'connections')
+    
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._hosts.clear()
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get connection reuse across all hosts.
+        
+        Returns:
+            Dictionary with request, new and reused connection counts, the
+            reuse rate, DNS cache hits, and the counts per host
+        """
+        with self._lock:
+            hosts = {host: dict(counts) for host, counts in self._hosts.items()}
+        
+        requests_sent = sum(counts['requests'] for counts in hosts.values())
+        connections = sum(counts['connections'] for counts in hosts.values())
+        reused = max(0, requests_sent - connections)
+        return {
+            'requests': requests_sent,
+            'new_connections': connections,
+            'reused_connections': reused,
+            'reuse_rate': round(reused / requests_sent, 3) if requests_sent else 0.0,
+            'dns_cache': get_dns_cache().get_metrics(),
+            'hosts': hosts
+        }
+
+
+class _CachedDNSConnectionMixin:
+    """Connects through the DNS cache and counts every new connection."""
+    
+    def _new_conn(self):
+        hostname = self._dns_host
+        dns_cache = get_dns_cache()
+        try:
+            address = dns_cache.resolve(hostname, self.port)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+        
+        # The host property reads _dns_host, so restore it before TLS uses it for SNI
+        self._dns_host = address
+        try:
+            sock = super()._new_conn()
+        except Exception:
+            dns_cache.invalidate(hostname, self.port)
+            raise
+        finally:
+            self._dns_host = hostname
+        
+        get_connection_stats().record_connection(self.host)
+        return sock
+
+
+class PooledHTTPConnection(_CachedDNSConnectionMixin, HTTPConnection):
+    """HTTP connection using the DNS cache."""
+
+
+class PooledHTTPSConnection(_CachedDNSConnectionMixin, HTTPSConnection):
+    """HTTPS connection using the DNS cache."""
+
+
+class PooledHTTPConnectionPool(HTTPConnectionPool):
+    """HTTP pool opening PooledHTTPConnections."""
+    ConnectionCls = PooledHTTPConnection
+
+
+class PooledHTTPSConnectionPool(HTTPSConnectionPool):
+    """HTTPS pool opening PooledHTTPSConnections."""
+    ConnectionCls = PooledHTTPSConnection
+
+
+POOL_CLASSES_BY_SCHEME = {
+    'http': PooledHTTPConnectionPool,
+    'https': PooledHTTPSConnectionPool
+}
+
+
+class PooledHTTPAdapter(CircuitBreakerAdapter):
+    """
+    Circuit breaker adapter whose pools are shared by many sessions.
+    
+    Connections resolve hosts through the DNS cache, and responses and new
+    connections are counted in the connection stats.
+    """
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = dict(POOL_CLASSES_BY_SCHEME)
+    
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        get_connection_stats().record_request(urlparse(request.url).hostname or '')
+        return response
+    
+    def close(self):
+        """Keep the pools open; other sessions mounted on this adapter still use them."""
+    
+    def close_pools(self) -> None:
+        """Close every pooled connection."""
+        super().close()
+
+
+_dns_cache: Optional[DNSCache] = None
+_connection_stats = ConnectionStats()
+_shared_adapter: Optional[PooledHTTPAdapter] = None
+_adapter_lock = threading.Lock()
+
+
+def _config_int(config, name: str, default: int) -> int:
+    value = getattr(config, name, None)
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    return default
+
+
+def get_dns_cache(config=None) -> DNSCache:
+    """Get the global DNS cache."""
+    global _dns_cache
+    if _dns_cache is None:
+        _dns_cache = DNSCache(ttl=_config_int(config, 'http_dns_cache_ttl', DEFAULT_DNS_CACHE_TTL))
+    return _dns_cache
+
+
+def get_connection_stats() -> ConnectionStats:
+    """Get the global connection reuse counters."""
+    return _connection_stats
+
+
+def get_http_adapter(config=None) -> PooledHTTPAdapter:
+    """
+    Get the adapter shared by every session from create_session().
+    
+    Pool sizes are read from the config the first time it is created.
+    
+    Args:
+        config: Configuration object
+    
+    Returns:
+        Shared PooledHTTPAdapter
+    """
+    global _shared_adapter
+    with _adapter_lock:
+        if _shared_adapter is None:
+            get_dns_cache(config)
+            pool_maxsize = _config_int(config, 'http_pool_maxsize', DEFAULT_POOL_MAXSIZE) or DEFAULT_POOL_MAXSIZE
+            _shared_adapter = PooledHTTPAdapter(
+                pool_connections=DEFAULT_POOL_HOSTS,
+                pool_maxsize=pool_maxsize,
+                max_retries=build_retry()
+            )
+            get_logger(__name__).debug(
+                f"HTTP pools: {DEFAULT_POOL_HOSTS} hosts x {pool_maxsize} connections, "
+                f"DNS cache TTL {_dns_cache.ttl}s"
+            )
+        return _shared_adapter
+
+
+def create_session(config=None, headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """
+    Create a session that sends through the shared connection pools.
+    
+    Args:
+        config: Configuration object (pool sizes and DNS cache TTL)
+        headers: Default headers for the session, e.g. the User-Agent
+    
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+    adapter = get_http_adapter(config)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def reset_http_client() -> None:
+    """Close the shared pools and clear the DNS cache and counters (for tests)."""
+    global _shared_adapter, _dns_cache
+    with _adapter_lock:
+        if _shared_adapter is not None:
+            _shared_adapter.close_pools()
+        _shared_adapter = None
+    _dns_cache = None
+    _connection_stats.reset()
@@ -0,0 +1,276 @@
+"""
+Shared rate limit state for several processes or worker hosts.
+
+Each rate limit key is one global token bucket kept in a shared store, so
+every host drawing on the same API account spends from the same budget
+instead of each enforcing its own copy of the limit. Hosts take tokens as
+leases: a lease is granted atomically, may be used from its start time until
+it expires, and unused tokens are refunded when the lease is released.
+
+Backends:
+
+- SQLiteRateLimitBackend: processes on one host, serialized by SQLite's
+  file lock (``BEGIN IMMEDIATE``)
+- RedisRateLimitBackend: several hosts on a Redis-protocol server; use a
+  ``memory://name`` URL for the in-process stand-in in tests
+
+Hosts must keep their clocks synchronized (e.g. NTP), since bucket refills
+are computed from wall-clock time.
+"""
+
+import json
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    Union
+)
+
+from utils.logging_config import get_logger
+from utils.shared_store import (
+    SQLiteConnectionPool,
+    compare_and_delete,
+    create_redis_client,
+    default_shared_path
+)
+
+# Bucket state: tokens, last refill time, capacity, refill rate and pause end
+BucketState = Dict[str, float]
+
+
+@dataclass
+class RateLimitLease:
+    """Tokens granted to one host from a shared bucket."""
+    key: str
+    lease_id: str
+    tokens: int
+    proceed_at: float
+    expires_at: float
+    used: int = 0
+
+    @property
+    def remaining(self) -> int:
+        """Get the number of leased tokens not used yet."""
+        return self.tokens - self.used
+
+
+def _holder_id() -> str:
+    """Identify the lease holder in logs."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _refill(state: Optional[BucketState], now: float, capacity: float, refill_rate: float) -> BucketState:
+    """Bring a bucket up to date, creating it full if it does not exist."""
+    if state is None:
+        return {'tokens': capacity, 'updated': now, 'capacity': capacity,
+                'refill_rate': refill_rate, 'paused_until': 0.0}
+
+    elapsed = max(0.0, now - state['updated'])
+    tokens = min(capacity, state['tokens'] + elapsed * refill_rate)
+    return {'tokens': tokens, 'updated': max(now, state['updated']), 'capacity': capacity,
+            'refill_rate': refill_rate, 'paused_until': state.get('paused_until', 0.0)}
+
+
+class RateLimitBackend:
+    """
+    Base class for shared token bucket stores.
+
+    Subclasses implement _update(), which applies a function to a bucket's
+    state atomically with respect to every other process using the store.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock
+        self.logger = get_logger(__name__)
+
+    def _update(self, key: str, update: Callable[[Optional[BucketState]], Tuple[Any, Optional[BucketState]]]) -> Any:
+        """
+        Atomically read, update and write a bucket.
+
+        Args:
+            key: Rate limit key
+            update: Function taking the current state (None if missing) and
+                returning (result, new state or None to leave it unchanged)
+
+        Returns:
+            The result returned by update
+        """
+        raise NotImplementedError
+
+    def reserve(self, key: str, tokens: int, capacity: float, refill_rate: float,
+                max_wait: Optional[float] = None, lease_ttl: float = 60.0) -> Optional[RateLimitLease]:
+        """
+        Lease tokens from the shared bucket, borrowing against future refills.
+
+        Leases are granted in the order they are requested across all
+        hosts; a lease that has to borrow starts once the debt is repaid.
+
+        Args:
+            key: Rate limit key
+            tokens: Number of tokens to lease
+            capacity: Bucket capacity (burst limit)
+            refill_rate: Tokens added per second
+            max_wait: Do not lease if the start would be more than this many seconds away
+            lease_ttl: Seconds after its start during which the lease may be used
+
+        Returns:
+            RateLimitLease, or None if max_wait was exceeded
+        """
+        now = self.clock()
+
+        def update(state):
+            state = _refill(state, now, capacity, refill_rate)
+            wait_time = max(0.0, (tokens - state['tokens']) / refill_rate)
+            wait_time = max(wait_time, state['paused_until'] - now)
+            if max_wait is not None and wait_time > max_wait:
+                return None, None
+
+            state['tokens'] -= tokens
+            proceed_at = now + wait_time
+            return RateLimitLease(key, _holder_id(), tokens, proceed_at, proceed_at + lease_ttl), state
+
+        return self._update(key, update)
+
+    def release(self, lease: RateLimitLease) -> None:
+        """
+        Return a lease's unused tokens to the shared bucket.
+
+        Args:
+            lease: Lease granted by reserve()
+        """
+        unused = lease.remaining
+        if unused <= 0:
+            return
+        lease.used = lease.tokens
+
+        def update(state):
+            if state is None:
+                return None, None
+            state = dict(state)
+            state['tokens'] = min(state['capacity'], state['tokens'] + unused)
+            return None, state
+
+        self._update(lease.key, update)
+
+    def pause(self, key: str, until: float) -> None:
+        """
+        Pause a bucket for every host, e.g. after a 429 with Retry-After.
+
+        Args:
+            key: Rate limit key
+            until: Clock time at which leases may start again
+        """
+        def update(state):
+            if state is None:
+                return None, None
+            state = dict(state)
+            state['paused_until'] = max(state.get('paused_until', 0.0), until)
+            state['tokens'] = min(state['tokens'], 0.0)
+            return None, state
+
+        self._update(key, update)
+
+    def get_state(self, key: str) -> Optional[BucketState]:
+        """Get a bucket's stored state, or None if no host has used it yet."""
+        return self._update(key, lambda state: (dict(state) if state else None, None))
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """
+    Shared buckets for all processes on one host.
+
+    Every update runs in a ``BEGIN IMMEDIATE`` transaction, which takes the
+    database's write lock before reading, so concurrent processes never
+    lease the same tokens.
+    """
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None,
+                 clock: Callable[[], float] = time.time):
+        super().__init__(clock)
+        self.pool = SQLiteConnectionPool(db_path or default_shared_path("prospectai-ratelimits.db"))
+        self.pool.connection().execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+            "key TEXT PRIMARY KEY, state TEXT NOT NULL)"
+        )
+
+    def _update(self, key, update):
+        conn = self.pool.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT state FROM rate_limit_buckets WHERE key = ?", (key,)).fetchone()
+            result, state = update(json.loads(row[0]) if row else None)
+            if state is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO rate_limit_buckets (key, state) VALUES (?, ?)",
+                    (key, json.dumps(state))
+                )
+            conn.execute("COMMIT")
+            return result
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    Shared buckets on a Redis-protocol server, for several worker hosts.
+
+    Updates are serialized with a short-lived lock key (``SET NX PX``), which
+    works with any server implementing the basic commands as well as the
+    in-process stand-in behind ``memory://`` URLs.
+    """
+
+    LOCK_TIMEOUT_MS = 2000
+    # Buckets idle for a day are dropped; they are recreated full
+    STATE_TTL_MS = 24 * 3600 * 1000
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "prospectai:ratelimit:",
+                 client=None, clock: Callable[[], float] = time.time):
+        super().__init__(clock)
+        self.client = client or create_redis_client(url)
+        self.prefix = prefix
+
+    def _update(self, key, update):
+        lock_name = f"{self.prefix}lock:{key}"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.LOCK_TIMEOUT_MS / 1000.0
+        while not self.client.set(lock_name, token, nx=True, px=self.LOCK_TIMEOUT_MS):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Timed out waiting for rate limit lock on {key}")
+            time.sleep(0.005)
+
+        try:
+            data = self.client.get(self.prefix + key)
+            result, state = update(json.loads(data) if data else None)
+            if state is not None:
+                self.client.set(self.prefix + key, json.dumps(state), px=self.STATE_TTL_MS)
+            return result
+        finally:
+            # Atomic, so a lock that expired and was taken by another host is left alone
+            compare_and_delete(self.client, lock_name, token)
+
+
+def create_rate_limit_backend(url: str, clock: Callable[[], float] = time.time) -> RateLimitBackend:
+    """
+    Create a shared rate limit backend from a URL.
+
+    Args:
+        url: ``sqlite:///path/to/file.db``, ``sqlite://`` (default shared-memory
+             file), ``redis://...`` or ``memory://name``
+        clock: Time source in seconds
+
+    Returns:
+        Rate limit backend instance
+    """
+    if url.startswith("sqlite://"):
+        path = url[len("sqlite://"):]
+        return SQLiteRateLimitBackend(path or None, clock=clock)
+    return RedisRateLimitBackend(url, clock=clock)
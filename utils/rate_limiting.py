@@ -6,27 +6,53 @@ logic from multiple services and implements service-specific rate limits with
 configuration support.
 """
 
+import asyncio
+import atexit
+import bisect
+import logging
+import re
 import time
 import threading
+from collections import deque
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
 from typing import (
+    Callable,
+    Deque,
     Dict,
+    Mapping,
     Optional,
     Any,
-    List
+    Iterator,
+    List,
+    Tuple,
+    Union
 )
 from dataclasses import (
     dataclass,
     field
 )
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 import json
 from pathlib import Path
 
+from utils.api_monitor import get_api_monitor
 from utils.config import Config
 from utils.logging_config import get_logger
+from utils.rate_limit_backends import (
+    RateLimitBackend,
+    RateLimitLease,
+    create_rate_limit_backend
+)
+from utils.upstreams import resolve_host
+
+
 
 
+class RateLimitTimeoutError(Exception):
+    """Raised when a rate limit slot is not available within the requested timeout."""
+    pass
 
 
 class RateLimitStrategy(Enum):
@@ -37,6 +63,14 @@ class RateLimitStrategy(Enum):
     LEAKY_BUCKET = "leaky_bucket"
 
 
+class RequestPriority(Enum):
+    """Priority lanes for rate limited calls, highest first."""
+    INTERACTIVE = "interactive"
+    SENDING = "sending"
+    DISCOVERY = "discovery"
+    ANALYTICS = "analytics"
+
+
 @dataclass
 class RateLimitConfig:
     """Configuration for a specific rate limit."""
@@ -74,6 +108,9 @@ class RateLimitStatus:
     is_limited: bool = False
     remaining_requests: int = 0
     reset_time: Optional[datetime] = None
+    total_wait_time: float = 0.0
+    waited_requests: int = 0
+    max_wait_time: float = 0.0
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert status to dictionary."""
@@ -87,27 +124,143 @@ class RateLimitStatus:
             'next_available_time': self.next_available_time.isoformat() if self.next_available_time else None,
             'is_limited': self.is_limited,
             'remaining_requests': self.remaining_requests,
-            'reset_time': self.reset_time.isoformat() if self.reset_time else None
+            'reset_time': self.reset_time.isoformat() if self.reset_time else None,
+            'total_wait_time': self.total_wait_time,
+            'waited_requests': self.waited_requests,
+            'max_wait_time': self.max_wait_time
         }
 
 
+@dataclass
+class RateLimitHeaders:
+    """Rate limit information parsed from API response headers."""
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset_seconds: Optional[float] = None
+    retry_after: Optional[float] = None
+
+
+@dataclass
+class AdaptiveLimitState:
+    """Request rate learned for one rate limit key from API responses."""
+    base_rpm: float
+    base_burst: int
+    current_rpm: float
+    ceiling_rpm: Optional[float] = None
+    paused_until: float = 0.0
+    success_streak: int = 0
+    updated_at: Optional[datetime] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert persistent fields to a dictionary."""
+        return {
+            'base_rpm': self.base_rpm,
+            'base_burst': self.base_burst,
+            'current_rpm': self.current_rpm,
+            'ceiling_rpm': self.ceiling_rpm,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+
+
+def _parse_seconds(value: str) -> Optional[float]:
+    """
+    Parse a header duration: plain seconds ("30"), a Unix timestamp,
+    a Go-style duration ("6m0s", "250ms") or an HTTP date.
+    """
+    value = value.strip()
+    try:
+        seconds = float(value)
+        # Large values are absolute Unix timestamps rather than deltas
+        return max(0.0, seconds - time.time()) if seconds > 10 ** 9 else seconds
+    except ValueError:
+        pass
+    
+    parts = _DURATION_PART.findall(value)
+    if parts and "".join(f"{number}{unit}" for number, unit in parts) == value:
+        multipliers = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+        return sum(float(number) * multipliers[unit] for number, unit in parts)
+    
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def parse_rate_limit_headers(headers: Optional[Mapping[str, str]]) -> RateLimitHeaders:
+    """
+    Parse rate limit headers case-insensitively.
+    
+    Understands the X-RateLimit-*, X-Rate-Limit-* and RateLimit-* families,
+    OpenAI's per-request variants (x-ratelimit-remaining-requests) and
+    Retry-After.
+    
+    Args:
+        headers: Response headers
+    
+    Returns:
+        RateLimitHeaders with the fields that were present
+    """
+    parsed = RateLimitHeaders()
+    if not headers:
+        return parsed
+    
+    lowered = {str(name).lower(): str(value) for name, value in headers.items()}
+    
+    def first(field_name: str) -> Optional[str]:
+        for prefix in ('x-ratelimit-', 'x-rate-limit-', 'ratelimit-'):
+            for suffix in ('', '-requests'):
+                value = lowered.get(f"{prefix}{field_name}{suffix}")
+                if value is not None:
+                    return value
+        return None
+    
+    try:
+        limit = first('limit')
+        if limit is not None:
+            parsed.limit = int(float(limit.split(',')[0]))
+        remaining = first('remaining')
+        if remaining is not None:
+            parsed.remaining = int(float(remaining))
+    except ValueError:
+        pass
+    
+    reset = first('reset')
+    if reset is not None:
+        parsed.reset_seconds = _parse_seconds(reset)
+    if 'retry-after' in lowered:
+        parsed.retry_after = _parse_seconds(lowered['retry-after'])
+    
+    return parsed
+
+
 class TokenBucket:
     """Token bucket implementation for rate limiting."""
     
-    def __init__(self, capacity: int, refill_rate: float):
+    def __init__(self, capacity: int, refill_rate: float,
+                 clock: Callable[[], float] = time.time):
         """
         Initialize token bucket.
         
         Args:
             capacity: Maximum number of tokens
             refill_rate: Tokens added per second
+            clock: Time source in seconds
         """
         self.capacity = capacity
         self.refill_rate = refill_rate
         self.tokens = capacity
-        self.last_refill = time.time()
+        self.clock = clock
+        self.last_refill = clock()
         self._lock = threading.Lock()
     
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.last_refill
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.last_refill = now
+    
     def consume(self, tokens: int = 1) -> bool:
         """
         Try to consume tokens from the bucket.
@@ -119,12 +272,8 @@ class TokenBucket:
             True if tokens were consumed, False if not enough tokens
         """
         with self._lock:
-            now = time.time()
-            
             # Refill tokens based on elapsed time
-            elapsed = now - self.last_refill
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
-            self.last_refill = now
+            self._refill(self.clock())
             
             if self.tokens >= tokens:
                 self.tokens -= tokens
@@ -132,6 +281,30 @@ class TokenBucket:
             
             return False
     
+    def reserve(self, tokens: int = 1, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Reserve tokens, borrowing against future refills if necessary.
+        
+        The bucket may go negative; later reservations then wait for the
+        debt to be repaid, so reservations are served in the order made.
+        
+        Args:
+            tokens: Number of tokens to reserve
+            max_wait: Do not reserve if the wait would exceed this many seconds
+            
+        Returns:
+            Seconds to wait before using the tokens, or None if max_wait was exceeded
+        """
+        with self._lock:
+            self._refill(self.clock())
+            
+            wait_time = max(0.0, (tokens - self.tokens) / self.refill_rate)
+            if max_wait is not None and wait_time > max_wait:
+                return None
+            
+            self.tokens -= tokens
+            return wait_time
+    
     def get_wait_time(self, tokens: int = 1) -> float:
         """
         Get time to wait until tokens are available.
@@ -151,22 +324,38 @@ class TokenBucket:
 
 
 class SlidingWindowCounter:
-    """Sliding window counter for rate limiting."""
+    """
+    Sliding window counter for rate limiting.
+    
+    Request times are kept sorted in a deque, so expired entries are pruned
+    from the left in amortized O(1) per request.
+    """
     
-    def __init__(self, window_size: int, max_requests: int):
+    def __init__(self, window_size: int, max_requests: int,
+                 clock: Callable[[], float] = time.time):
         """
         Initialize sliding window counter.
         
         Args:
             window_size: Window size in seconds
             max_requests: Maximum requests in window
+            clock: Time source in seconds
         """
         self.window_size = window_size
         self.max_requests = max_requests
-        self.requests: List[float] = []
+        self.clock = clock
+        # Sorted request times; reservations may lie in the future
+        self.requests: Deque[float] = deque()
         self._lock = threading.Lock()
         self.logger = get_logger(__name__)
     
+    def _prune(self, now: float) -> None:
+        """Drop requests that have left the window."""
+        cutoff_time = now - self.window_size
+        requests = self.requests
+        while requests and requests[0] <= cutoff_time:
+            requests.popleft()
+    
     def can_proceed(self) -> bool:
         """
         Check if request can proceed.
@@ -175,25 +364,24 @@ class SlidingWindowCounter:
             True if request can proceed, False otherwise
         """
         with self._lock:
-            now = time.time()
-            
-            # Remove old requests outside the window
-            cutoff_time = now - self.window_size
-            self.requests = [req_time for req_time in self.requests if req_time > cutoff_time]
-            
+            self._prune(self.clock())
             result = len(self.requests) < self.max_requests
-            self.logger.info(f"SlidingWindowCounter.can_proceed: {result}, requests={len(self.requests)}, max={self.max_requests}, cutoff_time={cutoff_time:.2f}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"SlidingWindowCounter.can_proceed: {result}, requests={len(self.requests)}, max={self.max_requests}")
             return result
     
     def record_request(self) -> None:
         """Record a new request."""
         with self._lock:
-            now = time.time()
-            # Remove old requests outside the window before adding new one
-            cutoff_time = now - self.window_size
-            self.requests = [req_time for req_time in self.requests if req_time > cutoff_time]
-            self.requests.append(now)
-            self.logger.info(f"SlidingWindowCounter.record_request: requests={len(self.requests)}, times={[f'{req-now:.2f}' for req in self.requests]}")
+            now = self.clock()
+            self._prune(now)
+            if not self.requests or now >= self.requests[-1]:
+                self.requests.append(now)
+            else:
+                # Earlier than a reserved future slot
+                self.requests.insert(bisect.bisect_right(self.requests, now), now)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"SlidingWindowCounter.record_request: requests={len(self.requests)}")
     
     def get_wait_time(self) -> float:
         """
@@ -203,24 +391,151 @@ class SlidingWindowCounter:
             Wait time in seconds
         """
         with self._lock:
-            now = time.time()
-            
-            # Remove old requests outside the window
-            cutoff_time = now - self.window_size
-            self.requests = [req_time for req_time in self.requests if req_time > cutoff_time]
+            now = self.clock()
+            self._prune(now)
             
             if len(self.requests) < self.max_requests:
-                self.logger.info(f"SlidingWindowCounter.get_wait_time: 0.0, requests={len(self.requests)}, max={self.max_requests}")
                 return 0.0
             
-            # Find the oldest request that needs to expire
-            if self.requests:
-                oldest_request = min(self.requests)
-                wait_time = (oldest_request + self.window_size) - now
-                self.logger.info(f"SlidingWindowCounter.get_wait_time: {wait_time:.2f}, requests={len(self.requests)}, max={self.max_requests}, oldest={oldest_request:.2f}, now={now:.2f}")
-                return max(0.0, wait_time)
-            self.logger.info(f"SlidingWindowCounter.get_wait_time: 0.0 (no requests)")
-            return 0.0
+            # Enough requests have to leave the window to free one slot
+            wait_time = (self.requests[-self.max_requests] + self.window_size) - now
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"SlidingWindowCounter.get_wait_time: {wait_time:.2f}, requests={len(self.requests)}, max={self.max_requests}")
+            return max(0.0, wait_time)
+    
+    def reserve(self, count: int = 1, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Reserve the earliest slots that keep the window within its limit.
+        
+        Args:
+            count: Number of request slots to reserve
+            max_wait: Do not reserve if the wait would exceed this many seconds
+            
+        Returns:
+            Seconds to wait before using the slots, or None if max_wait was exceeded
+        """
+        with self._lock:
+            now = self.clock()
+            self._prune(now)
+            
+            requests = self.requests
+            size = len(requests)
+            last = requests[-1] if requests else now
+            slots: List[float] = []
+            for i in range(count):
+                slot = max(now, last)
+                # The slot opens when the max_requests-th most recent request leaves the window
+                index = size + i - self.max_requests
+                if index >= 0:
+                    previous = requests[index] if index < size else slots[index - size]
+                    slot = max(slot, previous + self.window_size)
+                slots.append(slot)
+                last = slot
+            
+            wait_time = slots[-1] - now
+            if max_wait is not None and wait_time > max_wait:
+                return None
+            
+            # Slots never precede earlier reservations, so appending keeps the deque sorted
+            requests.extend(slots)
+            return wait_time
+
+
+_priority_context = threading.local()
+
+# Seconds each thread has spent waiting in acquire()
+_wait_context = threading.local()
+
+
+def current_priority() -> RequestPriority:
+    """Get the priority lane of rate limited calls made by this thread."""
+    return getattr(_priority_context, 'priority', RequestPriority.INTERACTIVE)
+
+
+@contextmanager
+def request_priority(priority: Optional[RequestPriority]) -> Iterator[None]:
+    """
+    Run rate limited calls made by this thread in a priority lane.
+    
+    Calls default to the interactive lane. Can also be used as a method
+    decorator.
+    
+    Args:
+        priority: Priority lane, or None to keep the current one
+    """
+    previous = current_priority()
+    if priority is not None:
+        _priority_context.priority = priority
+    try:
+        yield
+    finally:
+        _priority_context.priority = previous
+
+
+@dataclass
+class QueuedRequest:
+    """A batch caller waiting in a priority lane."""
+    priority: RequestPriority
+    tokens: int
+    enqueued_at: float
+    start_tag: float
+    finish_tag: float
+    sequence: int
+
+
+class PriorityLanes:
+    """
+    Weighted fair queue of batch callers waiting on one rate limit key.
+    
+    Each request is tagged with a virtual finish time: its lane's previous
+    finish tag (or the queue's virtual time, if later) plus tokens / weight.
+    The smallest tag goes next, so backlogged lanes share slots in
+    proportion to their weights.
+    """
+    
+    def __init__(self, weights: Mapping[RequestPriority, float], lock: threading.Lock):
+        """
+        Initialize priority lanes.
+        
+        Args:
+            weights: Share of slots per lane
+            lock: Lock guarding the queue; waiters sleep on a condition of it
+        """
+        self.weights = weights
+        self.waiting: List[QueuedRequest] = []
+        self.virtual_time = 0.0
+        self.condition = threading.Condition(lock)
+        self._last_finish: Dict[RequestPriority, float] = {}
+        self._sequence = 0
+    
+    def enqueue(self, priority: RequestPriority, tokens: int, now: float) -> QueuedRequest:
+        """Add a request to its lane."""
+        start = max(self.virtual_time, self._last_finish.get(priority, 0.0))
+        finish = start + tokens / self.weights[priority]
+        self._last_finish[priority] = finish
+        self._sequence += 1
+        request = QueuedRequest(priority, tokens, now, start, finish, self._sequence)
+        self.waiting.append(request)
+        return request
+    
+    def head(self) -> Optional[QueuedRequest]:
+        """Get the request that goes next."""
+        return min(self.waiting, key=lambda request: (request.finish_tag, request.sequence), default=None)
+    
+    def remove(self, request: QueuedRequest, served: bool = True) -> None:
+        """
+        Remove a request from the queue.
+        
+        Args:
+            request: Queued request
+            served: False if the request gave up, so its lane is not charged
+        """
+        self.waiting.remove(request)
+        if served:
+            self.virtual_time = max(self.virtual_time, request.start_tag)
+        elif self._last_finish.get(request.priority) == request.finish_tag:
+            self._last_finish[request.priority] = request.start_tag
+        self.condition.notify_all()
 
 
 class RateLimitingService:
@@ -234,19 +549,57 @@ class RateLimitingService:
     - Rate limit monitoring and reporting
     - Configuration-driven limits
     - Thread-safe operations
+    - Priority lanes (interactive > sending > discovery > analytics)
     """
     
-    def __init__(self, config: Config, config_path: Optional[str] = None):
+    # Adaptive limit tuning (AIMD): halve the rate on a 429, grow it by 10%
+    # after a run of successful responses, never past the learned ceiling
+    ADAPTIVE_DECREASE_FACTOR = 0.5
+    ADAPTIVE_INCREASE_FACTOR = 1.1
+    ADAPTIVE_INCREASE_AFTER = 10
+    ADAPTIVE_MIN_RPM = 1.0
+    # Learned limits older than this are discarded on load
+    LEARNED_LIMIT_MAX_AGE = timedelta(days=7)
+    # Learned limits are written at most this often from the request path
+    LEARNED_LIMIT_SAVE_INTERVAL = 60.0
+    # Interactive calls reserve a slot straight away. Batch lanes only reserve
+    # once their slot is PRIORITY_LOOKAHEAD seconds away, sharing slots by
+    # weight, so interactive calls never queue behind a batch backlog; a batch
+    # call deferred for PRIORITY_MAX_DEFER seconds reserves regardless
+    PRIORITY_WEIGHTS = {
+        RequestPriority.SENDING: 4.0,
+        RequestPriority.DISCOVERY: 2.0,
+        RequestPriority.ANALYTICS: 1.0
+    }
+    PRIORITY_LOOKAHEAD = 0.05
+    PRIORITY_MAX_DEFER = 30.0
+    
+    def __init__(self, config: Config, config_path: Optional[str] = None,
+                 clock: Optional[Callable[[], float]] = None,
+                 sleep: Optional[Callable[[float], None]] = None,
+                 learned_limits_path: Optional[str] = None,
+                 backend: Optional[Union[RateLimitBackend, str]] = None):
         """
         Initialize rate limiting service.
         
         Args:
             config: Global configuration object
             config_path: Optional path to rate limit configuration file
+            clock: Time source in seconds (defaults to time.time)
+            sleep: Optional sleep function used instead of condition waits,
+                e.g. to drive the service from a simulated clock
+            learned_limits_path: Optional path to the file that persists
+                limits learned from API responses
+            backend: Optional shared store (or its URL) holding the token
+                buckets, so several processes or hosts share one set of
+                limits; defaults to config.rate_limit_backend_url
         """
         self.config = config
         self.logger = get_logger(__name__)
         self.config_path = config_path or "logs/rate_limiting.json"
+        self.learned_limits_path = learned_limits_path or "logs/rate_limits_learned.json"
+        self._learned_limits_dirty = False
+        self._learned_limits_saved_at: Optional[float] = None
         
         # Rate limit configurations
         self.rate_limits: Dict[str, RateLimitConfig] = {}
@@ -258,6 +611,32 @@ class RateLimitingService:
         
         # Thread safety
         self._lock = threading.Lock()
+        self._register_lock = threading.Lock()
+        
+        # Time source and per-key conditions that reserved callers wait on
+        self._clock = clock or time.time
+        self._sleep = sleep
+        self._conditions: Dict[str, threading.Condition] = {}
+        
+        # Batch callers waiting per key, by priority lane
+        self._lanes: Dict[str, PriorityLanes] = {}
+        
+        # Limits learned from response headers and 429s
+        self.adaptive_limits: Dict[str, AdaptiveLimitState] = {}
+        
+        # Slot times handed out in the last minute, for utilization metrics
+        self._recent_slots: Dict[str, Deque[float]] = {}
+        
+        # Fixed sleeps skipped since pacing moved to the scheduler, by call site
+        self._avoided_sleep: Dict[str, float] = {}
+        
+        # Shared bucket store for multi-host deployments (None keeps limits local)
+        if backend is None:
+            backend_url = getattr(config, 'rate_limit_backend_url', None)
+            backend = backend_url if isinstance(backend_url, str) and backend_url else None
+        if isinstance(backend, str):
+            backend = create_rate_limit_backend(backend, clock=self._clock)
+        self.backend: Optional[RateLimitBackend] = backend
         
         # Initialize default rate limits
         self._initialize_default_limits()
@@ -265,14 +644,22 @@ class RateLimitingService:
         # Load custom configuration if available
         self._load_configuration()
         
+        # Resume from limits learned in previous runs
+        self._load_learned_limits()
+        
         self.logger.info("Rate limiting service initialized")
     
+    def _config_number(self, name: str, default: float) -> float:
+        """Read a numeric configuration value, falling back to a default."""
+        value = getattr(self.config, name, default)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return default
+        return value
+    
     def _initialize_default_limits(self) -> None:
         """Initialize default rate limits based on global configuration."""
         # OpenAI rate limits - increased for better performance
-        openai_rpm = 120  # Increased from 60 to 120
-        if hasattr(self.config, 'openai_requests_per_minute'):
-            openai_rpm = self.config.openai_requests_per_minute
+        openai_rpm = self._config_number('openai_requests_per_minute', 120)  # Increased from 60 to 120
         
         self.add_rate_limit(RateLimitConfig(
             service_name="openai",
@@ -284,7 +671,7 @@ class RateLimitingService:
         ))
         
         # Hunter.io rate limits - using safer default
-        hunter_rpm = getattr(self.config, 'hunter_requests_per_minute', 10)  # Safer default of 10
+        hunter_rpm = self._config_number('hunter_requests_per_minute', 10)  # Safer default of 10
         # Add rate limits for both domain search and email finder endpoints
         self.add_rate_limit(RateLimitConfig(
             service_name="hunter",
@@ -313,28 +700,28 @@ class RateLimitingService:
             strategy=RateLimitStrategy.SLIDING_WINDOW
         ))
         
-        # LinkedIn scraping rate limits
-        linkedin_delay = getattr(self.config, 'scraping_delay', 2.0)
+        # LinkedIn scraping rate limits - spaced by the LinkedIn scraper's delay
+        linkedin_delay = self._config_number('linkedin_scraping_delay', 3.0)
         linkedin_rpm = int(60 / linkedin_delay) if linkedin_delay > 0 else 30
         self.add_rate_limit(RateLimitConfig(
             service_name="linkedin",
             operation="scraping",
             requests_per_minute=linkedin_rpm,
             requests_per_hour=linkedin_rpm * 60,
-            burst_limit=2,
-            strategy=RateLimitStrategy.SLIDING_WINDOW
+            burst_limit=1,
+            strategy=RateLimitStrategy.TOKEN_BUCKET
         ))
         
         # ProductHunt scraping rate limits
-        scraping_delay = getattr(self.config, 'scraping_delay', 2.0)
+        scraping_delay = self._config_number('scraping_delay', 2.0)
         scraping_rpm = int(60 / scraping_delay) if scraping_delay > 0 else 30
         self.add_rate_limit(RateLimitConfig(
             service_name="producthunt",
             operation="scraping",
             requests_per_minute=scraping_rpm,
             requests_per_hour=scraping_rpm * 60,
-            burst_limit=2,
-            strategy=RateLimitStrategy.SLIDING_WINDOW
+            burst_limit=1,
+            strategy=RateLimitStrategy.TOKEN_BUCKET
         ))
         
         # Notion API rate limits
@@ -348,7 +735,7 @@ class RateLimitingService:
         ))
         
         # Resend API rate limits
-        resend_rpm = getattr(self.config, 'resend_requests_per_minute', 100)
+        resend_rpm = self._config_number('resend_requests_per_minute', 100)
         self.add_rate_limit(RateLimitConfig(
             service_name="resend",
             operation="email_send",
@@ -369,6 +756,7 @@ class RateLimitingService:
         
         with self._lock:
             self.rate_limits[key] = rate_limit_config
+            self.adaptive_limits.pop(key, None)
             self.rate_limit_status[key] = RateLimitStatus(
                 service_name=rate_limit_config.service_name,
                 operation=rate_limit_config.operation,
@@ -379,18 +767,117 @@ class RateLimitingService:
             if rate_limit_config.strategy == RateLimitStrategy.TOKEN_BUCKET:
                 self.token_buckets[key] = TokenBucket(
                     capacity=rate_limit_config.burst_limit,
-                    refill_rate=rate_limit_config.requests_per_minute / 60.0
+                    refill_rate=rate_limit_config.requests_per_minute / 60.0,
+                    clock=self._clock
                 )
             elif rate_limit_config.strategy == RateLimitStrategy.SLIDING_WINDOW:
                 window = SlidingWindowCounter(
                     window_size=60,  # 1 minute window
-                    max_requests=rate_limit_config.requests_per_minute
+                    max_requests=rate_limit_config.requests_per_minute,
+                    clock=self._clock
                 )
                 self.sliding_windows[key] = window
-                self.logger.info(f"Initialized sliding window for {key}: max_requests={window.max_requests}")
+                self.logger.debug(f"Initialized sliding window for {key}: max_requests={window.max_requests}")
         
         self.logger.info(f"Added rate limit for {key}: {rate_limit_config.requests_per_minute} RPM")
     
+    def register(self, service_name: str, operation: str = "default",
+                 min_interval: Optional[float] = None,
+                 requests_per_minute: Optional[float] = None,
+                 burst_limit: int = 1) -> str:
+        """
+        Register a limit for an upstream unless one is already configured.
+        
+        Services call this for the upstreams they talk to; the first
+        registration (or an explicit configuration) wins, so every caller
+        of one upstream shares a single limit instead of stacking their own.
+        
+        Args:
+            service_name: Name of the upstream service or host group
+            operation: Operation name
+            min_interval: Minimum seconds between requests
+            requests_per_minute: Rate limit (alternative to min_interval)
+            burst_limit: Requests allowed back to back
+            
+        Returns:
+            Rate limit key
+        """
+        key = f"{service_name}.{operation}"
+        if requests_per_minute is None:
+            if not min_interval or min_interval <= 0:
+                return key
+            requests_per_minute = 60.0 / min_interval
+        
+        with self._register_lock:
+            if key not in self.rate_limits:
+                self.add_rate_limit(RateLimitConfig(
+                    service_name=service_name,
+                    operation=operation,
+                    requests_per_minute=requests_per_minute,
+                    requests_per_hour=requests_per_minute * 60,
+                    requests_per_day=requests_per_minute * 60 * 24,
+                    burst_limit=burst_limit,
+                    strategy=RateLimitStrategy.TOKEN_BUCKET
+                ))
+        return key
+    
+    def acquire_url(self, url: str, min_interval: Optional[float] = None,
+                    timeout: Optional[float] = None,
+                    priority: Optional[RequestPriority] = None) -> float:
+        """
+        Reserve a slot for a request to a URL, scheduled by upstream host.
+        
+        Args:
+            url: Request URL
+            min_interval: Minimum seconds between requests to a host that has
+                no limit yet
+            timeout: Maximum seconds to wait
+            priority: Priority lane (defaults to the thread's current lane)
+            
+        Returns:
+            Clock time at which the request may proceed
+        """
+        service_name, operation = resolve_host(url)
+        self.register(service_name, operation, min_interval=min_interval)
+        return self.acquire(service_name, operation, timeout=timeout, priority=priority)
+    
+    def try_acquire(self, service_name: str, operation: str = "default", tokens: int = 1) -> bool:
+        """
+        Reserve a request slot only if one is open right now.
+        
+        Used for optional requests, such as hedged duplicates, that should
+        be dropped rather than wait for the limit.
+        
+        Args:
+            service_name: Name of the service
+            operation: Operation name
+            tokens: Number of requests to reserve
+            
+        Returns:
+            True if a slot was reserved, False if none is open
+        """
+        try:
+            self._reserve(f"{service_name}.{operation}", tokens, timeout=0)
+        except RateLimitTimeoutError:
+            return False
+        return True
+    
+    def try_acquire_url(self, url: str, min_interval: Optional[float] = None) -> bool:
+        """
+        Reserve a slot for a request to a URL only if one is open right now.
+        
+        Args:
+            url: Request URL
+            min_interval: Minimum seconds between requests to a host that has
+                no limit yet
+            
+        Returns:
+            True if a slot was reserved, False if none is open
+        """
+        service_name, operation = resolve_host(url)
+        self.register(service_name, operation, min_interval=min_interval)
+        return self.try_acquire(service_name, operation)
+    
     def wait_for_service(self, service_name: str, operation: str = "default") -> None:
         """
         Wait for rate limit if necessary before making a request.
@@ -399,44 +886,378 @@ class RateLimitingService:
             service_name: Name of the service
             operation: Operation name
         """
+        self.acquire(service_name, operation)
+    
+    def acquire(self, service_name: str, operation: str = "default", tokens: int = 1,
+                timeout: Optional[float] = None,
+                priority: Optional[RequestPriority] = None) -> float:
+        """
+        Atomically reserve a request slot and wait until it opens.
+        
+        The slot is reserved under the service lock, so concurrent callers
+        can never overshoot the limit. Interactive calls are handed slots in
+        arrival order (FIFO); batch lanes wait for a slot to come up and
+        share it by weight (see PRIORITY_WEIGHTS).
+        
+        Args:
+            service_name: Name of the service
+            operation: Operation name
+            tokens: Number of requests to reserve (token bucket limits only)
+            timeout: Maximum seconds to wait; nothing is reserved if exceeded
+            priority: Priority lane (defaults to the thread's current lane)
+            
+        Returns:
+            Clock time at which the request may proceed
+            
+        Raises:
+            RateLimitTimeoutError: If no slot opens within the timeout
+        """
         key = f"{service_name}.{operation}"
+        priority = priority or current_priority()
+        started = self._clock()
+        try:
+            if priority == RequestPriority.INTERACTIVE:
+                proceed_at = self._reserve(key, tokens, timeout)
+            else:
+                proceed_at = self._reserve_deferred(key, tokens, timeout, priority)
+            self._wait_until(key, proceed_at)
+        finally:
+            _wait_context.waited = self.thread_wait_time() + max(0.0, self._clock() - started)
+        return proceed_at
+    
+    async def acquire_async(self, service_name: str, operation: str = "default", tokens: int = 1,
+                            timeout: Optional[float] = None,
+                            priority: Optional[RequestPriority] = None) -> float:
+        """
+        Async version of acquire() that waits without blocking the event loop.
         
-        self.logger.info(f"wait_for_service called for {key}")
+        Args:
+            service_name: Name of the service
+            operation: Operation name
+            tokens: Number of requests to reserve (token bucket limits only)
+            timeout: Maximum seconds to wait; nothing is reserved if exceeded
+            priority: Priority lane (defaults to the thread's current lane)
+            
+        Returns:
+            Clock time at which the request may proceed
+            
+        Raises:
+            RateLimitTimeoutError: If no slot opens within the timeout
+        """
+        key = f"{service_name}.{operation}"
+        priority = priority or current_priority()
+        deadline = None if timeout is None else self._clock() + timeout
+        request = None
+        if priority != RequestPriority.INTERACTIVE:
+            with self._lock:
+                request = self._enqueue(key, tokens, priority)
+        
+        while request is not None:
+            shared_state = self._shared_state(key)
+            with self._lock:
+                pause = self._defer_step(key, request, deadline, shared_state)
+            if pause is None:
+                break
+            await asyncio.sleep(pause)
+        
+        proceed_at = self._reserve(key, tokens, self._remaining(deadline))
+        
+        delay = proceed_at - self._clock()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return proceed_at
+    
+    def _reserve(self, key: str, tokens: int = 1, timeout: Optional[float] = None) -> float:
+        """
+        Reserve the next slot for a rate limit key.
         
-        # Check if rate limit exists
-        if key not in self.rate_limits:
-            self.logger.debug(f"No rate limit configured for {key}")
-            return
+        Args:
+            key: Rate limit key
+            tokens: Number of requests to reserve
+            timeout: Maximum acceptable wait in seconds
+            
+        Returns:
+            Clock time at which the reserved slot opens
+            
+        Raises:
+            RateLimitTimeoutError: If the slot would open after the timeout
+        """
+        # Backend round-trips are made before taking the lock, so a slow
+        # shared store never holds up callers of other services
+        lease = None
+        if self.backend is not None:
+            lease = self._reserve_shared(key, tokens, timeout)
         
-        rate_limit = self.rate_limits[key]
+        try:
+            return self._reserve_slot(key, tokens, timeout, lease)
+        except RateLimitTimeoutError:
+            if isinstance(lease, RateLimitLease):
+                self._release_shared(lease)
+            raise
+    
+    def _reserve_slot(self, key: str, tokens: int, timeout: Optional[float],
+                      lease: Optional[Union[RateLimitLease, bool]]) -> float:
+        """
+        Reserve a slot from the local limiter, or record a shared lease.
         
-        # Skip if rate limiting is disabled
-        if not rate_limit.enabled:
-            self.logger.debug(f"Rate limiting disabled for {key}")
-            return
+        Args:
+            key: Rate limit key
+            tokens: Number of requests to reserve
+            timeout: Maximum acceptable wait in seconds
+            lease: Result of _reserve_shared() (None to limit locally)
+            
+        Returns:
+            Clock time at which the reserved slot opens
+            
+        Raises:
+            RateLimitTimeoutError: If the slot would open after the timeout
+        """
+        with self._lock:
+            now = self._clock()
+            rate_limit = self.rate_limits.get(key)
+            if rate_limit is None or not rate_limit.enabled:
+                return now
+            
+            # Check a Retry-After pause reported by the API before taking
+            # local capacity, so a caller that cannot wait it out spends nothing
+            adaptive = self.adaptive_limits.get(key)
+            paused_for = adaptive.paused_until - now if adaptive is not None else 0.0
+            if timeout is not None and paused_for > timeout:
+                raise RateLimitTimeoutError(f"{key} is paused for another {paused_for:.2f}s")
+            
+            wait_time: Optional[float] = 0.0
+            if lease is False:
+                wait_time = None
+            elif lease is not None:
+                wait_time = max(0.0, lease.proceed_at - now)
+            elif rate_limit.strategy == RateLimitStrategy.TOKEN_BUCKET and key in self.token_buckets:
+                wait_time = self.token_buckets[key].reserve(tokens, max_wait=timeout)
+            elif rate_limit.strategy == RateLimitStrategy.SLIDING_WINDOW and key in self.sliding_windows:
+                wait_time = self.sliding_windows[key].reserve(tokens, max_wait=timeout)
+            
+            if wait_time is None:
+                raise RateLimitTimeoutError(f"No {key} slot available within {timeout:.2f}s")
+            
+            wait_time = max(wait_time, paused_for)
+            
+            proceed_at = now + wait_time
+            status = self.rate_limit_status[key]
+            status.last_request_time = datetime.now()
+            status.next_available_time = status.last_request_time + timedelta(seconds=wait_time)
+            status.current_minute_count += tokens
+            status.current_hour_count += tokens
+            status.current_day_count += tokens
+            if wait_time > 0:
+                status.total_wait_time += wait_time
+                status.waited_requests += 1
+                status.max_wait_time = max(status.max_wait_time, wait_time)
+            
+            slots = self._recent_slots.setdefault(key, deque())
+            slots.extend([proceed_at] * tokens)
+            while slots and slots[0] <= now - 60:
+                slots.popleft()
+            
+            if wait_time > 0 and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Rate limiting {key}: reserved slot in {wait_time:.2f}s")
+            return proceed_at
+    
+    def _remaining(self, deadline: Optional[float]) -> Optional[float]:
+        """Get the seconds left until a deadline (None for no deadline)."""
+        return None if deadline is None else max(0.0, deadline - self._clock())
+    
+    def _enqueue(self, key: str, tokens: int, priority: RequestPriority) -> Optional[QueuedRequest]:
+        """
+        Queue a batch caller in its priority lane. Must be called with the lock held.
+        
+        Returns:
+            Queued request, or None if the key is not limited
+        """
+        rate_limit = self.rate_limits.get(key)
+        if rate_limit is None or not rate_limit.enabled:
+            return None
+        lanes = self._lanes.get(key)
+        if lanes is None:
+            lanes = self._lanes[key] = PriorityLanes(self.PRIORITY_WEIGHTS, self._lock)
+        return lanes.enqueue(priority, tokens, self._clock())
+    
+    def _defer_step(self, key: str, request: QueuedRequest, deadline: Optional[float],
+                    shared_state: Optional[Dict[str, float]] = None) -> Optional[float]:
+        """
+        Check whether a queued batch caller may reserve. Must be called with the lock held.
         
-        # Check if we can proceed immediately
-        can_proceed = self.can_make_request(service_name, operation)
-        self.logger.info(f"Can proceed immediately for {key}: {can_proceed}")
+        Args:
+            key: Rate limit key
+            request: The caller's queued request
+            deadline: Clock time by which the caller must have its slot
+            shared_state: The key's shared bucket, read before taking the lock
         
-        if can_proceed:
-            # Record the request immediately
-            self._record_request(key)
-            self.logger.info(f"Request recorded immediately for {key}")
-            return
+        Returns:
+            None once the caller has left the queue and should reserve,
+            otherwise seconds to wait before checking again
+            
+        Raises:
+            RateLimitTimeoutError: If the caller's slot cannot open before the deadline
+        """
+        lanes = self._lanes[key]
+        now = self._clock()
+        wait_time = self._peek_wait(key, request.tokens, now, shared_state)
+        is_head = lanes.head() is request
+        starving = now - request.enqueued_at >= self.PRIORITY_MAX_DEFER
+        
+        if starving or (is_head and wait_time <= self.PRIORITY_LOOKAHEAD):
+            lanes.remove(request)
+            return None
+        
+        if deadline is not None and (now >= deadline or (is_head and now + wait_time > deadline)):
+            lanes.remove(request, served=False)
+            raise RateLimitTimeoutError(f"No {key} slot available for {request.priority.value} call in time")
+        
+        pause = max(wait_time - self.PRIORITY_LOOKAHEAD, self.PRIORITY_LOOKAHEAD)
+        pause = min(pause, request.enqueued_at + self.PRIORITY_MAX_DEFER - now)
+        if deadline is not None:
+            pause = min(pause, deadline - now)
+        return pause
+    
+    def _reserve_deferred(self, key: str, tokens: int, timeout: Optional[float],
+                          priority: RequestPriority) -> float:
+        """
+        Wait in a batch lane until the caller's turn, then reserve its slot.
         
-        # If we can't proceed, wait until we can
-        wait_time = self._get_wait_time(key)
+        Args:
+            key: Rate limit key
+            tokens: Number of requests to reserve
+            timeout: Maximum acceptable wait in seconds
+            priority: Batch priority lane
+            
+        Returns:
+            Clock time at which the reserved slot opens
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._lock:
+            request = self._enqueue(key, tokens, priority)
+        
+        while request is not None:
+            shared_state = self._shared_state(key)
+            with self._lock:
+                pause = self._defer_step(key, request, deadline, shared_state)
+                if pause is None:
+                    break
+                if self._sleep is None:
+                    self._lanes[key].condition.wait(pause)
+                    continue
+            self._sleep(pause)
+        
+        return self._reserve(key, tokens, self._remaining(deadline))
+    
+    def _shared_state(self, key: str) -> Optional[Dict[str, float]]:
+        """Read a key's shared bucket (None without a backend). Call without the lock held."""
+        if self.backend is None:
+            return None
+        try:
+            return self.backend.get_state(key)
+        except Exception:
+            return None
+    
+    def _peek_wait(self, key: str, tokens: int, now: float,
+                   shared_state: Optional[Dict[str, float]] = None) -> float:
+        """Get how long a reservation made now would wait, without making it."""
+        rate_limit = self.rate_limits.get(key)
+        if rate_limit is None or not rate_limit.enabled:
+            return 0.0
         
-        self.logger.info(f"Rate limit check for {key}: wait_time={wait_time:.2f}s, RPM={rate_limit.requests_per_minute}")
+        wait_time = 0.0
+        state = shared_state
+        if state is not None:
+            capacity, refill_rate = self._shared_bucket_params(key)
+            available = min(capacity, state['tokens'] + max(0.0, now - state['updated']) * refill_rate)
+            wait_time = max(0.0, (tokens - available) / refill_rate, state['paused_until'] - now)
+        elif rate_limit.strategy == RateLimitStrategy.TOKEN_BUCKET and key in self.token_buckets:
+            bucket = self.token_buckets[key]
+            available = min(bucket.capacity, bucket.tokens + (now - bucket.last_refill) * bucket.refill_rate)
+            wait_time = max(0.0, (tokens - available) / bucket.refill_rate)
+        elif rate_limit.strategy == RateLimitStrategy.SLIDING_WINDOW and key in self.sliding_windows:
+            wait_time = self.sliding_windows[key].get_wait_time()
+        
+        adaptive = self.adaptive_limits.get(key)
+        if adaptive is not None:
+            wait_time = max(wait_time, adaptive.paused_until - now)
+        return wait_time
+    
+    def _shared_bucket_params(self, key: str) -> Tuple[float, float]:
+        """Get the capacity and refill rate (per second) of a key's shared bucket."""
+        bucket = self.token_buckets.get(key)
+        if bucket is not None:
+            return bucket.capacity, bucket.refill_rate
+        
+        # Sliding-window limits are shared as a bucket with the same rate
+        window = self.sliding_windows[key]
+        capacity = max(1, min(self.rate_limits[key].burst_limit, window.max_requests))
+        return capacity, window.max_requests / window.window_size
+    
+    def _reserve_shared(self, key: str, tokens: int, timeout: Optional[float]) -> Optional[Union[RateLimitLease, bool]]:
+        """
+        Lease tokens from the shared backend. Must be called without the lock held.
         
-        if wait_time > 0:
-            self.logger.info(f"Rate limiting {key}: waiting {wait_time:.2f}s")
-            time.sleep(wait_time)
+        Returns:
+            The lease, False if it would start after the timeout, or None if
+            the key has no enabled limit or the backend is unavailable and
+            the local limiter should be used
+        """
+        with self._lock:
+            rate_limit = self.rate_limits.get(key)
+            if rate_limit is None or not rate_limit.enabled:
+                return None
+            capacity, refill_rate = self._shared_bucket_params(key)
+        try:
+            lease = self.backend.reserve(key, tokens, capacity, refill_rate, max_wait=timeout)
+        except Exception as e:
+            self.logger.warning(f"Shared rate limit backend unavailable for {key}, limiting locally: {e}")
+            return None
+        return lease if lease is not None else False
+    
+    def _release_shared(self, lease: RateLimitLease) -> None:
+        """Refund an unused shared lease."""
+        try:
+            self.backend.release(lease)
+        except Exception as e:
+            self.logger.warning(f"Could not release rate limit lease {lease.lease_id}: {e}")
+    
+    def _share_pause(self, key: str, until: float) -> None:
+        """Propagate a pause to every host sharing the backend."""
+        if self.backend is None:
+            return
+        try:
+            self.backend.pause(key, until)
+        except Exception as e:
+            self.logger.warning(f"Could not share pause for {key}: {e}")
+    
+    def _wait_until(self, key: str, proceed_at: float) -> None:
+        """
+        Block until a reserved slot opens.
         
-        # Record the request after waiting
-        self._record_request(key)
-        self.logger.info(f"Request recorded for {key} after waiting")
+        Waiters sleep on the key's condition so they can be released early
+        when the limit is disabled or changed.
+        """
+        with self._lock:
+            condition = self._conditions.setdefault(key, threading.Condition())
+        
+        while True:
+            remaining = proceed_at - self._clock()
+            rate_limit = self.rate_limits.get(key)
+            if remaining <= 0 or rate_limit is None or not rate_limit.enabled:
+                return
+            if self._sleep is not None:
+                self._sleep(remaining)
+            else:
+                with condition:
+                    condition.wait(remaining)
+    
+    def _notify_waiters(self, key: str) -> None:
+        """Wake callers waiting on a key so they re-check the limit."""
+        condition = self._conditions.get(key)
+        if condition is not None:
+            with condition:
+                condition.notify_all()
     
     def _get_wait_time(self, key: str) -> float:
         """
@@ -449,25 +1270,18 @@ class RateLimitingService:
             Wait time in seconds
         """
         if key not in self.rate_limits:
-            self.logger.debug(f"_get_wait_time: No rate limit for {key}")
             return 0.0
         
         rate_limit = self.rate_limits[key]
-        self.logger.debug(f"_get_wait_time: {key} strategy={rate_limit.strategy.value}")
         
         if rate_limit.strategy == RateLimitStrategy.TOKEN_BUCKET:
             bucket = self.token_buckets.get(key)
-            wait_time = bucket.get_wait_time() if bucket else 0.0
-            self.logger.debug(f"_get_wait_time: token bucket wait_time={wait_time:.2f}")
-            return wait_time
+            return bucket.get_wait_time() if bucket else 0.0
         
         elif rate_limit.strategy == RateLimitStrategy.SLIDING_WINDOW:
             window = self.sliding_windows.get(key)
-            wait_time = window.get_wait_time() if window else 0.0
-            self.logger.debug(f"_get_wait_time: sliding window wait_time={wait_time:.2f}")
-            return wait_time
+            return window.get_wait_time() if window else 0.0
         
-        self.logger.debug(f"_get_wait_time: default 0.0")
         return 0.0
     
     def can_make_request(self, service_name: str, operation: str = "default") -> bool:
@@ -483,18 +1297,12 @@ class RateLimitingService:
         """
         key = f"{service_name}.{operation}"
         
-        if key not in self.rate_limits:
-            self.logger.debug(f"can_make_request: No rate limit for {key}, allowing request")
-            return True
-        
-        if not self.rate_limits[key].enabled:
-            self.logger.debug(f"can_make_request: Rate limit disabled for {key}, allowing request")
+        if key not in self.rate_limits or not self.rate_limits[key].enabled:
             return True
         
         # Check if the sliding window allows immediate execution
-        window_result = self.sliding_windows.get(key, SlidingWindowCounter(60, 1000)).can_proceed()
-        self.logger.debug(f"can_make_request: {key} sliding window result={window_result}")
-        return window_result
+        window = self.sliding_windows.get(key)
+        return window.can_proceed() if window else True
     
     def get_wait_time(self, service_name: str, operation: str = "default") -> float:
         """
@@ -589,6 +1397,97 @@ class RateLimitingService:
                 }
             return self.rate_limit_status.copy()
     
+    def get_metrics(self, service_name: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get quotas, live utilization and limiter wait time per service.
+        
+        Utilization is the share of the effective per-minute rate used by
+        slots handed out in the last minute.
+        
+        Args:
+            service_name: Optional service name to filter by
+            
+        Returns:
+            Dictionary of service metrics keyed by service name
+        """
+        metrics: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            now = self._clock()
+            for key, rate_limit in self.rate_limits.items():
+                if service_name and rate_limit.service_name != service_name:
+                    continue
+                
+                status = self.rate_limit_status[key]
+                adaptive = self.adaptive_limits.get(key)
+                effective_rpm = adaptive.current_rpm if adaptive else rate_limit.requests_per_minute
+                slots = self._recent_slots.get(key, ())
+                recent = sum(1 for slot in slots if now - 60 < slot <= now)
+                lanes = self._lanes.get(key)
+                
+                service = metrics.setdefault(rate_limit.service_name, {
+                    'total_wait_time': 0.0,
+                    'waited_requests': 0,
+                    'requests_last_minute': 0,
+                    'limits': {}
+                })
+                service['total_wait_time'] += status.total_wait_time
+                service['waited_requests'] += status.waited_requests
+                service['requests_last_minute'] += recent
+                service['limits'][rate_limit.operation] = {
+                    'quota_rpm': rate_limit.requests_per_minute,
+                    'effective_rpm': effective_rpm,
+                    'burst_limit': rate_limit.burst_limit,
+                    'enabled': rate_limit.enabled,
+                    'requests_last_minute': recent,
+                    'utilization': recent / effective_rpm if effective_rpm else 0.0,
+                    'total_wait_time': status.total_wait_time,
+                    'waited_requests': status.waited_requests,
+                    'max_wait_time': status.max_wait_time,
+                    'queued_requests': len(lanes.waiting) if lanes else 0
+                }
+        return metrics
+    
+    def record_avoided_sleep(self, source: str, seconds: float) -> None:
+        """
+        Record time a fixed sleep would have taken at a call site that is now
+        paced by the scheduler or an event-based wait.
+        
+        Args:
+            source: Call site name
+            seconds: Fixed sleep minus any time actually waited instead
+        """
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._avoided_sleep[source] = self._avoided_sleep.get(source, 0.0) + seconds
+    
+    def thread_wait_time(self) -> float:
+        """
+        Get the time the calling thread has spent in acquire() so far.
+        
+        Call sites that replaced a fixed sleep take the difference across a
+        step and pass the fixed sleep minus it to record_avoided_sleep().
+        
+        Returns:
+            Seconds waited by this thread
+        """
+        return getattr(_wait_context, 'waited', 0.0)
+    
+    def get_avoided_sleep(self) -> Dict[str, float]:
+        """
+        Get the fixed sleep time avoided so far, by call site.
+        
+        Returns:
+            Dictionary of seconds keyed by call site name
+        """
+        with self._lock:
+            return dict(self._avoided_sleep)
+    
+    def get_total_wait_time(self) -> float:
+        """Get the total time callers have waited on the scheduler."""
+        with self._lock:
+            return sum(status.total_wait_time for status in self.rate_limit_status.values())
+    
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get comprehensive rate limiting statistics.
@@ -652,15 +1551,19 @@ class RateLimitingService:
             
             # Reinitialize rate limiter if strategy changed
             if 'strategy' in kwargs or 'requests_per_minute' in kwargs or 'burst_limit' in kwargs:
+                # Explicit configuration replaces anything learned for the key
+                self.adaptive_limits.pop(key, None)
                 if rate_limit.strategy == RateLimitStrategy.TOKEN_BUCKET:
                     self.token_buckets[key] = TokenBucket(
                         capacity=rate_limit.burst_limit,
-                        refill_rate=rate_limit.requests_per_minute / 60.0
+                        refill_rate=rate_limit.requests_per_minute / 60.0,
+                        clock=self._clock
                     )
                 elif rate_limit.strategy == RateLimitStrategy.SLIDING_WINDOW:
                     self.sliding_windows[key] = SlidingWindowCounter(
                         window_size=60,
-                        max_requests=rate_limit.requests_per_minute
+                        max_requests=rate_limit.requests_per_minute,
+                        clock=self._clock
                     )
         
         self.logger.info(f"Updated rate limit for {key}")
@@ -677,6 +1580,7 @@ class RateLimitingService:
         
         if key in self.rate_limits:
             self.rate_limits[key].enabled = False
+            self._notify_waiters(key)
             self.logger.info(f"Disabled rate limiting for {key}")
     
     def enable_rate_limit(self, service_name: str, operation: str = "default") -> None:
@@ -693,6 +1597,230 @@ class RateLimitingService:
             self.rate_limits[key].enabled = True
             self.logger.info(f"Enabled rate limiting for {key}")
     
+    def observe_response(self, service_name: str, operation: Optional[str] = None,
+                         status_code: int = 200, headers: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Adapt a service's limits to an observed API response.
+        
+        429s (and 503s with Retry-After) halve the request rate and pause the
+        key for the Retry-After period. Rate limit headers with a reset
+        within the hour set the rate to the remaining quota spread over the
+        time left. Otherwise the rate grows back by 10% after a run of
+        successful responses, up to the learned ceiling or, without one,
+        the configured rate. Learned limits are persisted across runs.
+        
+        Args:
+            service_name: Name of the service
+            operation: Operation name; if it has no limit of its own, every
+                limit of the service is adapted
+            status_code: HTTP status code of the response (0 if none)
+            headers: Response headers
+        """
+        if not status_code:
+            return
+        
+        keys = self._adaptive_keys(service_name, operation)
+        if not keys:
+            return
+        
+        parsed = parse_rate_limit_headers(headers)
+        changed = False
+        pauses = []
+        with self._lock:
+            now = self._clock()
+            for key in keys:
+                state = self.adaptive_limits.get(key)
+                paused_until = state.paused_until if state is not None else 0.0
+                changed = self._adapt_limit(key, status_code, parsed, now) or changed
+                state = self.adaptive_limits.get(key)
+                if state is not None and state.paused_until > paused_until:
+                    pauses.append((key, state.paused_until))
+        
+        # Shared outside the lock, like every backend call
+        for key, until in pauses:
+            self._share_pause(key, until)
+        
+        if changed:
+            self._save_learned_limits_if_due()
+    
+    def _adaptive_keys(self, service_name: str, operation: Optional[str]) -> List[str]:
+        """Get the enabled rate limit keys a response applies to."""
+        key = f"{service_name}.{operation}"
+        if operation and key in self.rate_limits:
+            keys = [key]
+        else:
+            keys = [k for k, rl in self.rate_limits.items() if rl.service_name == service_name]
+        return [k for k in keys if self.rate_limits[k].enabled]
+    
+    def _adapt_limit(self, key: str, status_code: int, headers: RateLimitHeaders, now: float) -> bool:
+        """
+        Update the learned rate for one key. Must be called with the lock held.
+        
+        Returns:
+            True if the rate changed by enough to be worth persisting
+        """
+        rate_limit = self.rate_limits[key]
+        state = self.adaptive_limits.get(key)
+        if state is None:
+            state = AdaptiveLimitState(
+                base_rpm=float(rate_limit.requests_per_minute),
+                base_burst=rate_limit.burst_limit,
+                current_rpm=float(rate_limit.requests_per_minute)
+            )
+            self.adaptive_limits[key] = state
+        
+        status = self.rate_limit_status[key]
+        if headers.remaining is not None:
+            status.remaining_requests = headers.remaining
+        if headers.reset_seconds is not None:
+            status.reset_time = datetime.now() + timedelta(seconds=headers.reset_seconds)
+        
+        previous_rpm = state.current_rpm
+        throttled = status_code == 429 or (status_code == 503 and headers.retry_after is not None)
+        
+        if throttled:
+            state.success_streak = 0
+            status.is_limited = True
+            # Repeated reports of the same throttle episode only back off once
+            if now >= state.paused_until:
+                state.ceiling_rpm = max(self.ADAPTIVE_MIN_RPM, state.current_rpm * 0.9)
+                state.current_rpm = max(self.ADAPTIVE_MIN_RPM, state.current_rpm * self.ADAPTIVE_DECREASE_FACTOR)
+                pause = headers.retry_after if headers.retry_after is not None else 60.0 / state.current_rpm
+                state.paused_until = now + pause
+                self.logger.warning(
+                    f"{key} throttled (HTTP {status_code}); backing off to "
+                    f"{state.current_rpm:.1f} RPM for at least {pause:.1f}s"
+                )
+                bucket = self.token_buckets.get(key)
+                if bucket is not None:
+                    bucket.tokens = min(bucket.tokens, 0)
+        
+        elif status_code < 400:
+            status.is_limited = False
+            if (headers.remaining is not None and headers.reset_seconds is not None
+                    and 0 < headers.reset_seconds <= 3600):
+                if headers.remaining <= 0:
+                    state.paused_until = max(state.paused_until, now + headers.reset_seconds)
+                # Spread what is left of the quota over the rest of its window
+                sustainable = headers.remaining * 60.0 / headers.reset_seconds
+                state.ceiling_rpm = max(self.ADAPTIVE_MIN_RPM, sustainable)
+                state.current_rpm = state.ceiling_rpm
+            else:
+                state.success_streak += 1
+                ceiling = state.ceiling_rpm or state.base_rpm
+                if state.success_streak >= self.ADAPTIVE_INCREASE_AFTER and state.current_rpm < ceiling:
+                    state.success_streak = 0
+                    state.current_rpm = min(ceiling, max(state.current_rpm * self.ADAPTIVE_INCREASE_FACTOR,
+                                                         state.current_rpm + 1))
+        
+        if state.current_rpm == previous_rpm:
+            return False
+        
+        state.updated_at = datetime.now()
+        self._apply_adaptive_rate(key, state)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Adapted {key}: {previous_rpm:.1f} -> {state.current_rpm:.1f} RPM")
+        return round(state.current_rpm) != round(previous_rpm)
+    
+    def _apply_adaptive_rate(self, key: str, state: AdaptiveLimitState) -> None:
+        """Apply a learned rate to the key's limiter, scaling its burst with it."""
+        burst = max(1, round(state.base_burst * state.current_rpm / state.base_rpm))
+        
+        bucket = self.token_buckets.get(key)
+        if bucket is not None:
+            bucket.refill_rate = state.current_rpm / 60.0
+            bucket.capacity = burst
+            bucket.tokens = min(bucket.tokens, burst)
+        
+        window = self.sliding_windows.get(key)
+        if window is not None:
+            window.max_requests = max(1, int(state.current_rpm))
+    
+    def get_adaptive_limits(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the limits learned from API responses.
+        
+        Returns:
+            Dictionary of learned limit details keyed by rate limit key
+        """
+        with self._lock:
+            return {key: state.to_dict() for key, state in self.adaptive_limits.items()}
+    
+    def _load_learned_limits(self) -> None:
+        """Load limits learned in previous runs, skipping stale or outdated ones."""
+        try:
+            learned_file = Path(self.learned_limits_path)
+            if not learned_file.exists():
+                return
+            
+            with open(learned_file, 'r') as f:
+                data = json.load(f)
+            
+            now = datetime.now()
+            with self._lock:
+                for key, entry in data.get('limits', {}).items():
+                    rate_limit = self.rate_limits.get(key)
+                    if rate_limit is None or not entry.get('updated_at'):
+                        continue
+                    
+                    updated_at = datetime.fromisoformat(entry['updated_at'])
+                    # Configuration changes since the limit was learned take precedence
+                    if (now - updated_at > self.LEARNED_LIMIT_MAX_AGE
+                            or entry.get('base_rpm') != rate_limit.requests_per_minute
+                            or entry.get('base_burst') != rate_limit.burst_limit):
+                        continue
+                    
+                    state = AdaptiveLimitState(
+                        base_rpm=float(entry['base_rpm']),
+                        base_burst=int(entry['base_burst']),
+                        current_rpm=max(self.ADAPTIVE_MIN_RPM, float(entry['current_rpm'])),
+                        ceiling_rpm=entry.get('ceiling_rpm'),
+                        updated_at=updated_at
+                    )
+                    self.adaptive_limits[key] = state
+                    self._apply_adaptive_rate(key, state)
+            
+            if self.adaptive_limits:
+                self.logger.info(f"Loaded {len(self.adaptive_limits)} learned rate limits from {self.learned_limits_path}")
+            
+        except Exception as e:
+            self.logger.warning(f"Failed to load learned rate limits: {e}")
+    
+    def _save_learned_limits_if_due(self) -> None:
+        """Save learned limits unless they were saved within LEARNED_LIMIT_SAVE_INTERVAL."""
+        with self._lock:
+            now = self._clock()
+            saved_at = self._learned_limits_saved_at
+            if saved_at is not None and now - saved_at < self.LEARNED_LIMIT_SAVE_INTERVAL:
+                self._learned_limits_dirty = True
+                return
+        self.save_learned_limits()
+    
+    def flush_learned_limits(self) -> None:
+        """Save learned limits if they changed since the last save."""
+        if self._learned_limits_dirty:
+            self.save_learned_limits()
+    
+    def save_learned_limits(self) -> None:
+        """Save limits learned from API responses to file."""
+        with self._lock:
+            self._learned_limits_dirty = False
+            self._learned_limits_saved_at = self._clock()
+        try:
+            learned_file = Path(self.learned_limits_path)
+            learned_file.parent.mkdir(parents=True, exist_ok=True)
+            
+            data = {
+                'limits': self.get_adaptive_limits(),
+                'last_updated': datetime.now().isoformat()
+            }
+            
+            with open(learned_file, 'w') as f:
+                json.dump(data, f, indent=2)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to save learned rate limits: {e}")
+    
     def _load_configuration(self) -> None:
         """Load rate limiting configuration from file."""
         try:
@@ -761,6 +1889,10 @@ def get_rate_limiter(config: Optional[Config] = None) -> RateLimitingService:
         if config is None:
             raise ValueError("Config must be provided for first initialization")
         _global_rate_limiter = RateLimitingService(config)
+        # Learned limits changed since the last interval save are written on exit
+        atexit.register(_global_rate_limiter.flush_learned_limits)
+        # Feed observed responses back into the limits
+        get_api_monitor().add_observer(_global_rate_limiter.observe_response)
     return _global_rate_limiter
 
 
@@ -770,7 +1902,87 @@ def wait_for_service(service_name: str, operation: str = "default", config: Opti
     rate_limiter.wait_for_service(service_name, operation)
 
 
+def acquire(service_name: str, operation: str = "default", tokens: int = 1,
+            timeout: Optional[float] = None, config: Optional[Config] = None) -> float:
+    """Convenience function to reserve a rate limit slot and wait for it."""
+    rate_limiter = get_rate_limiter(config)
+    return rate_limiter.acquire(service_name, operation, tokens=tokens, timeout=timeout)
+
+
 def can_make_request(service_name: str, operation: str = "default", config: Optional[Config] = None) -> bool:
     """Convenience function to check if request can be made."""
     rate_limiter = get_rate_limiter(config)
     return rate_limiter.can_make_request(service_name, operation)
+
+
+class HostRateLimiter:
+    """
+    Per-caller handle on the central scheduler for scrapers that space
+    requests to an upstream by a minimum delay.
+    
+    Requests are scheduled under an explicit service/operation, or by the
+    host of the URL being fetched, so several scrapers hitting the same
+    site share one limit. Without a scheduler (no rate_limiter given and no
+    global instance yet) the delay is enforced locally.
+    """
+    
+    def __init__(self, delay: float = 2.0, service_name: Optional[str] = None,
+                 operation: str = "default", rate_limiter: Optional[RateLimitingService] = None):
+        """
+        Initialize host rate limiter.
+        
+        Args:
+            delay: Minimum seconds between requests to one upstream
+            service_name: Fixed service to schedule under (defaults to the URL host)
+            operation: Operation name used with service_name
+            rate_limiter: Scheduler to use (defaults to the global instance)
+        """
+        self.delay = delay
+        self.service_name = service_name
+        self.operation = operation
+        self.rate_limiter = rate_limiter
+        self.last_request_time = 0.0
+    
+    def wait_if_needed(self, url: Optional[str] = None) -> None:
+        """
+        Wait until a request to the upstream may proceed.
+        
+        Args:
+            url: URL about to be requested, used to pick the upstream host
+        """
+        scheduler = self.rate_limiter or _global_rate_limiter
+        if scheduler is None:
+            current_time = time.time()
+            time_since_last = current_time - self.last_request_time
+            if time_since_last < self.delay:
+                time.sleep(self.delay - time_since_last)
+        elif self.service_name:
+            scheduler.register(self.service_name, self.operation, min_interval=self.delay)
+            scheduler.acquire(self.service_name, self.operation)
+        else:
+            scheduler.acquire_url(url, min_interval=self.delay)
+        
+        self.last_request_time = time.time()
+    
+    def try_acquire(self, url: Optional[str] = None) -> bool:
+        """
+        Take a request slot for the upstream only if one is open right now.
+        
+        Args:
+            url: URL about to be requested, used to pick the upstream host
+            
+        Returns:
+            True if the request may proceed now, False if it would have to wait
+        """
+        scheduler = self.rate_limiter or _global_rate_limiter
+        if scheduler is None:
+            acquired = time.time() - self.last_request_time >= self.delay
+        elif self.service_name:
+            scheduler.register(self.service_name, self.operation, min_interval=self.delay)
+            acquired = scheduler.try_acquire(self.service_name, self.operation)
+        else:
+            acquired = scheduler.try_acquire_url(url, min_interval=self.delay)
+        
+        if acquired:
+            self.last_request_time = time.time()
+        return acquired
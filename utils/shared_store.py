@@ -0,0 +1,252 @@
+"""
+Shared state stores for coordinating several processes or hosts.
+
+Provides the connection helpers used by the cross-process cache backends:
+
+- SQLite databases on a shared-memory filesystem (``/dev/shm`` when
+  available) for processes on the same host
+- Redis-protocol clients for several hosts, with an in-process stand-in
+  (``memory://`` URLs) for tests and single-process development
+"""
+
+import fnmatch
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+from urllib.parse import urlparse
+
+# Check if the redis client is available
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    redis = None
+
+# Deletes a key only while it still holds the caller's value (lock release)
+COMPARE_AND_DELETE_SCRIPT = (
+    "if redis.call('get', KEYS[1]) == ARGV[1] then "
+    "return redis.call('del', KEYS[1]) else return 0 end"
+)
+
+
+def default_shared_path(filename: str) -> Path:
+    """
+    Get a path for a host-local shared database file.
+    
+    Prefers /dev/shm (memory-backed on Linux) and falls back to the
+    system temp directory.
+    """
+    shm = Path("/dev/shm")
+    base = shm if shm.is_dir() and os.access(shm, os.W_OK) else Path(tempfile.gettempdir())
+    return base / filename
+
+
+class SQLiteConnectionPool:
+    """
+    Per-thread SQLite connections to one database file.
+    
+    Connections use WAL mode so readers never block on writers, and are
+    re-opened after a fork so child processes do not share file handles.
+    """
+    
+    def __init__(self, db_path: Union[str, Path], timeout: float = 5.0):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.timeout = timeout
+        self._local = threading.local()
+    
+    def connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(str(self.db_path), timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+    
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class InProcessRedis:
+    """
+    In-process stand-in for the subset of the Redis API used by this project.
+    
+    Instances created through create_redis_client() with the same
+    ``memory://name`` URL share their data, which lets tests simulate
+    several processes or hosts talking to one server.
+    """
+    
+    def __init__(self):
+        self._data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+        self._lock = threading.RLock()
+    
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        if isinstance(value, bytes):
+            return value
+        return str(value).encode('utf-8')
+    
+    def _live(self, name: str) -> Optional[bytes]:
+        if isinstance(name, bytes):
+            name = name.decode('utf-8')
+        item = self._data.get(name)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and time.time() >= expires_at:
+            del self._data[name]
+            return None
+        return value
+    
+    def ping(self) -> bool:
+        return True
+    
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            return self._live(name)
+    
+    def set(self, name: str, value: Any, ex: Optional[float] = None, px: Optional[int] = None,
+            nx: bool = False) -> Optional[bool]:
+        with self._lock:
+            if nx and self._live(name) is not None:
+                return None
+            expires_at = None
+            if ex is not None:
+                expires_at = time.time() + ex
+            elif px is not None:
+                expires_at = time.time() + px / 1000.0
+            self._data[name] = (self._encode(value), expires_at)
+            return True
+    
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            deleted = 0
+            for name in names:
+                if self._live(name) is not None:
+                    deleted += 1
+                    self._data.pop(name.decode('utf-8') if isinstance(name, bytes) else name)
+            return deleted
+    
+    def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> int:
+        """Run a Lua script; only COMPARE_AND_DELETE_SCRIPT is supported."""
+        if script != COMPARE_AND_DELETE_SCRIPT or numkeys != 1:
+            raise NotImplementedError("The in-process Redis stand-in cannot run this script")
+        name, value = keys_and_args
+        with self._lock:
+            if self._live(name) != self._encode(value):
+                return 0
+            return self.delete(name)
+    
+    def exists(self, *names: str) -> int:
+        with self._lock:
+            return sum(1 for name in names if self._live(name) is not None)
+    
+    def pexpire(self, name: str, milliseconds: int) -> bool:
+        with self._lock:
+            value = self._live(name)
+            if value is None:
+                return False
+            self._data[name] = (value, time.time() + milliseconds / 1000.0)
+            return True
+    
+    def pttl(self, name: str) -> int:
+        with self._lock:
+            if self._live(name) is None:
+                return -2
+            expires_at = self._data[name][1]
+            if expires_at is None:
+                return -1
+            return int((expires_at - time.time()) * 1000)
+    
+    def incrby(self, name: str, amount: int = 1) -> int:
+        with self._lock:
+            current = self._live(name)
+            expires_at = self._data[name][1] if current is not None else None
+            value = int(current or 0) + amount
+            self._data[name] = (self._encode(value), expires_at)
+            return value
+    
+    def scan_iter(self, match: Optional[str] = None, count: Optional[int] = None) -> Iterator[bytes]:
+        with self._lock:
+            names = [name for name in list(self._data) if self._live(name) is not None]
+        for name in names:
+            if match is None or fnmatch.fnmatchcase(name, match):
+                yield name.encode('utf-8')
+    
+    def keys(self, pattern: str = "*") -> List[bytes]:
+        return list(self.scan_iter(match=pattern))
+    
+    def flushdb(self) -> bool:
+        with self._lock:
+            self._data.clear()
+            return True
+
+
+_in_process_servers: Dict[str, InProcessRedis] = {}
+_in_process_lock = threading.Lock()
+
+
+def compare_and_delete(client, name: str, value: str) -> bool:
+    """
+    Delete a key only if it still holds a value, atomically on the server.
+    
+    Used to release a lock key without deleting a lock another holder took
+    after ours expired.
+    
+    Args:
+        client: Client from create_redis_client()
+        name: Key name
+        value: Value the key must hold
+    
+    Returns:
+        True if the key was deleted
+    """
+    return bool(client.eval(COMPARE_AND_DELETE_SCRIPT, 1, name, value))
+
+
+def create_redis_client(url: str):
+    """
+    Create a Redis-protocol client for a URL.
+    
+    Args:
+        url: ``redis://``/``rediss://``/``unix://`` URL, or ``memory://name``
+             for the in-process stand-in
+    
+    Returns:
+        Client object exposing the Redis command API
+    
+    Raises:
+        ImportError: If a real Redis URL is given but redis-py is not installed
+    """
+    parsed = urlparse(url)
+    if parsed.scheme == "memory":
+        name = parsed.netloc or parsed.path or "default"
+        with _in_process_lock:
+            if name not in _in_process_servers:
+                _in_process_servers[name] = InProcessRedis()
+            return _in_process_servers[name]
+    
+    if not REDIS_AVAILABLE:
+        raise ImportError("The 'redis' package is required for Redis URLs (pip install redis)")
+    
+    return redis.Redis.from_url(url)
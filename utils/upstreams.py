@@ -0,0 +1,49 @@
+"""
+Mapping of request URLs to the upstream they count against.
+
+The rate limiter schedules requests and the circuit breakers count failures
+per upstream. Both resolve URLs here, so this module has no dependencies on
+either of them (or on anything else in the package).
+"""
+
+from typing import (
+    Dict,
+    Optional,
+    Tuple
+)
+from urllib.parse import urlparse
+
+# Upstream hosts with a dedicated rate limit, matched by domain suffix.
+# Any other host is limited under the "web" service, one key per host.
+KNOWN_HOSTS: Dict[str, Tuple[str, str]] = {
+    'linkedin.com': ('linkedin', 'scraping'),
+    'producthunt.com': ('producthunt', 'scraping'),
+    'api.hunter.io': ('hunter', 'default'),
+    'api.notion.com': ('notion', 'api_call'),
+    'api.openai.com': ('openai', 'completion'),
+    'api.resend.com': ('resend', 'email_send')
+}
+
+
+def resolve_host(url: Optional[str]) -> Tuple[str, str]:
+    """
+    Get the (service, operation) a request to a URL is scheduled under.
+    
+    Args:
+        url: Request URL or bare host name
+    
+    Returns:
+        Tuple of service name and operation
+    """
+    if not url:
+        return "web", "default"
+    
+    host = (urlparse(url).hostname if "//" in url else url.split('/')[0]) or ""
+    host = host.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    
+    for known_host, service in KNOWN_HOSTS.items():
+        if host == known_host or host.endswith("." + known_host):
+            return service
+    return "web", host or "default"
@@ -9,7 +9,9 @@ from typing import (
     Optional,
     Dict,
     Any,
-    List
+    List,
+    Sequence,
+    Tuple
 )
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -20,14 +22,43 @@ from queue import (
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (
+    TimeoutException,
+    WebDriverException
+)
+import psutil
 
 from utils.config import Config
+from utils.circuit_breaker import call_with_circuit_breaker
 from utils.logging_config import get_logger
 from utils.error_handling_enhanced import ErrorHandlingService
 
 
+# Requests blocked in scrape drivers: images, media, fonts and ad/analytics hosts
+DEFAULT_BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.mp3", "*.m4a", "*.ogg",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*facebook.net*", "*connect.facebook.com*",
+    "*hotjar.com*", "*segment.io*", "*cdn.segment.com*", "*mixpanel.com*",
+    "*amplitude.com*", "*fullstory.com*", "*clarity.ms*", "*intercom.io*",
+    "*intercomcdn.com*", "*hubspot.com*", "*hs-scripts.com*", "*ads.linkedin.com*",
+    "*px.ads.linkedin.com*", "*snap.licdn.com*", "*bat.bing.com*", "*twitter.com/i/adsct*"
+)
 
+# Wait for the document body when the caller has no better selector
+BODY = (By.TAG_NAME, "body")
+
+# Bytes transferred for the document and its subresources, per the Resource Timing API
+TRANSFER_SIZE_SCRIPT = (
+    "return performance.getEntriesByType('navigation')"
+    ".concat(performance.getEntriesByType('resource'))"
+    ".reduce(function(total, entry) { return total + (entry.transferSize || 0); }, 0);"
+)
 
 
 @dataclass
@@ -41,38 +72,233 @@ class WebDriverConfig:
     disable_images: bool = True  # Enable image blocking for faster loading
     disable_javascript: bool = False
     proxy: Optional[str] = None
+    # "eager" returns once the DOM is ready instead of waiting for every subresource
+    page_load_strategy: str = "eager"
+    blocked_url_patterns: Tuple[str, ...] = DEFAULT_BLOCKED_URL_PATTERNS
+
+
+@dataclass
+class PageLoad:
+    """Timing and transfer size of one page loaded in a browser."""
+    url: str
+    seconds: float
+    transferred_bytes: Optional[int] = None
+    ready: bool = True
+
+
+class PageLoadStats:
+    """Running totals of browser page loads."""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pages = 0
+        self.seconds = 0.0
+        self.transferred_bytes = 0
+        self.not_ready = 0
+    
+    def record(self, load: PageLoad) -> None:
+        """Add one page load to the totals."""
+        with self.lock:
+            self.pages += 1
+            self.seconds += load.seconds
+            self.transferred_bytes += load.transferred_bytes or 0
+            if not load.ready:
+                self.not_ready += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get page count, average load time and average transfer size."""
+        with self.lock:
+            return {
+                'pages_loaded': self.pages,
+                'avg_page_seconds': self.seconds / self.pages if self.pages else 0.0,
+                'avg_page_kb': self.transferred_bytes / 1024 / self.pages if self.pages else 0.0,
+                'pages_not_ready': self.not_ready
+            }
+
+
+_page_load_stats = PageLoadStats()
+
+
+def load_page(driver: webdriver.Chrome, url: str,
+              wait_for: Sequence[Tuple[str, str]] = (BODY,), timeout: float = 10) -> PageLoad:
+    """
+    Navigate to a page and wait until any of the given elements is present.
+    
+    Waiting for the elements a scrape needs, rather than the full load event,
+    lets eager page loads return as soon as the content is there. If none of
+    them appears within the timeout the page is left as it is and the load
+    is reported as not ready.
+    
+    Args:
+        driver: WebDriver to load the page in
+        url: Page URL
+        wait_for: Locators such as (By.CSS_SELECTOR, "h1"); any one is enough
+        timeout: Seconds to wait for the locators
+        
+    Returns:
+        PageLoad with the time taken and bytes transferred
+    """
+    start_time = time.time()
+    call_with_circuit_breaker(url, driver.get, url)
+    
+    ready = True
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.any_of(*[EC.presence_of_element_located(locator) for locator in wait_for])
+        )
+    except TimeoutException:
+        ready = False
+    
+    transferred = None
+    try:
+        value = driver.execute_script(TRANSFER_SIZE_SCRIPT)
+        if isinstance(value, (int, float)):
+            transferred = int(value)
+    except Exception:
+        pass
+    
+    load = PageLoad(url=url, seconds=time.time() - start_time, transferred_bytes=transferred, ready=ready)
+    _page_load_stats.record(load)
+    get_logger(__name__).debug(
+        f"Loaded {url} in {load.seconds:.2f}s"
+        + (f", {transferred / 1024:.0f} KB" if transferred is not None else "")
+        + ("" if ready else " (expected elements missing)")
+    )
+    return load
+
+
+def _config_number(config: Optional[Config], name: str, default: Optional[float]) -> Optional[float]:
+    """Read a numeric setting, falling back to the default when unset."""
+    value = getattr(config, name, default) if config else default
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return default
+    return value
+
+
+class WebDriverPoolExhausted(WebDriverException):
+    """Raised when no WebDriver becomes free within the acquire timeout."""
 
 
 class WebDriverPool:
-    """Pool of WebDriver instances for reuse and better resource management."""
+    """
+    Bounded pool of WebDriver instances for reuse and better resource management.
     
-    def __init__(self, max_size: int = 3, config: WebDriverConfig = None):
+    At most max_size drivers exist at once; callers block until one is free.
+    Drivers are recycled (quit and replaced on demand) after a number of
+    pages or once Chrome's memory use passes a limit, since long-lived
+    Chrome processes leak memory.
+    """
+    
+    def __init__(self, max_size: int = 3, config: WebDriverConfig = None,
+                 acquire_timeout: float = 60.0, max_pages_per_driver: int = 50,
+                 max_rss_mb: Optional[float] = None):
+        """
+        Initialize pool.
+        
+        Args:
+            max_size: Maximum number of drivers alive at once
+            config: WebDriver configuration
+            acquire_timeout: Seconds to wait for a free driver
+            max_pages_per_driver: Checkouts after which a driver is recycled
+            max_rss_mb: Memory of a driver's Chrome processes above which it is recycled
+        """
         self.max_size = max_size
         self.config = config or WebDriverConfig()
+        self.acquire_timeout = acquire_timeout
+        self.max_pages_per_driver = max_pages_per_driver
+        self.max_rss_mb = max_rss_mb
         self.pool = Queue(maxsize=max_size)
         self.active_drivers = set()
         self.lock = threading.Lock()
         self.logger = get_logger(__name__)
         
-    def get_driver(self) -> webdriver.Chrome:
-        """Get a WebDriver instance from the pool or create a new one."""
-        try:
-            # Try to get an existing driver from the pool
-            driver = self.pool.get_nowait()
-            with self.lock:
-                self.active_drivers.add(driver)
-            self.logger.debug("Retrieved WebDriver from pool")
-            return driver
-        except Empty:
-            # Create a new driver if pool is empty
-            driver = self._create_driver()
+        # Signalled when a driver is returned or retired
+        self._available = threading.Condition(self.lock)
+        # Drivers alive (idle, in use or starting) and pages served by each
+        self._total = 0
+        self._pages: Dict[Any, int] = {}
+        
+        self._health_stop = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
+        
+        # Reuse accounting: Chrome startup is the cost pooling avoids
+        self.drivers_created = 0
+        self.drivers_reused = 0
+        self.startup_seconds = 0.0
+        self.acquisitions = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.acquire_timeouts = 0
+        self.recycles = 0
+        self.health_check_failures = 0
+        
+    def get_driver(self, timeout: Optional[float] = None) -> webdriver.Chrome:
+        """
+        Get a WebDriver instance from the pool, creating one if below the cap.
+        
+        Args:
+            timeout: Seconds to wait for a free driver (defaults to acquire_timeout)
+            
+        Returns:
+            WebDriver instance
+            
+        Raises:
+            WebDriverPoolExhausted: If no driver became free in time
+        """
+        timeout = self.acquire_timeout if timeout is None else timeout
+        start_time = time.time()
+        driver = None
+        
+        with self._available:
+            while True:
+                try:
+                    driver = self.pool.get_nowait()
+                    break
+                except Empty:
+                    pass
+                
+                if self._total < self.max_size:
+                    # Reserve a slot and start Chrome outside the lock
+                    self._total += 1
+                    break
+                
+                remaining = start_time + timeout - time.time()
+                if remaining <= 0:
+                    self.acquire_timeouts += 1
+                    raise WebDriverPoolExhausted(
+                        f"No WebDriver free after {timeout:.0f}s ({self.max_size} in use)"
+                    )
+                self._available.wait(remaining)
+            waited = time.time() - start_time
+        
+        if driver is None:
+            try:
+                driver = self._create_driver()
+            except Exception:
+                with self._available:
+                    self._total -= 1
+                    self._available.notify()
+                raise
             with self.lock:
-                self.active_drivers.add(driver)
+                self.drivers_created += 1
+                self.startup_seconds += time.time() - start_time - waited
+                self._pages[driver] = 0
             self.logger.debug("Created new WebDriver instance")
-            return driver
+        else:
+            with self.lock:
+                self.drivers_reused += 1
+            self.logger.debug("Retrieved WebDriver from pool")
+        
+        with self.lock:
+            self.active_drivers.add(driver)
+            self._pages[driver] = self._pages.get(driver, 0) + 1
+            self.acquisitions += 1
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        return driver
     
     def return_driver(self, driver: webdriver.Chrome) -> None:
-        """Return a WebDriver instance to the pool."""
+        """Return a WebDriver instance to the pool, recycling it if due."""
         if not driver:
             return
             
@@ -80,44 +306,169 @@ class WebDriverPool:
             with self.lock:
                 if driver in self.active_drivers:
                     self.active_drivers.remove(driver)
+                pages = self._pages.get(driver, 0)
             
             # Check if driver is still usable
-            if self._is_driver_healthy(driver):
-                # Clear any existing state
-                self._reset_driver_state(driver)
-                
-                # Return to pool if there's space
-                try:
-                    self.pool.put_nowait(driver)
-                    self.logger.debug("Returned WebDriver to pool")
-                except:
-                    # Pool is full, quit the driver
+            if not self._is_driver_healthy(driver):
+                self._retire(driver, "unhealthy")
+                return
+            
+            reason = self._recycle_reason(driver, pages)
+            if reason:
+                self._retire(driver, reason, recycled=True)
+                return
+            
+            # Clear any existing state
+            self._reset_driver_state(driver)
+            
+            with self._available:
+                if driver not in self._pages:
+                    # Pool was cleaned up while the driver was in use
                     driver.quit()
-                    self.logger.debug("Pool full, quit WebDriver")
-            else:
-                # Driver is unhealthy, quit it
-                driver.quit()
-                self.logger.debug("Quit unhealthy WebDriver")
+                    return
+                self.pool.put_nowait(driver)
+                self._available.notify()
+            self.logger.debug("Returned WebDriver to pool")
                 
         except Exception as e:
             self.logger.warning(f"Error returning driver to pool: {e}")
+            self._retire(driver, "error")
+    
+    def warm(self, count: int) -> int:
+        """
+        Start drivers ahead of demand so the first pages skip Chrome startup.
+        
+        Args:
+            count: Number of idle drivers wanted
+            
+        Returns:
+            Number of drivers started
+        """
+        started = 0
+        for _ in range(count):
+            with self._available:
+                if self._total >= self.max_size or self.pool.qsize() >= count:
+                    break
+                self._total += 1
+            
+            start_time = time.time()
             try:
-                driver.quit()
-            except:
-                pass
+                driver = self._create_driver()
+            except Exception as e:
+                self.logger.warning(f"Failed to pre-warm WebDriver: {e}")
+                with self._available:
+                    self._total -= 1
+                    self._available.notify()
+                break
+            
+            with self._available:
+                self.drivers_created += 1
+                self.startup_seconds += time.time() - start_time
+                self._pages[driver] = 0
+                self.pool.put_nowait(driver)
+                self._available.notify()
+            started += 1
+        
+        if started:
+            self.logger.info(f"Pre-warmed {started} WebDriver instance(s)")
+        return started
+    
+    def check_idle_drivers(self) -> int:
+        """
+        Probe idle drivers, retiring crashed or bloated ones.
+        
+        Returns:
+            Number of drivers retired
+        """
+        idle = []
+        while True:
+            try:
+                idle.append(self.pool.get_nowait())
+            except Empty:
+                break
+        
+        retired = 0
+        for driver in idle:
+            if not self._is_driver_healthy(driver):
+                with self.lock:
+                    self.health_check_failures += 1
+                self._retire(driver, "failed health check")
+                retired += 1
+                continue
+            
+            reason = self._recycle_reason(driver, 0)
+            if reason:
+                self._retire(driver, reason, recycled=True)
+                retired += 1
+                continue
+            
+            with self._available:
+                if driver in self._pages:
+                    self.pool.put_nowait(driver)
+                    self._available.notify()
+        return retired
+    
+    def start_health_checks(self, interval: float) -> None:
+        """
+        Probe idle drivers in a background thread.
+        
+        Args:
+            interval: Seconds between probes
+        """
+        if interval <= 0 or (self._health_thread and self._health_thread.is_alive()):
+            return
+        
+        def run():
+            while not self._health_stop.wait(interval):
+                try:
+                    self.check_idle_drivers()
+                except Exception as e:
+                    self.logger.warning(f"WebDriver health check failed: {e}")
+        
+        self._health_stop.clear()
+        self._health_thread = threading.Thread(target=run, name="webdriver-health", daemon=True)
+        self._health_thread.start()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool size, utilization, wait time and recycle statistics.
+        
+        Returns:
+            Dictionary with pool statistics
+        """
+        with self.lock:
+            return {
+                'pool_size': self.pool.qsize(),
+                'active_drivers': len(self.active_drivers),
+                'total_drivers': self._total,
+                'max_pool_size': self.max_size,
+                'utilization': len(self.active_drivers) / self.max_size if self.max_size else 0.0,
+                'drivers_created': self.drivers_created,
+                'drivers_reused': self.drivers_reused,
+                'avg_startup_seconds': self.startup_seconds / self.drivers_created if self.drivers_created else 0.0,
+                'avg_wait_seconds': self.wait_seconds / self.acquisitions if self.acquisitions else 0.0,
+                'max_wait_seconds': self.max_wait_seconds,
+                'acquire_timeouts': self.acquire_timeouts,
+                'recycles': self.recycles,
+                'health_check_failures': self.health_check_failures
+            }
     
     def cleanup(self) -> None:
         """Clean up all drivers in the pool."""
         self.logger.info("Cleaning up WebDriver pool")
+        self._health_stop.set()
         
         # Quit all active drivers
-        with self.lock:
+        with self._available:
             for driver in list(self.active_drivers):
                 try:
                     driver.quit()
                 except:
                     pass
             self.active_drivers.clear()
+            self._pages.clear()
+            self._total = 0
+            self._available.notify_all()
         
         # Quit all pooled drivers
         while not self.pool.empty():
@@ -127,6 +478,40 @@ class WebDriverPool:
             except:
                 pass
     
+    def _recycle_reason(self, driver: webdriver.Chrome, pages: int) -> Optional[str]:
+        """Get why a driver should be recycled, or None to keep it."""
+        if self.max_pages_per_driver and pages >= self.max_pages_per_driver:
+            return f"served {pages} pages"
+        if self.max_rss_mb:
+            rss_mb = self._driver_rss_mb(driver)
+            if rss_mb is not None and rss_mb > self.max_rss_mb:
+                return f"using {rss_mb:.0f} MB"
+        return None
+    
+    def _retire(self, driver: webdriver.Chrome, reason: str, recycled: bool = False) -> None:
+        """Quit a driver and free its slot for a new one."""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        
+        with self._available:
+            if self._pages.pop(driver, None) is not None:
+                self._total -= 1
+                if recycled:
+                    self.recycles += 1
+            self._available.notify()
+        self.logger.debug(f"Quit WebDriver ({reason})")
+    
+    def _driver_rss_mb(self, driver: webdriver.Chrome) -> Optional[float]:
+        """Get the resident memory of a driver's chromedriver and Chrome processes."""
+        try:
+            process = psutil.Process(driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes) / 1024 / 1024
+        except Exception:
+            return None
+    
     def _create_driver(self) -> webdriver.Chrome:
         """Create a new WebDriver instance with standardized configuration."""
         options = self._create_chrome_options()
@@ -144,14 +529,27 @@ class WebDriverPool:
             # Execute script to avoid detection
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
+            self._block_resources(driver)
+            
             return driver
             
         except Exception as e:
             raise WebDriverException(f"Failed to create WebDriver: {e}")
     
+    def _block_resources(self, driver: webdriver.Chrome) -> None:
+        """Block heavy and third-party tracking requests through the DevTools protocol."""
+        if not self.config.blocked_url_patterns:
+            return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(self.config.blocked_url_patterns)})
+        except Exception as e:
+            self.logger.warning(f"Could not enable request blocking: {e}")
+    
     def _create_chrome_options(self) -> Options:
         """Create standardized Chrome options."""
         options = Options()
+        options.page_load_strategy = self.config.page_load_strategy
         
         # Basic options
         if self.config.headless:
@@ -256,6 +654,9 @@ class WebDriverPool:
             driver.execute_script("window.localStorage.clear();")
             driver.execute_script("window.sessionStorage.clear();")
             
+            # Undo per-page timeouts set by the last user
+            driver.set_page_load_timeout(self.config.page_load_timeout)
+            
             # Navigate to blank page
             driver.get("about:blank")
             
@@ -263,6 +664,482 @@ class WebDriverPool:
             self.logger.warning(f"Error resetting driver state: {e}")
 
 
+@dataclass(eq=False)
+class _BrowserHost:
+    """A Chrome process shared by several tabs."""
+    owner: webdriver.Chrome
+    debugger_address: str
+    tabs: int = 0
+    busy: int = 0
+    pages: int = 0
+
+
+@dataclass(eq=False)
+class _BrowserTab:
+    """A tab in its own browser context, driven by its own chromedriver session."""
+    host: _BrowserHost
+    driver: webdriver.Chrome
+    context_id: Optional[str] = None
+    target_id: Optional[str] = None
+    leased_at: float = 0.0
+
+
+class BrowserTabPool:
+    """
+    Pool of isolated browser tabs spread over a few shared Chrome processes.
+    
+    Each Chrome is started by an owner WebDriver. Every tab gets its own
+    chromedriver session attached to that browser through its DevTools
+    address, so tabs load pages concurrently without sharing a session, and
+    each checkout gets a fresh browser context (separate cookies and
+    storage) created with the CDP Target domain. Tabs are handed out from
+    the least busy browser, and a new browser is started only when every
+    running one has tabs_per_browser tabs.
+    
+    Browsers are recycled like WebDriverPool drivers: once a browser has
+    served max_pages_per_browser pages or its memory passes max_rss_mb, it
+    takes no new checkouts and is quit when its last busy tab comes back.
+    
+    Offers the same get_driver/return_driver/warm/health check interface as
+    WebDriverPool.
+    """
+    
+    def __init__(self, config: WebDriverConfig = None, max_browsers: int = 3,
+                 tabs_per_browser: int = 4, acquire_timeout: float = 60.0,
+                 tab_timeout: float = 30.0, max_pages_per_browser: int = 50,
+                 max_rss_mb: Optional[float] = None):
+        """
+        Initialize tab pool.
+        
+        Args:
+            config: WebDriver configuration
+            max_browsers: Maximum number of Chrome processes
+            tabs_per_browser: Maximum tabs driven concurrently in one Chrome
+            acquire_timeout: Seconds to wait for a free tab
+            tab_timeout: Page load and script timeout of each tab
+            max_pages_per_browser: Checkouts after which a browser is recycled
+            max_rss_mb: Memory of a browser's processes above which it is recycled
+        """
+        self.config = config or WebDriverConfig()
+        self.max_browsers = max_browsers
+        self.tabs_per_browser = tabs_per_browser
+        self.max_size = max_browsers * tabs_per_browser
+        self.acquire_timeout = acquire_timeout
+        self.tab_timeout = tab_timeout
+        self.logger = get_logger(__name__)
+        
+        # Builds owner drivers, and shares Chrome options and recycle limits with the process pool
+        self.factory = WebDriverPool(
+            max_size=max_browsers, config=self.config,
+            max_pages_per_driver=max_pages_per_browser, max_rss_mb=max_rss_mb
+        )
+        
+        self.lock = threading.Lock()
+        self._available = threading.Condition(self.lock)
+        self.hosts: List[_BrowserHost] = []
+        self._starting = 0
+        self._idle: List[_BrowserTab] = []
+        self._leased: Dict[Any, _BrowserTab] = {}
+        
+        self.browsers_started = 0
+        self.tabs_created = 0
+        self.tabs_reused = 0
+        self.acquisitions = 0
+        self.wait_seconds = 0.0
+        self.acquire_timeouts = 0
+        self.lease_overruns = 0
+        self.recycles = 0
+        self.health_check_failures = 0
+        
+        self._health_stop = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
+    
+    def _reserve(self, reuse_idle: bool = True) -> Tuple[Optional[_BrowserTab], Optional[_BrowserHost], bool]:
+        """
+        Claim an idle tab, a tab slot on a running browser, or a browser start.
+        
+        The caller holds the lock.
+        
+        Returns:
+            (idle tab, browser to open a tab on, whether to start a browser);
+            all empty when every tab is busy
+        """
+        if reuse_idle and self._idle:
+            tab = min(self._idle, key=lambda t: t.host.busy)
+            self._idle.remove(tab)
+            tab.host.busy += 1
+            return tab, None, False
+        
+        open_hosts = [h for h in self.hosts if h.tabs < self.tabs_per_browser]
+        if open_hosts:
+            host = min(open_hosts, key=lambda h: h.busy)
+            host.tabs += 1
+            host.busy += 1
+            return None, host, False
+        
+        if len(self.hosts) + self._starting < self.max_browsers:
+            self._starting += 1
+            return None, None, True
+        return None, None, False
+    
+    def get_driver(self, timeout: Optional[float] = None) -> webdriver.Chrome:
+        """
+        Get a driver for a free tab, opening a tab or browser if below the caps.
+        
+        Args:
+            timeout: Seconds to wait for a free tab (defaults to acquire_timeout)
+            
+        Returns:
+            WebDriver switched to the tab
+            
+        Raises:
+            WebDriverPoolExhausted: If no tab became free in time
+        """
+        timeout = self.acquire_timeout if timeout is None else timeout
+        start_time = time.time()
+        tab = None
+        host = None
+        
+        with self._available:
+            while True:
+                tab, host, start_browser = self._reserve()
+                if tab or host or start_browser:
+                    break
+                
+                remaining = start_time + timeout - time.time()
+                if remaining <= 0:
+                    self.acquire_timeouts += 1
+                    raise WebDriverPoolExhausted(
+                        f"No browser tab free after {timeout:.0f}s ({self.max_size} in use)"
+                    )
+                self._available.wait(remaining)
+            waited = time.time() - start_time
+        
+        if tab is None:
+            if host is None:
+                host = self._start_browser()
+            tab = self._open_tab(host)
+        else:
+            with self.lock:
+                self.tabs_reused += 1
+        
+        with self.lock:
+            tab.leased_at = time.time()
+            tab.host.pages += 1
+            self._leased[tab.driver] = tab
+            self.acquisitions += 1
+            self.wait_seconds += waited
+        return tab.driver
+    
+    def return_driver(self, driver: webdriver.Chrome) -> None:
+        """Return a tab with a fresh browser context and default timeouts, recycling its browser if due."""
+        with self.lock:
+            tab = self._leased.pop(driver, None)
+        if tab is None:
+            return
+        
+        if time.time() - tab.leased_at > self.tab_timeout:
+            with self.lock:
+                self.lease_overruns += 1
+        
+        host = tab.host
+        healthy = self.factory._is_driver_healthy(driver)
+        if healthy:
+            try:
+                self._new_context(tab)
+                # Undo per-page timeouts set by the last user
+                self._reset_timeouts(driver)
+            except Exception as e:
+                self.logger.warning(f"Error resetting browser tab: {e}")
+                healthy = False
+        
+        with self._available:
+            host.busy -= 1
+            keep = healthy and host in self.hosts
+            if keep:
+                self._idle.append(tab)
+            else:
+                host.tabs -= 1
+            drained = host not in self.hosts and host.tabs == 0
+            self._available.notify()
+        
+        if not keep:
+            self._close_tab(tab)
+            if drained:
+                # Last tab of a recycled browser
+                self._quit_owner(host)
+            elif not self.factory._is_driver_healthy(host.owner):
+                self._retire_browser(host, "crashed")
+            return
+        
+        reason = self.factory._recycle_reason(host.owner, host.pages)
+        if reason:
+            self._retire_browser(host, reason, recycled=True)
+    
+    def warm(self, count: int) -> int:
+        """
+        Open tabs ahead of demand so the first pages skip Chrome startup.
+        
+        Args:
+            count: Number of idle tabs wanted
+            
+        Returns:
+            Number of tabs opened
+        """
+        opened = 0
+        for _ in range(count):
+            with self._available:
+                if len(self._idle) >= count:
+                    break
+                _, host, start_browser = self._reserve(reuse_idle=False)
+                if host is None and not start_browser:
+                    break
+            
+            try:
+                if host is None:
+                    host = self._start_browser()
+                tab = self._open_tab(host)
+            except Exception as e:
+                self.logger.warning(f"Failed to pre-warm browser tab: {e}")
+                break
+            
+            with self._available:
+                tab.host.busy -= 1
+                self._idle.append(tab)
+                self._available.notify()
+            opened += 1
+        
+        if opened:
+            self.logger.info(f"Pre-warmed {opened} browser tab(s)")
+        return opened
+    
+    def check_idle_drivers(self) -> int:
+        """
+        Probe browsers and idle tabs, retiring crashed or bloated browsers.
+        
+        Returns:
+            Number of browsers retired
+        """
+        with self.lock:
+            hosts = list(self.hosts)
+        
+        retired = 0
+        for host in hosts:
+            if not self.factory._is_driver_healthy(host.owner):
+                with self.lock:
+                    self.health_check_failures += 1
+                self._retire_browser(host, "failed health check")
+                retired += 1
+                continue
+            
+            reason = self.factory._recycle_reason(host.owner, host.pages)
+            if reason:
+                self._retire_browser(host, reason, recycled=True)
+                retired += 1
+        
+        with self.lock:
+            idle = list(self._idle)
+        crashed = [t for t in idle if not self.factory._is_driver_healthy(t.driver)]
+        with self._available:
+            # Skip tabs checked out while they were probed
+            crashed = [t for t in crashed if t in self._idle]
+            for tab in crashed:
+                self._idle.remove(tab)
+                tab.host.tabs -= 1
+            self._available.notify_all()
+        for tab in crashed:
+            self._close_tab(tab)
+        return retired
+    
+    def start_health_checks(self, interval: float) -> None:
+        """
+        Probe browsers in a background thread.
+        
+        Args:
+            interval: Seconds between probes
+        """
+        if interval <= 0 or (self._health_thread and self._health_thread.is_alive()):
+            return
+        
+        def run():
+            while not self._health_stop.wait(interval):
+                try:
+                    self.check_idle_drivers()
+                except Exception as e:
+                    self.logger.warning(f"Browser tab health check failed: {e}")
+        
+        self._health_stop.clear()
+        self._health_thread = threading.Thread(target=run, name="webdriver-tab-health", daemon=True)
+        self._health_thread.start()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get browser, tab and wait statistics.
+        
+        Returns:
+            Dictionary with tab pool statistics
+        """
+        with self.lock:
+            return {
+                'browsers': len(self.hosts),
+                'max_browsers': self.max_browsers,
+                'tabs': sum(h.tabs for h in self.hosts),
+                'busy_tabs': len(self._leased),
+                'max_tabs': self.max_size,
+                'utilization': len(self._leased) / self.max_size if self.max_size else 0.0,
+                'browsers_started': self.browsers_started,
+                'tabs_created': self.tabs_created,
+                'tabs_reused': self.tabs_reused,
+                'avg_wait_seconds': self.wait_seconds / self.acquisitions if self.acquisitions else 0.0,
+                'acquire_timeouts': self.acquire_timeouts,
+                'lease_overruns': self.lease_overruns,
+                'recycles': self.recycles,
+                'health_check_failures': self.health_check_failures
+            }
+    
+    def cleanup(self) -> None:
+        """Close every tab and browser."""
+        self.logger.info("Cleaning up browser tab pool")
+        self._health_stop.set()
+        with self._available:
+            tabs = self._idle + list(self._leased.values())
+            hosts = list(self.hosts)
+            self._idle = []
+            self._leased.clear()
+            self.hosts = []
+            self._available.notify_all()
+        
+        for tab in tabs:
+            self._close_tab(tab)
+        for host in hosts:
+            try:
+                host.owner.quit()
+            except Exception:
+                pass
+    
+    def _start_browser(self) -> _BrowserHost:
+        """Start a Chrome process and reserve its first tab."""
+        try:
+            owner = self.factory._create_driver()
+            address = owner.capabilities['goog:chromeOptions']['debuggerAddress']
+        except Exception:
+            with self._available:
+                self._starting -= 1
+                self._available.notify()
+            raise
+        
+        host = _BrowserHost(owner=owner, debugger_address=address, tabs=1, busy=1)
+        with self._available:
+            self._starting -= 1
+            self.hosts.append(host)
+            self.browsers_started += 1
+        self.logger.debug(f"Started shared browser at {address}")
+        return host
+    
+    def _open_tab(self, host: _BrowserHost) -> _BrowserTab:
+        """Attach a new chromedriver session to a browser and open a tab in it."""
+        driver = None
+        try:
+            options = Options()
+            options.debugger_address = host.debugger_address
+            options.page_load_strategy = self.config.page_load_strategy
+            driver = webdriver.Chrome(options=options)
+            
+            tab = _BrowserTab(host=host, driver=driver)
+            self._new_context(tab)
+            self._reset_timeouts(driver)
+        except Exception as e:
+            if driver is not None:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+            with self._available:
+                host.tabs -= 1
+                host.busy -= 1
+                self._available.notify()
+            raise WebDriverException(f"Failed to open browser tab: {e}")
+        
+        with self.lock:
+            self.tabs_created += 1
+        return tab
+    
+    def _reset_timeouts(self, driver: webdriver.Chrome) -> None:
+        """Set a tab's page load and script timeouts to the pool default."""
+        driver.set_page_load_timeout(self.tab_timeout)
+        driver.set_script_timeout(self.tab_timeout)
+    
+    def _new_context(self, tab: _BrowserTab) -> None:
+        """Move a tab into a new, empty browser context and drop the old one."""
+        driver = tab.driver
+        context_id = driver.execute_cdp_cmd(
+            "Target.createBrowserContext", {"disposeOnDetach": True}
+        )['browserContextId']
+        target_id = driver.execute_cdp_cmd(
+            "Target.createTarget", {"url": "about:blank", "browserContextId": context_id}
+        )['targetId']
+        driver.switch_to.window(target_id)
+        
+        if tab.target_id:
+            driver.execute_cdp_cmd("Target.closeTarget", {"targetId": tab.target_id})
+        if tab.context_id:
+            driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": tab.context_id})
+        tab.context_id = context_id
+        tab.target_id = target_id
+        
+        self.factory._block_resources(driver)
+    
+    def _close_tab(self, tab: _BrowserTab) -> None:
+        """Close a tab's context and detach its chromedriver session."""
+        try:
+            if tab.context_id:
+                tab.driver.execute_cdp_cmd(
+                    "Target.disposeBrowserContext", {"browserContextId": tab.context_id}
+                )
+        except Exception:
+            pass
+        try:
+            # Sessions attached by debugger address leave the browser running
+            tab.driver.quit()
+        except Exception:
+            pass
+    
+    def _retire_browser(self, host: _BrowserHost, reason: str, recycled: bool = False) -> None:
+        """
+        Stop handing out a browser's tabs and close it.
+        
+        Idle tabs are closed now. A recycled browser with busy tabs is quit
+        when the last of them is returned; a crashed one is quit at once.
+        """
+        with self._available:
+            if host not in self.hosts:
+                return
+            self.hosts.remove(host)
+            orphans = [t for t in self._idle if t.host is host]
+            self._idle = [t for t in self._idle if t.host is not host]
+            host.tabs -= len(orphans)
+            drained = host.tabs == 0
+            if recycled:
+                self.recycles += 1
+            self._available.notify_all()
+        
+        for tab in orphans:
+            self._close_tab(tab)
+        if drained or not recycled:
+            self._quit_owner(host)
+        if recycled:
+            self.logger.debug(f"Recycling browser at {host.debugger_address} ({reason})")
+        else:
+            self.logger.warning(f"Retired browser at {host.debugger_address} ({reason})")
+    
+    def _quit_owner(self, host: _BrowserHost) -> None:
+        """Quit the WebDriver that started a browser, closing the browser."""
+        try:
+            host.owner.quit()
+        except Exception:
+            pass
+
+
 class WebDriverManager:
     """
     Unified WebDriver manager for all scraping operations.
@@ -296,8 +1173,44 @@ class WebDriverManager:
             self._load_config_settings(config)
         
         # Initialize driver pool
-        pool_size = getattr(config, 'webdriver_pool_size', 3) if config else 3
-        self.driver_pool = WebDriverPool(max_size=pool_size, config=self.webdriver_config)
+        pool_size = int(_config_number(config, 'webdriver_pool_size', 3))
+        self.driver_pool = WebDriverPool(
+            max_size=pool_size,
+            config=self.webdriver_config,
+            acquire_timeout=_config_number(config, 'webdriver_acquire_timeout', 60.0),
+            max_pages_per_driver=_config_number(config, 'webdriver_max_pages', 50),
+            max_rss_mb=_config_number(config, 'webdriver_max_rss_mb', None)
+        )
+        
+        # Optional tab mode: several isolated tabs share each Chrome process
+        tabs_per_browser = int(_config_number(config, 'webdriver_tabs_per_browser', 1))
+        self.tab_pool = None
+        if tabs_per_browser > 1:
+            self.tab_pool = BrowserTabPool(
+                config=self.webdriver_config,
+                max_browsers=pool_size,
+                tabs_per_browser=tabs_per_browser,
+                acquire_timeout=_config_number(config, 'webdriver_acquire_timeout', 60.0),
+                tab_timeout=_config_number(config, 'webdriver_tab_timeout', 30.0),
+                max_pages_per_browser=_config_number(config, 'webdriver_max_pages', 50),
+                max_rss_mb=_config_number(config, 'webdriver_max_rss_mb', None)
+            )
+        
+        # Warm and probe the pool get_driver draws from
+        pool = self._active_pool()
+        prewarm = _config_number(config, 'webdriver_prewarm', 0)
+        if prewarm:
+            threading.Thread(
+                target=pool.warm, args=(int(prewarm),),
+                name="webdriver-prewarm", daemon=True
+            ).start()
+        pool.start_health_checks(
+            _config_number(config, 'webdriver_health_check_interval', 60.0)
+        )
+        
+        # Per-page overhead: time from requesting a driver to having one
+        self.acquisitions = 0
+        self.acquire_seconds = 0.0
         
         self._initialized = True
         self.logger.info("WebDriverManager initialized")
@@ -320,6 +1233,13 @@ class WebDriverManager:
         user_agent = getattr(config, 'webdriver_user_agent', None)
         if user_agent:
             self.webdriver_config.user_agent = user_agent
+        
+        # Scrape profile: page load strategy and request blocking
+        strategy = getattr(config, 'webdriver_page_load_strategy', None)
+        if strategy in ("normal", "eager", "none"):
+            self.webdriver_config.page_load_strategy = strategy
+        if getattr(config, 'webdriver_block_resources', True) is False:
+            self.webdriver_config.blocked_url_patterns = ()
     
     @contextmanager
     def get_driver(self, service_name: str = "default"):
@@ -337,10 +1257,13 @@ class WebDriverManager:
         
         try:
             self.logger.info(f"Acquiring WebDriver for service: {service_name}")
-            driver = self.driver_pool.get_driver()
+            driver = self._active_pool().get_driver()
             
             # Log acquisition time
             acquisition_time = time.time() - start_time
+            with self.driver_pool.lock:
+                self.acquisitions += 1
+                self.acquire_seconds += acquisition_time
             self.logger.debug(f"WebDriver acquired in {acquisition_time:.2f}s for {service_name}")
             
             yield driver
@@ -359,12 +1282,16 @@ class WebDriverManager:
         finally:
             if driver:
                 try:
-                    self.driver_pool.return_driver(driver)
+                    self._active_pool().return_driver(driver)
                     total_time = time.time() - start_time
                     self.logger.debug(f"WebDriver session completed in {total_time:.2f}s for {service_name}")
                 except Exception as e:
                     self.logger.warning(f"Error returning WebDriver for {service_name}: {e}")
     
+    def _active_pool(self):
+        """Get the pool get_driver draws from: browser tabs if enabled, else processes."""
+        return self.tab_pool or self.driver_pool
+    
     def create_driver(self, custom_config: Optional[WebDriverConfig] = None) -> webdriver.Chrome:
         """
         Create a new WebDriver instance with custom configuration.
@@ -407,24 +1334,28 @@ class WebDriverManager:
         
         return options
     
-    def get_pool_stats(self) -> Dict[str, int]:
+    def get_pool_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the WebDriver pool.
         
         Returns:
-            Dict containing pool statistics
+            Dict containing pool statistics, including how many drivers were
+            reused instead of started, utilization, wait times and recycles
         """
+        stats = self.driver_pool.get_stats()
         with self.driver_pool.lock:
-            return {
-                'pool_size': self.driver_pool.pool.qsize(),
-                'active_drivers': len(self.driver_pool.active_drivers),
-                'max_pool_size': self.driver_pool.max_size
-            }
+            stats['avg_acquire_seconds'] = self.acquire_seconds / self.acquisitions if self.acquisitions else 0.0
+        stats.update(_page_load_stats.get_stats())
+        if self.tab_pool:
+            stats['tabs'] = self.tab_pool.get_stats()
+        return stats
     
     def cleanup(self) -> None:
         """Clean up all WebDriver resources."""
         self.logger.info("Cleaning up WebDriverManager")
         self.driver_pool.cleanup()
+        if self.tab_pool:
+            self.tab_pool.cleanup()
     
     def __del__(self):
         """Destructor to ensure cleanup on garbage collection."""